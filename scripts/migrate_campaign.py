@@ -7,6 +7,8 @@ format, where data is organized across multiple files in a directory structure.
 
 Usage:
     python scripts/migrate_campaign.py "Campaign Name" --backup --dry-run
+    python scripts/migrate_campaign.py "Campaign Name" --layout entities
+    python scripts/migrate_campaign.py "Campaign Name" --layout sections
 
 The script:
 1. Loads the monolithic campaign file (campaigns/{name}.json)
@@ -14,6 +16,9 @@ The script:
 3. Creates a new directory structure (campaigns/{name}/)
 4. Writes individual JSON files for each section
 5. Optionally backs up the original file
+6. With --layout entities, converts the sections to one file per entity
+   (storage_version 2). Already split campaigns are converted in place,
+   and --layout sections converts them back to one file per section.
 
 Author: Gamemaster MCP Team
 License: MIT
@@ -28,6 +33,18 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
+try:
+    from dm20_protocol.storage import SplitLayout, SplitStorageBackend
+except ImportError:  # Running from a source checkout without installing the package
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+    from dm20_protocol.storage import SplitLayout, SplitStorageBackend
+
+# --layout choices mapped to split storage versions
+LAYOUTS = {
+    "sections": SplitLayout.SECTION_FILES,
+    "entities": SplitLayout.ENTITY_FILES,
+}
+
 
 class MigrationError(Exception):
     """Custom exception for migration errors."""
@@ -44,6 +61,7 @@ class CampaignMigrator:
         backup: bool = False,
         force: bool = False,
         dry_run: bool = False,
+        layout: str | None = None,
     ):
         """Initialize migrator with configuration.
 
@@ -53,12 +71,20 @@ class CampaignMigrator:
             backup: Whether to keep original file as .json.bak
             force: Whether to overwrite existing split directory
             dry_run: Whether to show what would be done without making changes
+            layout: Target split layout, "sections" (one file per section) or
+                "entities" (one file per character/NPC/location/quest/encounter).
+                None migrates to "sections" and leaves split campaigns alone.
         """
+        if layout is not None and layout not in LAYOUTS:
+            raise MigrationError(f"Unknown layout '{layout}'. Use: {', '.join(LAYOUTS)}")
+
         self.campaign_name = campaign_name
         self.data_dir = data_dir
         self.backup = backup
         self.force = force
         self.dry_run = dry_run
+        self.layout = layout or "sections"
+        self._layout_requested = layout is not None
 
         self.safe_name = self._sanitize_name(campaign_name)
         self.monolithic_file = data_dir / "campaigns" / f"{self.safe_name}.json"
@@ -295,6 +321,43 @@ class CampaignMigrator:
         except Exception as e:
             raise MigrationError(f"Failed to handle original file: {e}")
 
+    def _is_layout_conversion(self) -> bool:
+        """Check whether only an in-place layout conversion is requested.
+
+        True when there is no monolithic file, the campaign is already split
+        and a layout was asked for.
+        """
+        return (
+            self._layout_requested
+            and not self.monolithic_file.exists()
+            and (self.split_dir / "campaign.json").exists()
+        )
+
+    def _convert_layout(self) -> None:
+        """Convert the split campaign to the requested layout.
+
+        Uses SplitStorageBackend so the files match what the server writes.
+
+        Raises:
+            MigrationError: If the campaign cannot be loaded or converted
+        """
+        target = LAYOUTS[self.layout]
+        if self.dry_run:
+            print(f"\n🔁 [DRY RUN] Would convert {self.split_dir.name} to '{self.layout}' layout (storage_version {target})")
+            return
+
+        print(f"\n🔁 Converting to '{self.layout}' layout")
+        try:
+            backend = SplitStorageBackend(data_dir=self.data_dir, auto_load=False)
+            backend.load_campaign(self.campaign_name)
+            if backend.storage_version == target:
+                print(f"  ✓ Already using storage_version {target}")
+                return
+            backend.convert_layout(target)
+        except Exception as e:
+            raise MigrationError(f"Failed to convert layout: {e}")
+        print(f"  ✓ Converted to storage_version {target} ({backend.bytes_written:,} bytes written)")
+
     def _rollback(self) -> None:
         """Rollback any changes made during failed migration."""
         if self.dry_run:
@@ -334,6 +397,21 @@ class CampaignMigrator:
         print(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
         print(f"Backup: {'Yes' if self.backup else 'No'}")
         print(f"Force: {'Yes' if self.force else 'No'}")
+        print(f"Layout: {self.layout}")
+
+        if self._is_layout_conversion():
+            try:
+                print(f"\n{'='*70}")
+                print("Convert Split Layout")
+                print(f"{'='*70}")
+                self._convert_layout()
+                print(f"\n{'='*70}")
+                print("✅ DRY RUN COMPLETE - No changes made" if self.dry_run else "✅ LAYOUT CONVERSION COMPLETE")
+                print(f"{'='*70}")
+            except MigrationError as e:
+                print(f"\n❌ Conversion failed: {e}", file=sys.stderr)
+                sys.exit(1)
+            return
 
         try:
             # Step 1: Validate
@@ -367,6 +445,13 @@ class CampaignMigrator:
             print(f"{'='*70}")
             self._handle_backup()
 
+            # Step 6: Optional per-entity layout
+            if self.layout != "sections":
+                print(f"\n{'='*70}")
+                print("Step 6: Convert Split Layout")
+                print(f"{'='*70}")
+                self._convert_layout()
+
             # Success
             print(f"\n{'='*70}")
             if self.dry_run:
@@ -413,6 +498,13 @@ Examples:
 
   # Custom data directory
   python scripts/migrate_campaign.py "My Campaign" --data-dir /path/to/data
+
+  # Store each character/NPC/location/quest in its own file
+  # (also converts an already split campaign in place)
+  python scripts/migrate_campaign.py "My Campaign" --layout entities
+
+  # Convert a split campaign back to one file per section
+  python scripts/migrate_campaign.py "My Campaign" --layout sections
         """,
     )
 
@@ -441,6 +533,15 @@ Examples:
         type=Path,
         help="Data directory path (default: dnd_data)"
     )
+    parser.add_argument(
+        "--layout",
+        choices=sorted(LAYOUTS),
+        default=None,
+        help=(
+            "Split layout: one file per section or per entity (default: sections). "
+            "Given for an already split campaign, converts it in place"
+        )
+    )
 
     return parser.parse_args()
 
@@ -455,6 +556,7 @@ def main() -> None:
         backup=args.backup,
         force=args.force,
         dry_run=args.dry_run,
+        layout=args.layout,
     )
 
     migrator.migrate()
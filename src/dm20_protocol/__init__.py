@@ -2,13 +2,30 @@
 D&D MCP Server - A comprehensive campaign management tool for D&D built with FastMCP 2.8.0+.
 """
 
-from .main import mcp
+from typing import TYPE_CHECKING
+
 from .models import *
 from .storage import DnDStorage
 
+if TYPE_CHECKING:
+    # Resolved lazily by __getattr__ below
+    from .main import mcp
+
 try:
     from importlib.metadata import version as _get_version
     __version__ = _get_version("dm20-protocol")
 except Exception:
     __version__ = "0.3.0"  # Fallback if metadata unavailable
 __all__ = ["mcp", "DnDStorage"]
+
+
+def __getattr__(name: str):  # type: ignore[no-untyped-def]
+    """Import the server module only when the MCP app is requested.
+
+    Importing ``dm20_protocol.main`` builds the server and its storage, so
+    subpackages such as ``dm20_protocol.models`` must not trigger it.
+    """
+    if name == "mcp":
+        from .main import mcp
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,176 @@
+"""
+Campaign registry for fast startup and campaign listing.
+
+Finding the most recent campaign used to mean listing ``campaigns/``,
+stat-ing every monolithic file and every split ``campaign.json``, and
+probing the filesystem again to detect the format. The registry keeps that
+information in a single ``campaign_registry.json`` next to the campaigns
+directory: one entry per campaign with its storage format, when it was last
+used and summary counts.
+
+The registry records the modification time of ``campaigns/`` when it was
+written. Creating, renaming or deleting a campaign outside the server
+changes that time, so a mismatch marks the registry as stale and callers
+fall back to a directory scan.
+
+Key components:
+- CampaignRegistryEntry: what is known about one campaign
+- CampaignRegistry: loads, validates and atomically rewrites the file
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger("dm20-protocol")
+
+REGISTRY_VERSION = 1
+
+
+class CampaignRegistryEntry(BaseModel):
+    """Registry record for a single campaign."""
+    name: str = Field(description="Campaign name as stored on disk (file stem or directory name)")
+    format: str = Field(description="StorageFormat value: 'split' or 'monolithic'")
+    last_used: datetime = Field(description="When the campaign was last created, loaded or saved")
+    counts: dict[str, int] = Field(default_factory=dict, description="Entity counts by section, empty if unknown")
+
+
+class CampaignRegistry:
+    """Index of the campaigns in a data directory.
+
+    Attributes:
+        path: Location of the registry file
+        campaigns_dir: Directory whose modification time guards freshness
+    """
+
+    def __init__(self, path: Path, campaigns_dir: Path):
+        self.path = Path(path)
+        self.campaigns_dir = Path(campaigns_dir)
+        self._entries: dict[str, CampaignRegistryEntry] = {}
+        self._current: str | None = None
+        self._stamp: int | None = None
+
+    # --- Reading ---
+
+    def load(self) -> bool:
+        """Read the registry file.
+
+        Returns:
+            True if the file exists, parses and is still fresh
+        """
+        self._entries = {}
+        self._current = None
+        self._stamp = None
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != REGISTRY_VERSION:
+                logger.debug("📇 Campaign registry version mismatch, ignoring it.")
+                return False
+            self._entries = {
+                name: CampaignRegistryEntry.model_validate(entry)
+                for name, entry in data.get("campaigns", {}).items()
+            }
+            self._current = data.get("current")
+            self._stamp = data.get("campaigns_mtime_ns")
+        except (json.JSONDecodeError, ValidationError, ValueError, AttributeError) as e:
+            logger.warning(f"⚠️ Campaign registry unreadable, rescanning campaigns: {e}")
+            self._entries = {}
+            self._current = None
+            return False
+        return self.is_fresh()
+
+    def is_fresh(self) -> bool:
+        """Whether no campaign was added or removed behind the registry's back."""
+        return self._stamp is not None and self._stamp == self._campaigns_mtime()
+
+    def names(self) -> list[str]:
+        """Sorted campaign names."""
+        return sorted(self._entries)
+
+    def get(self, name: str) -> CampaignRegistryEntry | None:
+        """Return the entry for a campaign, if registered."""
+        return self._entries.get(name)
+
+    def most_recent(self) -> CampaignRegistryEntry | None:
+        """The active campaign, or the most recently used one."""
+        if self._current in self._entries:
+            return self._entries[self._current]
+        if not self._entries:
+            return None
+        return max(self._entries.values(), key=lambda entry: entry.last_used)
+
+    # --- Updating ---
+
+    def replace(self, entries: list[CampaignRegistryEntry]) -> None:
+        """Replace all entries, e.g. with the result of a directory scan.
+
+        Counts already known for a campaign are kept.
+        """
+        previous = self._entries
+        self._entries = {}
+        for entry in entries:
+            if not entry.counts and entry.name in previous:
+                entry.counts = previous[entry.name].counts
+            self._entries[entry.name] = entry
+        if self._current not in self._entries:
+            self._current = None
+
+    def record(self, name: str, storage_format: str, counts: dict[str, int] | None = None, used: bool = True) -> None:
+        """Add or update a campaign.
+
+        Args:
+            name: Campaign name as stored on disk
+            storage_format: StorageFormat value
+            counts: Entity counts to store; None keeps the previous counts
+            used: Mark the campaign as the active, most recently used one
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = CampaignRegistryEntry(name=name, format=storage_format, last_used=datetime.now())
+            self._entries[name] = entry
+        entry.format = storage_format
+        if counts is not None:
+            entry.counts = dict(counts)
+        if used:
+            entry.last_used = datetime.now()
+            self._current = name
+
+    def remove(self, name: str) -> None:
+        """Drop a campaign from the registry."""
+        self._entries.pop(name, None)
+        if self._current == name:
+            self._current = None
+
+    def save(self) -> None:
+        """Write the registry atomically and stamp it as fresh."""
+        self._stamp = self._campaigns_mtime()
+        data = {
+            "version": REGISTRY_VERSION,
+            "campaigns_mtime_ns": self._stamp,
+            "current": self._current,
+            "campaigns": {
+                name: entry.model_dump(mode='json') for name, entry in sorted(self._entries.items())
+            },
+        }
+        temp_file = self.path.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            temp_file.replace(self.path)
+        except OSError as e:
+            # The registry is only a cache; a failed write means a rescan later
+            logger.warning(f"⚠️ Could not write campaign registry: {e}")
+            temp_file.unlink(missing_ok=True)
+            self._stamp = None
+
+    def _campaigns_mtime(self) -> int | None:
+        try:
+            return self.campaigns_dir.stat().st_mtime_ns
+        except OSError:
+            return None
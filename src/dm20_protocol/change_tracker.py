@@ -0,0 +1,606 @@
+"""
+Per-entity change tracking for campaign persistence.
+
+Instead of re-serializing and re-hashing the whole campaign on every save,
+the storage layer records which characters, NPCs, locations, quests and
+encounters were written or handed out since the campaign was loaded. A save
+then dumps only those entities and compares them against the last persisted
+snapshot, so a dirty check costs O(handed-out entities) rather than
+O(campaign size).
+
+Key components:
+- TrackedEntities: dict subclass used for the campaign entity sections that
+  reports lookups and writes to its tracker
+- LazyEntities: TrackedEntities whose contents are read from disk on first use
+- ChangeSet: the entities (and small singleton sections) that differ from
+  the last saved state
+- ChangeTracker: owns the persisted snapshots and the touched sets
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Self
+
+from .models import Campaign
+
+if TYPE_CHECKING:
+    from _collections_abc import dict_items, dict_keys, dict_values
+
+    from _typeshed import SupportsKeysAndGetItem
+
+logger = logging.getLogger("dm20-protocol")
+
+# Campaign fields holding name-keyed entity dicts
+ENTITY_SECTIONS: tuple[str, ...] = ("characters", "npcs", "locations", "quests", "encounters")
+
+# Campaign fields that are neither entity sections nor singletons
+_NON_METADATA_FIELDS = set(ENTITY_SECTIONS) | {"sessions", "game_state"}
+
+
+class TrackedEntities(dict):
+    """Entity section dict that reports access to a ChangeTracker.
+
+    Entities fetched by key may be edited in place and persisted later with
+    ``storage.save()``, so every lookup marks that key as touched. Bulk views
+    (``values()``/``items()``) hand out every entity at once and mark the
+    whole section for a rescan on the next save. Membership tests, ``len()``
+    and iteration over keys are not tracked.
+
+    Serialization (``model_dump``) reads the dict at C level and never marks
+    anything.
+    """
+
+    __slots__ = ("_tracker", "_section")
+
+    def __init__(self, data: dict, tracker: "ChangeTracker", section: str) -> None:
+        super().__init__(data)
+        self._tracker = tracker
+        self._section = section
+
+    def ensure_loaded(self) -> None:
+        """Hook for lazily loaded sections; eager sections are always loaded."""
+
+    # --- Lookups ---
+
+    def __getitem__(self, key: str) -> Any:
+        self.ensure_loaded()
+        self._tracker.touch(self._section, key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.ensure_loaded()
+        if super().__contains__(key):
+            self._tracker.touch(self._section, key)
+        return super().get(key, default)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.ensure_loaded()
+        self._tracker.touch(self._section, key)
+        return super().setdefault(key, default)
+
+    def values(self) -> "dict_values[Any, Any]":
+        self.ensure_loaded()
+        self._tracker.touch_section(self._section)
+        return super().values()
+
+    def items(self) -> "dict_items[Any, Any]":
+        self.ensure_loaded()
+        self._tracker.touch_section(self._section)
+        return super().items()
+
+    # --- Writes ---
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.ensure_loaded()
+        self._tracker.touch(self._section, key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.ensure_loaded()
+        self._tracker.touch(self._section, key)
+        super().__delitem__(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self.ensure_loaded()
+        self._tracker.touch(self._section, key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        self.ensure_loaded()
+        key, value = super().popitem()
+        self._tracker.touch(self._section, key)
+        return key, value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.ensure_loaded()
+        incoming = dict(*args, **kwargs)
+        for key in incoming:
+            self._tracker.touch(self._section, key)
+        super().update(incoming)
+
+    def __ior__(self, other: "SupportsKeysAndGetItem[Any, Any] | Iterable[tuple[Any, Any]]") -> Self:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        self.ensure_loaded()
+        self._tracker.touch_section(self._section)
+        super().clear()
+
+    # --- Copying hands out plain dicts, never a second tracked view ---
+
+    def copy(self) -> dict:
+        self.ensure_loaded()
+        return dict(dict.items(self))
+
+    def __or__(self, other: "SupportsKeysAndGetItem[Any, Any] | Iterable[tuple[Any, Any]]") -> dict:
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __copy__(self) -> dict:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        from copy import deepcopy
+        self.ensure_loaded()
+        return {key: deepcopy(value, memo) for key, value in dict.items(self)}
+
+    def __reduce__(self) -> tuple:
+        return (dict, (self.copy(),))
+
+
+class LazyEntities(TrackedEntities):
+    """Tracked entity section that is read from disk on first access.
+
+    Until loaded the underlying dict is empty. Every Python-level access,
+    including ``len()``, membership tests, iteration and comparison, loads
+    the section first, and ``Campaign`` serialization calls ensure_loaded()
+    before dumping. Loaded entities become the tracker's persisted baseline.
+    """
+
+    __slots__ = ("_loader", "_loaded")
+
+    def __init__(self, loader: Callable[[], dict], tracker: "ChangeTracker", section: str) -> None:
+        super().__init__({}, tracker, section)
+        self._loader: Callable[[], dict] | None = loader
+        self._loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the section has been read from disk."""
+        return self._loaded
+
+    def ensure_loaded(self) -> None:
+        """Read the section from disk if that has not happened yet."""
+        if self._loaded:
+            return
+        # Only mark the section loaded once the loader succeeded, so a failed
+        # read is retried instead of leaving an empty section to be saved.
+        if self._loader is not None:
+            dict.update(self, self._loader())
+        self._loaded = True
+        self._loader = None
+        self._tracker.seed(self._section, self)
+
+    def __contains__(self, key: object) -> bool:
+        self.ensure_loaded()
+        return super().__contains__(key)
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[Any]:
+        self.ensure_loaded()
+        return super().__iter__()
+
+    def keys(self) -> "dict_keys[Any, Any]":
+        self.ensure_loaded()
+        return super().keys()
+
+    def __eq__(self, other: object) -> bool:
+        self.ensure_loaded()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        self.ensure_loaded()
+        return super().__ne__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self.ensure_loaded()
+        return super().__repr__()
+
+
+@dataclass
+class ChangeSet:
+    """Entities that differ from the last saved snapshot.
+
+    Attributes:
+        entities: section -> key -> dumped entity, ``None`` marking a removal
+        metadata: Campaign scalar fields, if any of them changed
+        game_state: Dumped game state, if it changed
+        sessions: session_number -> dumped session for changed sessions
+        checked: section -> keys that were compared (changed or not)
+        rescanned: Sections that were compared in full
+        sessions_checked: Whether session notes were compared
+        seq: Tracker sequence number when the ChangeSet was collected
+    """
+    entities: dict[str, dict[str, dict | None]] = field(default_factory=dict)
+    metadata: dict | None = None
+    game_state: dict | None = None
+    sessions: dict[int, dict] = field(default_factory=dict)
+    checked: dict[str, set[str]] = field(default_factory=dict)
+    rescanned: set[str] = field(default_factory=set)
+    sessions_checked: bool = False
+    seq: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.entities or self.sessions) or self.metadata is not None or self.game_state is not None
+
+    def section_changed(self, section: str) -> bool:
+        """Check whether any entity in a section changed."""
+        return section in self.entities
+
+    @property
+    def entity_count(self) -> int:
+        """Number of changed entities across all sections."""
+        return sum(len(changed) for changed in self.entities.values())
+
+
+class ChangeTracker:
+    """Tracks which campaign entities may have changed since the last save.
+
+    The tracker keeps the last persisted dump of every entity. Entities are
+    only re-dumped when they were touched (looked up or written through a
+    TrackedEntities section) or when their section was handed out in bulk.
+    A caller may keep an entity it was handed and edit it after a save, so
+    handed-out entities and sections stay under comparison on every later
+    save until the campaign is re-attached.
+
+    Usage:
+        tracker.attach(campaign)           # after loading or creating
+        changes = tracker.collect(campaign)
+        if changes:
+            ... write changes ...
+            tracker.commit(changes)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._campaign: Campaign | None = None
+        self._snapshots: dict[str, dict[str, dict]] = {s: {} for s in ENTITY_SECTIONS}
+        self._metadata: dict = {}
+        self._game_state: dict = {}
+        self._sessions: dict[int, dict] = {}
+        # Touch marks map to the sequence number of the latest touch, so a
+        # commit only clears marks made before its collect() ran
+        self._seq = 0
+        self._touched: dict[str, dict[str, int]] = {s: {} for s in ENTITY_SECTIONS}
+        self._rescan: dict[str, int] = {}
+        self._sessions_touched = 0
+        # Entities and sections handed out before a commit, still reachable
+        # through references the caller kept
+        self._handed_out: dict[str, set[str]] = {s: set() for s in ENTITY_SECTIONS}
+        self._handed_out_sections: set[str] = set()
+
+    # --- Attachment ---
+
+    def attach(self, campaign: Campaign) -> None:
+        """Start tracking a campaign and take a baseline snapshot.
+
+        Wraps the entity sections in TrackedEntities and records the current
+        state as persisted. Re-attaching the already tracked campaign only
+        clears the touched sets.
+
+        Args:
+            campaign: The freshly loaded or created campaign
+        """
+        with self._lock:
+            if self._campaign is campaign and all(self._is_tracked(campaign, s) for s in ENTITY_SECTIONS):
+                self._clear_touched()
+                return
+
+            self._campaign = campaign
+            for section in ENTITY_SECTIONS:
+                entities = self._wrap(campaign, section)
+                # Unloaded lazy sections are empty here and report through seed()
+                self._snapshots[section] = {
+                    key: entity.model_dump(mode='json')
+                    for key, entity in dict.items(entities)
+                }
+            self._metadata = self._dump_metadata(campaign)
+            self._game_state = campaign.game_state.model_dump(mode='json')
+            self._sessions = {s.session_number: s.model_dump(mode='json') for s in campaign.sessions}
+            self._clear_touched()
+            logger.debug(f"🔎 Change tracking attached to campaign '{campaign.name}'")
+
+    def reset(self) -> None:
+        """Stop tracking and drop all snapshots."""
+        with self._lock:
+            self._campaign = None
+            self._snapshots = {s: {} for s in ENTITY_SECTIONS}
+            self._metadata = {}
+            self._game_state = {}
+            self._sessions = {}
+            self._clear_touched()
+
+    @property
+    def campaign(self) -> Campaign | None:
+        """The campaign currently being tracked."""
+        return self._campaign
+
+    def seed(self, section: str, entities: dict) -> None:
+        """Record freshly loaded entities as the persisted baseline.
+
+        Called by LazyEntities when a section is read from disk after attach().
+        """
+        with self._lock:
+            self._snapshots[section].update(
+                (key, entity.model_dump(mode='json')) for key, entity in dict.items(entities)
+            )
+
+    # --- Marking ---
+
+    def touch(self, section: str, key: str) -> None:
+        """Mark one entity as potentially modified."""
+        with self._lock:
+            self._touched[section][key] = self._next_seq()
+
+    def touch_section(self, section: str) -> None:
+        """Mark a whole entity section for comparison on the next save."""
+        with self._lock:
+            self._rescan[section] = self._next_seq()
+
+    def touch_sessions(self) -> None:
+        """Mark session notes for comparison on the next save."""
+        with self._lock:
+            self._sessions_touched = self._next_seq()
+
+    def touch_all(self) -> None:
+        """Mark the whole campaign for comparison on the next save."""
+        with self._lock:
+            self._mark_all()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether anything was touched since the last commit.
+
+        This is a cheap pre-check; touched entities may still turn out to be
+        unchanged once compared in collect(). Edits through references handed
+        out before the last commit are only found by collect().
+        """
+        with self._lock:
+            return bool(self._rescan) or bool(self._sessions_touched) or any(self._touched.values())
+
+    # --- Collecting and committing ---
+
+    def collect(self, campaign: Campaign, sections: tuple[str, ...] | None = None) -> ChangeSet:
+        """Compare touched entities against the last saved snapshot.
+
+        Does not modify the snapshots; call commit() once the changes were
+        written successfully.
+
+        Args:
+            campaign: Campaign to inspect (re-attached if it is a new object)
+            sections: Restrict the comparison to these entity sections and
+                skip metadata, game state and sessions. None compares all.
+
+        Returns:
+            ChangeSet describing what differs from the persisted state
+        """
+        with self._lock:
+            if self._campaign is not campaign:
+                # Campaign object replaced behind our back: everything is suspect
+                self._campaign = campaign
+                self._mark_all()
+
+            changes = ChangeSet(seq=self._seq)
+            for section in sections if sections is not None else ENTITY_SECTIONS:
+                if not self._is_tracked(campaign, section):
+                    self._wrap(campaign, section)
+                    self._rescan[section] = self._next_seq()
+                self._collect_section(campaign, section, changes)
+
+            if sections is None:
+                metadata = self._dump_metadata(campaign)
+                if metadata != self._metadata:
+                    changes.metadata = metadata
+
+                game_state = campaign.game_state.model_dump(mode='json')
+                if game_state != self._game_state:
+                    changes.game_state = game_state
+
+                if self._sessions_touched:
+                    changes.sessions_checked = True
+                    for session in campaign.sessions:
+                        data = session.model_dump(mode='json')
+                        if self._sessions.get(session.session_number) != data:
+                            changes.sessions[session.session_number] = data
+
+            if changes:
+                logger.debug(
+                    f"🔎 Collected {changes.entity_count} changed entities "
+                    f"in {sorted(changes.entities)}"
+                )
+            return changes
+
+    def commit(self, changes: ChangeSet) -> None:
+        """Record a written ChangeSet as the new persisted state.
+
+        Args:
+            changes: A ChangeSet returned by collect() and now on disk
+        """
+        with self._lock:
+            for section, changed in changes.entities.items():
+                snapshot = self._snapshots[section]
+                for key, data in changed.items():
+                    if data is None:
+                        snapshot.pop(key, None)
+                    else:
+                        snapshot[key] = data
+            if changes.metadata is not None:
+                self._metadata = changes.metadata
+            if changes.game_state is not None:
+                self._game_state = changes.game_state
+            self._sessions.update(changes.sessions)
+
+            # Marks made after collect() (e.g. while a background save was
+            # writing) stay set so those edits are compared again next time.
+            # Checked entities may still be edited through kept references,
+            # so they stay handed out.
+            for section, keys in changes.checked.items():
+                touched = self._touched[section]
+                handed_out = self._handed_out[section]
+                for key in keys:
+                    if touched.get(key, 0) <= changes.seq:
+                        touched.pop(key, None)
+                    if key in self._snapshots[section]:
+                        handed_out.add(key)
+                    else:
+                        handed_out.discard(key)
+            for section in changes.rescanned:
+                if self._rescan.get(section, 0) <= changes.seq:
+                    self._rescan.pop(section, None)
+                self._handed_out_sections.add(section)
+            if changes.sessions_checked and self._sessions_touched <= changes.seq:
+                self._sessions_touched = 0
+
+    # --- Assembling persisted views ---
+
+    def snapshot(self, section: str, key: str) -> dict | None:
+        """Get the last saved dump of one entity.
+
+        Commits replace snapshot dicts rather than modifying them, so the
+        result stays valid after later saves; treat it as read-only.
+
+        Args:
+            section: Entity section name
+            key: Entity key within the section
+
+        Returns:
+            JSON-ready entity data, or None if the entity was never saved
+        """
+        with self._lock:
+            return self._snapshots[section].get(key)
+
+    def section_data(self, section: str, campaign: Campaign, changes: ChangeSet | None = None) -> dict[str, dict]:
+        """Build the serialized form of an entity section without re-dumping.
+
+        Unchanged entities come from the snapshot, changed ones from the
+        ChangeSet. Order follows the campaign dict.
+
+        Args:
+            section: Entity section name
+            campaign: Campaign providing the key order
+            changes: Pending changes to overlay on the snapshot
+
+        Returns:
+            Dictionary of key to JSON-ready entity data
+        """
+        with self._lock:
+            entities = getattr(campaign, section)
+            ensure_loaded = getattr(entities, "ensure_loaded", None)
+            if ensure_loaded is not None:
+                ensure_loaded()
+            snapshot = self._snapshots[section]
+            pending = changes.entities.get(section, {}) if changes else {}
+            result = {}
+            # list() copies the keys in one step, safe against a concurrent insert
+            for key in list(dict.keys(entities)):
+                data = pending.get(key)
+                if data is None:
+                    data = snapshot.get(key)
+                if data is None:
+                    # Never seen before (e.g. added without going through the dict)
+                    data = dict.__getitem__(entities, key).model_dump(mode='json')
+                result[key] = data
+            return result
+
+    def campaign_data(self, campaign: Campaign, changes: ChangeSet | None = None) -> dict[str, Any]:
+        """Build the full serialized campaign (monolithic layout) from snapshots.
+
+        Args:
+            campaign: Campaign being saved
+            changes: Pending changes to overlay on the snapshot
+
+        Returns:
+            Dictionary equivalent to ``campaign.model_dump(mode='json')``
+        """
+        with self._lock:
+            metadata = changes.metadata if changes and changes.metadata is not None else self._metadata
+            game_state = changes.game_state if changes and changes.game_state is not None else self._game_state
+            pending_sessions = changes.sessions if changes else {}
+
+            data: dict[str, Any] = {}
+            for name in type(campaign).model_fields:
+                if name in ENTITY_SECTIONS:
+                    data[name] = self.section_data(name, campaign, changes)
+                elif name == "sessions":
+                    data[name] = [
+                        pending_sessions.get(s.session_number) or self._sessions.get(s.session_number)
+                        or s.model_dump(mode='json')
+                        for s in campaign.sessions
+                    ]
+                elif name == "game_state":
+                    data[name] = game_state
+                else:
+                    data[name] = metadata.get(name)
+            return data
+
+    # --- Internals ---
+
+    def _collect_section(self, campaign: Campaign, section: str, changes: ChangeSet) -> None:
+        entities: dict = getattr(campaign, section)
+        snapshot = self._snapshots[section]
+
+        if section in self._rescan or section in self._handed_out_sections:
+            keys = set(dict.keys(entities)) | set(snapshot)
+            changes.rescanned.add(section)
+        else:
+            keys = set(self._touched[section]) | self._handed_out[section]
+        changes.checked[section] = set(keys)
+
+        for key in keys:
+            if dict.__contains__(entities, key):
+                data = dict.__getitem__(entities, key).model_dump(mode='json')
+                if snapshot.get(key) != data:
+                    changes.entities.setdefault(section, {})[key] = data
+            elif key in snapshot:
+                changes.entities.setdefault(section, {})[key] = None
+
+    def _is_tracked(self, campaign: Campaign, section: str) -> bool:
+        entities = getattr(campaign, section)
+        return isinstance(entities, TrackedEntities) and entities._tracker is self
+
+    def _wrap(self, campaign: Campaign, section: str) -> TrackedEntities:
+        entities = getattr(campaign, section)
+        if not (isinstance(entities, TrackedEntities) and entities._tracker is self):
+            entities = TrackedEntities(dict(entities), self, section)
+            setattr(campaign, section, entities)
+        return entities
+
+    def _dump_metadata(self, campaign: Campaign) -> dict:
+        fields = set(type(campaign).model_fields) - _NON_METADATA_FIELDS
+        return campaign.model_dump(mode='json', include=fields)
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def _mark_all(self) -> None:
+        seq = self._next_seq()
+        self._rescan.update(dict.fromkeys(ENTITY_SECTIONS, seq))
+        self._sessions_touched = seq
+
+    def _clear_touched(self) -> None:
+        for keys in self._touched.values():
+            keys.clear()
+        for keys in self._handed_out.values():
+            keys.clear()
+        self._rescan.clear()
+        self._handed_out_sections.clear()
+        self._sessions_touched = 0
@@ -11,9 +11,11 @@ import logging
 import re
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import AbstractSet
 from uuid import uuid4
 
-from .fact_database import FactDatabase
+from .fact_database import STOP_WORDS, FactDatabase, extract_keywords  # noqa: F401 (STOP_WORDS re-exported)
+from .journal import StoreJournal
 from .models import (
     Contradiction,
     ContradictionSeverity,
@@ -26,21 +28,6 @@ from .npc_knowledge import NPCKnowledgeTracker
 
 logger = logging.getLogger("dm20-protocol")
 
-# Stop words to filter out when extracting keywords
-STOP_WORDS = {
-    "a", "an", "the", "is", "was", "were", "are", "been", "be", "being",
-    "have", "has", "had", "do", "does", "did", "will", "would", "should",
-    "could", "may", "might", "must", "can", "to", "of", "in", "on", "at",
-    "by", "for", "with", "about", "as", "from", "into", "through", "during",
-    "before", "after", "above", "below", "between", "under", "again", "further",
-    "then", "once", "here", "there", "when", "where", "why", "how", "all",
-    "both", "each", "few", "more", "most", "other", "some", "such", "no",
-    "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s",
-    "t", "just", "now", "d", "ll", "m", "o", "re", "ve", "y", "ain", "aren",
-    "couldn", "didn", "doesn", "hadn", "hasn", "haven", "isn", "ma", "mightn",
-    "mustn", "needn", "shan", "shouldn", "wasn", "weren", "won", "wouldn"
-}
-
 # Negation pairs for contradiction detection
 NEGATION_PAIRS = [
     ("alive", "dead"),
@@ -80,6 +67,7 @@ class ContradictionDetector:
         self._npc_tracker = npc_tracker
         self._contradictions: list[Contradiction] = []
         self._campaign_path = campaign_path or fact_database.campaign_path
+        self._journal = StoreJournal(self._contradictions_path)
 
         # Ensure the campaign directory exists
         Path(self._campaign_path).mkdir(parents=True, exist_ok=True)
@@ -102,15 +90,9 @@ class ContradictionDetector:
         Returns:
             Set of lowercase keywords
         """
-        # Convert to lowercase and split on non-alphanumeric characters
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-
-        # Filter out stop words and short words
-        keywords = {word for word in words if word not in STOP_WORDS and len(word) > 2}
-
-        return keywords
+        return set(extract_keywords(text))
 
-    def _check_negation_conflict(self, keywords1: set[str], keywords2: set[str]) -> bool:
+    def _check_negation_conflict(self, keywords1: AbstractSet[str], keywords2: AbstractSet[str]) -> bool:
         """
         Check if two keyword sets contain negation pairs.
 
@@ -157,7 +139,9 @@ class ContradictionDetector:
         self,
         statement: str,
         fact_content: str,
-        category: FactCategory | None
+        category: FactCategory | None,
+        statement_keywords: set[str] | None = None,
+        fact_keywords: frozenset[str] | set[str] | None = None,
     ) -> tuple[ContradictionType, ContradictionSeverity]:
         """
         Classify the type and severity of a contradiction.
@@ -166,6 +150,8 @@ class ContradictionDetector:
             statement: The new statement
             fact_content: The conflicting fact content
             category: Category of the fact
+            statement_keywords: Keywords of the statement, if already extracted
+            fact_keywords: Keywords of the fact content, if already extracted
 
         Returns:
             Tuple of (ContradictionType, ContradictionSeverity)
@@ -186,8 +172,10 @@ class ContradictionDetector:
             contradiction_type = ContradictionType.FACTUAL
 
         # Determine severity based on negation strength and numeric conflicts
-        statement_keywords = self._extract_keywords(statement)
-        fact_keywords = self._extract_keywords(fact_content)
+        if statement_keywords is None:
+            statement_keywords = self._extract_keywords(statement)
+        if fact_keywords is None:
+            fact_keywords = self._extract_keywords(fact_content)
 
         has_negation = self._check_negation_conflict(statement_keywords, fact_keywords)
         has_numeric = self._detect_numeric_conflict(statement, fact_content, statement_keywords & fact_keywords)
@@ -214,8 +202,9 @@ class ContradictionDetector:
         Check a new statement against established facts.
 
         Strategy:
-        1. Query facts by category and tags to narrow search
-        2. Compare statement text against fact content using keyword overlap
+        1. Find facts sharing at least two keywords with the statement,
+           across the whole database, via the fact database's keyword index
+        2. Narrow them by category and tags
         3. Detect potential contradictions based on conflicting keywords
         4. Classify contradiction type and severity
 
@@ -237,12 +226,12 @@ class ContradictionDetector:
             logger.debug("No keywords extracted from statement, skipping check")
             return detected
 
-        # Query relevant facts
-        relevant_facts = self._fact_db.query_facts(
-            category=category,
-            tags=related_tags,
-            limit=100
-        )
+        # Only facts with enough keyword overlap can contradict the statement
+        relevant_facts = [
+            fact for fact in self._fact_db.find_by_keywords(statement_keywords, min_shared=2)
+            if (category is None or fact.category == category)
+            and (not related_tags or all(tag in fact.tags for tag in related_tags))
+        ]
 
         logger.debug(
             f"Checking statement against {len(relevant_facts)} facts "
@@ -251,13 +240,8 @@ class ContradictionDetector:
 
         # Check each fact for contradictions
         for fact in relevant_facts:
-            fact_keywords = self._extract_keywords(fact.content)
-
-            # Calculate keyword overlap
+            fact_keywords = self._fact_db.get_keywords(fact.id)
             common_keywords = statement_keywords & fact_keywords
-            if len(common_keywords) < 2:
-                # Not enough overlap to consider a contradiction
-                continue
 
             # Check for contradiction patterns
             has_negation = self._check_negation_conflict(statement_keywords, fact_keywords)
@@ -266,7 +250,7 @@ class ContradictionDetector:
             if has_negation or has_numeric:
                 # Contradiction detected
                 contradiction_type, severity = self._classify_contradiction(
-                    statement, fact.content, category
+                    statement, fact.content, category, statement_keywords, fact_keywords
                 )
 
                 contradiction = Contradiction(
@@ -281,6 +265,7 @@ class ContradictionDetector:
                 )
 
                 self._contradictions.append(contradiction)
+                self._journal.append("put", contradiction=contradiction)
                 detected.append(contradiction)
 
                 logger.warning(
@@ -326,37 +311,33 @@ class ContradictionDetector:
         npc_knowledge = self._npc_tracker.get_npc_knowledge(npc_id)
         known_fact_ids = {entry.fact_id for entry in npc_knowledge}
 
-        # Query all facts that might be referenced
-        all_facts = self._fact_db.query_facts(limit=1000)
+        # Facts with significant keyword overlap might be referenced
+        referenced_facts = self._fact_db.find_by_keywords(statement_keywords, min_shared=3)
 
-        for fact in all_facts:
+        for fact in referenced_facts:
             # Skip facts the NPC already knows
             if fact.id in known_fact_ids:
                 continue
 
-            fact_keywords = self._extract_keywords(fact.content)
-            common_keywords = statement_keywords & fact_keywords
-
-            # If there's significant overlap, NPC might be referencing this fact
-            if len(common_keywords) >= 3:
-                # NPC is referencing a fact they shouldn't know
-                contradiction = Contradiction(
-                    id=f"ctr_{uuid4().hex[:8]}",
-                    contradiction_type=ContradictionType.CHARACTER,
-                    severity=ContradictionSeverity.MODERATE,
-                    new_statement=f"NPC {npc_id}: {statement}",
-                    conflicting_fact_ids=[fact.id],
-                    detected_at=datetime.now(timezone.utc),
-                    session_number=session_number,
-                    resolved=False
-                )
+            # NPC is referencing a fact they shouldn't know
+            contradiction = Contradiction(
+                id=f"ctr_{uuid4().hex[:8]}",
+                contradiction_type=ContradictionType.CHARACTER,
+                severity=ContradictionSeverity.MODERATE,
+                new_statement=f"NPC {npc_id}: {statement}",
+                conflicting_fact_ids=[fact.id],
+                detected_at=datetime.now(timezone.utc),
+                session_number=session_number,
+                resolved=False
+            )
 
-                self._contradictions.append(contradiction)
-                detected.append(contradiction)
+            self._contradictions.append(contradiction)
+            self._journal.append("put", contradiction=contradiction)
+            detected.append(contradiction)
 
-                logger.warning(
-                    f"NPC {npc_id} referenced fact {fact.id} they shouldn't know"
-                )
+            logger.warning(
+                f"NPC {npc_id} referenced fact {fact.id} they shouldn't know"
+            )
 
         return detected
 
@@ -465,6 +446,7 @@ class ContradictionDetector:
                 contradiction.resolved = True
                 contradiction.resolution = strategy
                 contradiction.resolution_notes = notes
+                self._journal.append("put", contradiction=contradiction)
 
                 logger.info(
                     f"Resolved contradiction {contradiction_id} using {strategy.value}"
@@ -513,53 +495,49 @@ class ContradictionDetector:
         return self._contradictions.copy()
 
     def save(self) -> None:
-        """
-        Persist contradictions to contradictions.json.
-
-        Saves all contradictions with metadata about the last update time
-        and summary statistics.
-        """
+        """Persist contradictions to contradictions.json and its journal."""
         total_detected = len(self._contradictions)
         total_resolved = sum(1 for c in self._contradictions if c.resolved)
-
-        data = {
-            "version": "1.0",
-            "contradictions": [
-                c.model_dump(mode="json") for c in self._contradictions
-            ],
-            "metadata": {
-                "last_updated": datetime.now(timezone.utc).isoformat(),
-                "total_detected": total_detected,
-                "total_resolved": total_resolved
+        changes = self._journal.pending
+
+        def build_snapshot() -> dict:
+            return {
+                "version": "1.0",
+                "contradictions": [
+                    c.model_dump(mode="json") for c in self._contradictions
+                ],
+                "metadata": {
+                    "last_updated": datetime.now(timezone.utc).isoformat(),
+                    "total_detected": total_detected,
+                    "total_resolved": total_resolved
+                }
             }
-        }
 
-        with open(self._contradictions_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        logger.info(
-            f"Saved {total_detected} contradictions "
-            f"({total_resolved} resolved) to {self._contradictions_path}"
-        )
+        if self._journal.save(build_snapshot, live_items=total_detected):
+            logger.info(
+                f"Saved {total_detected} contradictions "
+                f"({total_resolved} resolved) to {self._contradictions_path}"
+            )
+        else:
+            logger.debug(f"Journaled {changes} contradiction changes to {self._journal.journal_path}")
 
     def load(self) -> None:
         """
-        Load contradictions from contradictions.json.
+        Load contradictions from contradictions.json and replay the journal.
 
         Handles missing files gracefully by initializing an empty list.
         If the file is corrupt or invalid, logs an error and starts with
         empty contradictions list.
         """
-        if not self._contradictions_path.exists():
-            logger.debug(
-                f"No existing contradictions at {self._contradictions_path}, starting empty"
-            )
-            self._contradictions = []
-            return
+        self._contradictions = []
 
         try:
-            with open(self._contradictions_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._journal.read_snapshot()
+            if data is None:
+                logger.debug(
+                    f"No existing contradictions at {self._contradictions_path}, starting empty"
+                )
+                return
 
             # Validate structure
             if not isinstance(data, dict) or "contradictions" not in data:
@@ -569,10 +547,11 @@ class ContradictionDetector:
             self._contradictions = [
                 Contradiction(**c_data) for c_data in data["contradictions"]
             ]
+            replayed = self._journal.replay(data.get("journal"), self._apply_record)
 
             logger.info(
                 f"Loaded {len(self._contradictions)} contradictions "
-                f"from {self._contradictions_path}"
+                f"from {self._contradictions_path} ({replayed} journaled changes)"
             )
 
         except (json.JSONDecodeError, ValueError, TypeError) as e:
@@ -582,6 +561,17 @@ class ContradictionDetector:
             logger.warning("Starting with empty contradictions list")
             self._contradictions = []
 
+    def _apply_record(self, record: dict) -> None:
+        """Apply one journal record to the contradiction list."""
+        if record["op"] != "put":
+            raise ValueError(f"Unknown journal operation {record['op']!r}")
+        contradiction = Contradiction(**record["contradiction"])
+        for i, existing in enumerate(self._contradictions):
+            if existing.id == contradiction.id:
+                self._contradictions[i] = contradiction
+                return
+        self._contradictions.append(contradiction)
+
 
 __all__ = [
     "ContradictionDetector",
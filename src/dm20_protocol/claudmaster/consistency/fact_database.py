@@ -3,19 +3,62 @@ Fact database for storing and querying narrative facts.
 
 This module provides the FactDatabase class, which manages a collection
 of narrative facts with support for querying, filtering, and persistence.
+The database keeps an inverted index from content keywords to fact IDs, so
+facts about the same things can be found without scanning every fact, and
+secondary indexes (category, session, tag and relevance order) that let
+query_facts answer filtered, limited queries without sorting every fact.
+Changes are persisted incrementally through a StoreJournal.
 """
 
+import heapq
 import json
 import logging
+import re
+from bisect import bisect_left, insort
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import uuid4
 
+from .journal import StoreJournal
 from .models import Fact, FactCategory
 
 logger = logging.getLogger("dm20-protocol")
 
+# Stop words to filter out when extracting keywords
+STOP_WORDS = {
+    "a", "an", "the", "is", "was", "were", "are", "been", "be", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "should",
+    "could", "may", "might", "must", "can", "to", "of", "in", "on", "at",
+    "by", "for", "with", "about", "as", "from", "into", "through", "during",
+    "before", "after", "above", "below", "between", "under", "again", "further",
+    "then", "once", "here", "there", "when", "where", "why", "how", "all",
+    "both", "each", "few", "more", "most", "other", "some", "such", "no",
+    "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s",
+    "t", "just", "now", "d", "ll", "m", "o", "re", "ve", "y", "ain", "aren",
+    "couldn", "didn", "doesn", "hadn", "hasn", "haven", "isn", "ma", "mightn",
+    "mustn", "needn", "shan", "shouldn", "wasn", "weren", "won", "wouldn"
+}
+
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+
+
+def extract_keywords(text: str) -> frozenset[str]:
+    """
+    Extract keywords from text by removing stop words and normalizing.
+
+    Args:
+        text: Text to extract keywords from
+
+    Returns:
+        Set of lowercase keywords (words of 3+ letters, stop words removed)
+    """
+    return frozenset(
+        word for word in _WORD_RE.findall(text.lower())
+        if word not in STOP_WORDS and len(word) > 2
+    )
+
 
 class FactDatabase:
     """
@@ -25,6 +68,10 @@ class FactDatabase:
     during gameplay, enabling agents to query past events, NPC information,
     and other narrative details to maintain consistency.
 
+    Facts must be added through add_fact (also to replace an edited fact),
+    relevance changed through update_relevance and tags added through
+    add_tag, so that the indexes stay current.
+
     Attributes:
         campaign_path: Path to the campaign directory
         facts: Dictionary mapping fact IDs to Fact objects
@@ -42,6 +89,21 @@ class FactDatabase:
         self.facts: dict[str, Fact] = {}
         self.campaign_id = self.campaign_path.name
 
+        # Keyword index: fact ID -> (indexed content, its keywords), keyword -> fact IDs
+        self._keywords: dict[str, tuple[str, frozenset[str]]] = {}
+        self._keyword_index: dict[str, set[str]] = {}
+
+        # Secondary indexes: posting lists per category, session and tag, and
+        # all facts ordered by (-relevance, -timestamp, insertion order)
+        self._by_category: dict[FactCategory, set[str]] = {}
+        self._by_session: dict[int, set[str]] = {}
+        self._by_tag: dict[str, set[str]] = {}
+        self._order: list[tuple[float, float, int, str]] = []
+        self._order_keys: dict[str, tuple[float, float, int, str]] = {}
+        self._next_position = 0
+
+        self._journal = StoreJournal(self._db_path)
+
         # Ensure the campaign directory exists
         self.campaign_path.mkdir(parents=True, exist_ok=True)
 
@@ -69,13 +131,130 @@ class FactDatabase:
         if not fact.id:
             fact.id = f"fact_{uuid4().hex[:8]}"
 
-        # Store the fact
+        # Store the fact (a replaced fact keeps its insertion position)
+        position = None
+        if fact.id in self.facts:
+            position = self._order_keys[fact.id][2]
+            self._unindex_fact(fact.id)
         self.facts[fact.id] = fact
+        self._index_fact(fact, position)
+        self._journal.append("put", fact=fact)
 
         logger.debug(f"Added fact {fact.id} ({fact.category}): {fact.content[:50]}...")
 
         return fact.id
 
+    def _index_fact(self, fact: Fact, position: Optional[int] = None) -> None:
+        """Add a fact to the keyword and secondary indexes."""
+        self._index_keywords(fact)
+        self._by_category.setdefault(fact.category, set()).add(fact.id)
+        self._by_session.setdefault(fact.session_number, set()).add(fact.id)
+        for tag in fact.tags:
+            self._by_tag.setdefault(tag, set()).add(fact.id)
+
+        if position is None:
+            position = self._next_position
+            self._next_position += 1
+        key = (-fact.relevance_score, -fact.timestamp.timestamp(), position, fact.id)
+        self._order_keys[fact.id] = key
+        insort(self._order, key)
+
+    def _index_keywords(self, fact: Fact) -> None:
+        """Add a fact's keywords to the keyword index."""
+        keywords = extract_keywords(fact.content)
+        self._keywords[fact.id] = (fact.content, keywords)
+        for keyword in keywords:
+            self._keyword_index.setdefault(keyword, set()).add(fact.id)
+
+    def _unindex_fact(self, fact_id: str) -> None:
+        """Remove a fact from the keyword and secondary indexes."""
+        self._unindex_keywords(fact_id)
+        fact = self.facts[fact_id]
+        _discard(self._by_category, fact.category, fact_id)
+        _discard(self._by_session, fact.session_number, fact_id)
+        for tag in fact.tags:
+            _discard(self._by_tag, tag, fact_id)
+
+        key = self._order_keys.pop(fact_id)
+        del self._order[bisect_left(self._order, key)]
+
+    def _unindex_keywords(self, fact_id: str) -> None:
+        """Remove a fact from the keyword index."""
+        _, keywords = self._keywords.pop(fact_id, ("", frozenset()))
+        for keyword in keywords:
+            _discard(self._keyword_index, keyword, fact_id)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all indexes from self.facts."""
+        self._keywords = {}
+        self._keyword_index = {}
+        self._by_category = {}
+        self._by_session = {}
+        self._by_tag = {}
+        self._order = []
+        self._order_keys = {}
+        self._next_position = 0
+        for fact in self.facts.values():
+            self._index_fact(fact)
+
+    def get_keywords(self, fact_id: str) -> frozenset[str]:
+        """
+        Get the keywords of a fact's content.
+
+        Keywords are extracted once per fact and cached; a fact whose
+        content was edited in place is re-indexed here.
+
+        Args:
+            fact_id: The ID of the fact
+
+        Returns:
+            The fact's keywords (empty if the fact is not found)
+        """
+        fact = self.facts.get(fact_id)
+        if fact is None:
+            return frozenset()
+        cached = self._keywords.get(fact_id)
+        if cached is None or cached[0] != fact.content:
+            self._unindex_keywords(fact_id)
+            self._index_keywords(fact)
+            cached = self._keywords[fact_id]
+        return cached[1]
+
+    def find_by_keywords(self, keywords: set[str] | frozenset[str], min_shared: int = 1) -> list[Fact]:
+        """
+        Find facts whose content shares keywords with the given set.
+
+        Uses the inverted keyword index, so only facts sharing keywords
+        are examined, however large the database.
+
+        Args:
+            keywords: Keywords to look for (see extract_keywords)
+            min_shared: Minimum number of shared keywords
+
+        Returns:
+            Matching facts, sorted by relevance (highest first), then newest first
+        """
+        postings = [self._keyword_index[k] for k in keywords if k in self._keyword_index]
+        if len(postings) < min_shared:
+            return []
+
+        if min_shared <= 1:
+            candidates = set().union(*postings)
+        else:
+            # A fact sharing 2+ keywords is in the intersection of two posting lists
+            postings.sort(key=len)
+            candidates = set()
+            for i, first in enumerate(postings):
+                for second in postings[i + 1:]:
+                    candidates |= first & second
+
+        results = [
+            self.facts[fact_id] for fact_id in candidates
+            if fact_id in self.facts and len(self.get_keywords(fact_id) & keywords) >= min_shared
+        ]
+        results.sort(key=lambda f: (-f.relevance_score, -f.timestamp.timestamp()))
+        return results
+
     def get_fact(self, fact_id: str) -> Optional[Fact]:
         """
         Retrieve a specific fact by ID.
@@ -102,6 +281,11 @@ class FactDatabase:
         Filters are combined with AND logic. Results are sorted by
         relevance score (descending) and limited to the specified count.
 
+        The most selective posting list among the category, session and
+        tag filters is ranked directly when it is small; otherwise facts
+        are streamed in relevance order and the scan stops once ``limit``
+        matches are found or relevance drops below ``min_relevance``.
+
         Args:
             category: Filter by fact category
             session: Filter by session number
@@ -112,31 +296,45 @@ class FactDatabase:
         Returns:
             List of matching facts, sorted by relevance (highest first)
         """
-        results = list(self.facts.values())
-
-        # Apply category filter
+        def matches(fact: Fact) -> bool:
+            return (
+                (category is None or fact.category == category)
+                and (session is None or fact.session_number == session)
+                and fact.relevance_score >= min_relevance
+                and (not tags or all(tag in fact.tags for tag in tags))
+            )
+
+        # Pick the smallest posting list among the filters
+        postings: list[set[str]] = []
         if category is not None:
-            results = [f for f in results if f.category == category]
-
-        # Apply session filter
+            postings.append(self._by_category.get(category, set()))
         if session is not None:
-            results = [f for f in results if f.session_number == session]
-
-        # Apply relevance filter
-        results = [f for f in results if f.relevance_score >= min_relevance]
-
-        # Apply tags filter (fact must have ALL specified tags)
-        if tags:
-            results = [
-                f for f in results
-                if all(tag in f.tags for tag in tags)
-            ]
-
-        # Sort by relevance (highest first), then by timestamp (newest first)
-        results.sort(key=lambda f: (-f.relevance_score, -f.timestamp.timestamp()))
-
-        # Apply limit
-        return results[:limit]
+            postings.append(self._by_session.get(session, set()))
+        for tag in tags or ():
+            postings.append(self._by_tag.get(tag, set()))
+        candidates = min(postings, key=len) if postings else None
+
+        # Ranking C candidates costs about C steps; streaming in relevance
+        # order examines about limit * N / C facts before finding limit matches
+        if candidates is not None and len(candidates) ** 2 <= max(limit, 1) * len(self.facts):
+            keys = (self._order_keys[fact_id] for fact_id in candidates if matches(self.facts[fact_id]))
+            ranked = heapq.nsmallest(limit, keys) if limit >= 0 else sorted(keys)[:limit]
+            return [self.facts[key[3]] for key in ranked]
+
+        streamed = (
+            self.facts[fact_id] for fact_id in self._iter_by_relevance(min_relevance)
+            if (candidates is None or fact_id in candidates) and matches(self.facts[fact_id])
+        )
+        if limit < 0:
+            return list(streamed)[:limit]
+        return list(islice(streamed, limit))
+
+    def _iter_by_relevance(self, min_relevance: float) -> Iterator[str]:
+        """Yield fact IDs by relevance (highest first) down to ``min_relevance``."""
+        for neg_relevance, _, _, fact_id in self._order:
+            if -neg_relevance < min_relevance:
+                return
+            yield fact_id
 
     def get_related_facts(self, fact_id: str) -> list[Fact]:
         """
@@ -174,11 +372,43 @@ class FactDatabase:
         if fact_id not in self.facts:
             raise KeyError(f"Fact {fact_id} not found in database")
 
-        old_score = self.facts[fact_id].relevance_score
-        self.facts[fact_id].relevance_score = new_score
+        fact = self.facts[fact_id]
+        old_score = fact.relevance_score
+        old_key = self._order_keys[fact_id]
+        del self._order[bisect_left(self._order, old_key)]
+        fact.relevance_score = new_score
+        key = (-new_score, *old_key[1:])
+        self._order_keys[fact_id] = key
+        insort(self._order, key)
+        self._journal.append("relevance", fact_id=fact_id, score=new_score)
 
         logger.debug(f"Updated relevance for {fact_id}: {old_score} -> {new_score}")
 
+    def add_tag(self, fact_id: str, tag: str) -> bool:
+        """
+        Add a tag to a fact.
+
+        Args:
+            fact_id: The ID of the fact to tag
+            tag: The tag to add
+
+        Returns:
+            True if the tag was added, False if the fact already had it
+
+        Raises:
+            KeyError: If the fact ID is not found
+        """
+        if fact_id not in self.facts:
+            raise KeyError(f"Fact {fact_id} not found in database")
+
+        fact = self.facts[fact_id]
+        if tag in fact.tags:
+            return False
+        fact.tags.append(tag)
+        self._by_tag.setdefault(tag, set()).add(fact_id)
+        self._journal.append("tag", fact_id=fact_id, tag=tag)
+        return True
+
     def link_facts(self, fact_id_1: str, fact_id_2: str) -> None:
         """
         Create a bidirectional link between two facts.
@@ -205,64 +435,99 @@ class FactDatabase:
         if fact_id_1 not in self.facts[fact_id_2].related_facts:
             self.facts[fact_id_2].related_facts.append(fact_id_1)
 
+        self._journal.append("link", fact_ids=[fact_id_1, fact_id_2])
         logger.debug(f"Linked facts {fact_id_1} <-> {fact_id_2}")
 
     def save(self) -> None:
-        """
-        Persist facts to fact_database.json.
-
-        The database is saved as a JSON file with metadata about
-        the total number of facts and last update time.
-        """
-        data = {
-            "version": "1.0",
-            "campaign_id": self.campaign_id,
-            "facts": [fact.model_dump(mode="json") for fact in self.facts.values()],
-            "metadata": {
-                "total_facts": len(self.facts),
-                "last_updated": datetime.now().isoformat()
+        """Persist facts to fact_database.json and its journal."""
+        changes = self._journal.pending
+
+        def build_snapshot() -> dict:
+            return {
+                "version": "1.0",
+                "campaign_id": self.campaign_id,
+                "facts": [fact.model_dump(mode="json") for fact in self.facts.values()],
+                "metadata": {
+                    "total_facts": len(self.facts),
+                    "last_updated": datetime.now().isoformat()
+                }
             }
-        }
-
-        with open(self._db_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
 
-        logger.info(f"Saved {len(self.facts)} facts to {self._db_path}")
+        if self._journal.save(build_snapshot, live_items=len(self.facts)):
+            logger.info(f"Saved {len(self.facts)} facts to {self._db_path}")
+        else:
+            logger.debug(f"Journaled {changes} fact changes to {self._journal.journal_path}")
 
     def load(self) -> None:
         """
-        Load facts from fact_database.json.
+        Load facts from fact_database.json and replay the journal.
 
         If the file doesn't exist, initializes an empty database.
         If the file is corrupt or invalid, logs an error and starts with an empty database.
         """
-        if not self._db_path.exists():
-            logger.debug(f"No existing fact database at {self._db_path}, starting empty")
-            self.facts = {}
-            return
-
+        self.facts = {}
         try:
-            with open(self._db_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._journal.read_snapshot()
+            if data is None:
+                logger.debug(f"No existing fact database at {self._db_path}, starting empty")
+                self._rebuild_indexes()
+                return
 
             # Validate structure
             if not isinstance(data, dict) or "facts" not in data:
                 raise ValueError("Invalid database structure")
 
             # Load facts
-            self.facts = {}
             for fact_data in data["facts"]:
                 fact = Fact(**fact_data)
                 self.facts[fact.id] = fact
+            replayed = self._journal.replay(data.get("journal"), self._apply_record)
+            self._rebuild_indexes()
 
-            logger.info(f"Loaded {len(self.facts)} facts from {self._db_path}")
+            logger.info(
+                f"Loaded {len(self.facts)} facts from {self._db_path} "
+                f"({replayed} journaled changes)"
+            )
 
         except (json.JSONDecodeError, ValueError, TypeError) as e:
             logger.error(f"Failed to load fact database from {self._db_path}: {e}")
             logger.warning("Starting with empty fact database")
             self.facts = {}
+            self._rebuild_indexes()
+
+    def _apply_record(self, record: dict) -> None:
+        """Apply one journal record to self.facts (indexes are rebuilt after replay)."""
+        op = record["op"]
+        if op == "put":
+            fact = Fact(**record["fact"])
+            self.facts[fact.id] = fact
+        elif op == "relevance":
+            self.facts[record["fact_id"]].relevance_score = record["score"]
+        elif op == "tag":
+            tags = self.facts[record["fact_id"]].tags
+            if record["tag"] not in tags:
+                tags.append(record["tag"])
+        elif op == "link":
+            first, second = (self.facts[fact_id] for fact_id in record["fact_ids"])
+            if second.id not in first.related_facts:
+                first.related_facts.append(second.id)
+            if first.id not in second.related_facts:
+                second.related_facts.append(first.id)
+        else:
+            raise ValueError(f"Unknown journal operation {op!r}")
+
+
+def _discard(index: dict, key: object, fact_id: str) -> None:
+    """Remove a fact ID from a posting list, dropping the list when empty."""
+    fact_ids = index.get(key)
+    if fact_ids is not None:
+        fact_ids.discard(fact_id)
+        if not fact_ids:
+            del index[key]
 
 
 __all__ = [
     "FactDatabase",
+    "STOP_WORDS",
+    "extract_keywords",
 ]
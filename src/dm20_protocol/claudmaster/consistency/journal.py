@@ -0,0 +1,244 @@
+"""
+Append-only journal for the consistency stores.
+
+Each store (facts, NPC knowledge, timeline, location state, contradictions,
+party knowledge) persists to a JSON snapshot plus a JSON Lines journal next
+to it (``fact_database.json`` and ``fact_database.journal.jsonl``). Saving
+appends one record per change made since the last save instead of
+rewriting the whole file; once the journal holds as many records as the
+store holds items, the next save compacts it into a fresh snapshot.
+
+Crash consistency:
+- every snapshot gets a new token, written to the journal's header line;
+  records are only replayed after a header matching the loaded snapshot,
+  so a crash between writing a snapshot and resetting the journal cannot
+  replay records that the snapshot already contains
+- snapshots are written to a temporary file and renamed into place
+- a torn or corrupt record ends replay; it and anything after it are
+  truncated before the next append
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+logger = logging.getLogger("dm20-protocol")
+
+# Journal records written before the first compaction is considered
+DEFAULT_COMPACT_AFTER = 256
+
+
+def _encode(value: Any) -> Any:
+    """JSON encoder for models queued in records and snapshot fallbacks."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+class StoreJournal:
+    """
+    Snapshot file and append-only change journal of one store.
+
+    The store queues a record for each change with ``append``, applies
+    records in ``load`` through ``replay``, and calls ``save`` with a
+    function building its full snapshot, which is only called when the
+    journal is due for compaction.
+
+    Args:
+        snapshot_path: Path of the store's JSON snapshot
+        compact_after: Journal records always allowed before compacting
+
+    Usage:
+        journal = StoreJournal(campaign_path / "timeline.json")
+        data = journal.read_snapshot()  # None if missing
+        journal.replay(data.get("journal"), apply_record)
+        journal.append("event", event=event)
+        journal.save(build_snapshot, live_items=len(events))
+    """
+
+    def __init__(self, snapshot_path: Path, compact_after: int = DEFAULT_COMPACT_AFTER) -> None:
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(f"{self.snapshot_path.stem}.journal.jsonl")
+        self.compact_after = compact_after
+        self._token: Optional[str] = None
+        self._pending: list[dict[str, Any]] = []
+        self._record_count = 0
+        # Bytes of the journal holding a matching header and whole records;
+        # 0 means the journal must be reset before appending
+        self._valid_size = 0
+
+    @property
+    def pending(self) -> int:
+        """Records queued since the last save."""
+        return len(self._pending)
+
+    @property
+    def record_count(self) -> int:
+        """Records in the journal since the last snapshot."""
+        return self._record_count
+
+    def append(self, op: str, **fields: Any) -> None:
+        """
+        Queue a change record for the next save.
+
+        Model values are serialized when the record is written, so they
+        capture the state at save time.
+
+        Args:
+            op: Operation name understood by the store's replay function
+            **fields: Record fields
+        """
+        self._pending.append({"op": op, **fields})
+
+    def read_snapshot(self) -> Optional[Any]:
+        """
+        Read the snapshot file.
+
+        Returns:
+            The parsed snapshot, or None if there is none
+
+        Raises:
+            json.JSONDecodeError: If the snapshot is corrupt
+        """
+        self._token = None
+        self._pending = []
+        self._record_count = 0
+        self._valid_size = 0
+        if not self.snapshot_path.exists():
+            return None
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def replay(self, token: Optional[str], apply: Callable[[dict[str, Any]], None]) -> int:
+        """
+        Apply the journal records written after the loaded snapshot.
+
+        Args:
+            token: Journal token stored in the snapshot (None for snapshots
+                written before journaling, whose journal is ignored)
+            apply: Function applying one record to the store
+
+        Returns:
+            Number of records applied
+        """
+        self._token = token
+        if token is None or not self.journal_path.exists():
+            return 0
+
+        with open(self.journal_path, "rb") as f:
+            content = f.read()
+
+        records: list[dict[str, Any]] = []
+        offset = 0
+        header_seen = False
+        while offset < len(content):
+            end = content.find(b"\n", offset)
+            if end == -1:
+                logger.warning(f"Ignoring torn last record in {self.journal_path}")
+                break
+            try:
+                record = json.loads(content[offset:end])
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Ignoring corrupt records from byte {offset} of {self.journal_path}")
+                break
+            if not isinstance(record, dict):
+                logger.warning(f"Ignoring corrupt records from byte {offset} of {self.journal_path}")
+                break
+            if not header_seen:
+                if record.get("journal") != token:
+                    logger.debug(f"Journal {self.journal_path} predates the snapshot, ignoring it")
+                    return 0
+                header_seen = True
+            else:
+                records.append(record)
+            offset = end + 1
+        self._valid_size = offset if header_seen else 0
+
+        applied = 0
+        for record in records:
+            try:
+                apply(record)
+                applied += 1
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Skipping invalid {record.get('op')} record in {self.journal_path}: {e}")
+        self._record_count = len(records)
+        return applied
+
+    def save(self, build_snapshot: Callable[[], dict[str, Any]], live_items: int) -> bool:
+        """
+        Persist queued changes, compacting into a snapshot when due.
+
+        A snapshot is written when there is none yet, or when the journal
+        would hold at least ``max(compact_after, live_items)`` records.
+
+        Args:
+            build_snapshot: Function returning the store's full snapshot
+            live_items: Number of items in the store
+
+        Returns:
+            True if a snapshot was written, False if records were appended
+        """
+        if self._token is None or self._record_count + len(self._pending) >= max(self.compact_after, live_items):
+            self.write_snapshot(build_snapshot())
+            return True
+        self._write_records()
+        return False
+
+    def write_snapshot(self, data: dict[str, Any]) -> None:
+        """Write a full snapshot and start an empty journal after it."""
+        token = uuid4().hex[:12]
+        data = {**data, "journal": token}
+
+        tmp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=_encode)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        self._token = token
+        self._pending = []
+        self._record_count = 0
+        self._valid_size = 0
+        self._write_lines([])
+
+    def _write_records(self) -> None:
+        """Append the queued records to the journal."""
+        if not self._pending:
+            return
+        lines = [json.dumps(record, ensure_ascii=False, default=_encode) for record in self._pending]
+        self._write_lines(lines)
+        self._record_count += len(lines)
+        self._pending = []
+
+    def _write_lines(self, lines: list[str]) -> None:
+        """Append lines after the valid part of the journal, resetting it if needed."""
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        if self._valid_size == 0 or not self.journal_path.exists():
+            data = (json.dumps({"journal": self._token}) + "\n").encode("utf-8") + data
+            with open(self.journal_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._valid_size = len(data)
+            return
+
+        with open(self.journal_path, "r+b") as f:
+            # Drop a torn tail left by a crash before appending
+            f.truncate(self._valid_size)
+            f.seek(self._valid_size)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._valid_size += len(data)
+
+
+__all__ = [
+    "DEFAULT_COMPACT_AFTER",
+    "StoreJournal",
+]
@@ -12,15 +12,16 @@ Key components:
 - LocationStateManager: Manager for all location states in a campaign
 """
 
-import json
 import logging
+from bisect import bisect_left, insort
+from enum import Enum
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
-from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from .journal import StoreJournal
 from .timeline import GameTime
 
 logger = logging.getLogger("dm20-protocol")
@@ -91,6 +92,61 @@ class LocationState(BaseModel):
     last_visited: Optional[GameTime] = None
 
 
+_DOOR_CHANGES = frozenset({
+    StateChangeType.DOOR_OPENED, StateChangeType.DOOR_BROKEN, StateChangeType.DOOR_LOCKED,
+})
+_TRAP_DISABLING_CHANGES = frozenset({StateChangeType.TRAP_TRIGGERED, StateChangeType.TRAP_DISARMED})
+
+
+class _LocationView:
+    """
+    Materialized current state of one location.
+
+    Derived from the location's change history and kept current by
+    LocationStateManager as changes are recorded and reverted, so state
+    queries do not walk the history.
+    """
+
+    __slots__ = ("door_changes", "disabled_traps", "collected_loot", "changes_by_id", "timeline")
+
+    def __init__(self, loc: LocationState) -> None:
+        # Door -> its non-reverted door changes, oldest first (the last one decides)
+        self.door_changes: dict[Optional[str], list[StateChange]] = {}
+        # Trap/loot -> number of non-reverted triggered/disarmed or collected changes
+        self.disabled_traps: dict[Optional[str], int] = {}
+        self.collected_loot: dict[Optional[str], int] = {}
+        self.changes_by_id: dict[str, StateChange] = {}
+        # (total minutes, position in state_changes) of every change, sorted
+        self.timeline: list[tuple[int, int]] = []
+        for position, change in enumerate(loc.state_changes):
+            self.add(change, position)
+
+    def add(self, change: StateChange, position: int) -> None:
+        """Account for a change recorded at ``position`` in the history."""
+        self.changes_by_id.setdefault(change.id, change)
+        insort(self.timeline, (change.game_time._to_total_minutes(), position))
+        if not change.reverted:
+            self._apply(change, +1)
+
+    def revert(self, change: StateChange) -> None:
+        """Account for a change that was just reverted."""
+        self._apply(change, -1)
+
+    def _apply(self, change: StateChange, delta: int) -> None:
+        target = change.target_object
+        if change.change_type in _DOOR_CHANGES:
+            changes = self.door_changes.setdefault(target, [])
+            if delta > 0:
+                changes.append(change)
+            else:
+                # By identity: equal changes may have been recorded twice
+                del changes[next(i for i, c in enumerate(changes) if c is change)]
+        elif change.change_type in _TRAP_DISABLING_CHANGES:
+            self.disabled_traps[target] = self.disabled_traps.get(target, 0) + delta
+        elif change.change_type == StateChangeType.LOOT_COLLECTED:
+            self.collected_loot[target] = self.collected_loot.get(target, 0) + delta
+
+
 class LocationStateManager:
     """
     Manages persistent state changes for locations.
@@ -100,9 +156,15 @@ class LocationStateManager:
     collected loot. This ensures consistency across sessions and prevents
     contradictions like encountering the same loot twice.
 
+    The current state of each location (door, trap and loot status, and a
+    time index of its changes) is materialized as changes are recorded and
+    reverted, so state queries do not walk the history. Record and revert
+    changes through the manager rather than editing them in place.
+
     Attributes:
         campaign_path: Path to campaign directory for persistence
         _locations: Dictionary mapping location IDs to LocationState objects
+        _views: Materialized current state of each location
     """
 
     def __init__(self, campaign_path: Path):
@@ -114,6 +176,8 @@ class LocationStateManager:
         """
         self.campaign_path = Path(campaign_path)
         self._locations: dict[str, LocationState] = {}
+        self._views: dict[str, _LocationView] = {}
+        self._journal = StoreJournal(self.campaign_path / "location_state.json")
         self.campaign_path.mkdir(parents=True, exist_ok=True)
         self.load()
 
@@ -131,8 +195,16 @@ class LocationStateManager:
         """
         if location_id not in self._locations:
             self._locations[location_id] = LocationState(location_id=location_id)
+            self._journal.append("location", location_id=location_id)
         return self._locations[location_id]
 
+    def _view(self, location_id: str) -> _LocationView:
+        """Get the materialized state of a location, creating the location if needed."""
+        view = self._views.get(location_id)
+        if view is None:
+            view = self._views[location_id] = _LocationView(self._ensure_location(location_id))
+        return view
+
     def get_location_state(self, location_id: str) -> LocationState:
         """
         Get the state of a location.
@@ -156,10 +228,13 @@ class LocationStateManager:
         Returns:
             The change's ID (auto-generated if not provided)
         """
-        loc = self._ensure_location(location_id)
+        view = self._view(location_id)
+        loc = self._locations[location_id]
         if not change.id:
             change.id = f"sc_{uuid4().hex[:8]}"
         loc.state_changes.append(change)
+        view.add(change, len(loc.state_changes) - 1)
+        self._journal.append("change", location_id=location_id, change=change)
         logger.debug(f"Recorded {change.change_type} in {location_id}: {change.description}")
         return change.id
 
@@ -176,14 +251,9 @@ class LocationStateManager:
         Returns:
             True if door is open, False otherwise (default: closed)
         """
-        loc = self._ensure_location(location_id)
-        # Find the latest door state change for this door
-        for change in reversed(loc.state_changes):
-            if change.target_object == door_id and not change.reverted:
-                if change.change_type in (StateChangeType.DOOR_OPENED, StateChangeType.DOOR_BROKEN):
-                    return True
-                if change.change_type == StateChangeType.DOOR_LOCKED:
-                    return False
+        changes = self._view(location_id).door_changes.get(door_id)
+        if changes:
+            return changes[-1].change_type != StateChangeType.DOOR_LOCKED
         return False  # Default: doors are closed
 
     def is_trap_active(self, location_id: str, trap_id: str) -> bool:
@@ -197,12 +267,7 @@ class LocationStateManager:
         Returns:
             True if trap is active, False if triggered/disarmed (default: active)
         """
-        loc = self._ensure_location(location_id)
-        for change in reversed(loc.state_changes):
-            if change.target_object == trap_id and not change.reverted:
-                if change.change_type in (StateChangeType.TRAP_TRIGGERED, StateChangeType.TRAP_DISARMED):
-                    return False
-        return True  # Default: traps are active
+        return not self._view(location_id).disabled_traps.get(trap_id)
 
     def is_loot_collected(self, location_id: str, loot_id: str) -> bool:
         """
@@ -215,13 +280,7 @@ class LocationStateManager:
         Returns:
             True if loot has been collected, False otherwise
         """
-        loc = self._ensure_location(location_id)
-        for change in loc.state_changes:
-            if (change.target_object == loot_id and
-                change.change_type == StateChangeType.LOOT_COLLECTED and
-                not change.reverted):
-                return True
-        return False
+        return bool(self._view(location_id).collected_loot.get(loot_id))
 
     def get_changes_since(self, location_id: str, game_time: GameTime) -> list[StateChange]:
         """
@@ -235,8 +294,10 @@ class LocationStateManager:
             List of state changes at or after the threshold
         """
         loc = self._ensure_location(location_id)
-        threshold = game_time._to_total_minutes()
-        return [c for c in loc.state_changes if c.game_time._to_total_minutes() >= threshold]
+        timeline = self._view(location_id).timeline
+        start = bisect_left(timeline, (game_time._to_total_minutes(), -1))
+        positions = sorted(position for _, position in timeline[start:])
+        return [loc.state_changes[position] for position in positions]
 
     def revert_change(self, location_id: str, change_id: str) -> bool:
         """
@@ -251,15 +312,18 @@ class LocationStateManager:
         Returns:
             True if successfully reverted, False if not found or irreversible
         """
-        loc = self._ensure_location(location_id)
-        for change in loc.state_changes:
-            if change.id == change_id:
-                if not change.reversible:
-                    logger.warning(f"Cannot revert irreversible change {change_id}")
-                    return False
+        view = self._view(location_id)
+        change = view.changes_by_id.get(change_id)
+        if change is not None:
+            if not change.reversible:
+                logger.warning(f"Cannot revert irreversible change {change_id}")
+                return False
+            if not change.reverted:
                 change.reverted = True
-                logger.info(f"Reverted change {change_id} in {location_id}")
-                return True
+                view.revert(change)
+            self._journal.append("revert", location_id=location_id, change_id=change_id)
+            logger.info(f"Reverted change {change_id} in {location_id}")
+            return True
         logger.warning(f"Change {change_id} not found in {location_id}")
         return False
 
@@ -278,6 +342,7 @@ class LocationStateManager:
         if loc.first_visited is None:
             loc.first_visited = game_time
         loc.last_visited = game_time
+        self._journal.append("visit", location_id=location_id, game_time=game_time)
         logger.debug(f"Marked {location_id} as visited at {game_time.to_string('short')}")
 
     def get_location_summary(self, location_id: str) -> dict:
@@ -312,36 +377,67 @@ class LocationStateManager:
         return len(self._locations)
 
     def save(self) -> None:
-        """Persist location states to location_state.json."""
-        data = {
-            "version": "1.0",
-            "locations": {
-                lid: loc.model_dump() for lid, loc in self._locations.items()
-            },
-        }
-        path = self.campaign_path / "location_state.json"
-        path.write_text(json.dumps(data, indent=2, default=str))
-        logger.info(f"Saved state for {len(self._locations)} locations to {path}")
+        """Persist location states to location_state.json and its journal."""
+        changes = self._journal.pending
+
+        def build_snapshot() -> dict:
+            return {
+                "version": "1.0",
+                "locations": {
+                    lid: loc.model_dump() for lid, loc in self._locations.items()
+                },
+            }
+
+        live_items = len(self._locations) + sum(len(loc.state_changes) for loc in self._locations.values())
+        if self._journal.save(build_snapshot, live_items=live_items):
+            logger.info(f"Saved state for {len(self._locations)} locations to {self._journal.snapshot_path}")
+        else:
+            logger.debug(f"Journaled {changes} location changes to {self._journal.journal_path}")
 
     def load(self) -> None:
         """
-        Load location states from location_state.json.
+        Load location states from location_state.json and replay the journal.
 
         If the file doesn't exist, initializes with no locations.
         If the file is corrupt, logs a warning and starts fresh.
         """
-        path = self.campaign_path / "location_state.json"
-        if not path.exists():
-            logger.debug(f"No existing location state at {path}, starting fresh")
-            return
+        path = self._journal.snapshot_path
         try:
-            data = json.loads(path.read_text())
+            data = self._journal.read_snapshot()
+            if data is None:
+                logger.debug(f"No existing location state at {path}, starting fresh")
+                return
             for lid, loc_data in data.get("locations", {}).items():
                 self._locations[lid] = LocationState(**loc_data)
-            logger.info(f"Loaded state for {len(self._locations)} locations from {path}")
+            replayed = self._journal.replay(data.get("journal"), self._apply_record)
+            self._views = {}
+            logger.info(
+                f"Loaded state for {len(self._locations)} locations from {path} "
+                f"({replayed} journaled changes)"
+            )
         except Exception as e:
             logger.warning(f"Failed to load location state: {e}")
 
+    def _apply_record(self, record: dict) -> None:
+        """Apply one journal record to the location states."""
+        op = record["op"]
+        location_id = record["location_id"]
+        loc = self._locations.setdefault(location_id, LocationState(location_id=location_id))
+        if op == "change":
+            loc.state_changes.append(StateChange(**record["change"]))
+        elif op == "revert":
+            for change in loc.state_changes:
+                if change.id == record["change_id"]:
+                    change.reverted = True
+        elif op == "visit":
+            game_time = GameTime(**record["game_time"])
+            loc.visited = True
+            if loc.first_visited is None:
+                loc.first_visited = game_time
+            loc.last_visited = game_time
+        elif op != "location":
+            raise ValueError(f"Unknown journal operation {op!r}")
+
 
 __all__ = [
     "StateChangeType",
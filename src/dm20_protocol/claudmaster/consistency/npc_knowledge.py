@@ -8,10 +8,12 @@ with players, and enables knowledge propagation between NPCs.
 
 import json
 import logging
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .fact_database import FactDatabase
+from .journal import StoreJournal
 from .models import KnowledgeEntry, KnowledgeSource, PlayerInteraction
 
 logger = logging.getLogger("dm20-protocol")
@@ -30,6 +32,8 @@ class NPCKnowledgeTracker:
         _campaign_path: Path to the campaign directory
         _npc_knowledge: Mapping of NPC ID to list of knowledge entries
         _npc_interactions: Mapping of NPC ID to list of player interactions
+        _facts_by_npc: Index of the fact IDs each NPC knows
+        _npcs_by_fact: Index of the NPC IDs knowing each fact
     """
 
     def __init__(self, fact_database: FactDatabase, campaign_path: Path) -> None:
@@ -44,6 +48,11 @@ class NPCKnowledgeTracker:
         self._campaign_path = Path(campaign_path)
         self._npc_knowledge: dict[str, list[KnowledgeEntry]] = {}
         self._npc_interactions: dict[str, list[PlayerInteraction]] = {}
+        self._facts_by_npc: dict[str, set[str]] = {}
+        self._npcs_by_fact: dict[str, set[str]] = {}
+        # Position of each NPC in _npc_knowledge, to list NPCs in that order
+        self._npc_positions: dict[str, int] = {}
+        self._journal = StoreJournal(self._knowledge_path)
 
         # Ensure the campaign directory exists
         self._campaign_path.mkdir(parents=True, exist_ok=True)
@@ -79,8 +88,7 @@ class NPCKnowledgeTracker:
         Returns:
             True if the NPC knows this fact, False otherwise
         """
-        knowledge = self._npc_knowledge.get(npc_id, [])
-        return any(entry.fact_id == fact_id for entry in knowledge)
+        return fact_id in self._facts_by_npc.get(npc_id, ())
 
     def add_knowledge(
         self,
@@ -124,6 +132,8 @@ class NPCKnowledgeTracker:
             self._npc_knowledge[npc_id] = []
 
         self._npc_knowledge[npc_id].append(entry)
+        self._index_entry(npc_id, entry)
+        self._journal.append("knowledge", npc_id=npc_id, entry=entry)
 
         logger.debug(
             f"Added knowledge to {npc_id}: fact {fact_id} via {source} "
@@ -177,8 +187,7 @@ class NPCKnowledgeTracker:
             fact_ids: List of fact IDs to propagate
             session: Session number when propagation occurred
         """
-        from_knowledge = self.get_npc_knowledge(from_npc)
-        known_fact_ids = {entry.fact_id for entry in from_knowledge}
+        known_fact_ids = self._facts_by_npc.get(from_npc, set())
 
         for fact_id in fact_ids:
             # Only propagate if from_npc actually knows this fact
@@ -201,6 +210,85 @@ class NPCKnowledgeTracker:
 
         logger.debug(f"Propagated knowledge from {from_npc} to {to_npc} (session {session})")
 
+    def spread_knowledge(
+        self,
+        from_npcs: list[str],
+        fact_ids: list[str],
+        relationships: Mapping[str, Iterable[str]],
+        session: int,
+        max_hops: int | None = None
+    ) -> dict[str, list[str]]:
+        """
+        Spread facts through an NPC relationship graph in one breadth-first pass.
+
+        Starting from from_npcs, NPCs tell the facts they know (among
+        fact_ids) to every NPC they are related to, as with
+        propagate_knowledge. Facts move one hop per round: what each NPC
+        tells in a round is fixed before the round starts, so a fact heard
+        during a round is passed on in the next one. An NPC first reached in
+        a round also passes on what it already knew. NPCs close to the
+        source hear a fact first and credit the nearest teller, and no fact
+        travels more than max_hops from the sources.
+
+        Args:
+            from_npcs: NPC IDs where the rumor starts
+            fact_ids: Fact IDs being spread
+            relationships: NPC ID -> IDs of the NPCs it talks to (for
+                example the keys of NPC.relationships); use both directions
+                for mutual relationships
+            session: Session number when propagation occurred
+            max_hops: Maximum number of retellings from the sources
+                (default: no limit)
+
+        Returns:
+            Mapping of NPC ID to the fact IDs it newly learned, in the
+            order NPCs were reached
+        """
+        fact_ids = list(dict.fromkeys(fact_ids))
+        learned: dict[str, list[str]] = {}
+        reached = set(from_npcs)
+        # NPC -> facts it tells in the coming round (dicts as ordered sets)
+        frontier: dict[str, dict[str, None]] = {
+            npc: self._known_among(npc, fact_ids) for npc in dict.fromkeys(from_npcs)
+        }
+        hops = 0
+
+        while frontier and (max_hops is None or hops < max_hops):
+            hops += 1
+            next_frontier: dict[str, dict[str, None]] = {}
+            for teller, telling in frontier.items():
+                rumor = [fact_id for fact_id in fact_ids if fact_id in telling]
+                if not rumor:
+                    continue
+                for listener in relationships.get(teller, ()):
+                    if listener not in reached:
+                        reached.add(listener)
+                        next_frontier[listener] = self._known_among(listener, fact_ids)
+                    for fact_id in rumor:
+                        if not self.npc_knows_fact(listener, fact_id):
+                            self.add_knowledge(
+                                npc_id=listener,
+                                fact_id=fact_id,
+                                source=KnowledgeSource.TOLD_BY_NPC,
+                                session=session,
+                                confidence=1.0,
+                                source_entity=teller
+                            )
+                            learned.setdefault(listener, []).append(fact_id)
+                            next_frontier.setdefault(listener, {})[fact_id] = None
+            frontier = next_frontier
+
+        logger.debug(
+            f"Spread {len(fact_ids)} facts from {from_npcs} to {len(learned)} NPCs "
+            f"(session {session})"
+        )
+        return learned
+
+    def _known_among(self, npc_id: str, fact_ids: list[str]) -> dict[str, None]:
+        """The fact_ids an NPC knows, in order, as an ordered set."""
+        known = self._facts_by_npc.get(npc_id, ())
+        return {fact_id: None for fact_id in fact_ids if fact_id in known}
+
     def share_with_party(
         self,
         npc_id: str,
@@ -228,8 +316,7 @@ class NPCKnowledgeTracker:
         """
         from dm20_protocol.consistency.party_knowledge import AcquisitionMethod
 
-        npc_knowledge = self.get_npc_knowledge(npc_id)
-        known_fact_ids = {entry.fact_id for entry in npc_knowledge}
+        known_fact_ids = self._facts_by_npc.get(npc_id, set())
 
         shared = []
         for fact_id in fact_ids:
@@ -276,6 +363,7 @@ class NPCKnowledgeTracker:
             self._npc_interactions[npc_id] = []
 
         self._npc_interactions[npc_id].append(interaction)
+        self._journal.append("interaction", npc_id=npc_id, interaction=interaction)
 
         logger.debug(
             f"Recorded {interaction.interaction_type} interaction with {npc_id} "
@@ -314,12 +402,7 @@ class NPCKnowledgeTracker:
         Returns:
             List of NPC IDs who know this fact
         """
-        npcs = []
-        for npc_id, knowledge in self._npc_knowledge.items():
-            if any(entry.fact_id == fact_id for entry in knowledge):
-                npcs.append(npc_id)
-
-        return npcs
+        return sorted(self._npcs_by_fact.get(fact_id, ()), key=self._npc_positions.__getitem__)
 
     def get_knowledge_context(self, npc_id: str) -> dict:
         """
@@ -362,69 +445,64 @@ class NPCKnowledgeTracker:
         }
 
     def save(self) -> None:
-        """
-        Persist NPC knowledge to npc_knowledge.json.
-
-        Saves both knowledge entries and interaction history with metadata
-        about the last update time.
-        """
-        # Convert to serializable format
-        npc_data = {}
-        for npc_id in set(self._npc_knowledge.keys()) | set(self._npc_interactions.keys()):
-            npc_data[npc_id] = {
-                "known_facts": [
-                    entry.model_dump(mode="json")
-                    for entry in self._npc_knowledge.get(npc_id, [])
-                ],
-                "interactions": [
-                    interaction.model_dump(mode="json")
-                    for interaction in self._npc_interactions.get(npc_id, [])
-                ]
-            }
-
-        data = {
-            "version": "1.0",
-            "npc_knowledge": npc_data,
-            "metadata": {
-                "last_updated": datetime.now(timezone.utc).isoformat()
+        """Persist NPC knowledge to npc_knowledge.json and its journal."""
+        changes = self._journal.pending
+        npc_ids = list(dict.fromkeys([*self._npc_knowledge, *self._npc_interactions]))
+
+        def build_snapshot() -> dict:
+            # Convert to serializable format
+            npc_data = {}
+            for npc_id in npc_ids:
+                npc_data[npc_id] = {
+                    "known_facts": [
+                        entry.model_dump(mode="json")
+                        for entry in self._npc_knowledge.get(npc_id, [])
+                    ],
+                    "interactions": [
+                        interaction.model_dump(mode="json")
+                        for interaction in self._npc_interactions.get(npc_id, [])
+                    ]
+                }
+
+            return {
+                "version": "1.0",
+                "npc_knowledge": npc_data,
+                "metadata": {
+                    "last_updated": datetime.now(timezone.utc).isoformat()
+                }
             }
-        }
 
-        with open(self._knowledge_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        logger.info(
-            f"Saved knowledge for {len(npc_data)} NPCs to {self._knowledge_path}"
-        )
+        live_items = sum(map(len, self._npc_knowledge.values())) + sum(map(len, self._npc_interactions.values()))
+        if self._journal.save(build_snapshot, live_items=live_items):
+            logger.info(
+                f"Saved knowledge for {len(npc_ids)} NPCs to {self._knowledge_path}"
+            )
+        else:
+            logger.debug(f"Journaled {changes} NPC knowledge changes to {self._journal.journal_path}")
 
     def load(self) -> None:
         """
-        Load NPC knowledge from npc_knowledge.json.
+        Load NPC knowledge from npc_knowledge.json and replay the journal.
 
         Handles missing files gracefully by initializing empty structures.
         If the file is corrupt or invalid, logs an error and starts with
         empty knowledge.
         """
-        if not self._knowledge_path.exists():
-            logger.debug(
-                f"No existing NPC knowledge at {self._knowledge_path}, starting empty"
-            )
-            self._npc_knowledge = {}
-            self._npc_interactions = {}
-            return
+        self._npc_knowledge = {}
+        self._npc_interactions = {}
 
         try:
-            with open(self._knowledge_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._journal.read_snapshot()
+            if data is None:
+                logger.debug(
+                    f"No existing NPC knowledge at {self._knowledge_path}, starting empty"
+                )
+                return
 
             # Validate structure
             if not isinstance(data, dict) or "npc_knowledge" not in data:
                 raise ValueError("Invalid knowledge database structure")
 
-            # Load NPC knowledge
-            self._npc_knowledge = {}
-            self._npc_interactions = {}
-
             for npc_id, npc_data in data["npc_knowledge"].items():
                 # Load knowledge entries
                 if "known_facts" in npc_data:
@@ -440,9 +518,11 @@ class NPCKnowledgeTracker:
                         for interaction_data in npc_data["interactions"]
                     ]
 
+            replayed = self._journal.replay(data.get("journal"), self._apply_record)
+
             logger.info(
                 f"Loaded knowledge for {len(data['npc_knowledge'])} NPCs "
-                f"from {self._knowledge_path}"
+                f"from {self._knowledge_path} ({replayed} journaled changes)"
             )
 
         except (json.JSONDecodeError, ValueError, TypeError) as e:
@@ -453,6 +533,37 @@ class NPCKnowledgeTracker:
             self._npc_knowledge = {}
             self._npc_interactions = {}
 
+        finally:
+            self._rebuild_indexes()
+
+    def _index_entry(self, npc_id: str, entry: KnowledgeEntry) -> None:
+        """Add a knowledge entry to the NPC/fact indexes."""
+        self._npc_positions.setdefault(npc_id, len(self._npc_positions))
+        self._facts_by_npc.setdefault(npc_id, set()).add(entry.fact_id)
+        self._npcs_by_fact.setdefault(entry.fact_id, set()).add(npc_id)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the NPC/fact indexes from _npc_knowledge."""
+        self._facts_by_npc = {}
+        self._npcs_by_fact = {}
+        self._npc_positions = {}
+        for npc_id, entries in self._npc_knowledge.items():
+            self._npc_positions[npc_id] = len(self._npc_positions)
+            for entry in entries:
+                self._index_entry(npc_id, entry)
+
+    def _apply_record(self, record: dict) -> None:
+        """Apply one journal record to the knowledge and interaction maps."""
+        op = record["op"]
+        if op == "knowledge":
+            entry = KnowledgeEntry(**record["entry"])
+            self._npc_knowledge.setdefault(record["npc_id"], []).append(entry)
+        elif op == "interaction":
+            interaction = PlayerInteraction(**record["interaction"])
+            self._npc_interactions.setdefault(record["npc_id"], []).append(interaction)
+        else:
+            raise ValueError(f"Unknown journal operation {op!r}")
+
 
 __all__ = [
     "NPCKnowledgeTracker",
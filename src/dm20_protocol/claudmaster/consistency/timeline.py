@@ -12,8 +12,8 @@ Key components:
 - TimelineTracker: Manager for the campaign timeline and time progression
 """
 
-import json
 import logging
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
@@ -21,6 +21,8 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from .journal import StoreJournal
+
 logger = logging.getLogger("dm20-protocol")
 
 
@@ -215,7 +217,8 @@ class TimelineTracker:
     Attributes:
         campaign_path: Path to campaign directory for persistence
         _current_time: Current in-game time
-        _events: List of timeline events
+        _events: List of timeline events, in chronological order
+        _event_minutes: Total minutes of each event in _events (sort keys)
         _calendar: Calendar configuration
     """
 
@@ -229,7 +232,11 @@ class TimelineTracker:
         self.campaign_path = Path(campaign_path)
         self._current_time = GameTime()
         self._events: list[TimelineEvent] = []
+        self._event_minutes: list[int] = []
         self._calendar = {"months_per_year": 12, "days_per_month": 30, "hours_per_day": 24}
+        self._journal = StoreJournal(self.campaign_path / "timeline.json")
+        # Current time as of the last save or load, journaled only when changed
+        self._saved_time = self._current_time.model_copy()
         self.campaign_path.mkdir(parents=True, exist_ok=True)
         self.load()
 
@@ -269,7 +276,13 @@ class TimelineTracker:
         """
         Add an event to the timeline.
 
-        Events are automatically sorted chronologically after addition.
+        The event is inserted at its chronological position, after events
+        at the same time. Its time is read once here; change an event's
+        time by adding a new event rather than editing it in place.
+
+        Finding the position is a binary search, but the list insert still
+        shifts every later event, so back-dated events cost O(n); events
+        added in chronological order are appended.
 
         Args:
             event: The event to add
@@ -279,8 +292,11 @@ class TimelineTracker:
         """
         if not event.id:
             event.id = f"evt_{uuid4().hex[:8]}"
-        self._events.append(event)
-        self._events.sort(key=lambda e: e.game_time._to_total_minutes())
+        minutes = event.game_time._to_total_minutes()
+        index = bisect_right(self._event_minutes, minutes)
+        self._events.insert(index, event)
+        self._event_minutes.insert(index, minutes)
+        self._journal.append("event", event=event)
         return event.id
 
     def get_events_at(self, game_time: GameTime) -> list[TimelineEvent]:
@@ -294,7 +310,7 @@ class TimelineTracker:
             List of events at that time
         """
         target = game_time._to_total_minutes()
-        return [e for e in self._events if e.game_time._to_total_minutes() == target]
+        return self._events_in(target, target)
 
     def get_events_between(self, start: GameTime, end: GameTime) -> list[TimelineEvent]:
         """
@@ -307,9 +323,13 @@ class TimelineTracker:
         Returns:
             List of events in the time range
         """
-        s = start._to_total_minutes()
-        e = end._to_total_minutes()
-        return [ev for ev in self._events if s <= ev.game_time._to_total_minutes() <= e]
+        return self._events_in(start._to_total_minutes(), end._to_total_minutes())
+
+    def _events_in(self, start_minutes: int, end_minutes: int) -> list[TimelineEvent]:
+        """Events from start_minutes to end_minutes (inclusive), by bisecting the sort keys."""
+        low = bisect_left(self._event_minutes, start_minutes)
+        high = bisect_right(self._event_minutes, end_minutes, lo=low)
+        return self._events[low:high]
 
     def validate_temporal_order(self, new_event: TimelineEvent) -> tuple[bool, Optional[str]]:
         """
@@ -381,36 +401,67 @@ class TimelineTracker:
         return len(self._events)
 
     def save(self) -> None:
-        """Persist timeline to timeline.json."""
-        data = {
-            "version": "1.0",
-            "current_time": self._current_time.model_dump(),
-            "events": [e.model_dump() for e in self._events],
-            "calendar": self._calendar,
-        }
-        path = self.campaign_path / "timeline.json"
-        path.write_text(json.dumps(data, indent=2, default=str))
-        logger.info(f"Saved timeline with {len(self._events)} events to {path}")
+        """Persist timeline to timeline.json and its journal."""
+        if self._current_time != self._saved_time:
+            self._journal.append("time", game_time=self._current_time)
+        changes = self._journal.pending
+
+        def build_snapshot() -> dict:
+            return {
+                "version": "1.0",
+                "current_time": self._current_time.model_dump(),
+                "events": [e.model_dump() for e in self._events],
+                "calendar": self._calendar,
+            }
+
+        if self._journal.save(build_snapshot, live_items=len(self._events)):
+            logger.info(f"Saved timeline with {len(self._events)} events to {self._journal.snapshot_path}")
+        else:
+            logger.debug(f"Journaled {changes} timeline changes to {self._journal.journal_path}")
+        self._saved_time = self._current_time.model_copy()
 
     def load(self) -> None:
         """
-        Load timeline from timeline.json.
+        Load timeline from timeline.json and replay the journal.
 
         If the file doesn't exist, initializes with default values.
         If the file is corrupt, logs a warning and starts fresh.
         """
-        path = self.campaign_path / "timeline.json"
-        if not path.exists():
-            logger.debug(f"No existing timeline at {path}, starting fresh")
-            return
+        path = self._journal.snapshot_path
         try:
-            data = json.loads(path.read_text())
+            data = self._journal.read_snapshot()
+            if data is None:
+                logger.debug(f"No existing timeline at {path}, starting fresh")
+                return
             self._current_time = GameTime(**data.get("current_time", {}))
             self._events = [TimelineEvent(**e) for e in data.get("events", [])]
             self._calendar = data.get("calendar", self._calendar)
-            logger.info(f"Loaded timeline with {len(self._events)} events from {path}")
+            replayed = self._journal.replay(data.get("journal"), self._apply_record)
+            logger.info(
+                f"Loaded timeline with {len(self._events)} events from {path} "
+                f"({replayed} journaled changes)"
+            )
         except Exception as e:
             logger.warning(f"Failed to load timeline: {e}")
+        finally:
+            self._index_events()
+            self._saved_time = self._current_time.model_copy()
+
+    def _index_events(self) -> None:
+        """Sort events chronologically and recompute their sort keys."""
+        # Stable sort: same order as inserting each event with add_event
+        self._events.sort(key=lambda e: e.game_time._to_total_minutes())
+        self._event_minutes = [e.game_time._to_total_minutes() for e in self._events]
+
+    def _apply_record(self, record: dict) -> None:
+        """Apply one journal record to the timeline (events are indexed after replay)."""
+        op = record["op"]
+        if op == "event":
+            self._events.append(TimelineEvent(**record["event"]))
+        elif op == "time":
+            self._current_time = GameTime(**record["game_time"])
+        else:
+            raise ValueError(f"Unknown journal operation {op!r}")
 
 
 __all__ = [
@@ -19,6 +19,7 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 
 from .improvisation import ImprovisationLevel
+from .section_index import SectionIndex, jaccard, tokenize
 
 
 class ContentOrigin(str, Enum):
@@ -127,6 +128,12 @@ class ContentTagger:
     content matches published module text. It segments hybrid content to
     identify which parts are canonical and which are improvised.
 
+    Module sections are tokenized once into a SectionIndex; large modules
+    are only compared exactly with the sections found by MinHash/LSH (see
+    ``section_index`` for the tolerance of the canonical/hybrid/improvised
+    decisions). Assigning ``module_content`` replaces the index, which is
+    built on the next classification.
+
     Attributes:
         module_content: Mapping of section IDs to canonical module text
         similarity_threshold: Jaccard similarity threshold for canonical match (default 0.6)
@@ -147,6 +154,16 @@ class ContentTagger:
         self.module_content = module_content
         self.similarity_threshold = similarity_threshold
 
+    @property
+    def module_content(self) -> dict[str, str]:
+        """Mapping of section IDs to canonical module text."""
+        return self._module_content
+
+    @module_content.setter
+    def module_content(self, module_content: dict[str, str]) -> None:
+        self._module_content = module_content
+        self._section_index = SectionIndex(module_content)
+
     def tag_narrative(
         self,
         content: str,
@@ -193,7 +210,7 @@ class ContentTagger:
         """
         Classify content origin using text similarity.
 
-        Compares content against all module sections using Jaccard similarity.
+        Compares content against the module sections using Jaccard similarity.
         High match = canonical, low match = improvised, partial match = hybrid.
 
         Args:
@@ -207,14 +224,7 @@ class ContentTagger:
             return (ContentOrigin.IMPROVISED, 1.0, None)
 
         # Find best matching module section
-        best_match_section = None
-        best_similarity = 0.0
-
-        for section_id, module_text in self.module_content.items():
-            similarity = self._jaccard_similarity(content, module_text)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match_section = section_id
+        best_match_section, best_similarity = self._section_index.best_match(tokenize(content))
 
         # Classify based on similarity threshold
         if best_similarity >= self.similarity_threshold:
@@ -241,16 +251,7 @@ class ContentTagger:
             Similarity score between 0.0 and 1.0
         """
         # Tokenize into words (lowercase, alphanumeric only)
-        words1 = set(word.lower() for word in text1.split() if word.isalnum())
-        words2 = set(word.lower() for word in text2.split() if word.isalnum())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-
-        return intersection / union if union > 0 else 0.0
+        return jaccard(tokenize(text1), tokenize(text2))
 
     def _segment_hybrid(self, content: str) -> list[TaggedSegment]:
         """
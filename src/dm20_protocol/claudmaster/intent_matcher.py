@@ -0,0 +1,133 @@
+"""
+Compiled intent pattern matcher for the Orchestrator.
+
+Intent classification tests every weighted phrase of every intent as a
+substring of the player input. IntentMatcher compiles the phrase set once
+into a single regex (a trie of the phrases, so each input position costs
+one branch per character instead of one test per phrase) and scores all
+intents from one pass over the input.
+
+The regex finds the longest phrase starting at each position. Every other
+phrase present in the input is a substring of one of those, so each phrase
+also carries the list of phrases it contains.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .orchestrator import IntentType, WeightedPattern
+
+
+@dataclass
+class IntentScores:
+    """Accumulated pattern weights of the intents matched by an input.
+
+    All dicts follow the intent order of the compiled patterns.
+    """
+    scores: dict[IntentType, float] = field(default_factory=dict)
+    best_weights: dict[IntentType, float] = field(default_factory=dict)
+    matched: dict[IntentType, list[str]] = field(default_factory=dict)
+
+
+def _trie_regex(phrases: list[str]) -> str:
+    """Regex matching the longest of ``phrases`` that starts at a position."""
+    trie: dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy: continue to a longer phrase when possible
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class IntentMatcher:
+    """Weighted intent patterns compiled into one multi-phrase regex.
+
+    Scores are identical to testing each pattern with ``phrase in text``:
+    a pattern counts once however often it occurs, and an intent's weights
+    are summed in the order of its patterns sorted longest phrase first.
+
+    Args:
+        intent_patterns: Weighted patterns per intent, in priority order
+
+    Example:
+        >>> matcher = IntentMatcher(DEFAULT_INTENT_PATTERNS)
+        >>> matcher.score("i attack the goblin").scores
+        {<IntentType.COMBAT: 'combat'>: 0.8}
+    """
+
+    def __init__(self, intent_patterns: dict[IntentType, list[WeightedPattern]]) -> None:
+        self._intents: list[IntentType] = list(intent_patterns)
+        # phrase -> (intent position, rank within the intent, weight) per pattern
+        self._patterns_by_phrase: dict[str, list[tuple[int, int, float]]] = {}
+        for position, patterns in enumerate(intent_patterns.values()):
+            ranked = sorted(patterns, key=lambda p: len(p.phrase), reverse=True)
+            for rank, pattern in enumerate(ranked):
+                self._patterns_by_phrase.setdefault(pattern.phrase, []).append(
+                    (position, rank, pattern.weight)
+                )
+
+        phrases = [phrase for phrase in self._patterns_by_phrase if phrase]
+        self._always_present = "" in self._patterns_by_phrase
+        self._contained: dict[str, list[str]] = {
+            phrase: [other for other in phrases if other in phrase] for phrase in phrases
+        }
+        self._regex = re.compile("(?=(" + _trie_regex(phrases) + "))") if phrases else None
+
+    def present_phrases(self, text: str) -> set[str]:
+        """Phrases occurring in ``text`` (already lowercased)."""
+        present: set[str] = {""} if self._always_present else set()
+        if self._regex is None:
+            return present
+        longest: set[str] = set()
+        for match in self._regex.finditer(text):
+            phrase = match.group(1)
+            if phrase and phrase not in longest:
+                longest.add(phrase)
+                present.update(self._contained[phrase])
+        return present
+
+    def score(self, text: str) -> IntentScores:
+        """Accumulate pattern weights per intent for ``text`` (already lowercased).
+
+        Intents whose weights total 0 are left out, as are unmatched ones.
+        """
+        hits: dict[int, list[tuple[int, float, str]]] = {}
+        for phrase in self.present_phrases(text):
+            for position, rank, weight in self._patterns_by_phrase[phrase]:
+                hits.setdefault(position, []).append((rank, weight, phrase))
+
+        result = IntentScores()
+        for position in sorted(hits):
+            total = 0.0
+            best = 0.0
+            matched: list[str] = []
+            for _, weight, phrase in sorted(hits[position]):
+                total += weight
+                best = max(best, weight)
+                matched.append(phrase)
+            if total > 0:
+                intent_type = self._intents[position]
+                result.scores[intent_type] = total
+                result.best_weights[intent_type] = best
+                result.matched[intent_type] = matched
+        return result
+
+
+__all__ = [
+    "IntentMatcher",
+    "IntentScores",
+]
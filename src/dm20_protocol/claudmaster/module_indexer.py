@@ -14,7 +14,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .models.module import (
     ContentType,
@@ -25,8 +25,14 @@ from .models.module import (
 )
 from .vector_store import CollectionNotFoundError, HAS_CHROMADB, VectorStoreManager
 
+if TYPE_CHECKING:
+    from ..library.extractors.pages import PageTextExtractor
+
 logger = logging.getLogger("dm20-protocol")
 
+# Chunks stored per add_documents call while indexing a module
+INDEX_BATCH_SIZE = 256
+
 
 # ---------------------------------------------------------------------------
 # Configuration and result dataclasses
@@ -135,7 +141,8 @@ def _compute_text_hash(text: str) -> str:
 def extract_text_from_pdf(pdf_path: str | Path, page_start: int, page_end: int | None) -> str:
     """Extract text from a range of pages in a PDF.
 
-    Uses PyMuPDF (fitz) to read pages.  Page numbers are **1-indexed**.
+    One-off read through :class:`PageTextExtractor`, without a page cache.
+    Page numbers are **1-indexed**.
 
     Args:
         pdf_path: Path to the PDF file.
@@ -144,28 +151,17 @@ def extract_text_from_pdf(pdf_path: str | Path, page_start: int, page_end: int |
             only *page_start* is read.
 
     Returns:
-        Concatenated text from the requested pages.
+        Concatenated text from the requested pages, empty if the PDF
+        cannot be read.
     """
-    import fitz  # PyMuPDF  -- imported lazily to keep module lightweight
+    # Imported here: the library package pulls in PyMuPDF
+    from ..library.extractors.pages import PageTextExtractor
 
+    page_text = PageTextExtractor(workers=1)
     try:
-        doc = fitz.open(str(pdf_path))
-    except Exception as exc:
-        logger.error("Failed to open PDF %s: %s", pdf_path, exc)
-        return ""
-
-    try:
-        start_idx = max(0, page_start - 1)
-        end_idx = max(start_idx, (page_end or page_start) - 1)
-        end_idx = min(end_idx, doc.page_count - 1)
-
-        parts: list[str] = []
-        for page_num in range(start_idx, end_idx + 1):
-            page = doc[page_num]
-            parts.append(page.get_text())
-        return "\n\n".join(parts)
+        return page_text.text(pdf_path, page_start, page_end)
     finally:
-        doc.close()
+        page_text.close()
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +181,10 @@ class ModuleIndexer:
         vector_store: The :class:`VectorStoreManager` instance to use.
         chunk_config: Optional chunking configuration.  Defaults to
             :class:`ChunkConfig` with sensible defaults.
+        page_text: Page text extraction service.  Defaults to one caching
+            page text under the vector store's ``page_cache/`` directory,
+            owned by the indexer and released by :meth:`close`.
+        batch_size: Chunks stored (and embedded) per ``add_documents`` call.
     """
 
     # Key used in ChromaDB collection metadata to persist indexing info.
@@ -197,9 +197,21 @@ class ModuleIndexer:
         self,
         vector_store: VectorStoreManager,
         chunk_config: ChunkConfig | None = None,
+        page_text: "PageTextExtractor | None" = None,
+        batch_size: int = INDEX_BATCH_SIZE,
     ) -> None:
         self._store = vector_store
         self._config = chunk_config or ChunkConfig()
+        self._owns_page_text = page_text is None
+        if page_text is None:
+            # Imported here: the library package pulls in PyMuPDF
+            from ..library.extractors.pages import PageTextExtractor
+
+            persist_directory = vector_store.persist_directory
+            cache_dir = Path(persist_directory) / "page_cache" if isinstance(persist_directory, str) else None
+            page_text = PageTextExtractor(cache_dir)
+        self._page_text = page_text
+        self._batch_size = batch_size
 
     # ------------------------------------------------------------------
     # Public API
@@ -270,36 +282,54 @@ class ModuleIndexer:
         location_names = [loc.name for loc in module_structure.locations]
 
         errors: list[str] = []
-        all_docs: list[str] = []
-        all_metas: list[dict[str, Any]] = []
-        all_ids: list[str] = []
+        batch_docs: list[str] = []
+        batch_metas: list[dict[str, Any]] = []
+        batch_ids: list[str] = []
+        chunks_created = 0
         chapters_indexed = 0
+        npcs_found: set[str] = set()
+        locations_found: set[str] = set()
 
-        # Walk the module elements (chapters/sections)
-        for element in module_structure.chapters:
-            if element.content_type in (ContentType.CHAPTER, ContentType.APPENDIX):
-                chapters_indexed += 1
-
-            # Extract text for this element
-            page_end = element.page_end
-            if page_end is None:
-                page_end = element.page_start
-
+        def store_batch() -> None:
+            nonlocal chunks_created
+            if not batch_docs:
+                return
+            chunks_created += len(batch_docs)
             try:
-                text = extract_text_from_pdf(
-                    pdf_path_obj,
-                    element.page_start,
-                    page_end,
+                self._store.add_documents(
+                    module_id,
+                    documents=list(batch_docs),
+                    metadatas=list(batch_metas),
+                    ids=list(batch_ids),
                 )
             except Exception as exc:
+                msg = f"Failed to store chunks: {exc}"
+                logger.error(msg)
+                errors.append(msg)
+            batch_docs.clear()
+            batch_metas.clear()
+            batch_ids.clear()
+
+        # Walk the module elements (chapters/sections); page text is read
+        # ahead in parallel and chunks are stored as they are produced
+        elements = list(module_structure.chapters)
+        ranges = [(element.page_start, element.page_end or element.page_start) for element in elements]
+        sections = self._page_text.extract_ranges(pdf_path_obj, ranges, file_hash=source_hash)
+        for element, section in zip(elements, sections):
+            if element.content_type in (ContentType.CHAPTER, ContentType.APPENDIX):
+                chapters_indexed += 1
+
+            page_end = section.page_end
+            if section.error is not None:
                 msg = (
                     f"Failed to extract text for '{element.name}' "
-                    f"(pages {element.page_start}-{page_end}): {exc}"
+                    f"(pages {element.page_start}-{page_end}): {section.error}"
                 )
                 logger.warning(msg)
                 errors.append(msg)
                 continue
 
+            text = section.text
             if not text.strip():
                 continue
 
@@ -318,48 +348,28 @@ class ModuleIndexer:
                 "location_names": location_names,
             }
 
-            chunks = self.chunk_text(text, context)
-
-            for chunk_text, chunk_meta in chunks:
+            for chunk_text, chunk_meta in self.chunk_text(text, context):
                 doc_id = f"{module_id}_{element.page_start}_{chunk_meta.get('chunk_index', 0)}"
-                all_docs.append(chunk_text)
-                all_metas.append(chunk_meta)
-                all_ids.append(doc_id)
-
-        # Batch insert all chunks
-        if all_docs:
-            # ChromaDB can handle large batches, but we do a simple single call.
-            try:
-                self._store.add_documents(
-                    module_id,
-                    documents=all_docs,
-                    metadatas=all_metas,
-                    ids=all_ids,
-                )
-            except Exception as exc:
-                msg = f"Failed to store chunks: {exc}"
-                logger.error(msg)
-                errors.append(msg)
-
-        # Update collection metadata with total chunk count
-        # (ChromaDB doesn't allow metadata updates on collections easily,
-        #  but the count is available via collection_count.)
-
-        # Count referenced NPCs and locations
-        npcs_found: set[str] = set()
-        locations_found: set[str] = set()
-        for meta in all_metas:
-            npcs_ref = meta.get("npcs_referenced", "")
-            if npcs_ref:
-                npcs_found.update(n.strip() for n in npcs_ref.split(",") if n.strip())
-            locs_ref = meta.get("locations_referenced", "")
-            if locs_ref:
-                locations_found.update(loc.strip() for loc in locs_ref.split(",") if loc.strip())
+                batch_docs.append(chunk_text)
+                batch_metas.append(chunk_meta)
+                batch_ids.append(doc_id)
+
+                # Count referenced NPCs and locations
+                npcs_ref = chunk_meta.get("npcs_referenced", "")
+                if npcs_ref:
+                    npcs_found.update(n.strip() for n in npcs_ref.split(",") if n.strip())
+                locs_ref = chunk_meta.get("locations_referenced", "")
+                if locs_ref:
+                    locations_found.update(loc.strip() for loc in locs_ref.split(",") if loc.strip())
+
+                if len(batch_docs) >= self._batch_size:
+                    store_batch()
+        store_batch()
 
         elapsed = time.monotonic() - t0
         result = IndexingResult(
             module_id=module_id,
-            chunks_created=len(all_docs),
+            chunks_created=chunks_created,
             chapters_indexed=chapters_indexed,
             npcs_indexed=len(npcs_found),
             locations_indexed=len(locations_found),
@@ -576,6 +586,11 @@ class ModuleIndexer:
         self._store.delete_collection(module_id)
         logger.info("Deleted index for module '%s'", module_id)
 
+    def close(self) -> None:
+        """Release the page extraction pool, unless the extractor was passed in."""
+        if self._owns_page_text:
+            self._page_text.close()
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -22,6 +22,7 @@ from pydantic import BaseModel, Field
 from dm20_protocol.models import Campaign, GameState
 from .base import Agent, AgentResponse, AgentRole
 from .config import ClaudmasterConfig
+from .intent_matcher import IntentMatcher
 from .session import ClaudmasterSession
 
 logger = logging.getLogger("dm20-protocol")
@@ -293,6 +294,10 @@ class Orchestrator:
         self.agents: dict[str, Agent] = {}
         self.session: ClaudmasterSession | None = None
 
+        # Intent patterns compiled for the current config (see _get_intent_matcher)
+        self._intent_matcher: IntentMatcher | None = None
+        self._intent_matcher_key: tuple[Any, ...] = ()
+
         logger.info(f"Orchestrator initialized for campaign '{campaign.name}'")
 
     def register_agent(self, name: str, agent: Agent) -> None:
@@ -398,12 +403,36 @@ class Orchestrator:
 
         return patterns
 
+    def _get_intent_matcher(self) -> IntentMatcher:
+        """
+        Get the intent patterns compiled for the current config.
+
+        Recompiled when ``self.config`` is replaced or its
+        ``intent_weight_overrides`` change.
+
+        Returns:
+            IntentMatcher for the merged intent patterns.
+        """
+        key = (
+            self.config,
+            tuple(
+                (intent_key, tuple(phrase_overrides.items()))
+                for intent_key, phrase_overrides in self.config.intent_weight_overrides.items()
+            ),
+        )
+        cached = self._intent_matcher_key
+        if self._intent_matcher is None or cached[0] is not key[0] or cached[1] != key[1]:
+            self._intent_matcher = IntentMatcher(self._get_intent_patterns())
+            self._intent_matcher_key = key
+        return self._intent_matcher
+
     def classify_intent(self, player_input: str) -> PlayerIntent:
         """
         Classify player input into an intent type using weighted pattern scoring.
 
         For each IntentType, patterns are matched against the input and their
         weights are accumulated.  The intent with the highest total score wins.
+        All patterns are matched in one pass by the compiled IntentMatcher.
         If the gap between the top two scores is below ``ambiguity_threshold``,
         the result is flagged as ambiguous via metadata.
 
@@ -421,28 +450,13 @@ class Orchestrator:
 
         input_lower = player_input.lower().strip()
 
-        intent_patterns = self._get_intent_patterns()
         ambiguity_threshold = self.config.ambiguity_threshold
 
         # Step A: Score accumulation — match patterns and accumulate weights
-        scores: dict[IntentType, float] = {}
-        best_weights: dict[IntentType, float] = {}
-        all_matched: dict[IntentType, list[str]] = {}
-
-        for intent_type, patterns in intent_patterns.items():
-            sorted_patterns = sorted(patterns, key=lambda p: len(p.phrase), reverse=True)
-            total = 0.0
-            best = 0.0
-            matched: list[str] = []
-            for p in sorted_patterns:
-                if p.phrase in input_lower:
-                    total += p.weight
-                    best = max(best, p.weight)
-                    matched.append(p.phrase)
-            if total > 0:
-                scores[intent_type] = total
-                best_weights[intent_type] = best
-                all_matched[intent_type] = matched
+        intent_scores = self._get_intent_matcher().score(input_lower)
+        scores = intent_scores.scores
+        best_weights = intent_scores.best_weights
+        all_matched = intent_scores.matched
 
         # Step B: No matches → fallback to ACTION
         if not scores:
@@ -0,0 +1,241 @@
+"""
+Similarity index over module sections for content origin classification.
+
+ContentTagger compares every narrative (and, for hybrid narratives, every
+sentence) with the module text by word-level Jaccard similarity. Comparing
+against each section means re-tokenizing the whole module per call.
+SectionIndex tokenizes the sections once, on the first lookup, and files
+each section under the bands of its MinHash signature for
+locality-sensitive hashing (LSH): sections sharing at least one band with
+the query are candidates, and exact Jaccard is only computed for them.
+
+Signatures use one-permutation hashing: a single seeded 64-bit hash per
+token selects one of ``MINHASH_PERMUTATIONS`` bins and each bin keeps its
+minimum; empty bins are densified from other bins in a fixed random probe
+order. Two token sets agree on a bin with probability equal to their
+Jaccard similarity, as with independent permutations, at the cost of one
+hash per token instead of one per token and permutation.
+
+Tolerance: with ``LSH_BANDS`` bands of ``LSH_BAND_ROWS`` rows, a section
+with similarity ``s`` is missed with probability about
+``(1 - s ** LSH_BAND_ROWS) ** LSH_BANDS``: below 0.25% at s = 0.3 (the
+hybrid cut-off of the default threshold) and below 1e-12 at s = 0.6.
+Densified bins are not fully independent, so short sections (far fewer
+words than bins) are missed somewhat more often than the bound says.
+Query tokens absent from the module are left out of the query signature,
+which can only raise a section's chance to be a candidate. Sections that
+are not candidates are never compared, so the best similarity of content
+matching no section well can be underestimated. Modules with fewer than
+``EXACT_SCAN_SECTIONS`` sections are always compared exhaustively, which
+gives the same results as scanning the raw texts.
+"""
+
+import hashlib
+import random
+import threading
+from typing import Mapping, Optional
+
+# MinHash signature length, split into LSH_BANDS bands of LSH_BAND_ROWS rows
+MINHASH_PERMUTATIONS = 128
+LSH_BAND_ROWS = 2
+LSH_BANDS = MINHASH_PERMUTATIONS // LSH_BAND_ROWS
+
+# Below this many sections every section is compared exactly
+EXACT_SCAN_SECTIONS = 32
+
+# A 64-bit token hash picks a signature bin with its low bits and is
+# ranked within the bin by the remaining ones
+_BIN_BITS = (MINHASH_PERMUTATIONS - 1).bit_length()
+_BIN_MASK = MINHASH_PERMUTATIONS - 1
+_EMPTY = 1 << 64
+_HASH_KEY = b"dm20-section-index"
+_SEED = 0x5EC7
+
+# Densification: an empty bin borrows the value of the first non-empty bin
+# in its own fixed random order of all bins
+_rng = random.Random(_SEED)
+_PROBES: list[list[int]] = [
+    _rng.sample(range(MINHASH_PERMUTATIONS), MINHASH_PERMUTATIONS) for _ in range(MINHASH_PERMUTATIONS)
+]
+del _rng
+
+
+def tokenize(text: str) -> frozenset[str]:
+    """Word set used for Jaccard similarity (lowercase, alphanumeric words only)."""
+    return frozenset(word.lower() for word in text.split() if word.isalnum())
+
+
+def jaccard(tokens1: frozenset[str], tokens2: frozenset[str]) -> float:
+    """Jaccard coefficient |A ∩ B| / |A ∪ B| of two token sets, 0.0 if either is empty."""
+    if not tokens1 or not tokens2:
+        return 0.0
+    shared = len(tokens1 & tokens2)
+    return shared / (len(tokens1) + len(tokens2) - shared)
+
+
+def _token_hash(token: str) -> int:
+    """Seeded 64-bit hash of a token, stable across processes."""
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8, key=_HASH_KEY).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _band_keys(hashes: list[int]) -> list[int]:
+    """
+    LSH band keys of the MinHash signature of a set of token hashes.
+
+    The signature is a one-permutation MinHash: each token hash lands in one
+    bin and every bin keeps its minimum, with empty bins densified from
+    other bins, so that two sets agree on any bin with probability equal to
+    their Jaccard similarity.
+    """
+    signature = [_EMPTY] * MINHASH_PERMUTATIONS
+    for value in hashes:
+        slot = value & _BIN_MASK
+        rank = value >> _BIN_BITS
+        if rank < signature[slot]:
+            signature[slot] = rank
+    filled = signature[:]
+    for slot, rank in enumerate(signature):
+        if rank == _EMPTY:
+            for probe in _PROBES[slot]:
+                if signature[probe] != _EMPTY:
+                    filled[slot] = signature[probe]
+                    break
+    keys = []
+    for start in range(0, MINHASH_PERMUTATIONS, LSH_BAND_ROWS):
+        key = 0
+        for rank in filled[start:start + LSH_BAND_ROWS]:
+            key = (key << 64) | rank
+        keys.append(key)
+    return keys
+
+
+class SectionIndex:
+    """
+    Token sets and LSH buckets of module sections.
+
+    The index is built on the first lookup: sections are tokenized once and
+    each section is filed under the band keys of its MinHash signature. A
+    lookup hashes the query's known tokens, collects the sections sharing a
+    band with it and compares those exactly. Only one 64-bit hash per
+    vocabulary token and the band buckets are kept.
+
+    Args:
+        sections: Mapping of section IDs to module text
+        exact_scan_below: Section count below which lookups compare every
+            section instead of using LSH candidates
+
+    Example:
+        >>> index = SectionIndex({"room1": "You enter a dark chamber."})
+        >>> index.best_match(tokenize("You enter a dark hall"))
+        ('room1', 0.8)
+    """
+
+    def __init__(
+        self,
+        sections: Mapping[str, str],
+        exact_scan_below: int = EXACT_SCAN_SECTIONS,
+    ) -> None:
+        self._sections = sections
+        self._section_ids: list[str] = list(sections)
+        self._use_lsh = len(self._section_ids) >= exact_scan_below
+        self._lock = threading.Lock()
+        self._tokens: Optional[list[frozenset[str]]] = None
+        # Token -> seeded 64-bit hash, for every token of the module
+        self._token_hashes: dict[str, int] = {}
+        # Per band: band key -> positions of the sections having it
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(LSH_BANDS)]
+
+    def __len__(self) -> int:
+        """Number of indexed sections."""
+        return len(self._section_ids)
+
+    @property
+    def built(self) -> bool:
+        """Whether the sections have been tokenized and bucketed."""
+        return self._tokens is not None
+
+    def _section_tokens(self) -> list[frozenset[str]]:
+        """Token sets of the sections, building the index on first use."""
+        tokens = self._tokens
+        if tokens is not None:
+            return tokens
+        with self._lock:
+            if self._tokens is None:
+                self._build()
+            assert self._tokens is not None
+            return self._tokens
+
+    def _build(self) -> None:
+        tokens = [tokenize(text) for text in self._sections.values()]
+        if self._use_lsh:
+            token_hashes = self._token_hashes
+            for position, section in enumerate(tokens):
+                if not section:
+                    continue
+                hashes = []
+                for token in section:
+                    value = token_hashes.get(token)
+                    if value is None:
+                        value = token_hashes[token] = _token_hash(token)
+                    hashes.append(value)
+                for band, key in enumerate(_band_keys(hashes)):
+                    self._buckets[band].setdefault(key, []).append(position)
+        self._tokens = tokens
+
+    def candidates(self, tokens: frozenset[str]) -> list[int]:
+        """
+        Positions of the sections worth comparing with ``tokens``.
+
+        Args:
+            tokens: Token set of the query, from ``tokenize``
+
+        Returns:
+            Section positions in module order
+        """
+        sections = self._section_tokens()
+        if not self._use_lsh:
+            return [position for position, section in enumerate(sections) if section]
+        hashes = [self._token_hashes[token] for token in tokens if token in self._token_hashes]
+        if not hashes:
+            return []
+        found: set[int] = set()
+        for band, key in enumerate(_band_keys(hashes)):
+            found.update(self._buckets[band].get(key, ()))
+        return sorted(found)
+
+    def best_match(self, tokens: frozenset[str]) -> tuple[Optional[str], float]:
+        """
+        Find the section most similar to a token set.
+
+        Ties go to the section that comes first in the module.
+
+        Args:
+            tokens: Token set of the query, from ``tokenize``
+
+        Returns:
+            Tuple of (section ID, Jaccard similarity), or (None, 0.0) if
+            no candidate section shares a word with the query
+        """
+        best_section: Optional[str] = None
+        best_similarity = 0.0
+        if not tokens:
+            return (best_section, best_similarity)
+        sections = self._section_tokens()
+        for position in self.candidates(tokens):
+            similarity = jaccard(tokens, sections[position])
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_section = self._section_ids[position]
+        return (best_section, best_similarity)
+
+
+__all__ = [
+    "EXACT_SCAN_SECTIONS",
+    "LSH_BANDS",
+    "LSH_BAND_ROWS",
+    "MINHASH_PERMUTATIONS",
+    "SectionIndex",
+    "jaccard",
+    "tokenize",
+]
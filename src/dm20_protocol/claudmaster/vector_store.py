@@ -5,9 +5,21 @@ Uses ChromaDB as the backend for storing and querying document embeddings,
 with ChromaDB's built-in ONNX-based embedding function (DefaultEmbeddingFunction)
 for generating embeddings locally — no torch or sentence-transformers required.
 Each adventure module gets its own collection for isolated queries.
+
+Collection handles and document counts are cached per module, and query
+results are kept in an LRU cache keyed by (module, query text, result
+count, where-filter), so repeated lookups of the same NPC or room during a
+scene skip embedding and search. Adding documents to a module or deleting
+its collection invalidates its entries. ``query_async`` runs cache misses
+on a worker pool so that callers on the event loop are not blocked.
 """
 
+import asyncio
+import json
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 logger = logging.getLogger("dm20-protocol")
@@ -34,6 +46,12 @@ except ImportError:
 # Default embedding model - good balance of speed and quality for English text
 DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
+# Query results kept in the LRU cache, across all modules
+QUERY_CACHE_SIZE = 256
+
+# Worker threads running embedding and search for query_async
+QUERY_WORKERS = 4
+
 # Valid content types for document metadata
 VALID_CONTENT_TYPES = frozenset({
     "narrative", "encounter", "npc", "location", "item",
@@ -41,6 +59,14 @@ VALID_CONTENT_TYPES = frozenset({
 })
 
 
+def _copy_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy query results, metadata included, so callers cannot alter the cache."""
+    return [
+        {**result, "metadata": dict(result["metadata"] or {})}
+        for result in results
+    ]
+
+
 class VectorStoreError(Exception):
     """Base exception for vector store operations."""
 
@@ -87,12 +113,28 @@ class VectorStoreManager:
         # Use injected function or lazy-load later
         self._embedding_fn: Any = embedding_function
 
+        # Per-module collection handles, document counts and a generation
+        # number bumped whenever the module's documents change (_epoch is
+        # bumped when every module is invalidated at once)
+        self._collections: dict[str, Any] = {}
+        self._counts: dict[str, int] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._results: OrderedDict[tuple[str, str, int, str], list[dict[str, Any]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
         logger.info(
             "VectorStoreManager initialized (persist_dir=%s, model=%s)",
             persist_directory,
             embedding_model,
         )
 
+    @property
+    def persist_directory(self) -> str:
+        """Directory where ChromaDB stores data on disk."""
+        return self._persist_directory
+
     def _get_embedding_function(self) -> Any:
         """Return the embedding function, lazy-loading if needed.
 
@@ -120,6 +162,57 @@ class VectorStoreManager:
         safe = module_id.replace(" ", "_").replace("/", "_")[:60]
         return f"mod_{safe}"
 
+    def _get_collection(self, module_id: str, missing_message: str) -> Any:
+        """Return the module's collection handle, fetching it on first use.
+
+        Raises:
+            CollectionNotFoundError: With ``missing_message`` if the
+                collection does not exist.
+        """
+        with self._cache_lock:
+            collection = self._collections.get(module_id)
+            if collection is not None:
+                return collection
+            generation = self._generation(module_id)
+        try:
+            collection = self._client.get_collection(
+                name=self._collection_name(module_id),
+                embedding_function=self._get_embedding_function(),
+            )
+        except (ValueError, ChromaNotFoundError) as exc:
+            raise CollectionNotFoundError(missing_message) from exc
+        with self._cache_lock:
+            # Skip caching if the module was invalidated meanwhile
+            if self._generation(module_id) == generation:
+                self._collections[module_id] = collection
+        return collection
+
+    def _generation(self, module_id: str) -> tuple[int, int]:
+        """Current generation of a module's cache entries; call under _cache_lock."""
+        return (self._epoch, self._generations.get(module_id, 0))
+
+    def invalidate(self, module_id: str | None = None) -> None:
+        """Drop cached handles, counts and query results.
+
+        Called automatically when documents are added or a collection is
+        deleted; call it after changing a collection outside this manager.
+
+        Args:
+            module_id: Module to invalidate, or None for all modules.
+        """
+        with self._cache_lock:
+            if module_id is None:
+                self._collections.clear()
+                self._counts.clear()
+                self._results.clear()
+                self._epoch += 1
+                return
+            self._collections.pop(module_id, None)
+            self._counts.pop(module_id, None)
+            self._generations[module_id] = self._generations.get(module_id, 0) + 1
+            for key in [key for key in self._results if key[0] == module_id]:
+                del self._results[key]
+
     def create_collection(
         self,
         module_id: str,
@@ -137,11 +230,14 @@ class VectorStoreManager:
         col_metadata = metadata or {}
         col_metadata["module_id"] = module_id
 
-        self._client.get_or_create_collection(
+        collection = self._client.get_or_create_collection(
             name=name,
             embedding_function=self._get_embedding_function(),
             metadata=col_metadata,
         )
+        self.invalidate(module_id)
+        with self._cache_lock:
+            self._collections[module_id] = collection
         logger.info("Collection '%s' ready for module '%s'", name, module_id)
 
     def delete_collection(self, module_id: str) -> None:
@@ -154,6 +250,7 @@ class VectorStoreManager:
             CollectionNotFoundError: If the collection does not exist.
         """
         name = self._collection_name(module_id)
+        self.invalidate(module_id)
         try:
             self._client.delete_collection(name=name)
             logger.info("Collection '%s' deleted", name)
@@ -212,17 +309,15 @@ class VectorStoreManager:
             )
 
         name = self._collection_name(module_id)
-        try:
-            collection = self._client.get_collection(
-                name=name,
-                embedding_function=self._get_embedding_function(),
-            )
-        except (ValueError, ChromaNotFoundError) as exc:
-            raise CollectionNotFoundError(
-                f"No collection for module '{module_id}'. Call create_collection first."
-            ) from exc
+        collection = self._get_collection(
+            module_id,
+            f"No collection for module '{module_id}'. Call create_collection first.",
+        )
 
-        collection.add(documents=documents, metadatas=metadatas, ids=ids)
+        try:
+            collection.add(documents=documents, metadatas=metadatas, ids=ids)
+        finally:
+            self.invalidate(module_id)
         logger.info(
             "Added %d documents to collection '%s'", len(documents), name,
         )
@@ -249,23 +344,25 @@ class VectorStoreManager:
                 - metadata: The document's metadata dict
                 - distance: Similarity distance (lower is more similar)
 
+        Results are served from the query cache when the same query was
+        made since the module last changed. The returned list and result
+        dicts are copies, so callers may add to or reorder them.
+
         Raises:
             CollectionNotFoundError: If the module collection doesn't exist.
         """
-        name = self._collection_name(module_id)
-        try:
-            collection = self._client.get_collection(
-                name=name,
-                embedding_function=self._get_embedding_function(),
-            )
-        except (ValueError, ChromaNotFoundError) as exc:
-            raise CollectionNotFoundError(
-                f"No collection for module '{module_id}'"
-            ) from exc
+        key = self._cache_key(module_id, query_text, n_results, where)
+        cached = self._cached_results(key)
+        if cached is not None:
+            return cached
+
+        with self._cache_lock:
+            generation = self._generation(module_id)
+        collection = self._get_collection(module_id, f"No collection for module '{module_id}'")
 
         query_params: dict[str, Any] = {
             "query_texts": [query_text],
-            "n_results": min(n_results, collection.count() or n_results),
+            "n_results": min(n_results, self._count(module_id, collection) or n_results),
         }
         if where:
             query_params["where"] = where
@@ -283,7 +380,96 @@ class VectorStoreManager:
                     "distance": raw["distances"][0][i] if raw["distances"] else None,
                 })
 
-        return results
+        with self._cache_lock:
+            # Skip caching if the module changed while the query ran
+            if self._generation(module_id) == generation:
+                self._results[key] = results
+                self._results.move_to_end(key)
+                while len(self._results) > QUERY_CACHE_SIZE:
+                    self._results.popitem(last=False)
+        return _copy_results(results)
+
+    async def query_async(
+        self,
+        module_id: str,
+        query_text: str,
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query like ``query`` without blocking the event loop.
+
+        Cached results are returned directly; otherwise embedding and search
+        run on the manager's worker pool.
+
+        Args:
+            module_id: Module collection to search.
+            query_text: Natural-language query string.
+            n_results: Maximum number of results to return.
+            where: Optional ChromaDB where-filter on metadata fields.
+
+        Returns:
+            Result dicts as returned by ``query``.
+
+        Raises:
+            CollectionNotFoundError: If the module collection doesn't exist.
+        """
+        cached = self._cached_results(self._cache_key(module_id, query_text, n_results, where))
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            lambda: self.query(module_id, query_text, n_results=n_results, where=where),
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker pool for ``query_async``, created on first use."""
+        with self._cache_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=QUERY_WORKERS, thread_name_prefix="vector-query",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool used by ``query_async``."""
+        with self._cache_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _cache_key(
+        module_id: str,
+        query_text: str,
+        n_results: int,
+        where: dict[str, Any] | None,
+    ) -> tuple[str, str, int, str]:
+        """Query cache key; the where-filter is compared by its JSON form."""
+        return (module_id, query_text, n_results, json.dumps(where, sort_keys=True, default=str))
+
+    def _cached_results(self, key: tuple[str, str, int, str]) -> list[dict[str, Any]] | None:
+        """Copy of the cached results for ``key``, marking them recently used."""
+        with self._cache_lock:
+            results = self._results.get(key)
+            if results is None:
+                return None
+            self._results.move_to_end(key)
+        return _copy_results(results)
+
+    def _count(self, module_id: str, collection: Any) -> int:
+        """Document count of a module's collection, cached until it changes."""
+        with self._cache_lock:
+            count = self._counts.get(module_id)
+            if count is not None:
+                return count
+            generation = self._generation(module_id)
+        count = collection.count()
+        with self._cache_lock:
+            # Skip caching if the module changed while counting
+            if self._generation(module_id) == generation:
+                self._counts[module_id] = count
+        return count
 
     # ------------------------------------------------------------------
     # Utilities
@@ -301,17 +487,8 @@ class VectorStoreManager:
         Raises:
             CollectionNotFoundError: If the collection doesn't exist.
         """
-        name = self._collection_name(module_id)
-        try:
-            collection = self._client.get_collection(
-                name=name,
-                embedding_function=self._get_embedding_function(),
-            )
-        except (ValueError, ChromaNotFoundError) as exc:
-            raise CollectionNotFoundError(
-                f"No collection for module '{module_id}'"
-            ) from exc
-        return collection.count()
+        collection = self._get_collection(module_id, f"No collection for module '{module_id}'")
+        return self._count(module_id, collection)
 
 
 __all__ = [
@@ -320,5 +497,7 @@ __all__ = [
     "VectorStoreError",
     "CollectionNotFoundError",
     "DEFAULT_EMBEDDING_MODEL",
+    "QUERY_CACHE_SIZE",
+    "QUERY_WORKERS",
     "VALID_CONTENT_TYPES",
 ]
@@ -19,6 +19,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from .monster_table import MonsterTable, get_monster_table
+
 logger = logging.getLogger("dm20-protocol.combat")
 
 
@@ -343,11 +345,44 @@ def _find_cr_for_budget(
     return candidates
 
 
+def _strongest_fitting(
+    monsters: MonsterTable,
+    xp_budget: int,
+    multiplier: float,
+    count: int = 1,
+    extra_xp: int = 0,
+    below_xp: int | None = None,
+) -> int:
+    """Find the strongest monster of which ``count`` fit the budget.
+
+    Binary search over the XP-sorted table for the largest XP such that
+    ``int((extra_xp + xp * count) * multiplier) <= xp_budget``.
+
+    Args:
+        monsters: Candidate monsters.
+        xp_budget: Target XP budget.
+        multiplier: Encounter multiplier of the whole group.
+        count: Number of copies of the monster.
+        extra_xp: Base XP already spent on other monsters of the group.
+        below_xp: Only consider monsters with strictly less XP than this.
+
+    Returns:
+        Table position of the first monster with that XP, or -1 if none fits.
+    """
+    xps = monsters.xps
+    position = monsters.position_at_most(((xp_budget + 1) / multiplier - extra_xp) / count, below_xp)
+    while position >= 0 and int((extra_xp + xps[position] * count) * multiplier) > xp_budget:
+        position = monsters.first_with_xp(position) - 1
+    if position < 0 or xps[position] == 0:
+        return -1
+    return monsters.first_with_xp(position)
+
+
 def _build_single_powerful(
     xp_budget: int,
     party_size: int,
     thresholds: dict[str, int],
-    available_monsters: list[dict[str, Any]] | None,
+    available_monsters: MonsterTable | None,
     min_cr: float = 0,
     max_cr: float = 30,
     creature_type: str | None = None,
@@ -361,10 +396,12 @@ def _build_single_powerful(
         xp_budget: Target XP budget.
         party_size: Number of party members.
         thresholds: Party XP thresholds.
-        available_monsters: List of monster dicts from rulebook search, or None.
-        min_cr: Minimum CR filter.
-        max_cr: Maximum CR filter.
-        creature_type: Optional creature type filter.
+        available_monsters: Monster table already filtered by CR and type, or None.
+        min_cr: Minimum CR filter (CR table fallback).
+        max_cr: Maximum CR filter (CR table fallback).
+        creature_type: Unused. The table is already filtered by type; with no
+            monster of that type there is no table and the CR placeholders
+            are used, as with the old pre-filtered monster list.
 
     Returns:
         EncounterComposition or None if no suitable monster found.
@@ -372,36 +409,13 @@ def _build_single_powerful(
     multiplier = get_encounter_multiplier(1, party_size)
 
     if available_monsters:
-        # Filter and find best fit from actual monsters
-        best_monster = None
-        best_adjusted = 0
-
-        for monster in available_monsters:
-            cr = monster.get("challenge_rating", 0)
-            xp = monster.get("xp", 0)
-
-            if cr < min_cr or cr > max_cr:
-                continue
-            if creature_type and monster.get("type", "").lower() != creature_type.lower():
-                continue
-
-            adjusted = int(xp * multiplier)
-            if adjusted <= xp_budget and adjusted > best_adjusted:
-                best_monster = monster
-                best_adjusted = adjusted
-
-        if not best_monster:
+        position = _strongest_fitting(available_monsters, xp_budget, multiplier)
+        if position < 0:
             return None
 
-        group = MonsterGroup(
-            monster_name=best_monster["name"],
-            monster_index=best_monster["index"],
-            count=1,
-            challenge_rating=best_monster["challenge_rating"],
-            xp_per_monster=best_monster["xp"],
-            creature_type=best_monster.get("type"),
-        )
-        base_xp = best_monster["xp"]
+        best_monster = available_monsters[position]
+        group = _monster_group(best_monster, 1)
+        base_xp = best_monster.xp
     else:
         # No rulebooks: use CR table to find best fit
         candidates = _find_cr_for_budget(xp_budget, party_size, min_cr, max_cr)
@@ -437,116 +451,70 @@ def _build_mixed_group(
     xp_budget: int,
     party_size: int,
     thresholds: dict[str, int],
-    available_monsters: list[dict[str, Any]] | None,
+    available_monsters: MonsterTable | None,
     min_cr: float = 0,
     max_cr: float = 30,
     creature_type: str | None = None,
 ) -> EncounterComposition | None:
     """Build a mixed group encounter (leader + minions).
 
-    Strategy: One stronger monster (leader) taking ~60% of budget,
-    with 2-4 weaker monsters (minions) using the remaining budget.
+    Strategy: One stronger monster (leader) with 2-4 weaker monsters
+    (minions). With rulebooks, every leader XP value is paired with the
+    strongest minions that fit, and the combination closest to the budget
+    wins.
 
     Args:
         xp_budget: Target XP budget.
         party_size: Number of party members.
         thresholds: Party XP thresholds.
-        available_monsters: List of monster dicts from rulebook search, or None.
-        min_cr: Minimum CR filter.
-        max_cr: Maximum CR filter.
-        creature_type: Optional creature type filter.
+        available_monsters: Monster table already filtered by CR and type, or None.
+        min_cr: Minimum CR filter (CR table fallback).
+        max_cr: Maximum CR filter (CR table fallback).
+        creature_type: Unused. The table is already filtered by type; with no
+            monster of that type there is no table and the CR placeholders
+            are used, as with the old pre-filtered monster list.
 
     Returns:
         EncounterComposition or None if no suitable composition found.
     """
-    # Estimate leader budget as ~60% of total, solve for base XP
-    # We'll iterate to find a good combination
-    leader_budget_fraction = 0.6
-
     if available_monsters:
-        # Filter monsters by type if specified
-        filtered = available_monsters
-        if creature_type:
-            filtered = [m for m in available_monsters if m.get("type", "").lower() == creature_type.lower()]
-            if not filtered:
-                filtered = available_monsters
-
-        # Sort by XP descending
-        sorted_monsters = sorted(
-            [m for m in filtered if min_cr <= m.get("challenge_rating", 0) <= max_cr],
-            key=lambda m: m.get("xp", 0),
-            reverse=True,
-        )
-
-        if not sorted_monsters:
-            return None
-
-        # Try to find a leader + minion combination
-        for leader in sorted_monsters:
-            leader_xp = leader.get("xp", 0)
+        # Every distinct leader XP, strongest first, with the strongest
+        # minions that fit the rest of the budget; keep the fullest group
+        xps = available_monsters.xps
+        best: tuple[int, int, int, int] | None = None  # adjusted XP, leader, minion, minion count
+        for leader_position in available_monsters.distinct_xp_positions():
+            leader_xp = xps[leader_position]
             if leader_xp == 0:
                 continue
 
             # Try different minion counts (2-4)
             for minion_count in range(2, 5):
-                total_count = 1 + minion_count
-                multiplier = get_encounter_multiplier(total_count, party_size)
-                remaining_xp_budget = xp_budget / multiplier - leader_xp
-
-                if remaining_xp_budget <= 0:
-                    continue
-
-                target_minion_xp = remaining_xp_budget / minion_count
-
-                # Find best minion (lower CR than leader)
-                best_minion = None
-                best_diff = float("inf")
-                for m in sorted_monsters:
-                    m_xp = m.get("xp", 0)
-                    if m_xp >= leader_xp or m_xp == 0:
-                        continue
-                    diff = abs(m_xp - target_minion_xp)
-                    if diff < best_diff:
-                        best_minion = m
-                        best_diff = diff
-
-                if not best_minion:
+                multiplier = get_encounter_multiplier(1 + minion_count, party_size)
+                minion_position = _strongest_fitting(
+                    available_monsters, xp_budget, multiplier,
+                    count=minion_count, extra_xp=leader_xp, below_xp=leader_xp,
+                )
+                if minion_position < 0:
                     continue
-
-                minion_xp = best_minion.get("xp", 0)
-                base_xp = leader_xp + (minion_xp * minion_count)
-                adjusted_xp = int(base_xp * multiplier)
-
-                if adjusted_xp <= xp_budget:
-                    groups = [
-                        MonsterGroup(
-                            monster_name=leader["name"],
-                            monster_index=leader["index"],
-                            count=1,
-                            challenge_rating=leader["challenge_rating"],
-                            xp_per_monster=leader_xp,
-                            creature_type=leader.get("type"),
-                        ),
-                        MonsterGroup(
-                            monster_name=best_minion["name"],
-                            monster_index=best_minion["index"],
-                            count=minion_count,
-                            challenge_rating=best_minion["challenge_rating"],
-                            xp_per_monster=minion_xp,
-                            creature_type=best_minion.get("type"),
-                        ),
-                    ]
-                    actual_difficulty = classify_difficulty(adjusted_xp, thresholds)
-                    return EncounterComposition(
-                        strategy="mixed_group",
-                        strategy_description="A leader monster with a group of weaker minions",
-                        monster_groups=groups,
-                        total_monsters=total_count,
-                        base_xp=base_xp,
-                        encounter_multiplier=multiplier,
-                        adjusted_xp=adjusted_xp,
-                        actual_difficulty=actual_difficulty,
-                    )
+                adjusted_xp = int((leader_xp + xps[minion_position] * minion_count) * multiplier)
+                if best is None or adjusted_xp > best[0]:
+                    best = (adjusted_xp, leader_position, minion_position, minion_count)
+
+        if best is not None:
+            adjusted_xp, leader_position, minion_position, minion_count = best
+            leader = available_monsters[leader_position]
+            minion = available_monsters[minion_position]
+            total_count = 1 + minion_count
+            return EncounterComposition(
+                strategy="mixed_group",
+                strategy_description="A leader monster with a group of weaker minions",
+                monster_groups=[_monster_group(leader, 1), _monster_group(minion, minion_count)],
+                total_monsters=total_count,
+                base_xp=leader.xp + minion.xp * minion_count,
+                encounter_multiplier=get_encounter_multiplier(total_count, party_size),
+                adjusted_xp=adjusted_xp,
+                actual_difficulty=classify_difficulty(adjusted_xp, thresholds),
+            )
 
         return None
     else:
@@ -622,7 +590,7 @@ def _build_swarm(
     xp_budget: int,
     party_size: int,
     thresholds: dict[str, int],
-    available_monsters: list[dict[str, Any]] | None,
+    available_monsters: MonsterTable | None,
     min_cr: float = 0,
     max_cr: float = 30,
     creature_type: str | None = None,
@@ -636,10 +604,12 @@ def _build_swarm(
         xp_budget: Target XP budget.
         party_size: Number of party members.
         thresholds: Party XP thresholds.
-        available_monsters: List of monster dicts from rulebook search, or None.
-        min_cr: Minimum CR filter.
-        max_cr: Maximum CR filter.
-        creature_type: Optional creature type filter.
+        available_monsters: Monster table already filtered by CR and type, or None.
+        min_cr: Minimum CR filter (CR table fallback).
+        max_cr: Maximum CR filter (CR table fallback).
+        creature_type: Unused. The table is already filtered by type; with no
+            monster of that type there is no table and the CR placeholders
+            are used, as with the old pre-filtered monster list.
 
     Returns:
         EncounterComposition or None if no suitable composition found.
@@ -648,46 +618,28 @@ def _build_swarm(
     best_adjusted = 0
 
     if available_monsters:
-        filtered = available_monsters
-        if creature_type:
-            filtered = [m for m in available_monsters if m.get("type", "").lower() == creature_type.lower()]
-            if not filtered:
-                filtered = available_monsters
-
-        for monster in filtered:
-            cr = monster.get("challenge_rating", 0)
-            xp = monster.get("xp", 0)
-
-            if cr < min_cr or cr > max_cr or xp == 0:
+        # Strongest fitting monster for each swarm size from 4 to 8
+        for count in range(4, 9):
+            multiplier = get_encounter_multiplier(count, party_size)
+            position = _strongest_fitting(available_monsters, xp_budget, multiplier, count=count)
+            if position < 0:
                 continue
 
-            # Try swarm sizes from 4 to 8
-            for count in range(4, 9):
-                multiplier = get_encounter_multiplier(count, party_size)
-                base_xp = xp * count
-                adjusted_xp = int(base_xp * multiplier)
-
-                if adjusted_xp <= xp_budget and adjusted_xp > best_adjusted:
-                    group = MonsterGroup(
-                        monster_name=monster["name"],
-                        monster_index=monster["index"],
-                        count=count,
-                        challenge_rating=cr,
-                        xp_per_monster=xp,
-                        creature_type=monster.get("type"),
-                    )
-                    actual_difficulty = classify_difficulty(adjusted_xp, thresholds)
-                    best_composition = EncounterComposition(
-                        strategy="swarm",
-                        strategy_description="A swarm of weaker creatures overwhelming through numbers",
-                        monster_groups=[group],
-                        total_monsters=count,
-                        base_xp=base_xp,
-                        encounter_multiplier=multiplier,
-                        adjusted_xp=adjusted_xp,
-                        actual_difficulty=actual_difficulty,
-                    )
-                    best_adjusted = adjusted_xp
+            monster = available_monsters[position]
+            base_xp = monster.xp * count
+            adjusted_xp = int(base_xp * multiplier)
+            if adjusted_xp > best_adjusted:
+                best_composition = EncounterComposition(
+                    strategy="swarm",
+                    strategy_description="A swarm of weaker creatures overwhelming through numbers",
+                    monster_groups=[_monster_group(monster, count)],
+                    total_monsters=count,
+                    base_xp=base_xp,
+                    encounter_multiplier=multiplier,
+                    adjusted_xp=adjusted_xp,
+                    actual_difficulty=classify_difficulty(adjusted_xp, thresholds),
+                )
+                best_adjusted = adjusted_xp
     else:
         # No rulebooks: use CR table
         for cr, xp in CR_TO_XP.items():
@@ -723,6 +675,18 @@ def _build_swarm(
     return best_composition
 
 
+def _monster_group(monster: Any, count: int) -> MonsterGroup:
+    """Create a MonsterGroup of ``count`` copies of a monster table entry."""
+    return MonsterGroup(
+        monster_name=monster.name,
+        monster_index=monster.index,
+        count=count,
+        challenge_rating=monster.challenge_rating,
+        xp_per_monster=monster.xp,
+        creature_type=monster.type or None,
+    )
+
+
 def _format_cr(cr: float) -> str:
     """Format a CR value for display.
 
@@ -744,71 +708,23 @@ def _format_cr(cr: float) -> str:
         return str(cr)
 
 
-def _fetch_monsters_from_rulebooks(
-    rulebook_manager: Any,
-    min_cr: float = 0,
-    max_cr: float = 30,
-    creature_type: str | None = None,
-    environment: str | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch and filter monsters from loaded rulebooks.
+def _load_monster_table(rulebook_manager: Any) -> MonsterTable:
+    """Get the monster table of the loaded rulebooks.
 
-    Uses the RulebookManager search and get_monster infrastructure to
-    retrieve monster data suitable for encounter building.
+    The table covers every monster of the loaded sources and is cached per
+    rulebook manager until its sources change (see combat.monster_table).
 
     Args:
-        rulebook_manager: A RulebookManager instance (or None).
-        min_cr: Minimum challenge rating.
-        max_cr: Maximum challenge rating.
-        creature_type: Filter by creature type (e.g., 'undead', 'beast').
-        environment: Filter by environment/terrain (if data available).
+        rulebook_manager: A RulebookManager instance.
 
     Returns:
-        List of monster dicts with keys: name, index, challenge_rating, xp, type.
+        The monster table, empty if the rulebooks could not be read.
     """
-    if rulebook_manager is None:
-        return []
-
-    monsters: list[dict[str, Any]] = []
-
-    # Search for all monsters (empty query with category filter)
-    # We use a broad search to get as many candidates as possible
     try:
-        search_results = rulebook_manager.search(
-            query="",
-            categories=["monster"],
-            limit=50,
-        )
+        return get_monster_table(rulebook_manager)
     except Exception as e:
         logger.warning(f"Failed to search monsters from rulebooks: {e}")
-        return []
-
-    for result in search_results:
-        try:
-            monster_def = rulebook_manager.get_monster(result.index)
-            if monster_def is None:
-                continue
-
-            cr = monster_def.challenge_rating
-            if cr < min_cr or cr > max_cr:
-                continue
-
-            m_type = getattr(monster_def, "type", "")
-            if creature_type and m_type.lower() != creature_type.lower():
-                continue
-
-            monsters.append({
-                "name": monster_def.name,
-                "index": monster_def.index,
-                "challenge_rating": cr,
-                "xp": monster_def.xp,
-                "type": m_type,
-            })
-        except Exception as e:
-            logger.debug(f"Skipping monster {result.index}: {e}")
-            continue
-
-    return monsters
+        return MonsterTable([])
 
 
 def build_encounter(
@@ -857,12 +773,17 @@ def build_encounter(
     notes: list[str] = []
 
     # Attempt to fetch monsters from rulebooks
-    available_monsters: list[dict[str, Any]] | None = None
+    available_monsters: MonsterTable | None = None
     rulebooks_loaded = False
 
     if rulebook_manager is not None:
-        available_monsters = _fetch_monsters_from_rulebooks(
-            rulebook_manager,
+        monster_table = _load_monster_table(rulebook_manager)
+        if environment and monster_table and not monster_table.has_environments:
+            notes.append(
+                f"Loaded rulebooks have no environment data; environment '{environment}' was ignored."
+            )
+            environment = None
+        available_monsters = monster_table.select(
             min_cr=min_cr,
             max_cr=max_cr,
             creature_type=creature_type,
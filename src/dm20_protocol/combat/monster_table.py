@@ -0,0 +1,216 @@
+"""
+Precomputed monster table for encounter building.
+
+The encounter builder needs every monster of the loaded rulebooks with its
+challenge rating, XP, creature type and environments. Fetching those one
+by one for each encounter is slow, so a MonsterTable is built once per
+loaded rulebook set and cached until sources are loaded, unloaded or
+reordered (see RulebookManager.generation).
+
+Entries are sorted by XP, so the largest monster that fits an XP limit is
+a binary search away. Filtered views (CR range, creature type, environment)
+are built from per-facet position lists and keep the XP order.
+
+Key components:
+- MonsterEntry: the encounter-relevant fields of one monster
+- MonsterTable: XP-sorted entries with CR, type and environment indexes
+- get_monster_table: cached table for a rulebook manager
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import weakref
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+logger = logging.getLogger("dm20-protocol.combat")
+
+
+@dataclass(frozen=True)
+class MonsterEntry:
+    """A monster as seen by the encounter builder."""
+    name: str
+    index: str
+    challenge_rating: float
+    xp: int
+    type: str = ""
+    environments: tuple[str, ...] = ()
+
+
+class MonsterTable:
+    """Monsters sorted by XP (then name), indexed by CR, type and environment.
+
+    Args:
+        entries: Monsters in any order
+
+    Usage:
+        table = MonsterTable(entries)
+        undead = table.select(max_cr=5, creature_type="undead")
+        position = undead.position_at_most(1100)
+    """
+
+    def __init__(self, entries: Iterable[MonsterEntry]):
+        self._entries: list[MonsterEntry] = sorted(entries, key=lambda e: (e.xp, e.name, e.index))
+        self._xps: list[int] = [entry.xp for entry in self._entries]
+        self._by_cr: dict[float, list[int]] | None = None
+        self._by_type: dict[str, list[int]] | None = None
+        self._by_environment: dict[str, list[int]] | None = None
+
+    @classmethod
+    def _from_sorted(cls, entries: list[MonsterEntry]) -> MonsterTable:
+        table = cls.__new__(cls)
+        table._entries = entries
+        table._xps = [entry.xp for entry in entries]
+        table._by_cr = table._by_type = table._by_environment = None
+        return table
+
+    @classmethod
+    def from_rulebooks(cls, rulebook_manager: Any) -> MonsterTable:
+        """Build a table from every monster of a rulebook manager.
+
+        Entries shadowed by a higher-priority source are resolved by the
+        manager's search and get_monster, as for any other lookup.
+        """
+        results = rulebook_manager.search(query="", categories=["monster"], limit=sys.maxsize)
+        entries = []
+        for result in results:
+            try:
+                monster = rulebook_manager.get_monster(result.index)
+                if monster is None:
+                    continue
+                entries.append(MonsterEntry(
+                    name=monster.name,
+                    index=monster.index,
+                    challenge_rating=monster.challenge_rating,
+                    xp=monster.xp,
+                    type=getattr(monster, "type", "") or "",
+                    environments=tuple(getattr(monster, "environment", None) or ()),
+                ))
+            except Exception as e:
+                logger.debug(f"Skipping monster {result.index}: {e}")
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[MonsterEntry]:
+        return iter(self._entries)
+
+    def __getitem__(self, position: int) -> MonsterEntry:
+        return self._entries[position]
+
+    @property
+    def xps(self) -> list[int]:
+        """XP of each entry, ascending."""
+        return self._xps
+
+    @property
+    def has_environments(self) -> bool:
+        """Whether any entry carries environment data."""
+        return bool(self._indexes()[2])
+
+    def _indexes(self) -> tuple[dict[float, list[int]], dict[str, list[int]], dict[str, list[int]]]:
+        """CR, creature type and environment -> positions, built on first use."""
+        if self._by_cr is None:
+            by_cr: dict[float, list[int]] = {}
+            by_type: dict[str, list[int]] = {}
+            by_environment: dict[str, list[int]] = {}
+            for position, entry in enumerate(self._entries):
+                by_cr.setdefault(entry.challenge_rating, []).append(position)
+                by_type.setdefault(entry.type.lower(), []).append(position)
+                for environment in entry.environments:
+                    by_environment.setdefault(environment.lower(), []).append(position)
+            self._by_cr, self._by_type, self._by_environment = by_cr, by_type, by_environment
+        return self._by_cr, self._by_type, self._by_environment  # type: ignore[return-value]
+
+    # --- Queries ---
+
+    def select(
+        self,
+        min_cr: float = 0,
+        max_cr: float = 30,
+        creature_type: str | None = None,
+        environment: str | None = None,
+    ) -> MonsterTable:
+        """Entries within a CR range and of a creature type/environment.
+
+        Returns:
+            A new table in the same XP order (self if nothing is filtered)
+        """
+        by_cr, by_type, by_environment = self._indexes()
+        crs = [cr for cr in by_cr if min_cr <= cr <= max_cr]
+        if len(crs) == len(by_cr) and not creature_type and not environment:
+            return self
+
+        positions: set[int] = set()
+        for cr in crs:
+            positions.update(by_cr[cr])
+        if creature_type:
+            positions.intersection_update(by_type.get(creature_type.lower(), ()))
+        if environment:
+            positions.intersection_update(by_environment.get(environment.lower(), ()))
+        return MonsterTable._from_sorted([self._entries[p] for p in sorted(positions)])
+
+    def position_at_most(self, xp: float, below: int | None = None) -> int:
+        """Position of the strongest entry with XP <= xp (and < below).
+
+        Returns:
+            The position, or -1 if no entry qualifies
+        """
+        position = bisect_right(self._xps, xp) - 1
+        if below is not None:
+            position = min(position, bisect_left(self._xps, below) - 1)
+        return position
+
+    def first_with_xp(self, position: int) -> int:
+        """First position holding the same XP as ``position``."""
+        return bisect_left(self._xps, self._xps[position])
+
+    def distinct_xp_positions(self) -> list[int]:
+        """First position of each XP value, strongest first."""
+        positions = []
+        position = len(self._xps) - 1
+        while position >= 0:
+            first = self.first_with_xp(position)
+            positions.append(first)
+            position = first - 1
+        return positions
+
+
+# Tables cached per rulebook manager, keyed by the manager's generation
+_TABLE_CACHE: weakref.WeakKeyDictionary[Any, tuple[int, MonsterTable]] = weakref.WeakKeyDictionary()
+
+
+def get_monster_table(rulebook_manager: Any) -> MonsterTable:
+    """Monster table for a rulebook manager, rebuilt when its sources change.
+
+    Managers without a ``generation`` counter get a fresh table every call.
+    """
+    generation = getattr(rulebook_manager, "generation", None)
+    if not isinstance(generation, int):
+        return MonsterTable.from_rulebooks(rulebook_manager)
+
+    try:
+        cached = _TABLE_CACHE.get(rulebook_manager)
+    except TypeError:
+        cached = None
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    table = MonsterTable.from_rulebooks(rulebook_manager)
+    logger.debug(f"Built monster table with {len(table)} monsters")
+    try:
+        _TABLE_CACHE[rulebook_manager] = (generation, table)
+    except TypeError:
+        pass  # Not weak-referenceable: skip caching
+    return table
+
+
+__all__ = [
+    "MonsterEntry",
+    "MonsterTable",
+    "get_monster_table",
+]
@@ -101,6 +101,7 @@ class PartyKnowledge:
         """
         # Import here to avoid circular imports at module level
         from dm20_protocol.claudmaster.consistency.fact_database import FactDatabase as _FDB
+        from dm20_protocol.claudmaster.consistency.journal import StoreJournal
         if not isinstance(fact_db, _FDB):
             raise TypeError(
                 f"fact_db must be a FactDatabase instance, got {type(fact_db).__name__}"
@@ -109,6 +110,7 @@ class PartyKnowledge:
         self._fact_db = fact_db
         self._campaign_path = Path(campaign_path)
         self._records: dict[str, KnowledgeRecord] = {}
+        self._journal = StoreJournal(self._knowledge_path)
 
         self._campaign_path.mkdir(parents=True, exist_ok=True)
         self.load()
@@ -170,8 +172,7 @@ class PartyKnowledge:
             method = AcquisitionMethod(method)
 
         # Tag the fact in FactDatabase
-        if PARTY_KNOWN_TAG not in fact.tags:
-            fact.tags.append(PARTY_KNOWN_TAG)
+        self._fact_db.add_tag(fact_id, PARTY_KNOWN_TAG)
 
         # Create knowledge record
         record = KnowledgeRecord(
@@ -183,6 +184,7 @@ class PartyKnowledge:
             notes=notes,
         )
         self._records[fact_id] = record
+        self._journal.append("learn", record=record)
 
         logger.debug(
             f"Party learned fact {fact_id} via {method.value} "
@@ -379,57 +381,59 @@ class PartyKnowledge:
         return True
 
     def save(self) -> None:
-        """Persist party knowledge records to party_knowledge.json."""
-        data = {
-            "version": "1.0",
-            "records": [
-                record.model_dump(mode="json")
-                for record in self._records.values()
-            ],
-            "metadata": {
-                "total_known_facts": len(self._records),
-                "last_updated": datetime.now(timezone.utc).isoformat(),
-            },
-        }
-
-        with open(self._knowledge_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        logger.info(
-            f"Saved {len(self._records)} party knowledge records "
-            f"to {self._knowledge_path}"
-        )
+        """Persist party knowledge records to party_knowledge.json and its journal."""
+        changes = self._journal.pending
+
+        def build_snapshot() -> dict:
+            return {
+                "version": "1.0",
+                "records": [
+                    record.model_dump(mode="json")
+                    for record in self._records.values()
+                ],
+                "metadata": {
+                    "total_known_facts": len(self._records),
+                    "last_updated": datetime.now(timezone.utc).isoformat(),
+                },
+            }
+
+        if self._journal.save(build_snapshot, live_items=len(self._records)):
+            logger.info(
+                f"Saved {len(self._records)} party knowledge records "
+                f"to {self._knowledge_path}"
+            )
+        else:
+            logger.debug(f"Journaled {changes} party knowledge changes to {self._journal.journal_path}")
 
     def load(self) -> None:
         """
-        Load party knowledge records from party_knowledge.json.
+        Load party knowledge records from party_knowledge.json and replay the journal.
 
         If the file doesn't exist, initializes with no records.
         If the file is corrupt, logs a warning and starts fresh.
         """
-        if not self._knowledge_path.exists():
-            logger.debug(
-                f"No existing party knowledge at {self._knowledge_path}, "
-                f"starting empty"
-            )
-            self._records = {}
-            return
+        self._records = {}
 
         try:
-            with open(self._knowledge_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._journal.read_snapshot()
+            if data is None:
+                logger.debug(
+                    f"No existing party knowledge at {self._knowledge_path}, "
+                    f"starting empty"
+                )
+                return
 
             if not isinstance(data, dict) or "records" not in data:
                 raise ValueError("Invalid party knowledge structure")
 
-            self._records = {}
             for record_data in data["records"]:
                 record = KnowledgeRecord(**record_data)
                 self._records[record.fact_id] = record
+            replayed = self._journal.replay(data.get("journal"), self._apply_record)
 
             logger.info(
                 f"Loaded {len(self._records)} party knowledge records "
-                f"from {self._knowledge_path}"
+                f"from {self._knowledge_path} ({replayed} journaled changes)"
             )
 
         except (json.JSONDecodeError, ValueError, TypeError) as e:
@@ -439,6 +443,13 @@ class PartyKnowledge:
             logger.warning("Starting with empty party knowledge")
             self._records = {}
 
+    def _apply_record(self, record: dict) -> None:
+        """Apply one journal record to the knowledge records."""
+        if record["op"] != "learn":
+            raise ValueError(f"Unknown journal operation {record['op']!r}")
+        knowledge = KnowledgeRecord(**record["record"])
+        self._records[knowledge.fact_id] = knowledge
+
 
 __all__ = [
     "PARTY_KNOWN_TAG",
@@ -0,0 +1,295 @@
+"""
+Append-only adventure log with in-memory indexes.
+
+Events are stored one JSON object per line in ``events/adventure_log.jsonl``.
+Adding an event appends a single line instead of rewriting the whole log,
+and compaction rewrites the file only when it contains damaged records
+(e.g. a line torn by a crash mid-write) or when migrating the legacy
+``adventure_log.json`` array.
+
+Key components:
+- AdventureLog: owns the JSONL file, the events in insertion order and the
+  indexes used by DnDStorage.get_events and DnDStorage.search_events
+- Time index: event positions ordered by timestamp, overall and per
+  event_type, so the newest N events cost O(N)
+- Token index: inverted index of lowercase word tokens in titles and
+  descriptions, plus an n-gram index over that vocabulary; substring
+  searches only verify events holding a word that can match each query
+  token
+"""
+
+import json
+import logging
+import re
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterable
+
+from pydantic import ValidationError
+
+from .models import AdventureEvent
+
+logger = logging.getLogger("dm20-protocol")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Words are indexed under every substring up to this length
+_GRAM = 3
+
+
+class _TimeIndex:
+    """Event positions ordered by timestamp.
+
+    Ties are kept newest-inserted first, so iterating in reverse yields
+    newest timestamp first and insertion order among equal timestamps,
+    which matches a stable ``sorted(..., reverse=True)`` over the log.
+    """
+
+    __slots__ = ("times", "positions")
+
+    def __init__(self) -> None:
+        self.times: list[datetime] = []
+        self.positions: list[int] = []
+
+    def add(self, position: int, timestamp: datetime) -> None:
+        if not self.times or timestamp > self.times[-1]:
+            self.times.append(timestamp)
+            self.positions.append(position)
+            return
+        index = bisect_left(self.times, timestamp)
+        self.times.insert(index, timestamp)
+        self.positions.insert(index, position)
+
+    def newest(self) -> reversed:
+        return reversed(self.positions)
+
+
+class AdventureLog:
+    """JSONL-backed adventure log.
+
+    Attributes:
+        path: The JSONL file events are appended to
+        legacy_path: Optional JSON array file migrated on first load
+    """
+
+    def __init__(self, path: Path, legacy_path: Path | None = None):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._events: list[AdventureEvent] = []
+        self._by_time = _TimeIndex()
+        self._by_type: dict[str, _TimeIndex] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._grams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def events(self) -> list[AdventureEvent]:
+        """All events in the order they were added."""
+        return list(self._events)
+
+    # Persistence
+
+    def load(self) -> None:
+        """Load events from disk, replacing any events in memory.
+
+        Damaged lines are skipped and the file is compacted so later appends
+        start on a clean line. A legacy JSON array log is converted to JSONL
+        and kept as ``adventure_log.json.bak``.
+        """
+        with self._lock:
+            self._reset()
+            if self.path.exists():
+                self._load_jsonl()
+            elif self.legacy_path and self.legacy_path.exists():
+                self._load_legacy(self.legacy_path)
+            else:
+                logger.debug("❌ Adventure log file does not exist. No events loaded.")
+
+    def _load_jsonl(self) -> None:
+        damaged = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    event = AdventureEvent.model_validate_json(line)
+                except (ValidationError, ValueError) as e:
+                    damaged += 1
+                    logger.warning(f"⚠️ Skipping damaged adventure log record on line {line_number}: {e}")
+                    continue
+                self._index(event)
+                if not line.endswith("\n"):
+                    # Valid record without its terminator: rewrite before appending
+                    damaged += 1
+
+        logger.info(f"✅ Successfully loaded {len(self._events)} events.")
+        if damaged:
+            logger.warning(f"⚠️ Adventure log had {damaged} damaged record(s), compacting.")
+            self.compact()
+
+    def _load_legacy(self, legacy_path: Path) -> None:
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                events_data = json.load(f)
+            events = [AdventureEvent.model_validate(event) for event in events_data]
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"❌ Error loading events: {e}")
+            return
+
+        for event in events:
+            self._index(event)
+        self.compact()
+        legacy_path.replace(legacy_path.with_name(legacy_path.name + ".bak"))
+        logger.info(f"✅ Migrated {len(self._events)} events from {legacy_path.name} to {self.path.name}.")
+
+    def append(self, event: AdventureEvent) -> None:
+        """Append an event to the log file and the indexes.
+
+        Args:
+            event: The event to record
+        """
+        line = event.model_dump_json() + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self._index(event)
+
+    def compact(self) -> None:
+        """Rewrite the log file with exactly the events held in memory.
+
+        Writes to a temporary file and renames it over the log so a crash
+        leaves either the old or the new file intact.
+        """
+        with self._lock:
+            temp_file = self.path.with_suffix('.tmp')
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    for event in self._events:
+                        f.write(event.model_dump_json() + "\n")
+                temp_file.replace(self.path)
+            except Exception as e:
+                if temp_file.exists():
+                    temp_file.unlink()
+                logger.error(f"❌ Error compacting adventure log: {e}")
+                raise
+            logger.debug(f"✅ Compacted adventure log ({len(self._events)} events)")
+
+    # Indexing and queries
+
+    def _index(self, event: AdventureEvent) -> None:
+        position = len(self._events)
+        self._events.append(event)
+        self._by_time.add(position, event.timestamp)
+        self._by_type.setdefault(event.event_type, _TimeIndex()).add(position, event.timestamp)
+        tokens = set(_TOKEN_RE.findall(event.title.lower()))
+        tokens.update(_TOKEN_RE.findall(event.description.lower()))
+        for token in tokens:
+            positions = self._postings.get(token)
+            if positions is None:
+                positions = self._postings[token] = []
+                self._index_word(token)
+            positions.append(position)
+
+    def _index_word(self, word: str) -> None:
+        for size in range(1, min(_GRAM, len(word)) + 1):
+            for start in range(len(word) - size + 1):
+                self._grams.setdefault(word[start:start + size], set()).add(word)
+
+    def _words_matching(self, token: str, bounded_left: bool, bounded_right: bool) -> set[str]:
+        """Vocabulary words a query token can fall inside.
+
+        A token followed by more query text must end its word, one preceded
+        by query text must start it, so a token bounded on both sides is an
+        exact word lookup. Otherwise the n-gram index narrows the vocabulary
+        to words containing all of the token's trigrams.
+        """
+        if bounded_left and bounded_right:
+            return {token} if token in self._postings else set()
+        if len(token) <= _GRAM:
+            words = self._grams.get(token, set())
+        else:
+            gram_sets = sorted(
+                (self._grams.get(token[i:i + _GRAM], set()) for i in range(len(token) - _GRAM + 1)),
+                key=len,
+            )
+            words = set(gram_sets[0]).intersection(*gram_sets[1:])
+        if bounded_left:
+            return {word for word in words if word.startswith(token)}
+        if bounded_right:
+            return {word for word in words if word.endswith(token)}
+        return {word for word in words if token in word}
+
+    def recent(self, limit: int | None = None, event_type: str | None = None) -> list[AdventureEvent]:
+        """Get events newest first, optionally filtered by type.
+
+        Args:
+            limit: Maximum number of events to return (falsy for all)
+            event_type: Only return events of this type (falsy for all)
+
+        Returns:
+            Events ordered by timestamp, newest first
+        """
+        with self._lock:
+            if event_type:
+                index = self._by_type.get(event_type)
+                if index is None:
+                    return []
+            else:
+                index = self._by_time
+            positions: Iterable[int] = index.newest()
+            if limit:
+                positions = islice(positions, limit)
+            return [self._events[position] for position in positions]
+
+    def search(self, query: str) -> list[AdventureEvent]:
+        """Find events whose title or description contains the query.
+
+        Matching is a case-insensitive substring test, as before. Every word
+        of the query must lie inside some word of a matching event, so only
+        events whose postings cover all query words are tested. Inner query
+        words are looked up exactly, the first and last ones through the
+        n-gram index.
+
+        Args:
+            query: Text to look for
+
+        Returns:
+            Matching events in the order they were added
+        """
+        query_lower = query.lower()
+        with self._lock:
+            tokens = {
+                (match.group(), match.start() > 0, match.end() < len(query_lower))
+                for match in _TOKEN_RE.finditer(query_lower)
+            }
+            if tokens:
+                candidates: set[int] | None = None
+                # Exact words first, then longest: the most selective lookups
+                ordered = sorted(tokens, key=lambda t: (not (t[1] and t[2]), -len(t[0])))
+                for token, left, right in ordered:
+                    matches: set[int] = set()
+                    for word in self._words_matching(token, left, right):
+                        matches.update(self._postings[word])
+                    candidates = matches if candidates is None else candidates & matches
+                    if not candidates:
+                        return []
+                positions: Iterable[int] = sorted(candidates or ())
+            else:
+                positions = range(len(self._events))
+
+            results = []
+            for position in positions:
+                event = self._events[position]
+                if query_lower in event.title.lower() or query_lower in event.description.lower():
+                    results.append(event)
+            return results
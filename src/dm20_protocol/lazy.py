@@ -0,0 +1,96 @@
+"""
+Deferred initialization of expensive server resources.
+
+Some resources the server needs (the PDF library index, the global 5etools
+rulebook) take long to build and are not needed to answer the first
+request. A LazyResource builds its value on a background thread, either
+started explicitly once the server is up or on first use, and hands the
+value to every caller once it is ready.
+
+Key components:
+- LazyResource: thread-safe, build-once holder that also forwards
+  attribute access to the built value
+"""
+
+import logging
+import threading
+from typing import Callable, Generic, TypeVar
+
+logger = logging.getLogger("dm20-protocol")
+
+T = TypeVar("T")
+
+
+class LazyResource(Generic[T]):
+    """A value built once, off the calling thread, when first needed.
+
+    The factory always runs on a dedicated daemon thread, so it can create
+    its own asyncio event loop even when ``get()`` is called from inside a
+    running one. Exceptions raised by the factory are re-raised to every
+    caller of ``get()``.
+
+    Args:
+        name: Human-readable name used in log messages
+        factory: Callable that builds the value
+
+    Usage:
+        library = LazyResource("library manager", build_library)
+        library.start()          # begin loading in the background
+        library.get()            # wait for and return the value
+        library.list_library()   # attribute access is forwarded
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        self._name = name
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._value: T | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the factory has finished, successfully or not."""
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Begin building the value in the background. Idempotent."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._build, name=f"dm20-load-{self._name}", daemon=True)
+            self._thread.start()
+
+    def get(self, timeout: float | None = None) -> T:
+        """Return the value, building it first if needed.
+
+        Args:
+            timeout: Seconds to wait for a build in progress, None to wait
+                indefinitely
+
+        Raises:
+            TimeoutError: If the value is not ready within ``timeout``
+        """
+        self.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"{self._name} is still loading")
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+    def __getattr__(self, attr: str):  # type: ignore[no-untyped-def]
+        # Only reached for names not defined on LazyResource itself
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.get(), attr)
+
+    def _build(self) -> None:
+        try:
+            self._value = self._factory()
+            logger.debug(f"✅ {self._name} ready")
+        except BaseException as e:
+            logger.error(f"❌ Failed to load {self._name}: {e}")
+            self._error = e
+        finally:
+            self._ready.set()
@@ -9,13 +9,21 @@ The library system:
 - Extracts content on-demand to CustomSource JSON format
 - Loads extracted content through existing CustomSource infrastructure
 - Manages per-campaign bindings to enable/disable library content
+
+The manager, extractors and search modules pull in PyMuPDF and the vector
+store, so they are imported on first attribute access rather than when the
+package is imported.
 """
 
-from .manager import LibraryManager
-from .models import LibrarySource, IndexEntry, TOCEntry, ContentSummary, ContentType
-from .extractors import TOCExtractor, ContentExtractor, ExtractedContent
-from .bindings import SourceBinding, LibraryBindings
-from .search import LibrarySearch, SearchResult
+from typing import TYPE_CHECKING, Any
+
+from .bindings import LibraryBindings, SourceBinding
+from .models import ContentSummary, ContentType, IndexEntry, LibrarySource, TOCEntry
+
+if TYPE_CHECKING:
+    from .extractors import ContentExtractor, ExtractedContent, TOCExtractor
+    from .manager import LibraryManager
+    from .search import LibrarySearch, SearchResult
 
 __all__ = [
     "LibraryManager",
@@ -32,3 +40,25 @@ __all__ = [
     "LibrarySearch",
     "SearchResult",
 ]
+
+
+# Names resolved lazily by __getattr__, mapped to the submodule defining them
+_LAZY_EXPORTS = {
+    "LibraryManager": ".manager",
+    "TOCExtractor": ".extractors",
+    "ContentExtractor": ".extractors",
+    "ExtractedContent": ".extractors",
+    "LibrarySearch": ".search",
+    "SearchResult": ".search",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy submodules on first use."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
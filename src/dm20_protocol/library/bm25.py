@@ -0,0 +1,389 @@
+"""
+Persistent BM25 index for keyword search in the PDF Library System.
+
+Each library source is indexed into its own segment: one document per TOC
+entry, made of the entry title and, when the entry has been extracted, the
+extracted text. A segment is written next to the source's index file as
+``<source_id>.bm25.json`` (documents and vocabulary) plus
+``<source_id>.bm25`` (postings), and the postings file is memory-mapped
+when the segment is loaded, so startup reads only the vocabulary.
+
+Document frequencies, document count and average length are library-wide,
+summed over the loaded segments. A query only reads the postings of its
+terms, so its cost depends on how many documents contain them rather than
+on the size of the library.
+"""
+
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger("dm20-protocol")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title tokens count this many times in a document's term frequencies
+TITLE_WEIGHT = 3
+
+# Query terms also match indexed terms they are a prefix of ("dragon" ->
+# "dragonborn"), at this fraction of their weight
+PREFIX_WEIGHT = 0.5
+PREFIX_MIN_LENGTH = 3
+PREFIX_MAX_EXPANSIONS = 32
+
+SEGMENT_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens of a text."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass
+class IndexedDocument:
+    """A TOC entry as stored in a segment.
+
+    Attributes:
+        title: Entry title
+        page: Page where the entry starts
+        content_type: Content type value, None if unknown
+        length: Weighted token count used for length normalization
+    """
+
+    title: str
+    page: Optional[int]
+    content_type: Optional[str]
+    length: int
+
+
+class _Segment:
+    """Documents, vocabulary and memory-mapped postings of one source."""
+
+    def __init__(
+        self,
+        key: str,
+        documents: list[IndexedDocument],
+        terms: dict[str, tuple[int, int]],
+        postings: memoryview,
+        mapped: Optional[mmap.mmap] = None,
+    ) -> None:
+        self.key = key
+        self.documents = documents
+        # term -> (offset of its first (doc, tf) pair, number of pairs)
+        self.terms = terms
+        self.postings = postings
+        self.total_length = sum(doc.length for doc in documents)
+        self._mapped = mapped
+
+    def postings_of(self, term: str) -> Iterable[tuple[int, int]]:
+        """(document position, term frequency) pairs of a term."""
+        entry = self.terms.get(term)
+        if entry is None:
+            return ()
+        offset, count = entry
+        values = self.postings[offset * 2:(offset + count) * 2]
+        return zip(values[::2], values[1::2])
+
+    def document_frequencies(self) -> dict[str, int]:
+        """Number of documents of this segment containing each term."""
+        return {term: count for term, (_, count) in self.terms.items()}
+
+    def close(self) -> None:
+        """Release the memory map of the postings file.
+
+        If a postings slice is still referenced, the map cannot be closed
+        yet; it is unmapped when the last slice is garbage collected.
+        """
+        self.postings.release()
+        mapped, self._mapped = self._mapped, None
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                logger.debug("Postings still in use, leaving the segment map to the garbage collector")
+
+
+class BM25Index:
+    """Library-wide BM25 index made of per-source segments.
+
+    Args:
+        index_dir: Directory holding the segment files
+
+    Usage:
+        index = BM25Index(library_dir / "index")
+        if not index.load_source("phb", key):
+            index.index_source("phb", key, [("Fighter", 20, "class", "")])
+        index.search({"fighter": 1.0, "martial": 0.5}, limit=10)
+    """
+
+    def __init__(self, index_dir: Path) -> None:
+        self.index_dir = Path(index_dir)
+        self._segments: dict[str, _Segment] = {}
+        self._df: Counter[str] = Counter()
+        self._doc_count = 0
+        self._total_length = 0
+        self._vocabulary: Optional[list[str]] = None
+        # Held while segments are swapped and while they are searched
+        self._lock = threading.RLock()
+
+    def __contains__(self, source_id: str) -> bool:
+        return source_id in self._segments
+
+    def segment_key(self, source_id: str) -> Optional[str]:
+        """Key the loaded segment of a source was built for, None if not loaded."""
+        segment = self._segments.get(source_id)
+        return segment.key if segment else None
+
+    @property
+    def document_count(self) -> int:
+        """Number of indexed documents across all sources."""
+        return self._doc_count
+
+    def idf(self, term: str) -> float:
+        """Library-wide inverse document frequency of a term."""
+        df = self._df.get(term, 0)
+        return math.log(1 + (self._doc_count - df + 0.5) / (df + 0.5))
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def _paths(self, source_id: str) -> tuple[Path, Path]:
+        return (
+            self.index_dir / f"{source_id}.bm25.json",
+            self.index_dir / f"{source_id}.bm25",
+        )
+
+    def index_source(
+        self,
+        source_id: str,
+        key: str,
+        entries: Iterable[tuple[str, Optional[int], Optional[str], str]],
+    ) -> int:
+        """Build, persist and load the segment of a source.
+
+        Args:
+            source_id: The source identifier
+            key: Identifies what the segment was built from; ``load_source``
+                only accepts a persisted segment with the same key
+            entries: (title, page, content type, extracted text) per TOC entry
+
+        Returns:
+            Number of indexed documents
+        """
+        documents: list[IndexedDocument] = []
+        postings: dict[str, list[int]] = {}
+        for position, (title, page, content_type, text) in enumerate(entries):
+            frequencies: Counter[str] = Counter()
+            for token in tokenize(title):
+                frequencies[token] += TITLE_WEIGHT
+            if text:
+                frequencies.update(tokenize(text))
+            documents.append(IndexedDocument(
+                title=title,
+                page=page,
+                content_type=content_type,
+                length=sum(frequencies.values()),
+            ))
+            for term, tf in frequencies.items():
+                postings.setdefault(term, []).extend((position, tf))
+
+        flat = array("I")
+        terms: dict[str, tuple[int, int]] = {}
+        for term in sorted(postings):
+            values = postings[term]
+            terms[term] = (len(flat) // 2, len(values) // 2)
+            flat.extend(values)
+
+        meta_path, postings_path = self._paths(source_id)
+        with self._lock:
+            self.remove_source(source_id)
+            try:
+                self.index_dir.mkdir(parents=True, exist_ok=True)
+                _write_atomic(postings_path, flat.tobytes())
+                _write_atomic(meta_path, json.dumps({
+                    "version": SEGMENT_VERSION,
+                    "key": key,
+                    "byteorder": sys.byteorder,
+                    "documents": [
+                        [doc.title, doc.page, doc.content_type, doc.length] for doc in documents
+                    ],
+                    "terms": terms,
+                }).encode("utf-8"))
+            except OSError as exc:
+                logger.warning(f"Could not persist search index for {source_id}: {exc}")
+
+            self._add(source_id, _Segment(key, documents, terms, memoryview(flat)))
+        return len(documents)
+
+    def load_source(self, source_id: str, key: str) -> bool:
+        """Load a persisted segment, memory-mapping its postings.
+
+        Args:
+            source_id: The source identifier
+            key: Expected segment key
+
+        Returns:
+            True if a segment built for ``key`` was loaded
+        """
+        meta_path, postings_path = self._paths(source_id)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if (
+                meta.get("version") != SEGMENT_VERSION
+                or meta.get("key") != key
+                or meta.get("byteorder") != sys.byteorder
+            ):
+                return False
+            documents = [IndexedDocument(*doc) for doc in meta["documents"]]
+            terms = {term: (offset, count) for term, (offset, count) in meta["terms"].items()}
+            mapped: Optional[mmap.mmap] = None
+            if postings_path.stat().st_size:
+                with open(postings_path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                postings = memoryview(mapped).cast("I")
+            else:
+                postings = memoryview(array("I"))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.debug(f"No usable search index for {source_id}: {exc}")
+            return False
+
+        with self._lock:
+            self.remove_source(source_id)
+            self._add(source_id, _Segment(key, documents, terms, postings, mapped))
+        return True
+
+    def remove_source(self, source_id: str) -> None:
+        """Unload a source's segment (its files are kept)."""
+        with self._lock:
+            segment = self._segments.get(source_id)
+            if segment is None:
+                return
+            segment.close()
+            del self._segments[source_id]
+            self._df.subtract(segment.document_frequencies())
+            self._df += Counter()  # drop terms no longer in any segment
+            self._doc_count -= len(segment.documents)
+            self._total_length -= segment.total_length
+            self._vocabulary = None
+
+    def _add(self, source_id: str, segment: _Segment) -> None:
+        with self._lock:
+            self._segments[source_id] = segment
+            self._df.update(segment.document_frequencies())
+            self._doc_count += len(segment.documents)
+            self._total_length += segment.total_length
+            self._vocabulary = None
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _expand_prefixes(self, weights: dict[str, float]) -> dict[str, float]:
+        """Add indexed terms that query terms are a prefix of."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._df)
+        vocabulary = self._vocabulary
+        expanded = dict(weights)
+        for term, weight in weights.items():
+            if len(term) < PREFIX_MIN_LENGTH:
+                continue
+            position = bisect_left(vocabulary, term)
+            added = 0
+            while (
+                position < len(vocabulary)
+                and added < PREFIX_MAX_EXPANSIONS
+                and vocabulary[position].startswith(term)
+            ):
+                longer = vocabulary[position]
+                if longer != term and expanded.get(longer, 0.0) < weight * PREFIX_WEIGHT:
+                    expanded[longer] = weight * PREFIX_WEIGHT
+                    added += 1
+                position += 1
+        return expanded
+
+    def score(self, weights: dict[str, float]) -> dict[tuple[str, int], float]:
+        """BM25 scores of the documents containing any weighted query term.
+
+        Args:
+            weights: Query term -> weight
+
+        Returns:
+            (source_id, document position) -> score
+        """
+        with self._lock:
+            if not self._doc_count or not weights:
+                return {}
+            average_length = self._total_length / self._doc_count or 1.0
+            scores: dict[tuple[str, int], float] = {}
+            for term, weight in self._expand_prefixes(weights).items():
+                if term not in self._df:
+                    continue
+                term_weight = weight * self.idf(term)
+                for source_id, segment in self._segments.items():
+                    documents = segment.documents
+                    for position, tf in segment.postings_of(term):
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * documents[position].length / average_length)
+                        key = (source_id, position)
+                        scores[key] = scores.get(key, 0.0) + term_weight * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def search(
+        self,
+        weights: dict[str, float],
+        limit: int,
+        boost: Optional[dict[str, float]] = None,
+    ) -> list[tuple[float, str, IndexedDocument]]:
+        """Find the best matching documents.
+
+        Args:
+            weights: Query term -> weight
+            limit: Maximum number of results
+            boost: Optional score multiplier per content type
+
+        Returns:
+            (score, source_id, document) tuples, best first; ties keep
+            source and TOC order
+        """
+        ranked = []
+        with self._lock:
+            for (source_id, position), score in self.score(weights).items():
+                document = self._segments[source_id].documents[position]
+                if boost and document.content_type in boost:
+                    score *= boost[document.content_type]
+                ranked.append((score, source_id, position, document))
+            order = {source_id: i for i, source_id in enumerate(self._segments)}
+        best = heapq.nsmallest(limit, ranked, key=lambda r: (-r[0], order[r[1]], r[2]))
+        return [(score, source_id, document) for score, source_id, _, document in best]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file renamed into place."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+__all__ = [
+    "BM25Index",
+    "IndexedDocument",
+    "tokenize",
+]
@@ -4,10 +4,12 @@ Content extractors for the PDF/Markdown Library System.
 This package contains extractors for:
 - TOC (Table of Contents) extraction from PDFs and Markdown files
 - Content extraction for classes, races, spells, monsters, feats, items
+- Cached, parallel page text extraction from PDFs
 """
 
 from .toc import TOCExtractor, MarkdownTOCExtractor, get_toc_extractor
 from .content import ContentExtractor, ExtractedContent, MarkdownContentExtractor
+from .pages import PageTextExtractor, RangeText
 
 __all__ = [
     "TOCExtractor",
@@ -16,4 +18,6 @@ __all__ = [
     "ContentExtractor",
     "ExtractedContent",
     "MarkdownContentExtractor",
+    "PageTextExtractor",
+    "RangeText",
 ]
@@ -14,8 +14,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
-import fitz  # PyMuPDF
-
 from ..manager import LibraryManager
 from ..models import ContentType, TOCEntry
 
@@ -254,6 +252,7 @@ class ContentExtractor:
         # Save JSON
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(json_data, f, indent=2, default=str)
+        self.library_manager.invalidate_extracted(source_id)
 
         logger.info(f"Saved extracted content to {output_path}")
         return output_path
@@ -317,31 +316,8 @@ class ContentExtractor:
         page_start: int,
         page_end: int | None,
     ) -> str:
-        """Extract text from a range of PDF pages."""
-        try:
-            doc = fitz.open(pdf_path)
-        except Exception as e:
-            logger.error(f"Failed to open PDF: {e}")
-            return ""
-
-        try:
-            # Convert to 0-indexed
-            start_idx = page_start - 1
-            end_idx = (page_end or page_start) - 1
-
-            # Clamp to valid range
-            start_idx = max(0, min(start_idx, doc.page_count - 1))
-            end_idx = max(start_idx, min(end_idx, doc.page_count - 1))
-
-            text_parts = []
-            for page_num in range(start_idx, end_idx + 1):
-                page = doc[page_num]
-                text = page.get_text()
-                text_parts.append(text)
-
-            return "\n\n".join(text_parts)
-        finally:
-            doc.close()
+        """Extract text from a range of PDF pages (cached per source file)."""
+        return self.library_manager.page_text.text(pdf_path, page_start, page_end)
 
     def _parse_content(
         self,
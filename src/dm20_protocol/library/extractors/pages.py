@@ -0,0 +1,352 @@
+"""
+Page text extraction service for PDF sources.
+
+Module indexing and content extraction both read page ranges of the same
+PDFs. PageTextExtractor keeps each PDF open once per process, caches page
+text on disk keyed by the file's SHA-256 hash, and reads larger batches of
+uncached pages in a process pool (PyMuPDF holds the GIL while extracting,
+so threads would not help).
+
+Ranges are produced in order as their pages become available, with only a
+bounded number of page batches in flight, so a caller can chunk and store
+a 600-page book section by section without holding all of its text.
+
+Cache layout::
+
+    <cache_dir>/<file_hash>/meta.json     # {"page_count": 412}
+    <cache_dir>/<file_hash>/00041.txt     # text of page 42
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger("dm20-protocol")
+
+# Consecutive pages extracted by one pool task
+PAGES_PER_TASK = 16
+
+# Below this many uncached pages, extraction stays in the calling process
+PARALLEL_MIN_PAGES = 32
+
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# PDFs kept open per process
+MAX_OPEN_DOCUMENTS = 4
+
+# Open documents of a pool worker process, by file hash
+_worker_documents: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def _open_document(documents: "OrderedDict[str, Any]", path: str, file_hash: str) -> Any:
+    """Return an open PyMuPDF document from a per-process LRU."""
+    document = documents.get(file_hash)
+    if document is not None:
+        documents.move_to_end(file_hash)
+        return document
+    import fitz  # type: ignore[import-untyped]  # PyMuPDF, imported lazily to keep importers lightweight
+
+    document = fitz.open(path)
+    documents[file_hash] = document
+    while len(documents) > MAX_OPEN_DOCUMENTS:
+        documents.popitem(last=False)[1].close()
+    return document
+
+
+def _read_pages(documents: "OrderedDict[str, Any]", path: str, file_hash: str, pages: list[int]) -> list[str]:
+    document = _open_document(documents, path, file_hash)
+    return [document[page].get_text() for page in pages]
+
+
+def _worker_read_pages(path: str, file_hash: str, pages: list[int]) -> list[str]:
+    """Pool task: text of 0-indexed ``pages``, keeping the PDF open in the worker."""
+    return _read_pages(_worker_documents, path, file_hash, pages)
+
+
+@dataclass
+class RangeText:
+    """Text of a requested page range.
+
+    Attributes:
+        page_start: First requested page (1-indexed)
+        page_end: Last requested page (1-indexed, inclusive), None for one page
+        text: Page texts joined by blank lines, empty on error
+        error: Why the range could not be read, None on success
+    """
+
+    page_start: int
+    page_end: Optional[int]
+    text: str
+    error: Optional[str] = None
+
+
+class PageTextExtractor:
+    """Extracts page text from PDFs with a disk cache and a process pool.
+
+    Args:
+        cache_dir: Directory for cached page text, None to disable the cache
+        workers: Pool size for batches of uncached pages; 1 reads every page
+            in the calling process
+
+    Usage:
+        pages = PageTextExtractor(library_dir / "page_cache")
+        pages.text(pdf_path, 42, 45)
+        for section in pages.extract_ranges(pdf_path, [(1, 15), (5, 10)]):
+            print(section.text)
+        pages.close()
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, workers: int = DEFAULT_WORKERS) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+        # PyMuPDF documents are not thread-safe; used under _lock
+        self._documents: "OrderedDict[str, Any]" = OrderedDict()
+        self._hashes: dict[tuple[str, int, int], str] = {}
+        self._page_counts: dict[str, int] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def file_hash(self, pdf_path: str | Path) -> str:
+        """SHA-256 of a file, remembered while its size and mtime are unchanged."""
+        stat = os.stat(pdf_path)
+        key = (str(Path(pdf_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        digest = self._hashes.get(key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(pdf_path, "rb") as f:
+                for block in iter(lambda: f.read(65536), b""):
+                    hasher.update(block)
+            digest = self._hashes[key] = hasher.hexdigest()
+        return digest
+
+    def text(self, pdf_path: str | Path, page_start: int, page_end: Optional[int] = None) -> str:
+        """Text of one page range.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_start: First page to read (1-indexed)
+            page_end: Last page to read (1-indexed, inclusive), None for one page
+
+        Returns:
+            Page texts joined by blank lines, empty if the PDF cannot be read
+        """
+        [section] = self.extract_ranges(pdf_path, [(page_start, page_end)])
+        if section.error:
+            logger.error(f"Failed to read pages {page_start}-{page_end or page_start} of {pdf_path}: {section.error}")
+        return section.text
+
+    def extract_ranges(
+        self,
+        pdf_path: str | Path,
+        ranges: Iterable[tuple[int, Optional[int]]],
+        file_hash: Optional[str] = None,
+    ) -> Iterator[RangeText]:
+        """Text of several page ranges, produced in order.
+
+        Page numbers are clamped to the document. Uncached pages are read in
+        batches of PAGES_PER_TASK, in the pool when there are at least
+        PARALLEL_MIN_PAGES of them; at most two batches per worker are in
+        flight ahead of the range being produced.
+
+        Args:
+            pdf_path: Path to the PDF file
+            ranges: (page_start, page_end) pairs, 1-indexed and inclusive
+            file_hash: SHA-256 of the file if already known
+
+        Yields:
+            RangeText per requested range, in request order
+        """
+        ranges = list(ranges)
+        path = str(pdf_path)
+        try:
+            file_hash = file_hash or self.file_hash(path)
+            page_count = self._page_count(path, file_hash)
+        except Exception as exc:
+            for page_start, page_end in ranges:
+                yield RangeText(page_start, page_end, "", f"cannot open PDF: {exc}")
+            return
+
+        wanted: list[list[int]] = []
+        for page_start, page_end in ranges:
+            start = max(0, min(page_start - 1, page_count - 1))
+            end = max(start, min((page_end or page_start) - 1, page_count - 1))
+            wanted.append(list(range(start, end + 1)) if page_count else [])
+
+        # Uncached pages in the order they are first needed, split into tasks
+        # of consecutive pages; pages stay in memory until their last use
+        uses: dict[int, int] = {}
+        missing: list[int] = []
+        for pages in wanted:
+            for page in pages:
+                if page not in uses and not self._cached(file_hash, page):
+                    missing.append(page)
+                uses[page] = uses.get(page, 0) + 1
+        tasks: list[list[int]] = []
+        for page in missing:
+            if tasks and len(tasks[-1]) < PAGES_PER_TASK and tasks[-1][-1] == page - 1:
+                tasks[-1].append(page)
+            else:
+                tasks.append([page])
+        task_of = {page: i for i, task in enumerate(tasks) for page in task}
+
+        parallel = self.workers > 1 and len(missing) >= PARALLEL_MIN_PAGES
+        window = self.workers * 2
+        futures: dict[int, Future] = {}
+        loaded: dict[int, str] = {}
+        failed: dict[int, str] = {}
+        submitted = 0
+
+        def fall_back(exc: BaseException) -> None:
+            nonlocal parallel
+            logger.warning(f"PDF page pool unavailable, reading pages in-process: {exc}")
+            parallel = False
+            futures.clear()
+            self._discard_pool()
+
+        def submit_until(last: int) -> None:
+            nonlocal submitted
+            while submitted <= min(last, len(tasks) - 1):
+                if parallel:
+                    try:
+                        futures[submitted] = self._get_pool().submit(
+                            _worker_read_pages, path, file_hash, tasks[submitted],
+                        )
+                    except (BrokenProcessPool, OSError, RuntimeError) as exc:
+                        fall_back(exc)
+                submitted += 1
+
+        def collect(task: int) -> None:
+            pages = tasks[task]
+            texts: Optional[list[str]] = None
+            try:
+                if parallel and task in futures:
+                    try:
+                        texts = futures.pop(task).result()
+                    except BrokenProcessPool as exc:
+                        fall_back(exc)
+                if texts is None:
+                    with self._lock:
+                        texts = _read_pages(self._documents, path, file_hash, pages)
+            except Exception as exc:
+                for page in pages:
+                    failed[page] = str(exc)
+                return
+            for page, text in zip(pages, texts):
+                loaded[page] = text
+                self._store(file_hash, page, text)
+
+        for (page_start, page_end), pages in zip(ranges, wanted):
+            texts: list[str] = []
+            error: Optional[str] = None
+            for page in pages:
+                if page not in loaded and page not in failed:
+                    task = task_of.get(page)
+                    if task is None:
+                        try:
+                            loaded[page] = self._load(file_hash, page)
+                        except OSError as exc:
+                            failed[page] = str(exc)
+                    else:
+                        submit_until(task + window)
+                        collect(task)
+                if page in failed:
+                    error = error or failed[page]
+                else:
+                    texts.append(loaded[page])
+                uses[page] -= 1
+                if uses[page] == 0:
+                    loaded.pop(page, None)
+            yield RangeText(page_start, page_end, "" if error else "\n\n".join(texts), error)
+
+    def close(self) -> None:
+        """Shut the pool down and close open documents."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            for document in self._documents.values():
+                document.close()
+            self._documents.clear()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    # --- Internals ---
+
+    def _discard_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _page_count(self, path: str, file_hash: str) -> int:
+        count = self._page_counts.get(file_hash)
+        if count is not None:
+            return count
+        meta_path = self._cache_path(file_hash, "meta.json")
+        if meta_path is not None and meta_path.exists():
+            try:
+                count = int(json.loads(meta_path.read_text(encoding="utf-8"))["page_count"])
+            except (OSError, ValueError, KeyError, TypeError):
+                count = None
+        if count is None:
+            with self._lock:
+                count = _open_document(self._documents, path, file_hash).page_count
+            if meta_path is not None:
+                self._write(meta_path, json.dumps({"page_count": count}))
+        self._page_counts[file_hash] = count
+        return count
+
+    def _cache_path(self, file_hash: str, name: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / file_hash / name
+
+    def _page_path(self, file_hash: str, page: int) -> Optional[Path]:
+        return self._cache_path(file_hash, f"{page:05d}.txt")
+
+    def _cached(self, file_hash: str, page: int) -> bool:
+        path = self._page_path(file_hash, page)
+        return path is not None and path.exists()
+
+    def _load(self, file_hash: str, page: int) -> str:
+        path = self._page_path(file_hash, page)
+        assert path is not None
+        return path.read_text(encoding="utf-8")
+
+    def _store(self, file_hash: str, page: int, text: str) -> None:
+        path = self._page_path(file_hash, page)
+        if path is not None:
+            self._write(path, text)
+
+    @staticmethod
+    def _write(path: Path, text: str) -> None:
+        """Write a cache file through a temporary file renamed into place."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except (OSError, UnicodeError) as exc:
+            logger.warning(f"Could not cache page text at {path}: {exc}")
+
+
+__all__ = [
+    "PageTextExtractor",
+    "RangeText",
+]
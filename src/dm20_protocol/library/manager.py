@@ -13,6 +13,7 @@ import logging
 from datetime import datetime
 from hashlib import sha256
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .models import (
     LibrarySource,
@@ -20,6 +21,10 @@ from .models import (
     SourceType,
 )
 from .search import LibrarySearch
+from .vector_indexing import IndexingProgress, VectorIndexQueue
+
+if TYPE_CHECKING:
+    from .extractors.pages import PageTextExtractor
 
 logger = logging.getLogger("dm20-protocol")
 
@@ -80,6 +85,7 @@ class LibraryManager:
         dnd_data/library/
         ├── pdfs/           # User drops PDF/MD files here
         ├── index/          # Auto-generated index files
+        ├── page_cache/     # Extracted PDF page text, by file hash
         └── extracted/      # Extracted content (CustomSource format)
 
     Attributes:
@@ -107,9 +113,21 @@ class LibraryManager:
         # Cache of loaded indexes
         self._index_cache: dict[str, IndexEntry] = {}
 
+        # Whether each source has extracted JSON content, see has_extracted_content
+        self._extracted_cache: dict[str, bool] = {}
+
+        # Page text extraction shared by content extractors, see page_text
+        self._page_text: "PageTextExtractor | None" = None
+
+        # Keyword search, always kept up to date: it serves queries until
+        # the vector index is ready
+        self._keyword_search = LibrarySearch(self)
+
         # Select search backend based on available dependencies
         self._vector_store = None
         self._vector_search = None
+        # Background vector indexing, created with the first queued source
+        self._vector_indexer: VectorIndexQueue | None = None
 
         if HAS_CHROMADB and VectorLibrarySearch is not None:
             try:
@@ -118,7 +136,6 @@ class LibraryManager:
                     persist_directory=vector_dir,
                 )
                 self._vector_search = VectorLibrarySearch(self, self._vector_store)
-                self.semantic_search = self._vector_search
                 logger.info(
                     "LibraryManager using vector search backend (ChromaDB at %s)",
                     vector_dir,
@@ -129,11 +146,84 @@ class LibraryManager:
                     "Falling back to TF-IDF search.",
                     exc,
                 )
-                self.semantic_search = LibrarySearch(self)
         else:
-            self.semantic_search = LibrarySearch(self)
             logger.info("LibraryManager using TF-IDF search backend (chromadb not available)")
 
+    @property
+    def semantic_search(self) -> "LibrarySearch | VectorLibrarySearch":
+        """The search backend to use for natural language queries.
+
+        The vector backend once every queued source is vector indexed,
+        keyword search before that or when chromadb is not available.
+        """
+        if self._vector_search is not None and self.vector_index_ready:
+            return self._vector_search
+        return self._keyword_search
+
+    @property
+    def vector_index_ready(self) -> bool:
+        """Whether no source is waiting for or undergoing vector indexing."""
+        return self._vector_indexer is None or self._vector_indexer.idle
+
+    def vector_index_progress(self) -> dict[str, IndexingProgress]:
+        """Vector indexing progress of the sources queued since startup.
+
+        Returns:
+            Mapping of source IDs to their progress, empty when nothing was
+            queued or the vector backend is not active
+        """
+        if self._vector_indexer is None:
+            return {}
+        return self._vector_indexer.progress()
+
+    def wait_for_vector_index(self, timeout: float | None = None) -> bool:
+        """Block until background vector indexing has finished.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if no source is left to index
+        """
+        if self._vector_indexer is None:
+            return True
+        return self._vector_indexer.wait(timeout)
+
+    @property
+    def page_text(self) -> "PageTextExtractor":
+        """Page text extraction for library PDFs, cached under ``page_cache/``."""
+        if self._page_text is None:
+            from .extractors.pages import PageTextExtractor  # Avoid circular import
+
+            self._page_text = PageTextExtractor(self.library_dir / "page_cache")
+        return self._page_text
+
+    def close(self) -> None:
+        """Stop background vector indexing and release the search and page extraction pools."""
+        if self._vector_indexer is not None:
+            self._vector_indexer.close()
+        if self._vector_search is not None:
+            self._vector_search.close()
+        if self._page_text is not None:
+            self._page_text.close()
+
+    def _queue_vector_indexing(self, index_entry: IndexEntry, check_existing: bool = False) -> None:
+        """Queue a source for background vector indexing, if the backend is active.
+
+        Args:
+            index_entry: The source's index entry
+            check_existing: Keep a collection indexed before checkpoints existed
+        """
+        if self._vector_search is None:
+            return
+        if self._vector_indexer is None:
+            self._vector_indexer = VectorIndexQueue(self._vector_search, self.index_dir)
+        self._vector_indexer.enqueue(
+            index_entry,
+            self._flatten_toc(index_entry.toc),
+            check_existing=check_existing,
+        )
+
     def ensure_directories(self) -> None:
         """Create the library directory structure if it doesn't exist."""
         self.library_dir.mkdir(parents=True, exist_ok=True)
@@ -240,8 +330,9 @@ class LibraryManager:
     def save_index(self, index_entry: IndexEntry) -> None:
         """Save an index entry to disk.
 
-        Also triggers vector indexing of the TOC entries when the
-        vector search backend is active.
+        Also updates the keyword search index of the source and, when the
+        vector search backend is active, queues vector indexing of the TOC
+        entries in the background.
 
         Args:
             index_entry: The index entry to save
@@ -256,24 +347,9 @@ class LibraryManager:
         self._index_cache[index_entry.source_id] = index_entry
         logger.debug(f"💾 Saved index for {index_entry.source_id}")
 
-        # Index into vector store if available
-        if self._vector_search is not None:
-            try:
-                flat_entries = self._flatten_toc(index_entry.toc)
-                count = self._vector_search.index_source(
-                    source_id=index_entry.source_id,
-                    toc_entries=flat_entries,
-                    source_filename=index_entry.filename,
-                )
-                logger.info(
-                    "Vector indexed %d entries for '%s'",
-                    count, index_entry.source_id,
-                )
-            except Exception as exc:
-                logger.warning(
-                    "Vector indexing failed for '%s': %s",
-                    index_entry.source_id, exc,
-                )
+        # Update the keyword search index, and the vector index in the background
+        self._keyword_search.index_source(index_entry)
+        self._queue_vector_indexing(index_entry)
 
     def needs_reindex(self, source_id: str) -> bool:
         """Check if a source needs to be re-indexed.
@@ -367,12 +443,45 @@ class LibraryManager:
         """
         return self.extracted_dir / source_id
 
+    def has_extracted_content(self, source_id: str) -> bool:
+        """Check whether a source has extracted JSON content.
+
+        The result is cached until ``invalidate_extracted`` is called,
+        which the content extractor does after saving a file.
+
+        Args:
+            source_id: The source identifier
+
+        Returns:
+            True if the source's extracted directory holds JSON files
+        """
+        has_extracted = self._extracted_cache.get(source_id)
+        if has_extracted is None:
+            extracted_dir = self._get_extracted_dir(source_id)
+            has_extracted = extracted_dir.exists() and any(extracted_dir.glob("*.json"))
+            self._extracted_cache[source_id] = has_extracted
+        return has_extracted
+
+    def invalidate_extracted(self, source_id: str | None = None) -> None:
+        """Forget cached extracted-content flags.
+
+        The keyword search index of the source is re-checked on the next search.
+
+        Args:
+            source_id: Source whose extracted content changed, or None for all
+        """
+        if source_id is None:
+            self._extracted_cache.clear()
+        else:
+            self._extracted_cache.pop(source_id, None)
+        self._keyword_search.invalidate(source_id)
+
     def load_all_indexes(self) -> int:
         """Load all existing index files into cache.
 
         This should be called at startup to populate the cache
-        with all previously indexed sources. Also triggers vector
-        indexing for sources not yet in the vector store.
+        with all previously indexed sources. Also queues background
+        vector indexing for sources not yet (fully) in the vector store.
 
         Returns:
             Number of indexes loaded
@@ -386,23 +495,8 @@ class LibraryManager:
             index_entry = self._load_index(source_id)
             if index_entry:
                 count += 1
-                # Ensure vector index exists for this source
-                if (
-                    self._vector_search is not None
-                    and not self._vector_search.is_source_indexed(source_id)
-                ):
-                    try:
-                        flat_entries = self._flatten_toc(index_entry.toc)
-                        self._vector_search.index_source(
-                            source_id=source_id,
-                            toc_entries=flat_entries,
-                            source_filename=index_entry.filename,
-                        )
-                    except Exception as exc:
-                        logger.warning(
-                            "Vector indexing failed for '%s': %s",
-                            source_id, exc,
-                        )
+                # Resume or backfill the vector index without blocking startup
+                self._queue_vector_indexing(index_entry, check_existing=True)
 
         logger.debug(f"📚 Loaded {count} existing indexes")
         return count
@@ -2,19 +2,25 @@
 Natural language search for the PDF Library System.
 
 Provides semantic search across the library using keyword expansion
-and TF-IDF style scoring. Works without embedding models by leveraging
-D&D-specific concept synonyms and term frequency analysis.
+and BM25 ranking. Works without embedding models by leveraging
+D&D-specific concept synonyms and a persistent BM25 index (see bm25.py)
+of TOC titles and extracted content.
 """
 
-import math
-import re
-from collections import defaultdict
+import hashlib
+import json
+import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator
+
+from .bm25 import BM25Index, tokenize
+from .models import ContentType
 
 if TYPE_CHECKING:
     from .manager import LibraryManager
-    from .models import TOCEntry
+    from .models import IndexEntry, TOCEntry
+
+logger = logging.getLogger("dm20-protocol")
 
 
 @dataclass
@@ -43,9 +49,9 @@ class SearchResult:
 class LibrarySearch:
     """Natural language search across the library.
 
-    Uses keyword expansion with D&D concept synonyms and TF-IDF style
-    scoring to provide relevant search results. Does not require
-    embedding models or external APIs.
+    Uses keyword expansion with D&D concept synonyms and BM25 ranking
+    with library-wide term statistics to provide relevant search
+    results. Does not require embedding models or external APIs.
 
     Attributes:
         library_manager: Reference to the LibraryManager for accessing indexes
@@ -118,30 +124,11 @@ class LibrarySearch:
         "force": ["magic missile", "eldritch blast", "pure magic"],
     }
 
-    # Inverse document frequency approximations for common D&D terms
-    # Lower values = more common terms (less weight in scoring)
-    # Higher values = rarer terms (more weight in scoring)
-    TERM_RARITY: dict[str, float] = {
-        # Very common terms (low IDF)
-        "the": 0.1, "and": 0.1, "of": 0.1, "a": 0.1, "to": 0.1,
-        "class": 0.3, "spell": 0.3, "race": 0.3, "feat": 0.3,
-        "attack": 0.4, "damage": 0.4, "level": 0.4, "hit": 0.4,
-        "action": 0.4, "bonus": 0.4, "saving": 0.4, "throw": 0.4,
-        # Moderately common
-        "fighter": 0.6, "wizard": 0.6, "rogue": 0.6, "cleric": 0.6,
-        "elf": 0.6, "dwarf": 0.6, "human": 0.6, "halfling": 0.6,
-        "fire": 0.6, "lightning": 0.6, "cold": 0.6, "poison": 0.6,
-        # Less common
-        "dragon": 0.8, "draconic": 0.8, "dragonborn": 0.8,
-        "paladin": 0.7, "warlock": 0.7, "barbarian": 0.7,
-        "necromancy": 0.8, "conjuration": 0.8, "transmutation": 0.8,
-        # Rare/specific terms (high IDF)
-        "bladesinger": 1.0, "hexblade": 1.0, "battlemaster": 1.0,
-        "eldritch": 0.9, "metamagic": 0.9, "wild shape": 0.9,
-    }
+    # Weight of synonym terms relative to the terms typed in the query
+    SYNONYM_WEIGHT = 0.5
 
-    # Default IDF for unknown terms
-    DEFAULT_TERM_RARITY = 0.7
+    # Score multiplier for entries with an identified content type
+    CONTENT_TYPE_BOOST = 1.2
 
     def __init__(self, library_manager: "LibraryManager"):
         """Initialize LibrarySearch.
@@ -150,12 +137,21 @@ class LibrarySearch:
             library_manager: The LibraryManager instance to search
         """
         self.library_manager = library_manager
+        self._index = BM25Index(library_manager.index_dir)
+        # Index entry each loaded segment was checked against; segments are
+        # re-checked when the manager caches a new entry or after invalidate()
+        self._checked: dict[str, "IndexEntry"] = {}
+        self._boost = {
+            content_type.value: self.CONTENT_TYPE_BOOST
+            for content_type in ContentType
+            if content_type != ContentType.UNKNOWN
+        }
 
     def search(self, query: str, limit: int = 10) -> list[SearchResult]:
         """Search across all indexed library content using natural language.
 
-        Expands the query with D&D concept synonyms and scores results
-        using TF-IDF style weighting.
+        Expands the query with D&D concept synonyms and ranks TOC entries
+        by BM25 over their titles and extracted text.
 
         Args:
             query: Natural language search query
@@ -167,36 +163,124 @@ class LibrarySearch:
         if not query or not query.strip():
             return []
 
-        # Expand query with synonyms
-        keywords = self._expand_query(query)
+        self._sync()
+        weights = self._weighted_query(query)
 
         results: list[SearchResult] = []
+        for score, source_id, document in self._index.search(weights, limit, self._boost):
+            results.append(
+                SearchResult(
+                    title=document.title,
+                    source_id=source_id,
+                    source_name=self.library_manager._index_cache[source_id].filename,
+                    page=document.page,
+                    content_type=document.content_type,
+                    score=score,
+                    is_extracted=self.library_manager.has_extracted_content(source_id),
+                )
+            )
+        return results
+
+    def index_source(self, index_entry: "IndexEntry") -> int:
+        """Bring the search index of a source up to date.
+
+        Loads the persisted segment when it matches the source's index and
+        extracted content, otherwise rebuilds it. Called by
+        ``LibraryManager.save_index``; sources loaded another way are
+        indexed on the next search.
 
-        # Search across all indexed sources
-        for source_id, index in self.library_manager._index_cache.items():
-            # Check if extracted content exists
-            extracted_dir = self.library_manager.extracted_dir / source_id
-            has_extracted = extracted_dir.exists() and any(extracted_dir.glob("*.json"))
-
-            for entry in self._flatten_toc(index.toc):
-                score = self._score_entry(entry, keywords)
-                if score > 0:
-                    results.append(
-                        SearchResult(
-                            title=entry.title,
-                            source_id=source_id,
-                            source_name=index.filename,
-                            page=entry.page,
-                            content_type=entry.content_type.value if entry.content_type else None,
-                            score=score,
-                            is_extracted=has_extracted,
-                        )
-                    )
-
-        # Sort by score descending
-        results.sort(key=lambda r: r.score, reverse=True)
-
-        return results[:limit]
+        Args:
+            index_entry: The source's index entry
+
+        Returns:
+            Number of indexed TOC entries
+        """
+        source_id = index_entry.source_id
+        key = self._segment_key(index_entry)
+        self._checked[source_id] = index_entry
+        if self._index.segment_key(source_id) == key or self._index.load_source(source_id, key):
+            return len(self._flatten_toc(index_entry.toc))
+
+        texts = self._extracted_texts(source_id)
+        entries = []
+        for entry in self._flatten_toc(index_entry.toc):
+            entries.append((
+                entry.title,
+                entry.page,
+                entry.content_type.value if entry.content_type else None,
+                texts.get(entry.title.lower(), texts.get(entry.page, "")),
+            ))
+        count = self._index.index_source(source_id, key, entries)
+        logger.debug(f"Indexed {count} entries of {source_id} for keyword search")
+        return count
+
+    def invalidate(self, source_id: str | None = None) -> None:
+        """Re-check the search index of a source (or all) on the next search.
+
+        Args:
+            source_id: Source whose index or extracted content changed, or None for all
+        """
+        if source_id is None:
+            self._checked.clear()
+        else:
+            self._checked.pop(source_id, None)
+
+    def _sync(self) -> None:
+        """Index new or changed sources and drop removed ones."""
+        index_cache = self.library_manager._index_cache
+        for source_id in [s for s in self._checked if s not in index_cache]:
+            self._checked.pop(source_id)
+            self._index.remove_source(source_id)
+        for source_id, index_entry in index_cache.items():
+            if self._checked.get(source_id) is not index_entry:
+                self.index_source(index_entry)
+
+    def _segment_key(self, index_entry: "IndexEntry") -> str:
+        """Identify the source file, TOC and extracted files a segment is built from."""
+        source_id = index_entry.source_id
+        extracted = ""
+        if self.library_manager.has_extracted_content(source_id):
+            extracted_dir = self.library_manager._get_extracted_dir(source_id)
+            files = []
+            for path in sorted(extracted_dir.glob("*.json")):
+                stat = path.stat()
+                files.append(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}")
+            extracted = hashlib.sha256("|".join(files).encode("utf-8")).hexdigest()[:16]
+        toc = hashlib.sha256()
+        for entry in self._flatten_toc(index_entry.toc):
+            toc.update(f"{entry.title}\0{entry.page}\0{entry.content_type}\n".encode("utf-8"))
+        return f"{index_entry.file_hash}:{toc.hexdigest()[:16]}:{extracted}"
+
+    def _extracted_texts(self, source_id: str) -> dict[str | int, str]:
+        """Text of a source's extracted files, keyed by content name and start page.
+
+        Args:
+            source_id: The source identifier
+
+        Returns:
+            Mapping of lowercase content names and start pages to the text
+            of every string field of the extracted content
+        """
+        texts: dict[str | int, str] = {}
+        if not self.library_manager.has_extracted_content(source_id):
+            return texts
+        extracted_dir = self.library_manager._get_extracted_dir(source_id)
+        for path in sorted(extracted_dir.glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                page = data.get("source_info", {}).get("page_start")
+                for items in data.get("content", {}).values():
+                    for item in items:
+                        text = " ".join(_strings(item))
+                        name = item.get("name") if isinstance(item, dict) else None
+                        if isinstance(name, str):
+                            texts[name.lower()] = text
+                        if isinstance(page, int):
+                            texts.setdefault(page, text)
+            except (OSError, json.JSONDecodeError, AttributeError, TypeError) as e:
+                logger.warning(f"Skipping extracted file {path} in search index: {e}")
+        return texts
 
     def _expand_query(self, query: str) -> list[str]:
         """Expand query with D&D concept synonyms.
@@ -210,111 +294,42 @@ class LibrarySearch:
         Returns:
             List of keywords including original terms and synonyms
         """
-        # Tokenize query
+        return list(self._weighted_query(query))
+
+    def _weighted_query(self, query: str) -> dict[str, float]:
+        """Weight query terms and their D&D concept synonyms.
+
+        Terms typed in the query get weight 1.0, synonyms (including those
+        of multi-word concepts such as "martial arts") get SYNONYM_WEIGHT.
+
+        Args:
+            query: Original search query
+
+        Returns:
+            Mapping of terms to weights, original terms first
+        """
         query_lower = query.lower()
-        # Split on non-alphanumeric characters
-        original_tokens = re.findall(r"[a-z0-9]+", query_lower)
+        original_tokens = tokenize(query_lower)
 
-        # Start with original tokens (weighted higher)
-        keywords: list[str] = list(original_tokens)
+        weights: dict[str, float] = dict.fromkeys(original_tokens, 1.0)
+
+        def add_synonyms(synonyms: list[str]) -> None:
+            for synonym in synonyms:
+                # Synonyms can be multi-word phrases
+                for token in tokenize(synonym):
+                    weights.setdefault(token, self.SYNONYM_WEIGHT)
 
-        # Add synonyms for each token
         for token in original_tokens:
             if token in self.CONCEPT_SYNONYMS:
-                # Add synonyms (they'll have lower weight via TF-IDF)
-                for synonym in self.CONCEPT_SYNONYMS[token]:
-                    # Synonyms can be multi-word phrases
-                    synonym_tokens = re.findall(r"[a-z0-9]+", synonym.lower())
-                    keywords.extend(synonym_tokens)
+                add_synonyms(self.CONCEPT_SYNONYMS[token])
 
         # Also check for multi-word phrases in the original query
         for concept, synonyms in self.CONCEPT_SYNONYMS.items():
             if concept in query_lower and concept not in original_tokens:
-                keywords.append(concept)
-                for synonym in synonyms:
-                    synonym_tokens = re.findall(r"[a-z0-9]+", synonym.lower())
-                    keywords.extend(synonym_tokens)
-
-        # Remove duplicates while preserving order
-        seen: set[str] = set()
-        unique_keywords: list[str] = []
-        for kw in keywords:
-            if kw not in seen:
-                seen.add(kw)
-                unique_keywords.append(kw)
+                weights.setdefault(concept, self.SYNONYM_WEIGHT)
+                add_synonyms(synonyms)
 
-        return unique_keywords
-
-    def _score_entry(self, entry: "TOCEntry", keywords: list[str]) -> float:
-        """Score a TOC entry against expanded keywords using TF-IDF style scoring.
-
-        Args:
-            entry: The TOC entry to score
-            keywords: Expanded list of search keywords
-
-        Returns:
-            Relevance score (0.0 if no match)
-        """
-        title_lower = entry.title.lower()
-        title_tokens = set(re.findall(r"[a-z0-9]+", title_lower))
-
-        score = 0.0
-
-        # Track which original keywords (first few in list) matched
-        original_keyword_matches = 0
-        original_keyword_count = 0
-
-        for i, keyword in enumerate(keywords):
-            # Determine if this is an original keyword (before synonyms)
-            # Original keywords are at the start of the list
-            is_original = i < 5  # First 5 keywords are likely original
-
-            # Check if keyword is in title
-            if keyword in title_lower:
-                # Get term rarity (IDF approximation)
-                idf = self.TERM_RARITY.get(keyword, self.DEFAULT_TERM_RARITY)
-
-                # Position weight: earlier keywords in the expanded list
-                # are from the original query (more important)
-                # Keywords from synonyms are added later (less important)
-                position_weight = 1.0 / (1.0 + i * 0.1)
-
-                # Exact token match bonus (word boundary match)
-                exact_match_bonus = 1.5 if keyword in title_tokens else 1.0
-
-                # Calculate term contribution
-                term_score = idf * position_weight * exact_match_bonus
-                score += term_score
-
-                if is_original:
-                    original_keyword_matches += 1
-
-            if is_original:
-                original_keyword_count += 1
-
-        # Title length penalty (longer titles dilute relevance)
-        # Use stronger penalty for longer titles
-        if score > 0 and len(title_tokens) > 0:
-            # Shorter titles get higher scores
-            # 1 token = no penalty, 2 tokens = small penalty, etc.
-            length_penalty = 1.0 + (len(title_tokens) - 1) * 0.15
-            score = score / length_penalty
-
-        # Exact title match bonus (title is exactly or nearly the keyword)
-        # This heavily favors entries where title matches the search term
-        if len(title_tokens) == 1 and title_tokens.intersection(set(keywords)):
-            score *= 2.0
-        elif len(title_tokens) <= 2 and len(title_tokens.intersection(set(keywords))) == len(title_tokens):
-            score *= 1.5
-
-        # Content type bonus for specific content types
-        if entry.content_type:
-            content_type_value = entry.content_type.value
-            if content_type_value != "unknown":
-                # Boost results that have identified content types
-                score *= 1.2
-
-        return score
+        return weights
 
     def _flatten_toc(self, entries: list["TOCEntry"]) -> list["TOCEntry"]:
         """Recursively flatten hierarchical TOC entries.
@@ -331,3 +346,15 @@ class LibrarySearch:
             if entry.children:
                 flat.extend(self._flatten_toc(entry.children))
         return flat
+
+
+def _strings(value: Any) -> Iterator[str]:
+    """Every string nested in an extracted content item."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
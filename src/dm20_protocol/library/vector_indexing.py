@@ -0,0 +1,275 @@
+"""
+Background vector indexing for the PDF Library System.
+
+Embedding every TOC chunk of a large rulebook takes minutes, so sources are
+not indexed into ChromaDB on the thread that loads or saves their index.
+VectorIndexQueue hands them to a background thread that indexes one source
+at a time in batches, reporting progress as it goes.
+
+After each batch the queue writes a checkpoint next to the source's index
+file (``<source_id>.vector.json``) recording how many entries are stored and
+which index they belong to. A server killed mid-source resumes from the
+checkpoint on the next start; a source whose index changed is re-indexed
+from scratch.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .models import IndexEntry, TOCEntry
+    from .vector_search import VectorLibrarySearch
+
+logger = logging.getLogger("dm20-protocol")
+
+
+@dataclass
+class IndexingProgress:
+    """Vector indexing state of one source.
+
+    Attributes:
+        source_id: The library source identifier
+        total: TOC entries to index
+        done: TOC entries stored in the vector store
+        state: "queued", "indexing", "done", "stopped" (interrupted before
+            the last batch) or "failed"
+        error: Failure message when state is "failed"
+    """
+
+    source_id: str
+    total: int
+    done: int = 0
+    state: str = "queued"
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Return the progress as a plain dict."""
+        return {
+            "source_id": self.source_id,
+            "total": self.total,
+            "done": self.done,
+            "state": self.state,
+            "error": self.error,
+        }
+
+
+@dataclass
+class _Job:
+    """A source waiting to be indexed."""
+
+    index_entry: "IndexEntry"
+    entries: list["TOCEntry"]
+    # Trust an existing collection when there is no checkpoint (sources
+    # indexed before checkpoints existed)
+    check_existing: bool
+
+
+class VectorIndexQueue:
+    """Indexes library sources into the vector store from a background thread.
+
+    Args:
+        vector_search: The vector search backend doing the indexing
+        checkpoint_dir: Directory for the per-source checkpoint files
+
+    Usage:
+        queue = VectorIndexQueue(vector_search, library_dir / "index")
+        queue.enqueue(index_entry, flat_entries)   # returns immediately
+        queue.progress()                           # {"phb": IndexingProgress(...)}
+        queue.wait(timeout=60)                     # True once idle
+        queue.close()                              # stop after the current batch
+    """
+
+    def __init__(self, vector_search: "VectorLibrarySearch", checkpoint_dir: Path) -> None:
+        self.vector_search = vector_search
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self._condition = threading.Condition()
+        self._jobs: deque[_Job] = deque()
+        self._progress: dict[str, IndexingProgress] = {}
+        self._active: Optional[str] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def idle(self) -> bool:
+        """Whether no source is queued or being indexed."""
+        with self._condition:
+            return not self._jobs and self._active is None
+
+    def progress(self) -> dict[str, IndexingProgress]:
+        """Indexing progress of every source queued since startup."""
+        with self._condition:
+            return {
+                source_id: IndexingProgress(**vars(progress))
+                for source_id, progress in self._progress.items()
+            }
+
+    def enqueue(
+        self,
+        index_entry: "IndexEntry",
+        entries: list["TOCEntry"],
+        check_existing: bool = False,
+    ) -> None:
+        """Queue a source for vector indexing and return immediately.
+
+        A source already waiting in the queue is replaced by the new job.
+
+        Args:
+            index_entry: The source's index entry
+            entries: Flat list of its TOC entries
+            check_existing: Skip the source if it has no checkpoint but its
+                collection already holds documents
+        """
+        source_id = index_entry.source_id
+        with self._condition:
+            if self._closed:
+                return
+            self._jobs = deque(job for job in self._jobs if job.index_entry.source_id != source_id)
+            self._jobs.append(_Job(index_entry, entries, check_existing))
+            self._progress[source_id] = IndexingProgress(source_id=source_id, total=len(entries))
+            self._condition.notify_all()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="dm20-vector-index", daemon=True)
+                self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued source is indexed.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if the queue is idle
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._jobs and self._active is None,
+                timeout,
+            )
+
+    def close(self) -> None:
+        """Stop the background thread once its current batch is stored.
+
+        Queued sources stay unindexed; their checkpoints let the next start
+        resume them. Safe to call more than once.
+        """
+        with self._condition:
+            self._closed = True
+            self._jobs.clear()
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    # --- Checkpoints ---
+
+    def _checkpoint_path(self, source_id: str) -> Path:
+        return self.checkpoint_dir / f"{source_id}.vector.json"
+
+    @staticmethod
+    def _checkpoint_key(index_entry: "IndexEntry") -> str:
+        return f"{index_entry.file_hash}:{index_entry.indexed_at.isoformat()}"
+
+    def _read_checkpoint(self, index_entry: "IndexEntry") -> Optional[int]:
+        """Entries already indexed for this index, None without a usable checkpoint."""
+        try:
+            with open(self._checkpoint_path(index_entry.source_id), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != self._checkpoint_key(index_entry):
+            return None
+        done = data.get("done")
+        return done if isinstance(done, int) else None
+
+    def _write_checkpoint(self, index_entry: "IndexEntry", done: int, total: int) -> None:
+        path = self._checkpoint_path(index_entry.source_id)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": self._checkpoint_key(index_entry), "done": done, "total": total}, f)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not write vector index checkpoint for '%s': %s", index_entry.source_id, exc)
+
+    # --- Background thread ---
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._jobs and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                job = self._jobs.popleft()
+                source_id = job.index_entry.source_id
+                self._active = source_id
+                progress = self._progress[source_id]
+                progress.state = "indexing"
+            try:
+                self._index(job, progress)
+            except Exception as exc:
+                logger.warning("Vector indexing failed for '%s': %s", source_id, exc)
+                with self._condition:
+                    progress.state = "failed"
+                    progress.error = str(exc)
+            finally:
+                with self._condition:
+                    self._active = None
+                    self._condition.notify_all()
+
+    def _index(self, job: _Job, progress: IndexingProgress) -> None:
+        """Index one source, resuming from its checkpoint."""
+        index_entry = job.index_entry
+        source_id = index_entry.source_id
+        total = len(job.entries)
+
+        start = self._read_checkpoint(index_entry)
+        if start is None:
+            if job.check_existing and self.vector_search.is_source_indexed(source_id):
+                start = total
+            else:
+                # Entries of an older index of this source would linger
+                self.vector_search.delete_source_index(source_id)
+                start = 0
+            self._write_checkpoint(index_entry, start, total)
+
+        with self._condition:
+            progress.done = min(start, total)
+        if start < total:
+            logger.info("Vector indexing '%s' from entry %d of %d", source_id, start, total)
+
+            def on_batch(done: int) -> bool:
+                self._write_checkpoint(index_entry, done, total)
+                with self._condition:
+                    progress.done = done
+                    # Stop at shutdown or when a newer index of the source is queued
+                    return not self._closed and all(
+                        queued.index_entry.source_id != source_id for queued in self._jobs
+                    )
+
+            done = self.vector_search.index_source(
+                source_id=source_id,
+                toc_entries=job.entries,
+                source_filename=index_entry.filename,
+                start=start,
+                on_batch=on_batch,
+            )
+            if isinstance(done, int):
+                self._write_checkpoint(index_entry, done, total)
+                with self._condition:
+                    progress.done = done
+
+        with self._condition:
+            progress.state = "done" if progress.done >= total else "stopped"
+
+
+__all__ = [
+    "IndexingProgress",
+    "VectorIndexQueue",
+]
@@ -4,11 +4,20 @@ Vector-based semantic search for the PDF Library System.
 Provides semantic search across the library using ChromaDB vector embeddings.
 Falls back gracefully to TF-IDF search when chromadb is not installed.
 Uses per-source collections (library_{source_id}) for namespace isolation.
+
+A search embeds the query once and sends the vector to every source's
+collection concurrently on a thread pool kept by the searcher, then merges
+the per-source results into the top matches. Collection handles and document
+counts are cached per source until the source is re-indexed or its index
+deleted.
 """
 
+import heapq
 import logging
 import re
-from typing import TYPE_CHECKING, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
 
 from .search import SearchResult
 
@@ -20,9 +29,10 @@ logger = logging.getLogger("dm20-protocol")
 
 # Try importing vector store components
 try:
-    from ..claudmaster.vector_store import HAS_CHROMADB, VectorStoreManager
+    from ..claudmaster.vector_store import HAS_CHROMADB, ChromaNotFoundError, VectorStoreManager
 except ImportError:
     HAS_CHROMADB = False
+    ChromaNotFoundError = ValueError
     VectorStoreManager = None  # type: ignore[assignment,misc]
 
 # Chunk configuration for library content
@@ -30,6 +40,12 @@ LIBRARY_CHUNK_SIZE = 500
 LIBRARY_CHUNK_OVERLAP = 100
 LIBRARY_MIN_CHUNK_SIZE = 100
 
+# Collections queried at the same time by one search
+SEARCH_WORKERS = 8
+
+# TOC chunks embedded and stored per call while indexing a source
+INDEX_BATCH_SIZE = 64
+
 
 def _collection_name_for_source(source_id: str) -> str:
     """Derive a ChromaDB collection name for a library source.
@@ -63,6 +79,68 @@ class VectorLibrarySearch:
     ) -> None:
         self.library_manager = library_manager
         self._store = vector_store
+        # source_id -> (collection handle, document count); None when the
+        # source has no collection yet. _generation is bumped by invalidate()
+        # so a lookup that raced with it is not cached.
+        self._collections: dict[str, tuple[Any, int] | None] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _collection(self, source_id: str) -> tuple[Any, int] | None:
+        """Return a source's collection and document count, cached.
+
+        Args:
+            source_id: The library source identifier.
+
+        Returns:
+            Tuple of (collection, count), or None if the source has no
+            collection or it could not be read. Read failures are logged and
+            not cached, so the next call tries again.
+        """
+        with self._lock:
+            if source_id in self._collections:
+                return self._collections[source_id]
+            generation = self._generation
+        try:
+            collection = self._store._client.get_collection(
+                name=_collection_name_for_source(source_id),
+                embedding_function=self._store._get_embedding_function(),
+            )
+            entry: tuple[Any, int] | None = (collection, collection.count())
+        except (ValueError, ChromaNotFoundError):
+            # Collection not yet created for this source
+            entry = None
+        except Exception as exc:
+            logger.warning(
+                "Reading the vector index of source '%s' failed: %s", source_id, exc,
+            )
+            return None
+        with self._lock:
+            # Skip caching if the source was invalidated meanwhile
+            if self._generation == generation:
+                self._collections[source_id] = entry
+        return entry
+
+    def invalidate(self, source_id: str | None = None) -> None:
+        """Forget cached collection handles and counts.
+
+        Args:
+            source_id: Source whose collection changed, or None for all.
+        """
+        with self._lock:
+            self._generation += 1
+            if source_id is None:
+                self._collections.clear()
+            else:
+                self._collections.pop(source_id, None)
+
+    def close(self) -> None:
+        """Shut down the thread pool used to query collections."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def search(self, query: str, limit: int = 10) -> list[SearchResult]:
         """Search across all indexed library content using vector similarity.
@@ -74,46 +152,52 @@ class VectorLibrarySearch:
         Returns:
             List of SearchResult objects sorted by relevance (best first).
         """
-        if not query or not query.strip():
+        if not query or not query.strip() or limit <= 0:
             return []
 
-        results: list[SearchResult] = []
-
+        # Sources indexed into the vector store, with documents
+        targets: list[tuple[str, Any, Any, int]] = []
         for source_id, index in self.library_manager._index_cache.items():
-            col_name = _collection_name_for_source(source_id)
-
-            # Check if this source has been indexed into the vector store
-            try:
-                collection = self._store._client.get_collection(
-                    name=col_name,
-                    embedding_function=self._store._get_embedding_function(),
-                )
-            except Exception:
-                # Collection not yet created for this source — skip
+            entry = self._collection(source_id)
+            if entry is None or entry[1] == 0:
                 continue
+            collection, count = entry
+            targets.append((source_id, index, collection, count))
+        if not targets:
+            return []
 
-            if collection.count() == 0:
-                continue
+        # Embed once for all collections
+        try:
+            embedding = self._store._get_embedding_function()([query])[0]
+        except Exception as exc:
+            logger.warning("Embedding the library search query failed: %s", exc)
+            return []
 
-            # Query the collection
-            n = min(limit, collection.count())
+        def query_source(target: tuple[str, Any, Any, int]) -> Any:
+            source_id, _, collection, count = target
             try:
-                raw = collection.query(
-                    query_texts=[query],
-                    n_results=n,
+                return collection.query(
+                    query_embeddings=[embedding],
+                    n_results=min(limit, count),
                 )
             except Exception as exc:
                 logger.warning(
                     "Vector search failed for source '%s': %s", source_id, exc,
                 )
-                continue
+                return None
 
-            if not raw["ids"] or not raw["ids"][0]:
+        if len(targets) == 1:
+            raws = [query_source(targets[0])]
+        else:
+            raws = list(self._get_executor().map(query_source, targets))
+
+        results: list[SearchResult] = []
+        for (source_id, index, _, _), raw in zip(targets, raws):
+            if raw is None or not raw["ids"] or not raw["ids"][0]:
                 continue
 
             # Check if extracted content exists
-            extracted_dir = self.library_manager.extracted_dir / source_id
-            has_extracted = extracted_dir.exists() and any(extracted_dir.glob("*.json"))
+            has_extracted = self.library_manager.has_extracted_content(source_id)
 
             # Convert results to SearchResult objects
             for i, doc_id in enumerate(raw["ids"][0]):
@@ -136,28 +220,45 @@ class VectorLibrarySearch:
                     )
                 )
 
-        # Sort by score descending (best match first)
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:limit]
+        # Best matches first; ties keep source order
+        return heapq.nlargest(limit, results, key=lambda r: r.score)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the collection query pool, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=SEARCH_WORKERS, thread_name_prefix="library-search",
+                )
+            return self._executor
 
     def index_source(
         self,
         source_id: str,
         toc_entries: list["TOCEntry"],
         source_filename: str,
+        start: int = 0,
+        batch_size: int = INDEX_BATCH_SIZE,
+        on_batch: Callable[[int], bool | None] | None = None,
     ) -> int:
         """Index a library source's TOC entries into the vector store.
 
-        Creates text chunks from TOC entry titles and metadata,
-        then stores them in a per-source ChromaDB collection.
+        Creates text chunks from TOC entry titles and metadata, then
+        upserts them into a per-source ChromaDB collection in batches of
+        ``batch_size`` chunks, one embedding call per batch. Chunk IDs are
+        stable, so indexing can resume from ``start`` after an interruption.
 
         Args:
             source_id: The library source identifier.
             toc_entries: Flat list of TOC entries to index.
             source_filename: Original filename for metadata.
+            start: Number of leading entries already indexed.
+            batch_size: Chunks embedded and stored per call.
+            on_batch: Called with the number of entries indexed so far after
+                each batch; returning False stops indexing early.
 
         Returns:
-            Number of chunks indexed.
+            Number of entries indexed, including the ``start`` ones.
         """
         col_name = _collection_name_for_source(source_id)
 
@@ -167,46 +268,50 @@ class VectorLibrarySearch:
             embedding_function=self._store._get_embedding_function(),
             metadata={"source_id": source_id, "filename": source_filename},
         )
-
-        if not toc_entries:
-            return 0
-
-        documents: list[str] = []
-        metadatas: list[dict[str, Any]] = []
-        ids: list[str] = []
-
-        for idx, entry in enumerate(toc_entries):
-            # Build a searchable text from the TOC entry
-            doc_text = entry.title
-            content_type = entry.content_type.value if entry.content_type else "unknown"
-
-            # Add content type context for better semantic matching
-            if content_type != "unknown":
-                doc_text = f"{content_type}: {entry.title}"
-
-            doc_id = f"{source_id}_{idx}"
-            metadata = {
-                "title": entry.title,
-                "source_id": source_id,
-                "page": entry.page,
-                "content_type": content_type,
-            }
-            if entry.end_page is not None:
-                metadata["end_page"] = entry.end_page
-
-            documents.append(doc_text)
-            metadatas.append(metadata)
-            ids.append(doc_id)
-
-        # Batch add to collection
-        if documents:
-            collection.add(documents=documents, metadatas=metadatas, ids=ids)
+        self.invalidate(source_id)
+
+        done = min(start, len(toc_entries))
+        while done < len(toc_entries):
+            batch = toc_entries[done:done + batch_size]
+            documents: list[str] = []
+            metadatas: list[dict[str, Any]] = []
+            ids: list[str] = []
+
+            for idx, entry in enumerate(batch, start=done):
+                # Build a searchable text from the TOC entry
+                doc_text = entry.title
+                content_type = entry.content_type.value if entry.content_type else "unknown"
+
+                # Add content type context for better semantic matching
+                if content_type != "unknown":
+                    doc_text = f"{content_type}: {entry.title}"
+
+                doc_id = f"{source_id}_{idx}"
+                metadata = {
+                    "title": entry.title,
+                    "source_id": source_id,
+                    "page": entry.page,
+                    "content_type": content_type,
+                }
+                if entry.end_page is not None:
+                    metadata["end_page"] = entry.end_page
+
+                documents.append(doc_text)
+                metadatas.append(metadata)
+                ids.append(doc_id)
+
+            collection.upsert(documents=documents, metadatas=metadatas, ids=ids)
+            self.invalidate(source_id)
+            done += len(batch)
+            if on_batch is not None and on_batch(done) is False:
+                break
+
+        if done > start:
             logger.info(
                 "Indexed %d entries for library source '%s'",
-                len(documents), source_id,
+                done - start, source_id,
             )
-
-        return len(documents)
+        return done
 
     def is_source_indexed(self, source_id: str) -> bool:
         """Check whether a library source has been indexed into the vector store.
@@ -217,15 +322,8 @@ class VectorLibrarySearch:
         Returns:
             True if the source collection exists and has documents.
         """
-        col_name = _collection_name_for_source(source_id)
-        try:
-            collection = self._store._client.get_collection(
-                name=col_name,
-                embedding_function=self._store._get_embedding_function(),
-            )
-            return collection.count() > 0
-        except Exception:
-            return False
+        entry = self._collection(source_id)
+        return entry is not None and entry[1] > 0
 
     def delete_source_index(self, source_id: str) -> None:
         """Delete a source's vector index.
@@ -234,6 +332,7 @@ class VectorLibrarySearch:
             source_id: The library source identifier.
         """
         col_name = _collection_name_for_source(source_id)
+        self.invalidate(source_id)
         try:
             self._store._client.delete_collection(name=col_name)
             logger.info("Deleted vector index for library source '%s'", source_id)
@@ -242,5 +341,6 @@ class VectorLibrarySearch:
 
 
 __all__ = [
+    "INDEX_BATCH_SIZE",
     "VectorLibrarySearch",
 ]
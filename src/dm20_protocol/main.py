@@ -5,34 +5,44 @@ A comprehensive D&D campaign management server built with modern FastMCP framewo
 
 import json
 import logging
+import os
 import random
 import re
-import os
 from collections import defaultdict
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
+
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from pydantic import Field
 
-from .storage import DnDStorage
-from .models import (
-    Character, NPC, Location, Quest, SessionNote, AdventureEvent, EventType,
-    AbilityScore, CharacterClass, Race, Item, Spell
-)
 from .character_builder import CharacterBuilder, CharacterBuilderError
+from .lazy import LazyResource
 from .level_up_engine import LevelUpEngine, LevelUpError
+from .models import (
+    NPC,
+    AbilityScore,
+    AdventureEvent,
+    Character,
+    CharacterClass,
+    EventType,
+    Item,
+    Location,
+    Quest,
+    Race,
+    SessionNote,
+    Spell,
+)
+from .output_filter import OutputFilter, SessionCoordinator
+from .permissions import PermissionResolver, PlayerRole
 from .rulebooks import RulebookManager
-from .rulebooks.sources.srd import SRDSource
-from .rulebooks.sources.custom import CustomSource
-from .rulebooks.validators import CharacterValidator
-from .library import LibraryManager, TOCExtractor, ContentExtractor, SearchResult
-from .adventures.index import AdventureIndex
-from .adventures.discovery import search_adventures, format_search_results
 from .sheets.sync import SheetSyncManager
-from .sheets.diff import SheetDiffEngine
-from .permissions import PermissionResolver, PlayerRole
-from .output_filter import OutputFilter, SessionCoordinator
+from .storage import DnDStorage
+
+if TYPE_CHECKING:
+    # Heavy subsystems (PyMuPDF, vector store, adventure index) are imported
+    # inside the tools that use them to keep server startup fast.
+    from .library import LibraryManager, SearchResult
 
 logger = logging.getLogger("dm20-protocol")
 
@@ -46,17 +56,35 @@ if not load_dotenv():
 data_path = Path(os.getenv("DM20_STORAGE_DIR", "")).resolve()
 logger.debug(f"📂 Data path: {data_path}")
 
+# Optional write-behind saving: debounce window in milliseconds (unset or 0 = synchronous saves)
+write_behind_ms = int(os.getenv("DM20_WRITE_BEHIND_MS", "0") or 0)
+
 
 # Initialize storage and FastMCP server
-storage = DnDStorage(data_dir=data_path)
+storage = DnDStorage(
+    data_dir=data_path,
+    write_behind=write_behind_ms > 0,
+    write_behind_delay=write_behind_ms / 1000,
+)
 logger.debug("✅ Storage layer initialized")
 
-# Initialize library manager for PDF rulebook library
+# Library manager for the PDF rulebook library, loaded in the background once
+# the server is up (or on first use by a library tool). Tools resolve it with
+# library_manager.get() and use the returned LibraryManager.
 library_dir = data_path / "library"
-library_manager = LibraryManager(library_dir)
-library_manager.ensure_directories()
-loaded_indexes = library_manager.load_all_indexes()
-logger.debug(f"📚 Library manager initialized ({loaded_indexes} indexes loaded)")
+
+
+def _init_library_manager() -> "LibraryManager":
+    """Create the library manager and load all existing indexes."""
+    from .library import LibraryManager
+    manager = LibraryManager(library_dir)
+    manager.ensure_directories()
+    loaded_indexes = manager.load_all_indexes()
+    logger.debug(f"📚 Library manager initialized ({loaded_indexes} indexes loaded)")
+    return manager
+
+
+library_manager: LazyResource["LibraryManager"] = LazyResource("library manager", _init_library_manager)
 
 mcp = FastMCP(
     name="dm20-protocol"
@@ -88,14 +116,13 @@ logger.debug("🔒 Output filter and session coordinator initialized")
 
 # Initialize global RulebookManager for standalone rules access (no campaign required).
 # Uses 5etools as default source with 2024 rules version.
-# This allows rules tools to work immediately without loading a campaign.
-global_rulebook_manager: RulebookManager | None = None
-
+# This allows rules tools to work without loading a campaign. The source is
+# loaded in the background once the server is up, or on first use.
 def _init_global_rulebook_manager() -> RulebookManager | None:
     """Initialize the global RulebookManager with 5etools source.
 
     Returns the initialized manager, or None if initialization fails.
-    This runs at import time so it must handle errors gracefully.
+    This runs on a background thread so it must handle errors gracefully.
     """
     import asyncio
     try:
@@ -124,7 +151,9 @@ def _init_global_rulebook_manager() -> RulebookManager | None:
         logger.warning(f"⚠️ Failed to initialize global RulebookManager: {e}")
         return None
 
-global_rulebook_manager = _init_global_rulebook_manager()
+global_rulebook_manager: LazyResource[RulebookManager | None] = LazyResource(
+    "global rulebook manager", _init_global_rulebook_manager
+)
 
 
 def _get_rulebook_manager() -> RulebookManager | None:
@@ -133,7 +162,7 @@ def _get_rulebook_manager() -> RulebookManager | None:
     Returns the campaign's RulebookManager if a campaign is loaded and has one,
     otherwise falls back to the global RulebookManager.
     """
-    return storage.rulebook_manager or global_rulebook_manager
+    return storage.rulebook_manager or global_rulebook_manager.get()
 
 
 # ----------------------------------------------------------------------
@@ -226,7 +255,7 @@ def get_campaign_info() -> str:
 @mcp.tool
 def list_campaigns() -> str:
     """List all available campaigns."""
-    campaigns = storage.list_campaigns()
+    campaigns = storage.campaign_summaries()
     if not campaigns:
         return f"❌ No campaigns found in {storage.data_dir}!"
 
@@ -235,8 +264,13 @@ def list_campaigns() -> str:
 
     campaign_list = []
     for campaign in campaigns:
-        marker = " (current)" if campaign == current_name else ""
-        campaign_list.append(f"• {campaign}{marker}")
+        marker = " (current)" if campaign.name == current_name else ""
+        counts = ", ".join(
+            f"{campaign.counts[key]} {label}"
+            for key, label in (("characters", "characters"), ("npcs", "NPCs"), ("sessions", "sessions"))
+            if key in campaign.counts
+        )
+        campaign_list.append(f"• {campaign.name}{marker}" + (f" — {counts}" if counts else ""))
 
     return "**Available Campaigns:**\n" + "\n".join(campaign_list)
 
@@ -2796,6 +2830,7 @@ async def load_rulebook(
         storage._rulebook_manager = RulebookManager(campaign_dir)
 
     if source == "srd":
+        from .rulebooks.sources.srd import SRDSource
         srd_source = SRDSource(version=version or "2014", cache_dir=storage.rulebook_cache_dir)
         await storage.rulebook_manager.load_source(srd_source)
         counts = srd_source.content_counts()
@@ -2819,6 +2854,7 @@ async def load_rulebook(
         if not path:
             return "❌ Custom source requires 'path' parameter"
         full_path = storage.rulebooks_dir / path if storage.rulebooks_dir else Path(path)
+        from .rulebooks.sources.custom import CustomSource
         custom_source = CustomSource(full_path)
         await storage.rulebook_manager.load_source(custom_source)
         counts = custom_source.content_counts()
@@ -2897,23 +2933,37 @@ def search_rules(
         str | None,
         Field(description="Filter spells by class (e.g., 'ranger', 'wizard'). Only applies to spell category.")
     ] = None,
+    spell_level: Annotated[int | None, Field(description="Only spells of this level (0 for cantrips)", ge=0, le=9)] = None,
+    school: Annotated[str | None, Field(description="Only spells of this school (e.g., 'evocation')")] = None,
+    challenge_rating: Annotated[float | None, Field(description="Only monsters of this CR (e.g., 0.25, 5)", ge=0)] = None,
+    creature_type: Annotated[str | None, Field(description="Only monsters of this type (e.g., 'undead')")] = None,
 ) -> str:
     """Search for rules content across all loaded rulebooks.
 
     Works without a campaign loaded (uses global rulebook manager).
     When a campaign is active, its rulebook manager takes priority.
+    Results are ranked: exact and prefix name matches first, description
+    matches last.
 
     Examples:
         - search_rules(query="fire", category="spell") - Find spells with 'fire' in name
         - search_rules(class_filter="ranger", category="spell") - All ranger spells
         - search_rules(query="cure", class_filter="ranger", category="spell") - Ranger spells with 'cure' in name
+        - search_rules(creature_type="undead", challenge_rating=1) - CR 1 undead
     """
     manager = _get_rulebook_manager()
     if not manager:
         return "❌ No rulebooks loaded. Use `load_rulebook` first or ensure the global rulebook manager is initialized."
 
-    if not query and not class_filter:
-        return "❌ Please provide either a search query or a class_filter."
+    facets = {
+        facet: value
+        for facet, value in (
+            ("level", spell_level), ("school", school), ("cr", challenge_rating), ("type", creature_type),
+        )
+        if value is not None
+    }
+    if not query and not class_filter and not facets:
+        return "❌ Please provide either a search query, a class_filter or a spell/monster filter."
 
     categories = [category] if category and category != "all" else None
     results = manager.search(
@@ -2921,10 +2971,13 @@ def search_rules(
         categories=categories,
         limit=limit,
         class_filter=class_filter,
+        facets=facets or None,
     )
 
     if not results:
         filter_desc = f"class='{class_filter}'" if class_filter else f"'{query}'"
+        if facets:
+            filter_desc += " with " + ", ".join(f"{facet}={value}" for facet, value in facets.items())
         return f"No results found for {filter_desc}."
 
     # Build header
@@ -2932,6 +2985,8 @@ def search_rules(
         header = f"# Search Results: '{query}' (class: {class_filter})\n"
     elif class_filter:
         header = f"# Spells for class: {class_filter}\n"
+    elif not query:
+        header = f"# Rules matching: {', '.join(f'{facet}={value}' for facet, value in facets.items())}\n"
     else:
         header = f"# Search Results: '{query}'\n"
 
@@ -3097,6 +3152,7 @@ def validate_character_rules(
     if not storage.rulebook_manager:
         return "⚠️ No rulebooks loaded. Cannot validate without rules."
 
+    from .rulebooks.validators import CharacterValidator
     validator = CharacterValidator(storage.rulebook_manager)
     report = validator.validate(character)
 
@@ -3222,7 +3278,8 @@ def open_library_folder() -> str:
     import platform
     import subprocess
 
-    pdfs_dir = library_manager.pdfs_dir
+    library = library_manager.get()
+    pdfs_dir = library.pdfs_dir
     pdfs_dir.mkdir(parents=True, exist_ok=True)
 
     # Open in system file manager
@@ -3267,13 +3324,14 @@ def scan_library() -> str:
 
     Returns a summary of files found and indexed.
     """
+    library = library_manager.get()
     # Scan for files
-    files = library_manager.scan_library()
+    files = library.scan_library()
 
     if not files:
         return (
             "📚 No PDF or Markdown files found in library.\n\n"
-            f"**Library folder:** `{library_manager.pdfs_dir}`\n\n"
+            f"**Library folder:** `{library.pdfs_dir}`\n\n"
             "Use `open_library_folder` to open it in your file manager, "
             "then drop your PDF or Markdown files there."
         )
@@ -3287,22 +3345,23 @@ def scan_library() -> str:
         source_id = generate_source_id(file_path.name)
 
         # Check if needs indexing
-        if not library_manager.needs_reindex(source_id):
+        if not library.needs_reindex(source_id):
             skipped_count += 1
             continue
 
         # Index the file
         try:
             if file_path.suffix.lower() == ".pdf":
+                from .library.extractors import TOCExtractor
                 extractor = TOCExtractor(file_path)
                 index_entry = extractor.extract()
-                library_manager.save_index(index_entry)
+                library.save_index(index_entry)
                 indexed_count += 1
             elif file_path.suffix.lower() in (".md", ".markdown"):
                 from .library.extractors import MarkdownTOCExtractor
                 md_extractor = MarkdownTOCExtractor(file_path)
                 index_entry = md_extractor.extract()
-                library_manager.save_index(index_entry)
+                library.save_index(index_entry)
                 indexed_count += 1
             else:
                 # Unknown file type, skip
@@ -3312,7 +3371,7 @@ def scan_library() -> str:
 
     # Build response
     lines = ["# 📚 Library Scan Complete", ""]
-    lines.append(f"**Library folder:** `{library_manager.pdfs_dir}`")
+    lines.append(f"**Library folder:** `{library.pdfs_dir}`")
     lines.append(f"**Total files:** {len(files)}")
     lines.append(f"**Newly indexed:** {indexed_count}")
     lines.append(f"**Skipped (up-to-date):** {skipped_count}")
@@ -3332,10 +3391,11 @@ def list_library() -> str:
     Returns a formatted list of all PDF and Markdown sources
     in the library, showing their index status and content counts.
     """
-    sources = library_manager.list_library()
+    library = library_manager.get()
+    sources = library.list_library()
 
     if not sources:
-        return "📚 Library is empty.\n\nAdd PDF or Markdown files to: " + str(library_manager.pdfs_dir)
+        return "📚 Library is empty.\n\nAdd PDF or Markdown files to: " + str(library.pdfs_dir)
 
     lines = ["# 📚 Library Sources", ""]
 
@@ -3390,11 +3450,12 @@ def get_library_toc(
     Args:
         source_id: The source identifier (use list_library to see available sources)
     """
-    toc = library_manager.get_toc_formatted(source_id)
+    library = library_manager.get()
+    toc = library.get_toc_formatted(source_id)
 
     if not toc:
         # Try to find similar source IDs
-        sources = library_manager.list_library()
+        sources = library.list_library()
         available = [s.source_id for s in sources if s.is_indexed]
 
         if available:
@@ -3427,7 +3488,8 @@ def search_library(
     if not query and content_type == "all":
         return "❌ Please provide a search query or specify a content_type filter."
 
-    results = library_manager.search(
+    library = library_manager.get()
+    results = library.search(
         query=query,
         content_type=content_type if content_type != "all" else None,
         limit=limit,
@@ -3491,8 +3553,13 @@ def ask_books(
     if not query or not query.strip():
         return "Please provide a search query."
 
-    # Use semantic search
-    results = library_manager.semantic_search.search(query, limit)
+    # Use semantic search (keyword search while the vector index is being built)
+    library = library_manager.get()
+    results = library.semantic_search.search(query, limit)
+    indexing = [
+        p for p in library.vector_index_progress().values()
+        if p.state in ("queued", "indexing")
+    ]
 
     if not results:
         return f"No results found for: '{query}'\n\nTry different keywords or check that your library has indexed content."
@@ -3521,6 +3588,12 @@ def ask_books(
             output.append(f"- **{r.title}** {page_info} {type_badge} {status} `{score_bars}`")
 
     output.append("\n---")
+    if indexing:
+        done = sum(p.done for p in indexing)
+        total = sum(p.total for p in indexing)
+        output.append(
+            f"_Vector index still building ({done}/{total} entries); showing keyword matches._"
+        )
     output.append("_Use `extract_content` to extract specific content for use in campaigns._")
 
     return "\n".join(output)
@@ -3555,10 +3628,11 @@ def extract_content(
     Returns:
         Success message with path to extracted file, or error message
     """
+    library = library_manager.get()
     # Verify source exists and is indexed
-    source = library_manager.get_source(source_id)
+    source = library.get_source(source_id)
     if not source:
-        sources = library_manager.list_library()
+        sources = library.list_library()
         available = [s.source_id for s in sources]
         if available:
             return f"❌ Source '{source_id}' not found.\n\nAvailable sources:\n" + "\n".join(f"- {s}" for s in available)
@@ -3572,7 +3646,8 @@ def extract_content(
         return f"❌ Content extraction only supports PDF files. '{source.filename}' is not a PDF."
 
     # Create extractor and extract content
-    extractor = ContentExtractor(library_manager)
+    from .library.extractors import ContentExtractor
+    extractor = ContentExtractor(library)
 
     try:
         output_path = extractor.save_extracted_content(source_id, content_name, content_type)
@@ -3582,7 +3657,7 @@ def extract_content(
 
     if not output_path:
         # Try to find similar content in the TOC
-        results = library_manager.search(
+        results = library.search(
             query=content_name,
             content_type=content_type,
             limit=5,
@@ -3684,10 +3759,11 @@ def enable_library_source(
         return "❌ No campaign loaded. Use `load_campaign` first."
 
     # Verify source exists in library
-    source = library_manager.get_source(source_id)
+    library = library_manager.get()
+    source = library.get_source(source_id)
     if not source:
         # Try to find similar sources
-        sources = library_manager.list_library()
+        sources = library.list_library()
         available = [s.source_id for s in sources if s.is_indexed]
         if available:
             return f"❌ Source '{source_id}' not found.\n\nAvailable sources:\n" + "\n".join(f"- {s}" for s in available)
@@ -3762,6 +3838,7 @@ def list_enabled_library() -> str:
     if not enabled_sources:
         return "📚 No library sources enabled for this campaign.\n\nUse `enable_library_source` to add sources from the library."
 
+    library = library_manager.get()
     lines = ["# 📚 Enabled Library Sources", ""]
 
     for source_id in enabled_sources:
@@ -3770,7 +3847,7 @@ def list_enabled_library() -> str:
             continue
 
         # Get source info from library manager
-        source = library_manager.get_source(source_id)
+        source = library.get_source(source_id)
         filename = source.filename if source else "Unknown file"
 
         lines.append(f"## {source_id}")
@@ -4126,6 +4203,9 @@ async def discover_adventures(
     - "heist" → Keys from the Golden Vault, Waterdeep
     - "space" → Spelljammer
     """
+    from .adventures.discovery import format_search_results, search_adventures
+    from .adventures.index import AdventureIndex
+
     # Create and load adventure index
     adventure_index = AdventureIndex(data_path)
     await adventure_index.load()
@@ -5535,7 +5615,21 @@ logger.debug("✅ All tools successfully registered. DM20 Protocol server runnin
 
 def main() -> None:
     """Main entry point for the D&D MCP Server."""
-    mcp.run()
+    # Load rulebooks and the library index while the server starts accepting
+    # requests; tools that need them wait for the load to finish.
+    global_rulebook_manager.start()
+    library_manager.start()
+    try:
+        mcp.run()
+    finally:
+        # Write anything still queued by write-behind saving
+        storage.close()
+        # Stop vector indexing at a checkpoint; the next start resumes it
+        if library_manager.loaded:
+            try:
+                library_manager.get().close()
+            except Exception as e:
+                logger.debug(f"Library manager not closed: {e}")
 
 if __name__ == "__main__":
     main()
@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Annotated
 from shortuuid import random
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, field_serializer, model_validator
 from logging import Handler
 
 from .logutils import logger
@@ -532,6 +532,14 @@ class Campaign(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime | None = Field(default_factory=datetime.now)
 
+    @field_serializer("characters", "npcs", "locations", "quests", "encounters", mode="wrap")
+    def _serialize_entities(self, value: dict, handler: SerializerFunctionWrapHandler) -> Any:
+        """Read lazily loaded entity sections (storage LazyEntities) before dumping."""
+        ensure_loaded = getattr(value, "ensure_loaded", None)
+        if ensure_loaded is not None:
+            ensure_loaded()
+        return handler(value)
+
     def get_setting(self) -> str:
         """Return the setting details for the active campaign."""
         if isinstance(self.setting, str):
@@ -11,6 +11,8 @@ separate from the main MCP stdio transport, ensuring no interference.
 Key components:
 - auth: Token generation, validation, and QR code creation
 - server: Starlette web app, WebSocket connections, and background thread lifecycle
+- outbox: Bounded per-connection outbound queues with writer tasks
+- patch: JSON Patch deltas pushed to players when their character is saved
 - static: HTML/CSS/JS for the player UI (built in Task 3)
 
 Public API:
@@ -0,0 +1,273 @@
+"""
+Per-connection outbound queues for Party Mode WebSockets.
+
+Every WebSocket gets an Outbox: a bounded queue drained by its own writer
+task. Senders only enqueue, so one slow phone no longer holds up the
+narrative for the rest of the table, and fanning a message out to N
+connections costs the slowest send instead of the sum of all sends.
+
+Backpressure policy:
+- combat_state and ping messages are coalesced: a newer one replaces a
+  queued one that has not been sent yet (only the latest state matters)
+- when the queue is full, a queued droppable message (ping, combat_state,
+  system, in that order) is dropped to make room
+- narrative, private, action_status and audio messages are never dropped
+  (a missing audio chunk would corrupt the whole clip); a connection whose
+  queue is full of them is closed, and the client reconnects and replays
+  the history it missed
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Optional
+
+logger = logging.getLogger("dm20-protocol.party")
+
+# Message types where only the newest queued message is worth sending
+COALESCED_TYPES = frozenset({"combat_state", "ping"})
+
+# Message types that may be dropped under backpressure, first dropped first
+DROP_ORDER = ("ping", "combat_state", "system")
+
+DEFAULT_MAX_QUEUE = 256
+
+# Weight of the newest sample in the moving average send latency
+_LATENCY_SMOOTHING = 0.2
+
+# WebSocket close code for "try again later"
+_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class _Pending:
+    """A queued message and the futures waiting for its delivery."""
+
+    __slots__ = ("message", "kind", "enqueued_at", "waiters")
+
+    def __init__(self, message: dict, enqueued_at: float) -> None:
+        self.message = message
+        self.kind: Any = message.get("type")
+        self.enqueued_at = enqueued_at
+        self.waiters: list[asyncio.Future] = []
+
+    def resolve(self, sent: bool) -> None:
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(sent)
+        self.waiters.clear()
+
+
+class Outbox:
+    """
+    Bounded outbound queue and writer task of one WebSocket connection.
+
+    Must be created on the event loop that serves the connection.
+
+    Args:
+        player_id: The player the connection belongs to
+        websocket: The WebSocket connection
+        max_queue: Queued messages allowed before backpressure applies
+
+    Usage:
+        outbox = Outbox("thorin", websocket)
+        delivered = asyncio.get_running_loop().create_future()
+        if outbox.put({"type": "narrative", ...}, delivered):
+            await delivered
+    """
+
+    def __init__(self, player_id: str, websocket: Any, max_queue: int = DEFAULT_MAX_QUEUE) -> None:
+        self.player_id = player_id
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self._queue: deque[_Pending] = deque()
+        self._latest: dict[Any, _Pending] = {}
+        self._closed = False
+
+        # Metrics
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_queue_depth = 0
+        self.last_latency: Optional[float] = None
+        self.avg_latency: Optional[float] = None
+        self.max_latency = 0.0
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    @property
+    def closed(self) -> bool:
+        """Whether the outbox was closed (no further messages are queued)."""
+        return self._closed
+
+    @property
+    def queue_depth(self) -> int:
+        """Messages waiting to be sent."""
+        return len(self._queue)
+
+    def is_current(self) -> bool:
+        """Whether the writer task is alive on the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return loop is self._loop and not self._task.done()
+
+    def put(self, message: dict, waiter: Optional[asyncio.Future] = None) -> bool:
+        """
+        Queue a message for the writer task.
+
+        Args:
+            message: The JSON-serializable message dict
+            waiter: Optional future set to True once the message is sent,
+                or False if sending fails or the message is dropped
+
+        Returns:
+            True if the message was queued (or merged into a queued one)
+        """
+        if self._closed:
+            if waiter is not None:
+                waiter.set_result(False)
+            return False
+
+        kind = message.get("type")
+        if kind in COALESCED_TYPES:
+            queued = self._latest.get(kind)
+            if queued is not None:
+                queued.message = message
+                if waiter is not None:
+                    queued.waiters.append(waiter)
+                self.coalesced += 1
+                return True
+
+        if len(self._queue) >= self.max_queue and not self._make_room(kind):
+            if kind in DROP_ORDER:
+                self.dropped += 1
+                logger.debug(f"Dropped {kind} message for slow connection of {self.player_id}")
+            else:
+                self._overflow()
+            if waiter is not None:
+                waiter.set_result(False)
+            return False
+
+        pending = _Pending(message, time.perf_counter())
+        if waiter is not None:
+            pending.waiters.append(waiter)
+        self._queue.append(pending)
+        if kind in COALESCED_TYPES:
+            self._latest[kind] = pending
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        self._wakeup.set()
+        return True
+
+    def _make_room(self, kind: Any) -> bool:
+        """Drop one queued message less important than ``kind``."""
+        rank = DROP_ORDER.index(kind) if kind in DROP_ORDER else len(DROP_ORDER)
+        for victim_kind in DROP_ORDER[:rank]:
+            for pending in self._queue:
+                if pending.kind == victim_kind:
+                    self._queue.remove(pending)
+                    if self._latest.get(victim_kind) is pending:
+                        del self._latest[victim_kind]
+                    pending.resolve(False)
+                    self.dropped += 1
+                    logger.debug(f"Dropped {victim_kind} message for slow connection of {self.player_id}")
+                    return True
+        return False
+
+    def _overflow(self) -> None:
+        """Close a connection too far behind to keep its narrative."""
+        logger.warning(
+            f"Outbound queue of {self.player_id} is full ({len(self._queue)} messages), "
+            f"closing the connection so the client replays its history"
+        )
+        self.close()
+        self._loop.create_task(self._close_websocket())
+
+    async def _close_websocket(self) -> None:
+        try:
+            await self.websocket.close(code=_CLOSE_TRY_AGAIN_LATER, reason="Too far behind")
+        except Exception as e:
+            logger.debug(f"Error closing slow WebSocket of {self.player_id}: {e}")
+
+    def close(self) -> None:
+        """Stop the writer task; queued messages are not sent. Thread-safe."""
+        self._closed = True
+        if self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._task.cancel()
+        else:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, send latency and backpressure counters."""
+        def ms(seconds: Optional[float]) -> Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.max_queue_depth,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_latency_ms": ms(self.last_latency),
+            "avg_latency_ms": ms(self.avg_latency),
+            "max_latency_ms": ms(self.max_latency),
+        }
+
+    async def _run(self) -> None:
+        """Writer task: send queued messages in order."""
+        pending: Optional[_Pending] = None
+        try:
+            while True:
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                pending = self._queue.popleft()
+                if self._latest.get(pending.kind) is pending:
+                    del self._latest[pending.kind]
+                try:
+                    await self.websocket.send_json(pending.message)
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(f"Failed to send message to {self.player_id}: {e}")
+                    pending.resolve(False)
+                else:
+                    self._record_latency(time.perf_counter() - pending.enqueued_at)
+                    pending.resolve(True)
+                pending = None
+        finally:
+            if pending is not None:
+                pending.resolve(False)
+            for queued in self._queue:
+                queued.resolve(False)
+
+    def _record_latency(self, latency: float) -> None:
+        self.sent += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += _LATENCY_SMOOTHING * (latency - self.avg_latency)
+
+
+__all__ = [
+    "COALESCED_TYPES",
+    "DROP_ORDER",
+    "DEFAULT_MAX_QUEUE",
+    "Outbox",
+]
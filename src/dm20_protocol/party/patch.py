@@ -0,0 +1,128 @@
+"""
+JSON Patch (RFC 6902) deltas for Party Mode character sync.
+
+When the host saves a character, connected players receive the difference
+between the previous and the new character data instead of refetching the
+whole sheet. make_patch() produces ``add``/``remove``/``replace`` operations;
+the player UI (static/app.js) applies them with the same semantics.
+
+Lists are diffed after trimming their common prefix and suffix, so adding
+or removing one inventory item or spell is a single operation.
+"""
+
+from typing import Any
+
+
+def _escape(key: Any) -> str:
+    """Encode a key as a JSON Pointer reference token."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    Build a JSON Patch turning one JSON document into another.
+
+    Args:
+        old: JSON-ready document the client holds
+        new: JSON-ready document to produce
+        path: JSON Pointer of the documents within an enclosing document
+
+    Returns:
+        List of patch operations, empty if the documents are equal
+    """
+    if type(old) is type(new) and old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key in old:
+                ops.extend(make_patch(old[key], value, child))
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        start = 0
+        while start < len(old) and start < len(new) and old[start] == new[start]:
+            start += 1
+        old_end, new_end = len(old), len(new)
+        while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        common = min(old_end, new_end) - start
+        ops = []
+        for i in range(start, start + common):
+            ops.extend(make_patch(old[i], new[i], f"{path}/{i}"))
+        # Remove surplus items back to front so earlier indexes stay valid
+        for i in range(old_end - 1, start + common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for i in range(start + common, new_end):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        return ops
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """
+    Apply a patch from make_patch() to a decoded JSON document.
+
+    The document is modified in place where possible; use the return value,
+    which differs from the argument when the root is replaced.
+
+    Args:
+        document: Document as decoded from JSON (string object keys)
+        patch: Patch operations
+
+    Returns:
+        The patched document
+
+    Raises:
+        ValueError: If an operation is unsupported or its path does not exist
+    """
+    for op in patch:
+        kind, path = op.get("op"), op.get("path", "")
+        if kind not in ("add", "remove", "replace"):
+            raise ValueError(f"Unsupported patch operation: {kind}")
+        if path == "":
+            if kind == "remove":
+                raise ValueError("Cannot remove the document root")
+            document = op["value"]
+            continue
+
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        target = document
+        try:
+            for token in parents:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            if isinstance(target, list):
+                index = len(target) if last == "-" else int(last)
+                if kind == "add":
+                    target.insert(index, op["value"])
+                elif kind == "remove":
+                    del target[index]
+                else:
+                    target[index] = op["value"]
+            elif kind == "remove":
+                del target[last]
+            else:
+                target[last] = op["value"]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Cannot apply {kind} at {path}: {e}") from e
+    return document
+
+
+__all__ = [
+    "apply_patch",
+    "make_patch",
+]
@@ -8,14 +8,19 @@ stdio transport).
 Key components:
 - Starlette app with routes for player UI and WebSocket connections
 - Background thread lifecycle management (start/stop)
-- WebSocket connection manager for real-time updates
+- WebSocket connection manager for real-time updates, with a bounded
+  outbound queue and writer task per connection (see outbox.py)
 - Token-based authentication middleware
 - Integration with PCRegistry, PermissionResolver, and StorageManager
+- Versioned character views: ETags built from the storage's per-character
+  revision, and ``character_patch`` WebSocket messages carrying a JSON Patch
+  (see patch.py) whenever the host saves a changed character
 
 Routes:
 - GET /play?token=xxx - Serve player UI (static HTML)
 - POST /action - Submit player action
-- GET /character/{player_id} - Get character data (with permission check)
+- GET /character/{player_id} - Get character data (with permission check);
+  answers 304 when If-None-Match carries the current ETag
 - GET /status - Server health and connected players
 - WS /ws?token=xxx - WebSocket connection for real-time updates
 """
@@ -24,9 +29,10 @@ import asyncio
 import logging
 import threading
 import time
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import uvicorn
 from starlette.applications import Starlette
@@ -47,6 +53,8 @@ from dm20_protocol.storage import DnDStorage
 
 from . import bridge
 from .auth import TokenManager, detect_host_ip
+from .outbox import DEFAULT_MAX_QUEUE, Outbox
+from .patch import make_patch
 from .queue import ActionQueue, ResponseQueue
 
 if TYPE_CHECKING:
@@ -62,6 +70,16 @@ _server_instance: Optional["PartyServer"] = None
 _stop_event: Optional[threading.Event] = None
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections for Party Mode.
@@ -69,16 +87,32 @@ class ConnectionManager:
     Tracks active connections per player_id. A player may have multiple
     tabs open, so we store a set of WebSocket connections per player.
 
+    Messages are never written to a WebSocket by the sender: each
+    connection has an Outbox whose writer task sends them, so fan-out is
+    concurrent and a slow connection only delays itself. Send methods
+    wait for delivery by default, but at most ``send_timeout`` seconds.
+
     Attributes:
         _connections: Dict mapping player_id -> set of WebSocket connections
+        _outboxes: Dict mapping WebSocket -> its Outbox
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty ConnectionManager."""
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE, send_timeout: float = 5.0) -> None:
+        """
+        Initialize an empty ConnectionManager.
+
+        Args:
+            max_queue: Outbound messages queued per connection before
+                backpressure applies
+            send_timeout: Longest wait for delivery in the send methods
+        """
         self._connections: dict[str, set[WebSocket]] = {}
+        self._outboxes: dict[WebSocket, Outbox] = {}
         self._last_seen: dict[str, str] = {}
         self._last_pong: dict[str, float] = {}
         self._lock = threading.Lock()
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
 
     async def connect(self, player_id: str, websocket: WebSocket) -> None:
         """
@@ -93,6 +127,7 @@ class ConnectionManager:
             if player_id not in self._connections:
                 self._connections[player_id] = set()
             self._connections[player_id].add(websocket)
+            self._outboxes[websocket] = Outbox(player_id, websocket, self.max_queue)
         logger.info(f"WebSocket connected: player_id={player_id} "
                    f"({len(self._connections[player_id])} total connections)")
 
@@ -109,54 +144,118 @@ class ConnectionManager:
                 self._connections[player_id].discard(websocket)
                 if not self._connections[player_id]:
                     del self._connections[player_id]
+            outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox.close()
         logger.info(f"WebSocket disconnected: player_id={player_id}")
 
-    async def send_to_player(self, player_id: str, message: dict) -> int:
+    def _outbox(self, player_id: str, websocket: WebSocket) -> Optional[Outbox]:
+        """
+        Get the Outbox of a connection, creating it on first use.
+
+        An outbox left behind by another event loop is closed and replaced.
+        Must be called on the event loop serving the connection.
+
+        Returns:
+            The Outbox, or None if it was closed for falling behind
+        """
+        stale: Optional[Outbox] = None
+        with self._lock:
+            outbox = self._outboxes.get(websocket)
+            if outbox is not None and outbox.closed:
+                return None
+            if outbox is None or not outbox.is_current():
+                stale = outbox
+                outbox = Outbox(player_id, websocket, self.max_queue)
+                self._outboxes[websocket] = outbox
+        if stale is not None:
+            stale.close()
+        return outbox
+
+    async def _deliver(self, sends: list[tuple[str, WebSocket, dict]], wait: bool = True) -> int:
+        """
+        Queue messages on their connections' outboxes.
+
+        All outboxes send concurrently; with ``wait`` this returns once
+        every message is sent or ``send_timeout`` has passed.
+
+        Args:
+            sends: (player_id, websocket, message) per message
+            wait: Whether to wait for delivery
+
+        Returns:
+            Number of messages sent, or still queued when not waiting or
+            when the timeout passed
+        """
+        loop = asyncio.get_running_loop()
+        queued = 0
+        waiters: list[asyncio.Future[bool]] = []
+        for player_id, websocket, message in sends:
+            outbox = self._outbox(player_id, websocket)
+            if outbox is None:
+                continue
+            waiter: Optional[asyncio.Future[bool]] = loop.create_future() if wait else None
+            if outbox.put(message, waiter):
+                queued += 1
+                if waiter is not None:
+                    waiters.append(waiter)
+
+        if not waiters:
+            return queued
+        done, pending = await asyncio.wait(waiters, timeout=self.send_timeout)
+        return len(pending) + len([waiter for waiter in done if waiter.result()])
+
+    async def send(self, player_id: str, websocket: WebSocket, message: dict, wait: bool = True) -> int:
+        """
+        Send a JSON message to one connection of a player.
+
+        Args:
+            player_id: The player the connection belongs to
+            websocket: The WebSocket connection
+            message: The JSON-serializable message dict
+            wait: Whether to wait for delivery (up to send_timeout)
+
+        Returns:
+            1 if the message was sent (or queued), 0 otherwise
+        """
+        return await self._deliver([(player_id, websocket, message)], wait)
+
+    async def send_to_player(self, player_id: str, message: dict, wait: bool = True) -> int:
         """
         Send a JSON message to all connections for a specific player.
 
         Args:
             player_id: The player to send to
             message: The JSON-serializable message dict
+            wait: Whether to wait for delivery (up to send_timeout)
 
         Returns:
-            Number of connections the message was sent to
+            Number of connections the message was sent (or queued) to
         """
         with self._lock:
             connections = self._connections.get(player_id, set()).copy()
 
-        sent = 0
-        for ws in connections:
-            try:
-                await ws.send_json(message)
-                sent += 1
-            except Exception as e:
-                logger.warning(f"Failed to send message to {player_id}: {e}")
-        return sent
+        return await self._deliver([(player_id, ws, message) for ws in connections], wait)
 
-    async def broadcast(self, message: dict) -> int:
+    async def broadcast(self, message: dict, wait: bool = True) -> int:
         """
         Broadcast a JSON message to all connected players.
 
         Args:
             message: The JSON-serializable message dict
+            wait: Whether to wait for delivery (up to send_timeout)
 
         Returns:
-            Number of connections the message was sent to
+            Number of connections the message was sent (or queued) to
         """
         with self._lock:
-            all_connections = []
-            for conns in self._connections.values():
-                all_connections.extend(conns)
+            sends = [
+                (player_id, ws, message)
+                for player_id, conns in self._connections.items()
+                for ws in conns
+            ]
 
-        sent = 0
-        for ws in all_connections:
-            try:
-                await ws.send_json(message)
-                sent += 1
-            except Exception as e:
-                logger.warning(f"Failed to broadcast message: {e}")
-        return sent
+        return await self._deliver(sends, wait)
 
     def get_connected_players(self) -> list[str]:
         """
@@ -183,6 +282,24 @@ class ConnectionManager:
                 return len(self._connections.get(player_id, set()))
             return sum(len(conns) for conns in self._connections.values())
 
+    def get_connection_metrics(self) -> dict[str, list[dict]]:
+        """
+        Get outbound queue metrics of every connection.
+
+        Returns:
+            Dict mapping player_id -> one metrics dict per connection
+            (queue depth, send latency, sent/failed/dropped/coalesced counts)
+        """
+        with self._lock:
+            return {
+                player_id: [
+                    self._outboxes[ws].metrics()
+                    for ws in conns
+                    if ws in self._outboxes
+                ]
+                for player_id, conns in self._connections.items()
+            }
+
     async def close_all(self) -> None:
         """Close all WebSocket connections gracefully."""
         with self._lock:
@@ -190,6 +307,11 @@ class ConnectionManager:
             for conns in self._connections.values():
                 all_connections.extend(conns)
             self._connections.clear()
+            outboxes = list(self._outboxes.values())
+            self._outboxes.clear()
+
+        for outbox in outboxes:
+            outbox.close()
 
         for ws in all_connections:
             try:
@@ -218,18 +340,17 @@ class ConnectionManager:
             Total number of WebSocket sends
         """
         with self._lock:
-            player_ids = list(self._connections.keys())
+            connections = {pid: list(conns) for pid, conns in self._connections.items()}
 
-        total_sent = 0
-        for player_id in player_ids:
+        sends: list[tuple[str, WebSocket, dict]] = []
+        for player_id, player_connections in connections.items():
             filtered = bridge.format_response(response, player_id, permission_resolver)
             # Wrap as a WebSocket message with type
             ws_msg = {"type": "narrative", **filtered}
             if "private" in filtered:
                 ws_msg["type"] = "private"
                 ws_msg["from"] = "DM"
-            sent = await self.send_to_player(player_id, ws_msg)
-            total_sent += sent
+            sends.extend((player_id, ws, ws_msg) for ws in player_connections)
 
             # If there's a private message for this player, send it separately
             if "private" in filtered and filtered.get("narrative"):
@@ -250,7 +371,7 @@ class ConnectionManager:
                 # Replace the combined message with two separate ones
                 # (The client expects separate narrative and private messages)
 
-        return total_sent
+        return await self._deliver(sends)
 
     async def broadcast_combat_state(
         self,
@@ -273,18 +394,58 @@ class ConnectionManager:
             Total number of WebSocket sends
         """
         with self._lock:
-            player_ids = list(self._connections.keys())
+            connections = {pid: list(conns) for pid, conns in self._connections.items()}
 
-        total_sent = 0
-        for player_id in player_ids:
+        sends: list[tuple[str, WebSocket, dict]] = []
+        for player_id, player_connections in connections.items():
             combat_msg = bridge.get_combat_state(
                 player_id, turn_manager, storage
             )
             if combat_msg is not None:
-                sent = await self.send_to_player(player_id, combat_msg)
-                total_sent += sent
+                sends.extend((player_id, ws, combat_msg) for ws in player_connections)
+
+        return await self._deliver(sends)
+
+    async def broadcast_character_patch(
+        self,
+        character_id: str,
+        message: dict,
+        storage: DnDStorage,
+        permission_resolver: PermissionResolver,
+    ) -> int:
+        """
+        Send a character_patch message to the players of a character.
+
+        Only connected players whose own character is ``character_id`` and
+        who may read it receive the patch; other players never fetch that
+        character, so they have nothing to patch.
 
-        return total_sent
+        Args:
+            character_id: ID of the saved character
+            message: The character_patch message
+            storage: Campaign storage for player -> character lookups
+            permission_resolver: Permission validation
+
+        Returns:
+            Total number of WebSocket sends
+        """
+        with self._lock:
+            connections = {pid: list(conns) for pid, conns in self._connections.items()}
+
+        sends: list[tuple[str, WebSocket, dict]] = []
+        for player_id, player_connections in connections.items():
+            try:
+                character = storage.find_character(player_id)
+            except Exception as e:
+                logger.debug(f"Could not resolve character for {player_id}: {e}")
+                continue
+            if character is None or character.id != character_id:
+                continue
+            if not permission_resolver.check_permission(player_id, "get_character", player_id):
+                continue
+            sends.extend((player_id, ws, message) for ws in player_connections)
+
+        return await self._deliver(sends)
 
     async def handle_reconnect(
         self,
@@ -316,9 +477,14 @@ class ConnectionManager:
             is_dm=is_dm,
         )
 
-        for resp in missed:
-            msg = {"type": "narrative", **resp}
-            await self.send_to_player(player_id, msg)
+        with self._lock:
+            player_connections = list(self._connections.get(player_id, ()))
+
+        await self._deliver([
+            (player_id, ws, {"type": "narrative", **resp})
+            for resp in missed
+            for ws in player_connections
+        ])
 
         if missed:
             logger.info(f"Replayed {len(missed)} messages for {player_id}")
@@ -412,6 +578,10 @@ class PartyServer:
         # Event loop reference (set when server thread starts)
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+        # Distinguishes this server's character ETags from those handed out
+        # before a restart, when storage revisions started over
+        self._etag_prefix = uuid.uuid4().hex[:8]
+
         # Initialize queues
         self.action_queue = ActionQueue(campaign_dir)
         self.response_queue = ResponseQueue(
@@ -458,6 +628,49 @@ class PartyServer:
         except RuntimeError as e:
             logger.error(f"Failed to schedule broadcast: {e}")
 
+    def _character_etag(self, character_id: str, revision: int) -> str:
+        """ETag of a character at a storage revision."""
+        return f'"{self._etag_prefix}-{character_id}-{revision}"'
+
+    def _on_character_event(self, action: str, *args: Any) -> None:
+        """
+        Storage callback pushing a character_patch for each saved character.
+
+        Runs on the thread that saved the campaign. The patch is computed
+        there and its delivery is scheduled on the server's event loop.
+        """
+        if action != "updated" or len(args) < 4:
+            return
+        if not self._loop or self._loop.is_closed():
+            return
+
+        name, revision, previous, data = args[:4]
+        character_id = data.get("id", name)
+        if previous is None:
+            # Nothing the client could hold to patch: replace the whole document
+            base_etag = None
+            patch = [{"op": "replace", "path": "", "value": data}]
+        else:
+            base_etag = self._character_etag(character_id, revision - 1)
+            patch = make_patch(previous, data)
+        message = {
+            "type": "character_patch",
+            "character": name,
+            "base_etag": base_etag,
+            "etag": self._character_etag(character_id, revision),
+            "patch": patch,
+        }
+
+        async def _do_patch_broadcast() -> None:
+            await self.connection_manager.broadcast_character_patch(
+                character_id, message, self.storage, self.permission_resolver
+            )
+
+        try:
+            asyncio.run_coroutine_threadsafe(_do_patch_broadcast(), self._loop)
+        except RuntimeError as e:
+            logger.error(f"Failed to schedule character patch: {e}")
+
     def _build_app(self) -> Starlette:
         """
         Build the Starlette application with routes.
@@ -613,12 +826,15 @@ This page is for the DM to verify the server is running.</p></body></html>"""
         Get character data for a specific player.
 
         Validates token and checks permissions before returning character data.
+        The response carries an ETag for the character's saved revision; a
+        request whose If-None-Match holds that ETag gets 304 Not Modified.
+        A character that was never saved is sent without an ETag.
 
         Args:
             request: Starlette request object
 
         Returns:
-            JSON response with character data or error
+            JSON response with character data, 304 response, or error
         """
         player_id = request.path_params.get("player_id")
         if not player_id:
@@ -642,11 +858,11 @@ This page is for the DM to verify the server is running.</p></body></html>"""
                 status_code=403
             )
 
-        # Get character data from storage
+        # Get the saved character data and its revision from storage
         try:
-            character = self.storage.get_character(player_id)
-            # Use mode='json' to handle datetime and other non-standard types
-            return JSONResponse(character.model_dump(mode='json'))
+            view = self.storage.get_character_view(player_id)
+            if view is None:
+                raise ValueError(f"Character {player_id} not found")
         except Exception as e:
             logger.error(f"Failed to get character {player_id}: {e}")
             return JSONResponse(
@@ -654,12 +870,24 @@ This page is for the DM to verify the server is running.</p></body></html>"""
                 status_code=404
             )
 
+        revision, data = view
+        if revision is None:
+            # Never saved: edits before the first save would not change an
+            # ETag, so send the live data without one
+            return JSONResponse(data, headers={"Cache-Control": "no-cache"})
+        etag = self._character_etag(data.get("id", player_id), revision)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(data, headers=headers)
+
     async def get_status(self, request: Request) -> Response:
         """
         Get server health and status information.
 
         Returns:
-            JSON response with server status
+            JSON response with server status, including queue depth and
+            send latency of every WebSocket connection
         """
         uptime_seconds = (datetime.now() - self.start_time).total_seconds()
         connected_players = self.connection_manager.get_connected_players()
@@ -670,6 +898,7 @@ This page is for the DM to verify the server is running.</p></body></html>"""
             "connected_players": connected_players,
             "total_connections": self.connection_manager.connection_count(),
             "active_pcs": len(self.pc_registry.get_all_active()),
+            "connections": self.connection_manager.get_connection_metrics(),
         })
 
     def broadcast_combat_update(self) -> None:
@@ -848,7 +1077,7 @@ This page is for the DM to verify the server is running.</p></body></html>"""
 
         try:
             # Send initial connection confirmation
-            await websocket.send_json({
+            await self.connection_manager.send(player_id, websocket, {
                 "type": "connected",
                 "player_id": player_id,
                 "timestamp": datetime.now().isoformat(),
@@ -938,9 +1167,10 @@ This page is for the DM to verify the server is running.</p></body></html>"""
         try:
             while True:
                 await asyncio.sleep(30)
-                try:
-                    await websocket.send_json({"type": "ping"})
-                except Exception:
+                sent = await self.connection_manager.send(
+                    player_id, websocket, {"type": "ping"}
+                )
+                if not sent:
                     break
 
                 # Check for stale connection
@@ -968,6 +1198,7 @@ def _run_server(server: PartyServer, stop_event: threading.Event) -> None:
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     server._loop = loop
+    server.storage.register_character_callback(server._on_character_event)
 
     config = uvicorn.Config(
         server.app,
@@ -998,6 +1229,7 @@ def _run_server(server: PartyServer, stop_event: threading.Event) -> None:
     except Exception as e:
         logger.error(f"Server thread error: {e}")
     finally:
+        server.storage.unregister_character_callback(server._on_character_event)
         loop.close()
         logger.info("Server thread exited")
 
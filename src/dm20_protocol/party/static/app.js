@@ -37,6 +37,7 @@
     let isPrivateMode = false;
     let activeTab = 'game';
     let cachedCharacterData = null;
+    let characterEtag = null;  // ETag of cachedCharacterData, base for patches
 
     // Audio playback state
     let audioContext = null;
@@ -218,6 +219,10 @@
                 updateCharacterTabs(msg.data);
                 break;
 
+            case 'character_patch':
+                applyCharacterPatch(msg);
+                break;
+
             case 'combat_state':
                 updateCombatState(msg.data);
                 break;
@@ -500,24 +505,100 @@
 
     // ===== Character Data =====
 
+    function setCharacterData(data, etag) {
+        cachedCharacterData = data;
+        characterEtag = etag;
+        updateCharacterBar(data);
+        updateCharacterTabs(data);
+    }
+
     function fetchCharacter() {
-        fetch(API_BASE + '/character/' + encodeURIComponent(PLAYER_ID) + '?token=' + TOKEN)
+        // Revalidate the cached sheet: the server answers 304 if it is current
+        var headers = {};
+        if (cachedCharacterData && characterEtag) {
+            headers['If-None-Match'] = characterEtag;
+        }
+        fetch(API_BASE + '/character/' + encodeURIComponent(PLAYER_ID) + '?token=' + TOKEN, {
+            headers: headers,
+            cache: 'no-store',
+        })
             .then(function (resp) {
-                if (!resp.ok) return null;
-                return resp.json();
-            })
-            .then(function (data) {
-                if (data) {
-                    cachedCharacterData = data;
-                    updateCharacterBar(data);
-                    updateCharacterTabs(data);
-                }
+                if (!resp.ok) return;  // includes 304 Not Modified
+                var etag = resp.headers.get('ETag');
+                return resp.json().then(function (data) {
+                    setCharacterData(data, etag);
+                });
             })
             .catch(function (err) {
                 console.error('Failed to fetch character:', err);
             });
     }
 
+    function applyCharacterPatch(msg) {
+        // A patch applies only to the revision it was made from; a missing
+        // base_etag means the patch replaces the whole sheet
+        if (msg.base_etag !== null && (!cachedCharacterData || msg.base_etag !== characterEtag)) {
+            fetchCharacter();
+            return;
+        }
+        var data;
+        try {
+            data = applyJsonPatch(cachedCharacterData, msg.patch || []);
+        } catch (err) {
+            console.warn('Failed to apply character patch, refetching:', err);
+            fetchCharacter();
+            return;
+        }
+        setCharacterData(data, msg.etag);
+    }
+
+    function applyJsonPatch(doc, patch) {
+        // RFC 6902 add/remove/replace, applied to a copy of doc
+        var result = JSON.parse(JSON.stringify(doc === undefined ? null : doc));
+        patch.forEach(function (op) {
+            if (op.op !== 'add' && op.op !== 'remove' && op.op !== 'replace') {
+                throw new Error('Unsupported patch operation: ' + op.op);
+            }
+            if (op.path === '') {
+                if (op.op === 'remove') throw new Error('Cannot remove the document root');
+                result = op.value;
+                return;
+            }
+            var tokens = op.path.split('/').slice(1).map(function (t) {
+                return t.replace(/~1/g, '/').replace(/~0/g, '~');
+            });
+            var last = tokens.pop();
+            var target = tokens.reduce(function (node, token) {
+                if (node === null || typeof node !== 'object' || !(token in node)) {
+                    throw new Error('Invalid patch path: ' + op.path);
+                }
+                return node[token];
+            }, result);
+            if (Array.isArray(target)) {
+                var index = last === '-' ? target.length : parseInt(last, 10);
+                if (isNaN(index) || index < 0 || index > target.length) {
+                    throw new Error('Invalid patch index: ' + op.path);
+                }
+                if (op.op === 'add') {
+                    target.splice(index, 0, op.value);
+                } else if (op.op === 'remove') {
+                    target.splice(index, 1);
+                } else {
+                    target[index] = op.value;
+                }
+            } else if (target !== null && typeof target === 'object') {
+                if (op.op === 'remove') {
+                    delete target[last];
+                } else {
+                    target[last] = op.value;
+                }
+            } else {
+                throw new Error('Invalid patch path: ' + op.path);
+            }
+        });
+        return result;
+    }
+
     function updateCharacterBar(data) {
         if (!data) return;
 
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import RLock
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 from .models import (
     ClassDefinition,
@@ -29,6 +29,14 @@ from .models import (
     RulebookSource as RulebookSourceEnum,
 )
 from .sources.base import RulebookSourceBase, SearchResult, ContentCounts
+from .search_index import (
+    TIER_DESCRIPTION,
+    TIER_EXACT,
+    check_facets,
+    match_tier,
+    matches_facets,
+    rank_key,
+)
 
 if TYPE_CHECKING:
     from .sources.srd import SRDSource
@@ -126,6 +134,7 @@ class RulebookManager:
         self._priority: list[str] = []
         self._lock = RLock()
         self._manifest_dir: Path | None = None
+        self._generation = 0
 
         if campaign_dir:
             self._manifest_dir = campaign_dir / "rulebooks"
@@ -143,6 +152,15 @@ class RulebookManager:
         with self._lock:
             return list(self._priority)
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the set or order of loaded sources changes.
+
+        Lets callers cache data derived from the loaded content, e.g. the
+        encounter builder's monster table.
+        """
+        return self._generation
+
     @property
     def source_ids(self) -> list[str]:
         """Get IDs of all loaded sources."""
@@ -171,6 +189,8 @@ class RulebookManager:
         try:
             if not source.is_loaded:
                 await source.load()
+            # Index the content now rather than on the first query
+            source.build_search_index()
 
             with self._lock:
                 # Remove existing source with same ID if present
@@ -179,6 +199,7 @@ class RulebookManager:
 
                 self._sources[source.source_id] = source
                 self._priority.append(source.source_id)
+                self._generation += 1
 
             self._save_manifest()
             logger.info(f"Loaded source: {source.source_id}")
@@ -202,6 +223,7 @@ class RulebookManager:
 
             del self._sources[source_id]
             self._priority.remove(source_id)
+            self._generation += 1
 
         self._save_manifest()
         logger.info(f"Unloaded source: {source_id}")
@@ -224,6 +246,7 @@ class RulebookManager:
                     f"Expected: {set(self._sources.keys())}, got: {set(priority)}"
                 )
             self._priority = list(priority)
+            self._generation += 1
 
         self._save_manifest()
 
@@ -329,21 +352,34 @@ class RulebookManager:
         limit: int = 20,
         source_id: str | None = None,
         class_filter: str | None = None,
+        facets: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """
         Search across all loaded sources.
 
+        Results from every source are merged and ranked best match first
+        (see rulebooks.search_index). When several sources define the same
+        entry, the one from the highest-priority source is kept.
+
         Args:
-            query: Search term (case-insensitive, partial match)
+            query: Search term (case-insensitive, partial match). May be
+                empty when filtering by class_filter, categories or facets.
             categories: Filter to specific categories (class, race, spell, etc.)
             limit: Maximum number of results
             source_id: If provided, search only in this source
             class_filter: Filter spells by class (e.g., "ranger", "wizard")
+            facets: Exact-match filters: category, class, level, school
+                (spells), cr, type (monsters). A list value matches any of
+                its elements, e.g. ``{"cr": [1, 2], "type": "undead"}``.
 
         Returns:
             List of SearchResult objects
+
+        Raises:
+            ValueError: If an unknown facet is requested
         """
-        results: list[SearchResult] = []
+        check_facets(facets)
+        ranked: list[tuple[tuple, int, SearchResult]] = []
         seen: set[tuple[str, str]] = set()  # (category, index) for deduplication
 
         with self._lock:
@@ -353,17 +389,51 @@ class RulebookManager:
                 else [self._sources[sid] for sid in reversed(self._priority)]
             )
 
-            for source in sources_to_search:
-                for result in source.search(query, categories, limit, class_filter):
-                    key = (result.category, result.index)
-                    if key not in seen:
-                        seen.add(key)
-                        results.append(result)
-
-                        if len(results) >= limit:
-                            return results
-
-        return results
+            for order, source in enumerate(sources_to_search):
+                # Ask for enough results to still fill the limit after
+                # dropping entries shadowed by higher-priority sources
+                hits = self._ranked_results(source, query, categories, limit + len(seen), class_filter, facets)
+                for key, result in hits:
+                    entry = (result.category, result.index)
+                    if entry not in seen:
+                        seen.add(entry)
+                        ranked.append((key, order, result))
+
+        ranked.sort(key=lambda hit: (hit[0], hit[1]))
+        return [result for _, _, result in ranked[:limit]]
+
+    @staticmethod
+    def _ranked_results(
+        source: RulebookSourceBase,
+        query: str,
+        categories: list[str] | None,
+        limit: int,
+        class_filter: str | None,
+        facets: dict[str, Any] | None,
+    ) -> list[tuple[tuple, SearchResult]]:
+        """Ranked results from one source.
+
+        Sources using the default search() are queried through their index.
+        Results from sources with their own search() are ranked and
+        facet-filtered here.
+        """
+        if type(source).search is RulebookSourceBase.search:
+            return source.search_index.search_ranked(query, categories, limit, class_filter, facets)
+
+        query_lower = query.lower()
+        hits: list[tuple[tuple, SearchResult]] = []
+        for result in source.search(query, categories, limit if not facets else 10**9, class_filter):
+            if facets:
+                getter = getattr(source, f"get_{result.category}", None)
+                item = getter(result.index) if getter else None
+                if item is None or not matches_facets(result.category, item, facets):
+                    continue
+            tier = match_tier(query_lower, result.name, result.index) if query_lower else TIER_EXACT
+            hits.append((rank_key(TIER_DESCRIPTION if tier is None else tier, result.name,
+                                  result.category, bool(query_lower)), result))
+            if len(hits) >= limit:
+                break
+        return hits
 
     def content_counts(self, source_id: str | None = None) -> ContentCounts:
         """
@@ -588,6 +658,7 @@ class RulebookManager:
                 await source.close()
             self._sources.clear()
             self._priority.clear()
+            self._generation += 1
 
     def __repr__(self) -> str:
         source_info = ", ".join(self._sources.keys()) if self._sources else "none"
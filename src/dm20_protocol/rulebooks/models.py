@@ -318,6 +318,10 @@ class MonsterDefinition(RulebookEntry):
 
     # Description
     desc: str | None = Field(default=None)
+    environment: list[str] = Field(
+        default_factory=list,
+        description="Environments the monster is found in, lowercase (e.g., 'forest', 'underdark')",
+    )
 
     def get_ability_modifier(self, ability: str) -> int:
         """Calculate ability modifier."""
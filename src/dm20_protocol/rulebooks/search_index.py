@@ -0,0 +1,482 @@
+"""
+Inverted search index for rulebook sources.
+
+Each source used to answer ``search()`` by walking every category dict and
+checking ``query in index or query in name`` entry by entry, yielding
+matches in dict order. A RulebookSearchIndex is built once from a source's
+content and answers the same queries from posting lists, ranked by how well
+the name matches.
+
+Indexes:
+- Name trigrams: substring matches on the entry name or index are found by
+  intersecting the postings of the query's trigrams and verifying the
+  survivors. Queries shorter than three characters use the trigram
+  vocabulary.
+- Tokens: ``\\w+`` tokens of names and descriptions, kept in a sorted
+  vocabulary so token prefixes resolve with a binary search.
+- Facets: category, spell class, spell level, spell school, monster
+  challenge rating and monster type, usable as exact-match filters.
+
+Ranking (best first): exact name or index, name prefix, prefix of a word in
+the name, substring of name or index, and finally entries whose description
+contains every query word (as a word prefix). Ties are broken by shorter
+name, then alphabetically.
+
+Key components:
+- RulebookSearchIndex: the per-source index
+- facet_values / matches_facets: facet extraction and filtering for one entry
+- match_tier / rank_key: ranking shared with RulebookManager
+"""
+
+import heapq
+import re
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator
+
+from .sources.base import SearchResult
+
+# Category name -> source attribute, in the order results used to be listed
+CATEGORY_ATTRS: dict[str, str] = {
+    "class": "_classes",
+    "subclass": "_subclasses",
+    "race": "_races",
+    "subrace": "_subraces",
+    "spell": "_spells",
+    "monster": "_monsters",
+    "feat": "_feats",
+    "background": "_backgrounds",
+    "item": "_items",
+}
+CATEGORY_RANK = {category: rank for rank, category in enumerate(CATEGORY_ATTRS)}
+
+# Facets understood by RulebookSearchIndex.search(facets=...)
+FACETS = ("category", "class", "level", "school", "cr", "type")
+
+# Match tiers, best first
+TIER_EXACT = 0
+TIER_PREFIX = 1
+TIER_WORD_PREFIX = 2
+TIER_SUBSTRING = 3
+TIER_DESCRIPTION = 4
+
+_TOKEN_RE = re.compile(r"\w+")
+_NGRAM = 3
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _normalize_facet(facet: str, value: Any) -> Any:
+    if facet == "cr":
+        return float(value)
+    if facet == "level":
+        return int(value)
+    return str(_enum_value(value)).lower()
+
+
+def facet_values(category: str, item: Any) -> dict[str, list[Any]]:
+    """Facet values of one entry, normalized for lookup.
+
+    Args:
+        category: Category the entry belongs to
+        item: The rulebook model
+
+    Returns:
+        Facet name -> list of values (lists because a spell has many classes)
+    """
+    facets: dict[str, list[Any]] = {"category": [category]}
+    if category == "spell":
+        facets["class"] = [_normalize_facet("class", c) for c in getattr(item, "classes", [])]
+        facets["level"] = [_normalize_facet("level", item.level)]
+        facets["school"] = [_normalize_facet("school", item.school)]
+    elif category == "monster":
+        facets["cr"] = [_normalize_facet("cr", item.challenge_rating)]
+        facets["type"] = [_normalize_facet("type", item.type)]
+    return facets
+
+
+def check_facets(facets: dict[str, Any] | None) -> None:
+    """Raise ValueError for facet names the index does not know."""
+    for facet in facets or {}:
+        if facet not in FACETS:
+            raise ValueError(f"Unknown facet '{facet}'. Valid facets: {', '.join(FACETS)}")
+
+
+def _facet_options(facet: str, value: Any) -> set[Any]:
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    return {_normalize_facet(facet, v) for v in values}
+
+
+def matches_facets(category: str, item: Any, facets: dict[str, Any] | None) -> bool:
+    """Whether an entry satisfies facet filters (any listed value matches)."""
+    if not facets:
+        return True
+    values = facet_values(category, item)
+    return all(_facet_options(facet, wanted) & set(values.get(facet, [])) for facet, wanted in facets.items())
+
+
+def rank_key(tier: int, name: str, category: str, has_query: bool) -> tuple:
+    """Sort key for a result; comparable across indexes and sources."""
+    name_lower = name.lower()
+    category_rank = CATEGORY_RANK.get(category, len(CATEGORY_RANK))
+    if has_query:
+        return (tier, len(name_lower), name_lower, category_rank)
+    return (tier, category_rank, name_lower, 0)
+
+
+def _summary(item: Any) -> str | None:
+    desc = getattr(item, "desc", None)
+    if not desc:
+        return None
+    return desc if isinstance(desc, str) else desc[0]
+
+
+def _description_text(item: Any) -> str:
+    desc = getattr(item, "desc", None)
+    if not desc:
+        return ""
+    return desc if isinstance(desc, str) else " ".join(desc)
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+def match_tier(query: str, name: str, index: str) -> int | None:
+    """Rank a name/index match for a lowercased, non-empty query.
+
+    Returns:
+        A TIER_* constant, or None if neither name nor index contains the query
+    """
+    return _match_tier(query, name.lower(), index)
+
+
+def _match_tier(query: str, name_lower: str, index: str) -> int | None:
+    if query == name_lower or query == index:
+        return TIER_EXACT
+    if name_lower.startswith(query) or index.startswith(query):
+        return TIER_PREFIX
+    position = name_lower.find(query)
+    if position > 0 and not _TOKEN_RE.match(name_lower, position - 1):
+        return TIER_WORD_PREFIX
+    if position >= 0 or query in index:
+        if any(token.startswith(query) for token in _TOKEN_RE.findall(name_lower)):
+            return TIER_WORD_PREFIX
+        return TIER_SUBSTRING
+    return None
+
+
+class RulebookSearchIndex:
+    """Search index over the content of one rulebook source.
+
+    Build it with ``from_source()`` after the source has loaded; it is a
+    snapshot of the content at build time.
+
+    Usage:
+        index = RulebookSearchIndex.from_source(source)
+        index.search("fire", categories=["spell"], facets={"level": 3})
+    """
+
+    def __init__(self, source_id: str):
+        self.source_id = source_id
+        # Entry id -> entry data
+        self._categories: list[str] = []
+        self._indexes: list[str] = []
+        self._names: list[str] = []
+        self._names_lower: list[str] = []
+        self._summaries: list[str | None] = []
+        # Trigram -> entry ids whose name or index contains it
+        self._ngrams: dict[str, list[int]] = {}
+        # Entries whose name or index is shorter than a trigram
+        self._short: list[int] = []
+        # Lowercased names and indexes, sorted for prefix lookups, with their entry ids
+        self._prefix_keys: list[str] = []
+        self._prefix_ids: list[int] = []
+        self._prefixes: list[tuple[str, int]] = []
+        # Token -> entry ids, over names only and over names and descriptions
+        self._name_tokens: dict[str, list[int]] = {}
+        self._name_vocabulary: list[str] = []
+        self._tokens: dict[str, list[int]] = {}
+        self._vocabulary: list[str] = []
+        # (facet, value) -> entry ids
+        self._facets: dict[tuple[str, Any], set[int]] = {}
+        # Entry ids in ranking order within a tier, with and without a query
+        self._ranked_ids: list[int] = []
+        self._listed_ids: list[int] = []
+        self._rank_position: list[int] = []
+        self._list_position: list[int] = []
+
+    @classmethod
+    def from_source(cls, source: Any) -> "RulebookSearchIndex":
+        """Index every entry of a loaded source."""
+        index = cls(source.source_id)
+        for category, attr in CATEGORY_ATTRS.items():
+            index.add_all(category, getattr(source, attr, {}).values())
+        index.finalize()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # --- Building ---
+
+    def add_all(self, category: str, items: Iterable[Any]) -> None:
+        """Add the entries of one category."""
+        for item in items:
+            self.add(category, item)
+
+    def add(self, category: str, item: Any) -> None:
+        """Add one entry. Call finalize() once all entries are added."""
+        entry_id = len(self._names)
+        name_lower = item.name.lower()
+        self._categories.append(category)
+        self._indexes.append(item.index)
+        self._names.append(item.name)
+        self._names_lower.append(name_lower)
+        self._summaries.append(_summary(item))
+
+        for gram in _ngrams(name_lower) | _ngrams(item.index):
+            self._ngrams.setdefault(gram, []).append(entry_id)
+        if len(name_lower) < _NGRAM or len(item.index) < _NGRAM:
+            self._short.append(entry_id)
+        self._prefixes.append((name_lower, entry_id))
+        if item.index != name_lower:
+            self._prefixes.append((item.index, entry_id))
+
+        name_tokens = set(_TOKEN_RE.findall(name_lower))
+        for token in name_tokens:
+            self._name_tokens.setdefault(token, []).append(entry_id)
+        for token in name_tokens | set(_TOKEN_RE.findall(_description_text(item).lower())):
+            self._tokens.setdefault(token, []).append(entry_id)
+
+        for facet, values in facet_values(category, item).items():
+            for value in values:
+                self._facets.setdefault((facet, value), set()).add(entry_id)
+
+    def finalize(self) -> None:
+        """Sort the lookup tables and precompute the ranking orders."""
+        self._prefixes.sort()
+        self._prefix_keys = [key for key, _ in self._prefixes]
+        self._prefix_ids = [entry_id for _, entry_id in self._prefixes]
+        self._prefixes = []
+        self._name_vocabulary = sorted(self._name_tokens)
+        self._vocabulary = sorted(self._tokens)
+
+        entry_ids = range(len(self._names))
+        self._ranked_ids = sorted(entry_ids, key=lambda i: self._rank_key(i, 0, True))
+        self._listed_ids = sorted(entry_ids, key=lambda i: self._rank_key(i, 0, False))
+        self._rank_position = [0] * len(self._names)
+        self._list_position = [0] * len(self._names)
+        for position, entry_id in enumerate(self._ranked_ids):
+            self._rank_position[entry_id] = position
+        for position, entry_id in enumerate(self._listed_ids):
+            self._list_position[entry_id] = position
+
+    # --- Querying ---
+
+    def facet_counts(self, facet: str) -> dict[Any, int]:
+        """Number of entries for each value of a facet."""
+        return {value: len(ids) for (name, value), ids in self._facets.items() if name == facet}
+
+    def search(
+        self,
+        query: str,
+        categories: list[str] | None = None,
+        limit: int = 20,
+        class_filter: str | None = None,
+        facets: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """Ranked search.
+
+        Args:
+            query: Search term (case-insensitive). Empty to list everything
+                matching the filters.
+            categories: Restrict to these categories
+            limit: Maximum number of results
+            class_filter: Only keep spells of this class; other categories
+                are unaffected. With an empty query only spells are listed.
+            facets: Exact-match filters, e.g. ``{"cr": 2, "type": "undead"}``
+
+        Returns:
+            Best matches first
+        """
+        return [result for _, result in self.search_ranked(query, categories, limit, class_filter, facets)]
+
+    def search_ranked(
+        self,
+        query: str,
+        categories: list[str] | None = None,
+        limit: int = 20,
+        class_filter: str | None = None,
+        facets: dict[str, Any] | None = None,
+    ) -> list[tuple[tuple, SearchResult]]:
+        """Like search(), returning ``(rank_key, result)`` pairs.
+
+        Rank keys from different indexes are comparable, which lets
+        RulebookManager merge results across sources.
+        """
+        query = query.lower()
+        limit = max(limit, 0)
+        allowed = self._filter(categories, facets)
+        excluded: set[int] = set()
+        if class_filter:
+            class_spells = self._facets.get(("class", class_filter.lower()), set())
+            if query:
+                excluded = self._facets.get(("category", "spell"), set()) - class_spells
+            else:
+                allowed = set(class_spells) if allowed is None else allowed & class_spells
+        if allowed is not None and not allowed:
+            return []
+
+        if query:
+            tiers = self._match(query, allowed, excluded, limit)
+            positions = self._rank_position
+            ordered_ids = self._ranked_ids
+        elif allowed is None:
+            # Nothing to search for and nothing to filter by
+            return []
+        else:
+            tiers = dict.fromkeys(allowed, TIER_EXACT)
+            positions = self._list_position
+            ordered_ids = self._listed_ids
+
+        # One integer per hit: tier first, then the precomputed order
+        size = len(self._names)
+        best = heapq.nsmallest(limit, (tier * size + positions[entry_id] for entry_id, tier in tiers.items()))
+        hits = []
+        for value in best:
+            tier, position = divmod(value, size)
+            entry_id = ordered_ids[position]
+            hits.append((self._rank_key(entry_id, tier, bool(query)), self._result(entry_id)))
+        return hits
+
+    def _rank_key(self, entry_id: int, tier: int, has_query: bool) -> tuple:
+        return rank_key(tier, self._names[entry_id], self._categories[entry_id], has_query)
+
+    def _result(self, entry_id: int) -> SearchResult:
+        return SearchResult(
+            index=self._indexes[entry_id],
+            name=self._names[entry_id],
+            category=self._categories[entry_id],  # type: ignore[arg-type]
+            source=self.source_id,
+            summary=self._summaries[entry_id],
+        )
+
+    def _filter(self, categories: list[str] | None, facets: dict[str, Any] | None) -> set[int] | None:
+        """Entry ids allowed by category and facet filters, or None for no restriction."""
+        allowed: set[int] | None = None
+
+        def restrict(ids: set[int]) -> None:
+            nonlocal allowed
+            allowed = set(ids) if allowed is None else allowed & ids
+
+        if categories:
+            restrict(set().union(*(self._facets.get(("category", c), set()) for c in categories)))
+        check_facets(facets)
+        for facet, value in (facets or {}).items():
+            restrict(set().union(*(self._facets.get((facet, v), set()) for v in _facet_options(facet, value))))
+        return allowed
+
+    def _match(self, query: str, allowed: set[int] | None, excluded: set[int], limit: int) -> dict[int, int]:
+        """Entry id -> match tier for the entries matching the query.
+
+        Tiers are filled best first; once ``limit`` entries are found, the
+        worse tiers cannot make the cut and are not computed.
+        """
+        def permitted(entry_id: int) -> bool:
+            return (allowed is None or entry_id in allowed) and entry_id not in excluded
+
+        tiers: dict[int, int] = {}
+        if _TOKEN_RE.fullmatch(query):
+            # Single word: prefix and word-prefix hits come from sorted tables
+            start, end = _prefix_range(self._prefix_keys, query)
+            for position in range(start, end):
+                entry_id = self._prefix_ids[position]
+                if permitted(entry_id) and tiers.get(entry_id) != TIER_EXACT:
+                    tiers[entry_id] = TIER_EXACT if self._prefix_keys[position] == query else TIER_PREFIX
+            start, end = _prefix_range(self._name_vocabulary, query)
+            for token in self._name_vocabulary[start:end]:
+                for entry_id in self._name_tokens[token]:
+                    if entry_id not in tiers and permitted(entry_id):
+                        tiers[entry_id] = TIER_WORD_PREFIX
+            if len(tiers) >= limit:
+                return tiers
+            for entry_id in self._name_candidates(query):
+                if entry_id not in tiers and permitted(entry_id) and (
+                    query in self._names_lower[entry_id] or query in self._indexes[entry_id]
+                ):
+                    tiers[entry_id] = TIER_SUBSTRING
+        else:
+            for entry_id in self._name_candidates(query):
+                if permitted(entry_id):
+                    tier = _match_tier(query, self._names_lower[entry_id], self._indexes[entry_id])
+                    if tier is not None:
+                        tiers[entry_id] = tier
+
+        if len(query) < _NGRAM or len(tiers) >= limit:
+            # Too short to be a meaningful word prefix in descriptions
+            return tiers
+        for entry_id in self._description_candidates(query):
+            if entry_id not in tiers and permitted(entry_id):
+                tiers[entry_id] = TIER_DESCRIPTION
+        return tiers
+
+    def _name_candidates(self, query: str) -> Iterator[int]:
+        """Entries that may contain the query in their name or index."""
+        if len(query) >= _NGRAM:
+            postings = []
+            for gram in _ngrams(query):
+                ids = self._ngrams.get(gram)
+                if ids is None:
+                    return
+                postings.append(ids)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                candidates.intersection_update(ids)
+                if not candidates:
+                    return
+            yield from candidates
+            return
+
+        seen: set[int] = set()
+        for gram, ids in self._ngrams.items():
+            if query in gram:
+                seen.update(ids)
+        seen.update(self._short)
+        yield from seen
+
+    def _description_candidates(self, query: str) -> set[int]:
+        """Entries whose name or description has every query word as a word prefix."""
+        words = _TOKEN_RE.findall(query)
+        if not words:
+            return set()
+        result: set[int] | None = None
+        for word in sorted(words, key=len, reverse=True):
+            ids: set[int] = set()
+            start, end = _prefix_range(self._vocabulary, word)
+            for token in self._vocabulary[start:end]:
+                ids.update(self._tokens[token])
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result or set()
+
+
+def _prefix_range(keys: list[str], prefix: str) -> tuple[int, int]:
+    """Slice bounds of the strings starting with prefix in a sorted list."""
+    return bisect_left(keys, prefix), bisect_left(keys, prefix + _MAX_CHAR)
+
+
+__all__ = [
+    "RulebookSearchIndex",
+    "CATEGORY_ATTRS",
+    "FACETS",
+    "check_facets",
+    "facet_values",
+    "match_tier",
+    "matches_facets",
+    "rank_key",
+]
@@ -0,0 +1,223 @@
+"""
+Binary snapshots of fully mapped rulebook sources.
+
+Loading a remote source from its local cache still means parsing large JSON
+files (5etools) or thousands of small ones (SRD) and mapping every entry
+into Pydantic models. A snapshot stores the mapped models of a source in a
+single file that is read in one call and unpickled without re-validation,
+so a source whose upstream cache has not changed hydrates in milliseconds.
+
+File layout::
+
+    b"DM20SNAP" | header length (4 bytes, big-endian) | JSON header | pickle payload
+
+The header records the snapshot format, the source identity and version,
+the source's mapper version, a fingerprint of the rulebook model fields and
+a content hash of the upstream cache. A snapshot is only used when all of
+them match; otherwise the source re-maps its cache and writes a new one.
+
+Snapshots are a local cache written by this server next to the rulebook
+cache they summarize; they are not meant to be shared between machines.
+
+Key components:
+- CONTENT_ATTRS: the per-category dicts a snapshot captures
+- hash_files: stat-based content hash for an upstream cache
+- read_snapshot / write_snapshot: the file format
+- load_source_snapshot / save_source_snapshot: helpers used by sources
+"""
+
+import json
+import logging
+import pickle
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from . import models
+
+if TYPE_CHECKING:
+    from .sources.base import RulebookSourceBase
+
+logger = logging.getLogger("dm20-protocol")
+
+SNAPSHOT_MAGIC = b"DM20SNAP"
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Source attributes holding the mapped content of each category
+CONTENT_ATTRS = (
+    "_classes",
+    "_subclasses",
+    "_races",
+    "_subraces",
+    "_spells",
+    "_monsters",
+    "_feats",
+    "_backgrounds",
+    "_items",
+)
+
+_schema_fingerprint: str | None = None
+
+
+class SnapshotError(Exception):
+    """A snapshot file is missing, damaged or does not match."""
+    pass
+
+
+def schema_fingerprint() -> str:
+    """Hash of the field names of every rulebook model.
+
+    Adding, removing or renaming a model field changes the fingerprint and
+    so invalidates snapshots pickled against the old model layout.
+    """
+    global _schema_fingerprint
+    if _schema_fingerprint is None:
+        digest = sha256()
+        for name in sorted(dir(models)):
+            model = getattr(models, name)
+            fields = getattr(model, "model_fields", None)
+            if isinstance(model, type) and isinstance(fields, dict):
+                digest.update(f"{name}:{','.join(sorted(fields))};".encode())
+        _schema_fingerprint = digest.hexdigest()[:16]
+    return _schema_fingerprint
+
+
+def hash_files(paths: Iterable[Path]) -> str:
+    """Content hash of a set of cache files from their names, sizes and mtimes.
+
+    Stat-based rather than reading the bytes: the upstream cache is only
+    ever rewritten by a download, which changes size or modification time.
+    """
+    digest = sha256()
+    for path in sorted(paths):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def write_snapshot(path: Path, header: dict[str, Any], content: dict[str, dict]) -> int:
+    """Atomically write a snapshot file.
+
+    Args:
+        path: Destination file
+        header: Identity fields checked when reading
+        content: Category attribute name -> {index: model}
+
+    Returns:
+        Number of bytes written
+    """
+    header_bytes = json.dumps({**header, "format": SNAPSHOT_FORMAT_VERSION}, sort_keys=True).encode("utf-8")
+    payload = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+    data = SNAPSHOT_MAGIC + len(header_bytes).to_bytes(4, "big") + header_bytes + payload
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_suffix(path.suffix + ".tmp")
+    temp_file.write_bytes(data)
+    temp_file.replace(path)
+    return len(data)
+
+
+def read_snapshot(path: Path, expected: dict[str, Any]) -> dict[str, dict]:
+    """Read a snapshot, checking its header against ``expected``.
+
+    Raises:
+        SnapshotError: If the file is missing, damaged or stale
+    """
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise SnapshotError(f"cannot read {path.name}: {e}") from e
+
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise SnapshotError(f"{path.name} is not a rulebook snapshot")
+    offset = len(SNAPSHOT_MAGIC)
+    header_length = int.from_bytes(data[offset:offset + 4], "big")
+    offset += 4
+    try:
+        header = json.loads(data[offset:offset + header_length])
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise SnapshotError(f"damaged header in {path.name}") from e
+
+    expected = {**expected, "format": SNAPSHOT_FORMAT_VERSION}
+    mismatched = sorted(key for key, value in expected.items() if header.get(key) != value)
+    if mismatched:
+        raise SnapshotError(f"{path.name} is stale ({', '.join(mismatched)} changed)")
+
+    try:
+        content = pickle.loads(data[offset + header_length:])
+    except Exception as e:
+        raise SnapshotError(f"damaged payload in {path.name}: {e}") from e
+    if not isinstance(content, dict) or set(content) - set(CONTENT_ATTRS):
+        raise SnapshotError(f"unexpected payload in {path.name}")
+    return content
+
+
+def _source_header(source: "RulebookSourceBase", content_hash: str) -> dict[str, Any]:
+    return {
+        "source_type": source.source_type.value,
+        "source_id": source.source_id,
+        "source_version": source.snapshot_version_key(),
+        "mapper": source.SNAPSHOT_MAPPER_VERSION,
+        "schema": schema_fingerprint(),
+        "content_hash": content_hash,
+    }
+
+
+def load_source_snapshot(source: "RulebookSourceBase") -> bool:
+    """Hydrate a source from its snapshot if the snapshot is current.
+
+    Returns:
+        True if the source's content was replaced from the snapshot
+    """
+    path = source.snapshot_path()
+    content_hash = source.snapshot_content_hash() if path else None
+    if path is None or content_hash is None or not path.exists():
+        return False
+    try:
+        content = read_snapshot(path, _source_header(source, content_hash))
+    except SnapshotError as e:
+        logger.info(f"Rebuilding {source.source_id} snapshot: {e}")
+        return False
+
+    for attr in CONTENT_ATTRS:
+        setattr(source, attr, content.get(attr, {}))
+    logger.debug(f"Hydrated {source.source_id} from snapshot {path}")
+    return True
+
+
+def save_source_snapshot(source: "RulebookSourceBase") -> bool:
+    """Write the mapped content of a freshly loaded source to its snapshot.
+
+    Failures are logged and ignored: the snapshot is only a cache.
+
+    Returns:
+        True if a snapshot was written
+    """
+    path = source.snapshot_path()
+    content_hash = source.snapshot_content_hash() if path else None
+    if path is None or content_hash is None:
+        return False
+    content = {attr: getattr(source, attr, {}) for attr in CONTENT_ATTRS}
+    try:
+        size = write_snapshot(path, _source_header(source, content_hash), content)
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"Could not write {source.source_id} snapshot: {e}")
+        return False
+    logger.debug(f"Wrote {source.source_id} snapshot ({size} bytes) to {path}")
+    return True
+
+
+__all__ = [
+    "SNAPSHOT_FORMAT_VERSION",
+    "CONTENT_ATTRS",
+    "SnapshotError",
+    "schema_fingerprint",
+    "hash_files",
+    "write_snapshot",
+    "read_snapshot",
+    "load_source_snapshot",
+    "save_source_snapshot",
+]
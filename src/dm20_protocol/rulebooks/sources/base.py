@@ -8,7 +8,8 @@ enabling a plugin architecture for different data sources (SRD API, Open5e, loca
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterator, Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Literal
 
 from ..models import (
     ClassDefinition,
@@ -23,6 +24,9 @@ from ..models import (
     RulebookSource as RulebookSourceType,
 )
 
+if TYPE_CHECKING:
+    from ..search_index import RulebookSearchIndex
+
 
 @dataclass
 class SearchResult:
@@ -106,6 +110,8 @@ class RulebookSourceBase(ABC):
         self.name = name or source_id
         self.loaded_at: datetime | None = None
         self._loaded = False
+        self._search_index: "RulebookSearchIndex | None" = None
+        self._search_index_key: tuple | None = None
 
     @property
     def is_loaded(self) -> bool:
@@ -249,7 +255,6 @@ class RulebookSourceBase(ABC):
         """
         pass
 
-    @abstractmethod
     def search(
         self,
         query: str,
@@ -260,6 +265,10 @@ class RulebookSourceBase(ABC):
         """
         Search across all content in this source.
 
+        The default implementation queries the source's search index, so
+        results come best match first. Sources that do not keep their
+        content in the standard category dicts override this.
+
         Args:
             query: Search term (case-insensitive, partial match)
             categories: Filter to specific categories (class, race, spell, monster, etc.)
@@ -271,7 +280,42 @@ class RulebookSourceBase(ABC):
         Yields:
             SearchResult objects matching the query
         """
-        pass
+        yield from self.search_index.search(query, categories, limit, class_filter)
+
+    @property
+    def search_index(self) -> "RulebookSearchIndex":
+        """
+        Get the search index over this source's content.
+
+        Built on first use and rebuilt when a category dict is replaced or
+        changes size, e.g. after the source is reloaded.
+        """
+        index = getattr(self, "_search_index", None)
+        if index is None or self._content_key() != getattr(self, "_search_index_key", None):
+            index = self.build_search_index()
+        return index
+
+    def build_search_index(self) -> "RulebookSearchIndex":
+        """
+        (Re)build the search index from the current content.
+
+        Returns:
+            The new index
+        """
+        from ..search_index import RulebookSearchIndex
+
+        self._search_index = RulebookSearchIndex.from_source(self)
+        self._search_index_key = self._content_key()
+        return self._search_index
+
+    def _content_key(self) -> tuple:
+        """Identity and size of each category dict, to detect reloads."""
+        from ..search_index import CATEGORY_ATTRS
+
+        return tuple(
+            None if content is None else (id(content), len(content))
+            for content in (getattr(self, attr, None) for attr in CATEGORY_ATTRS.values())
+        )
 
     @abstractmethod
     def content_counts(self) -> ContentCounts:
@@ -287,6 +331,40 @@ class RulebookSourceBase(ABC):
     # Optional Methods - Can be overridden by subclasses
     # =========================================================================
 
+    # Version of the code mapping upstream data into models. Sources that
+    # support snapshots bump it when a mapping change should invalidate them.
+    SNAPSHOT_MAPPER_VERSION: int = 1
+
+    def snapshot_path(self) -> Path | None:
+        """
+        Get the file holding this source's binary snapshot.
+
+        Override this, together with snapshot_content_hash(), to let the
+        source hydrate from a snapshot instead of re-mapping its cache.
+
+        Returns:
+            Snapshot file path, or None if the source does not use snapshots
+        """
+        return None
+
+    def snapshot_content_hash(self) -> str | None:
+        """
+        Get a hash identifying the current state of the upstream cache.
+
+        Returns:
+            Hash string, or None if the cache is not available
+        """
+        return None
+
+    def snapshot_version_key(self) -> str | None:
+        """
+        Get the upstream data version a snapshot must match (e.g. "2014").
+
+        Returns:
+            Version string, or None if the source is unversioned
+        """
+        return None
+
     def stats_summary(self) -> str:
         """
         Get a formatted summary of content counts.
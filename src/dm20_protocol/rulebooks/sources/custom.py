@@ -9,7 +9,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 
 import yaml
 from pydantic import ValidationError
@@ -26,7 +26,7 @@ from ..models import (
     ItemDefinition,
     RulebookSource as RulebookSourceType,
 )
-from .base import RulebookSourceBase, SearchResult, ContentCounts
+from .base import RulebookSourceBase, ContentCounts
 
 
 logger = logging.getLogger("dm20-protocol")
@@ -323,72 +323,6 @@ class CustomSource(RulebookSourceBase):
     def get_item(self, index: str) -> ItemDefinition | None:
         return self._items.get(index.lower())
 
-    def search(
-        self,
-        query: str,
-        categories: list[str] | None = None,
-        limit: int = 20,
-        class_filter: str | None = None,
-    ) -> Iterator[SearchResult]:
-        """Search across all content.
-
-        Args:
-            query: Search term (case-insensitive, partial match)
-            categories: Filter to specific categories
-            limit: Maximum number of results
-            class_filter: Filter spells by class (e.g., "ranger", "wizard")
-        """
-        query_lower = query.lower()
-        class_filter_lower = class_filter.lower() if class_filter else None
-        count = 0
-
-        # Define category -> (storage, category_name) mapping
-        category_map = {
-            "class": (self._classes, "class"),
-            "subclass": (self._subclasses, "subclass"),
-            "race": (self._races, "race"),
-            "subrace": (self._subraces, "subrace"),
-            "spell": (self._spells, "spell"),
-            "monster": (self._monsters, "monster"),
-            "feat": (self._feats, "feat"),
-            "background": (self._backgrounds, "background"),
-            "item": (self._items, "item"),
-        }
-
-        # Filter to requested categories
-        if categories:
-            search_categories = [(k, v) for k, v in category_map.items() if k in categories]
-        else:
-            search_categories = list(category_map.items())
-
-        for category_name, (storage, cat) in search_categories:
-            for index, item in storage.items():
-                if count >= limit:
-                    return
-
-                # Apply class filter for spells
-                if class_filter_lower and cat == "spell":
-                    spell_classes = getattr(item, "classes", [])
-                    if class_filter_lower not in [c.lower() for c in spell_classes]:
-                        continue
-
-                # Match by query (or return all if query is empty and class_filter is set)
-                if query_lower:
-                    if query_lower not in index and query_lower not in item.name.lower():
-                        continue
-                elif not class_filter_lower:
-                    # If no query and no class_filter, skip (need at least one filter)
-                    continue
-
-                yield SearchResult(
-                    index=item.index,
-                    name=item.name,
-                    category=cat,  # type: ignore
-                    source=self.source_id,
-                    summary=getattr(item, "desc", [None])[0] if hasattr(item, "desc") else None,
-                )
-                count += 1
-
     def content_counts(self) -> ContentCounts:
         """Get counts of all content types."""
         return ContentCounts(
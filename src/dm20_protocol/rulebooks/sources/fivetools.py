@@ -13,7 +13,7 @@ import logging
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 
 import httpx
 
@@ -41,7 +41,8 @@ from ..models import (
     Size,
     ItemRarity,
 )
-from .base import RulebookSourceBase, SearchResult, ContentCounts
+from ..snapshot import hash_files, load_source_snapshot, save_source_snapshot
+from .base import RulebookSourceBase, ContentCounts
 from .fivetools_utils import convert_5etools_markup, render_entries
 
 
@@ -197,9 +198,14 @@ class FiveToolsSource(RulebookSourceBase):
         │   ├── spells.json
         │   ├── bestiary.json
         │   └── ...
+        ├── snapshots/
+        │   └── 5etools.snapshot  # Mapped models, see rulebooks.snapshot
         └── metadata.json  # Download timestamps, file manifest
     """
 
+    # 2: monsters carry their environments
+    SNAPSHOT_MAPPER_VERSION = 2
+
     def __init__(self, cache_dir: Path | None = None):
         super().__init__(
             source_id="5etools",
@@ -228,10 +234,16 @@ class FiveToolsSource(RulebookSourceBase):
     # =========================================================================
 
     async def load(self) -> None:
-        """Load 5etools data from cache or by downloading from GitHub."""
+        """Load 5etools data from cache or by downloading from GitHub.
+
+        When the merged cache is unchanged since the last load, the mapped
+        models are hydrated from the binary snapshot instead of re-parsing.
+        """
         await self._ensure_data_downloaded()
-        self._load_merged_data()
-        self._parse_all_data()
+        if not load_source_snapshot(self):
+            self._load_merged_data()
+            self._parse_all_data()
+            save_source_snapshot(self)
         self._loaded = True
         self.loaded_at = datetime.now()
         logger.info(f"Loaded 5etools: {self.content_counts()}")
@@ -519,9 +531,28 @@ class FiveToolsSource(RulebookSourceBase):
             json.dumps(metadata, indent=2), encoding="utf-8"
         )
 
+    # =========================================================================
+    # Snapshot
+    # =========================================================================
+
+    def snapshot_path(self) -> Path | None:
+        """Snapshot file inside the 5etools cache directory."""
+        return self.cache_dir / "snapshots" / f"{self.source_id}.snapshot"
+
+    def snapshot_content_hash(self) -> str | None:
+        """Hash of the merged category files the models are mapped from."""
+        merged_dir = self.cache_dir / "merged"
+        merged_files = list(merged_dir.glob("*.json")) if merged_dir.exists() else []
+        if not merged_files:
+            return None
+        return hash_files(merged_files)
+
     @property
     def raw_data_counts(self) -> dict[str, int]:
-        """Get counts of raw (unparsed) data entries per category."""
+        """Get counts of raw (unparsed) data entries per category.
+
+        Empty when the source was hydrated from its snapshot.
+        """
         return {cat: len(entries) for cat, entries in self._raw_data.items()}
 
     # =========================================================================
@@ -1022,6 +1053,7 @@ class FiveToolsSource(RulebookSourceBase):
             actions=actions,
             reactions=reactions,
             legendary_actions=legendary_actions,
+            environment=[str(env).lower() for env in data.get("environment", [])],
             source=self.source_id,
         )
 
@@ -1415,69 +1447,6 @@ class FiveToolsSource(RulebookSourceBase):
     def get_item(self, index: str) -> ItemDefinition | None:
         return self._items.get(index.lower())
 
-    def search(
-        self,
-        query: str,
-        categories: list[str] | None = None,
-        limit: int = 20,
-        class_filter: str | None = None,
-    ) -> Iterator[SearchResult]:
-        """Search across all content (populated after model mapping in #84)."""
-        query_lower = query.lower()
-        class_filter_lower = class_filter.lower() if class_filter else None
-        count = 0
-
-        category_map = {
-            "class": (self._classes, "class"),
-            "subclass": (self._subclasses, "subclass"),
-            "race": (self._races, "race"),
-            "subrace": (self._subraces, "subrace"),
-            "spell": (self._spells, "spell"),
-            "monster": (self._monsters, "monster"),
-            "feat": (self._feats, "feat"),
-            "background": (self._backgrounds, "background"),
-            "item": (self._items, "item"),
-        }
-
-        if categories:
-            search_categories = [
-                (k, v) for k, v in category_map.items() if k in categories
-            ]
-        else:
-            search_categories = list(category_map.items())
-
-        for _category_name, (storage, cat) in search_categories:
-            for index, item in storage.items():
-                if count >= limit:
-                    return
-
-                if class_filter_lower and cat == "spell":
-                    spell_classes = getattr(item, "classes", [])
-                    if class_filter_lower not in [c.lower() for c in spell_classes]:
-                        continue
-
-                if query_lower:
-                    if (
-                        query_lower not in index
-                        and query_lower not in item.name.lower()
-                    ):
-                        continue
-                elif not class_filter_lower:
-                    continue
-
-                yield SearchResult(
-                    index=item.index,
-                    name=item.name,
-                    category=cat,  # type: ignore[arg-type]
-                    source=self.source_id,
-                    summary=(
-                        getattr(item, "desc", [None])[0]
-                        if hasattr(item, "desc") and item.desc
-                        else None
-                    ),
-                )
-                count += 1
-
     def content_counts(self) -> ContentCounts:
         """Get model content counts (populated after mapping in #84)."""
         return ContentCounts(
@@ -10,7 +10,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 
 import httpx
 
@@ -37,7 +37,8 @@ from ..models import (
     SpellSchool,
     Size,
 )
-from .base import RulebookSourceBase, SearchResult, ContentCounts
+from ..snapshot import hash_files, load_source_snapshot, save_source_snapshot
+from .base import RulebookSourceBase, ContentCounts
 
 
 logger = logging.getLogger("dm20-protocol")
@@ -100,10 +101,25 @@ class SRDSource(RulebookSourceBase):
         self._backgrounds: dict[str, BackgroundDefinition] = {}
         self._items: dict[str, ItemDefinition] = {}
 
+        # Entries that failed to load during the last load() call
+        self._load_failures = 0
+
     async def load(self) -> None:
-        """Load all SRD content from API or cache."""
+        """Load all SRD content from API or cache.
+
+        When the cached API responses are unchanged since the last complete
+        load, the mapped models are hydrated from the binary snapshot
+        instead of reading and mapping one cache file per entry.
+        """
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        if load_source_snapshot(self):
+            self._loaded = True
+            self.loaded_at = datetime.now()
+            logger.info(f"Loaded SRD {self.version} from snapshot: {self.stats_summary()}")
+            return
+
+        self._load_failures = 0
         async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
             self._client = client
 
@@ -123,6 +139,11 @@ class SRDSource(RulebookSourceBase):
         self._loaded = True
         self.loaded_at = datetime.now()
 
+        # A partial load must not be frozen into a snapshot: the next load
+        # retries the entries that failed
+        if self._load_failures == 0:
+            save_source_snapshot(self)
+
         logger.info(f"Loaded SRD {self.version}: {self.stats_summary()}")
 
     async def close(self) -> None:
@@ -197,6 +218,25 @@ class SRDSource(RulebookSourceBase):
 
         raise SRDSourceError(f"Failed to fetch {endpoint} after {MAX_RETRIES} retries: {last_error}")
 
+    # =========================================================================
+    # Snapshot
+    # =========================================================================
+
+    def snapshot_path(self) -> Path | None:
+        """Snapshot file inside the SRD cache directory."""
+        return self.cache_dir / "snapshots" / f"{self.source_id}.snapshot"
+
+    def snapshot_content_hash(self) -> str | None:
+        """Hash of the cached API responses the models are mapped from."""
+        cache_files = list(self.cache_dir.glob("*.json"))
+        if not cache_files:
+            return None
+        return hash_files(cache_files)
+
+    def snapshot_version_key(self) -> str | None:
+        """SRD version the snapshot was mapped from."""
+        return self.version
+
     def _get_cache_path(self, endpoint: str) -> Path:
         """Convert endpoint to cache file path."""
         # /classes/wizard -> classes_wizard.json
@@ -237,9 +277,11 @@ class SRDSource(RulebookSourceBase):
                         sub_def = self._map_subclass(sub_data)
                         self._subclasses[sub_index] = sub_def
                     except Exception as e:
+                        self._load_failures += 1
                         logger.warning(f"Failed to load subclass {sub_index}: {e}")
 
             except Exception as e:
+                self._load_failures += 1
                 logger.warning(f"Failed to load class {index}: {e}")
 
     async def _load_races(self) -> None:
@@ -261,9 +303,11 @@ class SRDSource(RulebookSourceBase):
                         sub_def = self._map_subrace(sub_data)
                         self._subraces[sub_index] = sub_def
                     except Exception as e:
+                        self._load_failures += 1
                         logger.warning(f"Failed to load subrace {sub_index}: {e}")
 
             except Exception as e:
+                self._load_failures += 1
                 logger.warning(f"Failed to load race {index}: {e}")
 
     async def _load_spells(self) -> None:
@@ -284,6 +328,7 @@ class SRDSource(RulebookSourceBase):
             spell_def = self._map_spell(spell_data)
             self._spells[index] = spell_def
         except Exception as e:
+            self._load_failures += 1
             logger.warning(f"Failed to load spell {index}: {e}")
 
     async def _load_monsters(self) -> None:
@@ -304,6 +349,7 @@ class SRDSource(RulebookSourceBase):
             monster_def = self._map_monster(monster_data)
             self._monsters[index] = monster_def
         except Exception as e:
+            self._load_failures += 1
             logger.warning(f"Failed to load monster {index}: {e}")
 
     async def _load_equipment(self) -> None:
@@ -323,6 +369,7 @@ class SRDSource(RulebookSourceBase):
             item_def = self._map_item(item_data)
             self._items[index] = item_def
         except Exception as e:
+            self._load_failures += 1
             logger.warning(f"Failed to load item {index}: {e}")
 
     async def _load_feats(self) -> None:
@@ -336,6 +383,7 @@ class SRDSource(RulebookSourceBase):
                 feat_def = self._map_feat(feat_data)
                 self._feats[index] = feat_def
             except Exception as e:
+                self._load_failures += 1
                 logger.warning(f"Failed to load feat {index}: {e}")
 
     async def _load_backgrounds(self) -> None:
@@ -349,6 +397,7 @@ class SRDSource(RulebookSourceBase):
                 bg_def = self._map_background(bg_data)
                 self._backgrounds[index] = bg_def
             except Exception as e:
+                self._load_failures += 1
                 logger.warning(f"Failed to load background {index}: {e}")
 
     # =========================================================================
@@ -652,70 +701,6 @@ class SRDSource(RulebookSourceBase):
     def get_item(self, index: str) -> ItemDefinition | None:
         return self._items.get(index.lower())
 
-    def search(
-        self,
-        query: str,
-        categories: list[str] | None = None,
-        limit: int = 20,
-        class_filter: str | None = None,
-    ) -> Iterator[SearchResult]:
-        """Search across all SRD content.
-
-        Args:
-            query: Search term (case-insensitive, partial match)
-            categories: Filter to specific categories
-            limit: Maximum number of results
-            class_filter: Filter spells by class (e.g., "ranger", "wizard")
-        """
-        query_lower = query.lower()
-        class_filter_lower = class_filter.lower() if class_filter else None
-        count = 0
-
-        category_map = {
-            "class": (self._classes, "class"),
-            "subclass": (self._subclasses, "subclass"),
-            "race": (self._races, "race"),
-            "subrace": (self._subraces, "subrace"),
-            "spell": (self._spells, "spell"),
-            "monster": (self._monsters, "monster"),
-            "feat": (self._feats, "feat"),
-            "background": (self._backgrounds, "background"),
-            "item": (self._items, "item"),
-        }
-
-        if categories:
-            search_categories = [(k, v) for k, v in category_map.items() if k in categories]
-        else:
-            search_categories = list(category_map.items())
-
-        for category_name, (storage, cat) in search_categories:
-            for index, item in storage.items():
-                if count >= limit:
-                    return
-
-                # Apply class filter for spells
-                if class_filter_lower and cat == "spell":
-                    spell_classes = getattr(item, "classes", [])
-                    if class_filter_lower not in [c.lower() for c in spell_classes]:
-                        continue
-
-                # Match by query (or return all if query is empty and class_filter is set)
-                if query_lower:
-                    if query_lower not in index and query_lower not in item.name.lower():
-                        continue
-                elif not class_filter_lower:
-                    # If no query and no class_filter, skip (need at least one filter)
-                    continue
-
-                yield SearchResult(
-                    index=item.index,
-                    name=item.name,
-                    category=cat,  # type: ignore
-                    source=self.source_id,
-                    summary=getattr(item, "desc", [None])[0] if hasattr(item, "desc") and item.desc else None,
-                )
-                count += 1
-
     def content_counts(self) -> ContentCounts:
         """Get counts of all SRD content."""
         return ContentCounts(
@@ -325,7 +325,8 @@ class SheetSyncManager:
         """Handle storage events (called by the storage callback system).
 
         Actions:
-            - "saved": Campaign was saved → regenerate changed sheets
+            - "updated": A character was saved → regenerate its sheet from
+              the saved data, which is safe on the write-behind thread
             - "deleted": Character was deleted → remove sheet
             - "renamed": Character was renamed → rename sheet
         """
@@ -333,10 +334,8 @@ class SheetSyncManager:
             return
 
         try:
-            if action == "saved" and self._storage:
-                campaign = self._storage.get_current_campaign()
-                if campaign:
-                    self.render_all(campaign.characters)
+            if action == "updated" and len(args) >= 4:
+                self.render_character(Character.model_validate(args[3]))
             elif action == "deleted" and len(args) >= 1:
                 self.delete_sheet(str(args[0]))
             elif action == "renamed" and len(args) >= 3:
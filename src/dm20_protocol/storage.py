@@ -8,20 +8,33 @@ import logging
 import shutil
 import shortuuid
 import json
+import threading
 from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from hashlib import sha256
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, cast
+
+from pydantic import BaseModel
+
+from .campaign_registry import CampaignRegistry, CampaignRegistryEntry
+from .change_tracker import ChangeSet, ChangeTracker, ENTITY_SECTIONS, LazyEntities
+from .event_log import AdventureLog
+from .write_behind import WriteBehindSaver
 
 from .models import (
     Campaign, Character, NPC, Location, Quest, CombatEncounter,
     SessionNote, GameState, AdventureEvent
 )
 from .rulebooks.manager import RulebookManager
-from .library.manager import LibraryManager
 from .library.bindings import LibraryBindings
 from .consistency.discovery import DiscoveryTracker
 
+if TYPE_CHECKING:
+    # Imported on first use: the library manager pulls in PDF and vector backends
+    from .library.manager import LibraryManager
+
 logger = logging.getLogger("dm20-protocol")
 
 logging.basicConfig(
@@ -42,10 +55,26 @@ class StorageFormat:
     SPLIT = "split"           # Directory with separate JSON files
     NOT_FOUND = "not_found"   # Campaign doesn't exist yet
 
+
+class SplitLayout:
+    """Entity section layouts for split campaigns.
+
+    Stored as ``storage_version`` in campaign.json (absent means SECTION_FILES).
+    """
+    SECTION_FILES = 1  # One JSON file per section (characters.json, npcs.json, ...)
+    ENTITY_FILES = 2   # One directory per section, one JSON file per entity
+
 class DnDStorage:
-    """Handles storage and retrieval of D&D campaign data."""
+    """Handles storage and retrieval of D&D campaign data.
 
-    def __init__(self, data_dir: str | Path = "dnd_data"):
+    Saves are synchronous by default. With ``write_behind`` enabled, a save
+    serializes the changed entities on the calling thread and a background
+    thread writes them once the edits have been quiet for
+    ``write_behind_delay`` seconds; call flush() or close() to write pending
+    changes immediately.
+    """
+
+    def __init__(self, data_dir: str | Path = "dnd_data", write_behind: bool = False, write_behind_delay: float = 0.5):
         self.data_dir = Path(data_dir)
         logger.debug(f"📂 Initializing DnDStorage with data_dir: {self.data_dir.resolve()}")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -56,7 +85,7 @@ class DnDStorage:
         logger.debug("📂 Storage subdirectories ensured.")
 
         self._current_campaign: Campaign | None = None
-        self._events: list[AdventureEvent] = []
+        self._event_log = AdventureLog(self._get_events_file(), legacy_path=self._get_legacy_events_file())
 
         # Performance optimization: indexes for O(1) character lookups
         self._character_id_index: dict[str, str] = {}  # id -> character_name
@@ -68,14 +97,31 @@ class DnDStorage:
         # Callback system for sheet sync and other listeners
         self._character_callbacks: list = []
 
-        # Dirty tracking: hash of last saved campaign state
-        self._campaign_hash: str = ""
+        # Saved revision per character ID, bumped by every save that writes
+        # the character; IDs are never reused, so revisions are not reset
+        self._character_revisions: dict[str, int] = {}
+        self._revision_lock = threading.Lock()
+
+        # Dirty tracking: per-entity change tracker shared with the split backend
+        self._tracker = ChangeTracker()
+
+        # Serializes campaign writes between callers and the write-behind thread
+        self._save_lock = threading.RLock()
+        self._saver: WriteBehindSaver | None = None
+        # Changes collected on the mutating thread, written by the next flush
+        self._pending_changes: ChangeSet | None = None
+        if write_behind:
+            self._saver = WriteBehindSaver(self._flush_pending_save, debounce=write_behind_delay)
 
         # Track storage format of current campaign
         self._current_format: str = StorageFormat.NOT_FOUND
 
+        # Registry of known campaigns, avoids scanning campaigns/ on startup
+        self._registry = CampaignRegistry(self.data_dir / "campaign_registry.json", self.data_dir / "campaigns")
+        self._registry_name: str | None = None
+
         # Initialize split storage backend (without auto-loading campaigns)
-        self._split_backend = SplitStorageBackend(data_dir=data_dir, auto_load=False)
+        self._split_backend = SplitStorageBackend(data_dir=data_dir, auto_load=False, tracker=self._tracker)
 
         # Rulebook manager for the current campaign
         self._rulebook_manager: RulebookManager | None = None
@@ -87,7 +133,7 @@ class DnDStorage:
         self._interaction_mode: str = "classic"
 
         # Library manager (lazy initialization)
-        self._library_manager: LibraryManager | None = None
+        self._library_manager: "LibraryManager | None" = None
 
         # Library bindings for the current campaign
         self._library_bindings: LibraryBindings | None = None
@@ -171,7 +217,7 @@ class DnDStorage:
         return packs
 
     @property
-    def library_manager(self) -> LibraryManager:
+    def library_manager(self) -> "LibraryManager":
         """Get the library manager, creating it if necessary.
 
         The library manager is lazily initialized on first access.
@@ -181,6 +227,7 @@ class DnDStorage:
             LibraryManager instance for the global library
         """
         if self._library_manager is None:
+            from .library.manager import LibraryManager
             self._library_manager = LibraryManager(self.library_dir)
             self._library_manager.ensure_directories()
             logger.debug(f"📚 Initialized LibraryManager at {self.library_dir}")
@@ -206,7 +253,11 @@ class DnDStorage:
         return self.data_dir / "campaigns" / f"{safe_name}.json"
 
     def _get_events_file(self) -> Path:
-        """Get the file path for adventure events."""
+        """Get the file path for adventure events (append-only JSONL)."""
+        return self.data_dir / "events" / "adventure_log.jsonl"
+
+    def _get_legacy_events_file(self) -> Path:
+        """Get the file path of the pre-JSONL adventure log."""
         return self.data_dir / "events" / "adventure_log.json"
 
     def _detect_campaign_format(self, campaign_name: str) -> str:
@@ -254,12 +305,32 @@ class DnDStorage:
                     self._player_name_index[char.player_name.lower()] = name
             logger.debug(f"🔄 Character index rebuilt with {len(self._character_id_index)} ID entries, {len(self._player_name_index)} player entries")
 
-    def _compute_campaign_hash(self) -> str:
-        """Compute hash of campaign data for dirty tracking."""
-        if not self._current_campaign:
-            return ""
-        campaign_data = self._current_campaign.model_dump(mode='json')
-        return sha256(json.dumps(campaign_data, sort_keys=True).encode()).hexdigest()
+    @property
+    def change_tracker(self) -> ChangeTracker:
+        """Get the per-entity change tracker for the current campaign."""
+        return self._tracker
+
+    def mark_dirty(self, section: str, key: str | None = None) -> None:
+        """Mark an entity (or a whole section) as modified.
+
+        Entities fetched through storage lookups are compared on every save,
+        including edits made through a reference kept across a save. Use this
+        for entities reached without going through a campaign section, e.g.
+        through a plain ``copy()`` of one.
+
+        Args:
+            section: Entity section ('characters', 'npcs', 'locations',
+                'quests', 'encounters') or 'sessions'
+            key: Entity key within the section. None marks the whole section.
+        """
+        if section == "sessions":
+            self._tracker.touch_sessions()
+        elif section not in ENTITY_SECTIONS:
+            raise ValueError(f"Unknown campaign section: {section}")
+        elif key is None:
+            self._tracker.touch_section(section)
+        else:
+            self._tracker.touch(section, key)
 
     @contextmanager
     def batch_update(self):
@@ -289,30 +360,87 @@ class DnDStorage:
             logger.debug("⏳ Batch mode active, deferring save...")
             return
 
-        # Dirty tracking: skip save if unchanged (unless forced)
-        if not force:
-            current_hash = self._compute_campaign_hash()
-            if current_hash == self._campaign_hash:
-                logger.debug("✅ Campaign unchanged, skipping save.")
-                return
+        # Write-behind: serialize the changes here, on the thread that made
+        # them, and let the background thread coalesce the disk writes. Touch
+        # marks stay set until a commit, so the latest collect covers every
+        # earlier one.
+        if self._saver is not None and not force:
+            with self._save_lock:
+                self._pending_changes = self._tracker.collect(self._current_campaign)
+            self._saver.request()
+            return
+
+        with self._save_lock:
+            self._write_campaign(force)
+
+    def _write_campaign(self, force: bool = False, changes: ChangeSet | None = None) -> None:
+        """Write the current campaign's changes to disk.
+
+        Must be called with the save lock held.
+
+        Args:
+            force: If True, write even when nothing appears to have changed.
+            changes: Changes collected earlier by write-behind. None collects
+                them now.
+        """
+        # Anything still pending is older than what this write covers
+        self._pending_changes = None
+        if not self._current_campaign:
+            return
+
+        # Dirty tracking: only touched entities are compared to the last save
+        if changes is None:
+            changes = self._tracker.collect(self._current_campaign)
+        if not force and not changes:
+            logger.debug("✅ Campaign unchanged, skipping save.")
+            self._tracker.commit(changes)
+            return
 
         # Route to appropriate saver based on current format
         if self._current_format == StorageFormat.MONOLITHIC:
-            self._save_monolithic_campaign()
+            self._save_monolithic_campaign(changes)
         elif self._current_format == StorageFormat.SPLIT:
-            self._save_split_campaign()
+            self._save_split_campaign(changes)
         else:
             # Default to monolithic for backward compatibility
             logger.warning(f"⚠️ Unknown storage format '{self._current_format}', defaulting to monolithic")
-            self._save_monolithic_campaign()
-
-        # Update hash after successful save
-        self._campaign_hash = self._compute_campaign_hash()
+            self._save_monolithic_campaign(changes)
+
+        # Record the written state as the new baseline
+        changed_characters = changes.entities.get("characters", {})
+        previous = {name: self._tracker.snapshot("characters", name) for name in changed_characters}
+        with self._revision_lock:
+            self._tracker.commit(changes)
+            updated = self._bump_character_revisions(changed_characters)
         logger.debug(f"✅ Campaign '{self._current_campaign.name}' saved successfully.")
 
+        # Keep registry summary counts current (rewritten only when they change)
+        self._record_current_campaign(used=False)
+
         # Notify listeners
+        for name, revision, data in updated:
+            self._notify_character_callbacks("updated", name, revision, previous[name], data)
         self._notify_character_callbacks("saved")
 
+    def _bump_character_revisions(self, changed: dict[str, dict | None]) -> list[tuple[str, int, dict]]:
+        """Advance the revision of every character written by a save.
+
+        Args:
+            changed: Character name -> saved data (None for removals)
+
+        Returns:
+            (name, new revision, saved data) per written character
+        """
+        updated = []
+        for name, data in changed.items():
+            if data is None:
+                continue
+            character_id = data.get("id", name)
+            revision = self._character_revisions.get(character_id, 0) + 1
+            self._character_revisions[character_id] = revision
+            updated.append((name, revision, data))
+        return updated
+
     def save(self) -> None:
         """Save the current campaign to disk.
 
@@ -321,16 +449,70 @@ class DnDStorage:
         """
         self._save_campaign()
 
+    def _flush_pending_save(self) -> None:
+        """Write-behind flush callback.
+
+        Writes the changes collected by the last deferred save without
+        serializing any model on this thread.
+        """
+        with self._save_lock:
+            changes = self._pending_changes
+            if changes is None:
+                return
+            try:
+                self._write_campaign(changes=changes)
+            except Exception:
+                # Keep the snapshot for the saver's retry unless a newer one arrived
+                if self._pending_changes is None:
+                    self._pending_changes = changes
+                raise
+
+    def flush(self) -> None:
+        """Write any save deferred by write-behind mode now.
+
+        No-op in synchronous mode.
+        """
+        if self._saver is not None:
+            self._saver.flush()
+
+    def close(self) -> None:
+        """Flush pending saves and stop the write-behind thread."""
+        if self._saver is not None:
+            self._saver.close()
+            logger.info(f"💾 Write-behind saver closed: {self._saver.metrics.to_dict()}")
+
+    @property
+    def write_behind(self) -> bool:
+        """Whether saves are deferred to a background thread."""
+        return self._saver is not None and not self._saver.closed
+
+    @property
+    def save_metrics(self) -> dict | None:
+        """Write-behind metrics (coalescing ratio, flush latency), or None in sync mode."""
+        return self._saver.metrics.to_dict() if self._saver is not None else None
+
     # --- Character Callback System ---
 
     def register_character_callback(self, callback) -> None:
         """Register a callback for character events.
 
         The callback is called as callback(action, *args) where action is
-        one of: "saved", "deleted", "renamed".
+        one of: "saved", "deleted", "renamed", "updated". An "updated" event
+        is fired per character written by a save, before "saved", with
+        (name, revision, previous_data, data); previous_data is None when
+        the character had not been saved under that name before.
+
+        "updated" and "saved" run on the thread that wrote the campaign,
+        which is the background thread in write-behind mode; they should
+        use the event data rather than read live campaign objects.
         """
         self._character_callbacks.append(callback)
 
+    def unregister_character_callback(self, callback: Callable[..., Any]) -> None:
+        """Remove a callback added with register_character_callback."""
+        if callback in self._character_callbacks:
+            self._character_callbacks.remove(callback)
+
     def _notify_character_callbacks(self, action: str, *args) -> None:
         """Fire all registered character callbacks, catching exceptions."""
         for cb in self._character_callbacks:
@@ -343,18 +525,30 @@ class DnDStorage:
         """Public wrapper for _find_character — find by name, ID, or player name."""
         return self._find_character(name_or_id)
 
-    def _save_monolithic_campaign(self) -> None:
-        """Save campaign as a single JSON file (legacy format)."""
+    def _save_monolithic_campaign(self, changes: ChangeSet | None = None) -> None:
+        """Save campaign as a single JSON file (legacy format).
+
+        Args:
+            changes: Pending changes; unchanged entities are reused from the
+                tracker's snapshot instead of being serialized again.
+        """
+        if not self._current_campaign:
+            return
+
         campaign_file = self._get_campaign_file()
         logger.debug(f"💾 Saving campaign '{self._current_campaign.name}' to {campaign_file} (monolithic)")
         logger.info(f"💾 Autosaving '{self._current_campaign.name}'")
-        campaign_data = self._current_campaign.model_dump(mode='json')
+        campaign_data = self._tracker.campaign_data(self._current_campaign, changes)
 
         with open(campaign_file, 'w', encoding='utf-8') as f:
             json.dump(campaign_data, f, default=str)
 
-    def _save_split_campaign(self) -> None:
-        """Save campaign using split directory structure (new format)."""
+    def _save_split_campaign(self, changes: ChangeSet | None = None) -> None:
+        """Save campaign using split directory structure (new format).
+
+        Args:
+            changes: Pending changes; only the affected section files are written.
+        """
         if not self._current_campaign:
             return
 
@@ -363,88 +557,142 @@ class DnDStorage:
         # Sync current campaign to split backend
         self._split_backend._current_campaign = self._current_campaign
 
-        # Use split backend to save all files
-        self._split_backend.save_all(force=False)
+        # Use split backend to save the modified files
+        self._split_backend.save_all(force=False, changes=changes)
 
         logger.debug(f"✅ Campaign '{self._current_campaign.name}' saved successfully (split format).")
 
     def _load_current_campaign(self):
-        """Load the most recently used campaign."""
-        logger.debug("📂 Attempting to load the most recent campaign...")
-        campaigns_dir = self.data_dir / "campaigns"
-        if not campaigns_dir.exists():
-            logger.debug("❌ Campaigns directory does not exist. No campaign loaded.")
-            return
-
-        # Find the most recent campaign (file or directory)
-        campaign_files = list(campaigns_dir.glob("*.json"))
-        campaign_dirs = [d for d in campaigns_dir.iterdir() if d.is_dir()]
+        """Load the most recently used campaign.
 
-        if not campaign_files and not campaign_dirs:
-            logger.debug("❌ No campaigns found.")
-            return
+        Reads the campaign registry; campaigns/ is only scanned when the
+        registry is missing or stale, or its campaign fails to load.
+        """
+        logger.debug("📂 Attempting to load the most recent campaign...")
+        if self._registry.load():
+            entry = self._registry.most_recent()
+            if entry is None:
+                logger.debug("❌ No campaigns registered.")
+                return
+            try:
+                self._open_campaign(entry.name, entry.format)
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ Registered campaign '{entry.name}' failed to load ({e}), rescanning campaigns")
 
-        # Get most recent from both files and directories
-        all_campaigns = []
-        if campaign_files:
-            all_campaigns.extend(campaign_files)
-        if campaign_dirs:
-            # For directories, check campaign.json modification time
-            for d in campaign_dirs:
-                campaign_file = d / "campaign.json"
-                if campaign_file.exists():
-                    all_campaigns.append(campaign_file)
-
-        if not all_campaigns:
+        entries = self._refresh_registry()
+        if not entries:
             logger.debug("❌ No valid campaigns found.")
             return
 
-        # Sort by modification time and load the most recent
-        latest_file = max(all_campaigns, key=lambda f: f.stat().st_mtime)
-        logger.debug(f"📂 Most recent campaign file is '{latest_file.name}'.")
-
-        # Determine campaign name from the file/directory
-        if latest_file.name == "campaign.json":
-            # Split format: campaign name is the parent directory
-            campaign_name = latest_file.parent.name
-        else:
-            # Monolithic format: campaign name is the file stem
-            campaign_name = latest_file.stem
+        latest = max(entries, key=lambda entry: entry.last_used)
+        logger.debug(f"📂 Most recent campaign is '{latest.name}'.")
 
         # Load campaign using the appropriate method
         try:
-            self.load_campaign(campaign_name)
+            self.load_campaign(latest.name)
         except Exception as e:
-            logger.error(f"❌ Error loading campaign '{campaign_name}': {e}")
+            logger.error(f"❌ Error loading campaign '{latest.name}': {e}")
+
+    # Campaign Registry
+    @staticmethod
+    def _safe_campaign_name(name: str) -> str:
+        """Filesystem name used for a campaign's file or directory."""
+        return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_', "'")).rstrip()
+
+    def _scan_campaigns(self) -> list[CampaignRegistryEntry]:
+        """Find all campaigns on disk (both monolithic and split formats).
+
+        Returns:
+            Registry entries with last_used set to the file modification time
+        """
+        campaigns_dir = self.data_dir / "campaigns"
+        if not campaigns_dir.exists():
+            return []
 
-    def _save_events(self):
-        """Save adventure events to disk."""
-        events_file = self._get_events_file()
-        logger.debug(f"💾 Saving {len(self._events)} events to {events_file}...")
-        events_data = [event.model_dump(mode='json') for event in self._events]
+        entries: dict[str, CampaignRegistryEntry] = {}
+        for campaign_file in campaigns_dir.glob("*.json"):
+            entries[campaign_file.stem] = CampaignRegistryEntry(
+                name=campaign_file.stem,
+                format=StorageFormat.MONOLITHIC,
+                last_used=datetime.fromtimestamp(campaign_file.stat().st_mtime),
+            )
+        for campaign_dir in campaigns_dir.iterdir():
+            campaign_file = campaign_dir / "campaign.json"
+            if campaign_dir.is_dir() and campaign_file.exists():
+                last_used = datetime.fromtimestamp(campaign_file.stat().st_mtime)
+                previous = entries.get(campaign_dir.name)
+                if previous is not None:
+                    # Split format wins, as in _detect_campaign_format
+                    last_used = max(last_used, previous.last_used)
+                entries[campaign_dir.name] = CampaignRegistryEntry(
+                    name=campaign_dir.name, format=StorageFormat.SPLIT, last_used=last_used
+                )
+        return list(entries.values())
+
+    def _refresh_registry(self) -> list[CampaignRegistryEntry]:
+        """Rebuild the campaign registry from a directory scan."""
+        entries = self._scan_campaigns()
+        logger.debug(f"📇 Rebuilding campaign registry from scan ({len(entries)} campaigns)")
+        self._registry.replace(entries)
+        if entries or self._registry.path.exists():
+            self._registry.save()
+        return entries
+
+    def _ensure_registry(self) -> None:
+        """Rescan campaigns/ if it changed since the registry was written."""
+        if not self._registry.is_fresh():
+            self._refresh_registry()
+
+    def _campaign_counts(self, campaign: Campaign) -> dict[str, int]:
+        """Entity counts of the given campaign.
+
+        Sections that are still waiting to be lazily loaded keep their
+        previously registered count instead of being read from disk.
+        """
+        entry = self._registry.get(self._registry_name) if self._registry_name else None
+        counts = dict(entry.counts) if entry else {}
+        for section in ENTITY_SECTIONS:
+            entities = getattr(campaign, section)
+            if isinstance(entities, LazyEntities) and not entities.is_loaded:
+                continue
+            counts[section] = len(entities)
+        counts["sessions"] = len(campaign.sessions)
+        return counts
+
+    def _record_current_campaign(self, used: bool = True) -> None:
+        """Write the current campaign's format, counts and last use to the registry."""
+        if not self._current_campaign or not self._registry_name:
+            return
+        counts = self._campaign_counts(self._current_campaign)
+        if not used:
+            entry = self._registry.get(self._registry_name)
+            if entry is not None and entry.counts == counts:
+                return
+        self._registry.record(self._registry_name, self._current_format, counts, used=used)
+        self._registry.save()
+
+    def campaign_summaries(self) -> list[CampaignRegistryEntry]:
+        """Registry entries for all campaigns, sorted by name.
 
-        with open(events_file, 'w', encoding='utf-8') as f:
-            json.dump(events_data, f, default=str)
-        logger.debug("✅ Events saved successfully.")
+        Counts are empty for campaigns that have not been opened since the
+        registry was (re)built.
+        """
+        self._ensure_registry()
+        entries = (self._registry.get(name) for name in self._registry.names())
+        return [entry for entry in entries if entry is not None]
 
     def _load_events(self):
         """Load adventure events from disk."""
         logger.debug("📂 Attempting to load adventure events...")
-        events_file = self._get_events_file()
-        if not events_file.exists():
-            logger.debug("❌ Adventure log file does not exist. No events loaded.")
-            return
+        self._event_log.load()
 
-        try:
-            with open(events_file, 'r', encoding='utf-8') as f:
-                events_data = json.load(f)
-            self._events = [AdventureEvent.model_validate(event) for event in events_data]
-            logger.info(f"✅ Successfully loaded {len(self._events)} events.")
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"❌ Error loading events: {e}")
+    def compact_events(self) -> None:
+        """Rewrite the adventure log file from the events in memory."""
+        self._event_log.compact()
 
     # Campaign Management
-    def create_campaign(self, name: str, description: str, dm_name: str | None = None, setting: str | Path | None = None, rules_version: str = "2024", interaction_mode: str = "classic") -> Campaign:
+    def create_campaign(self, name: str, description: str, dm_name: str | None = None, setting: str | Path | None = None, rules_version: str = "2024", interaction_mode: str = "classic", storage_version: int | None = None) -> Campaign:
         """Create a new campaign using split storage format.
 
         Args:
@@ -454,15 +702,20 @@ class DnDStorage:
             setting: Campaign setting
             rules_version: D&D rules version ('2014' or '2024', default '2024')
             interaction_mode: Interaction mode ('classic', 'narrated', or 'immersive', default 'classic')
+            storage_version: Split layout for entity sections (see SplitLayout).
+                Defaults to SplitStorageBackend.DEFAULT_STORAGE_VERSION.
         """
         logger.info(f"✨ Creating new campaign: '{name}' (rules: {rules_version}, mode: {interaction_mode})")
+        self.flush()
+        self._ensure_registry()
 
         # Use split backend to create the campaign
         campaign = self._split_backend.create_campaign(
             name=name,
             description=description,
             dm_name=dm_name,
-            setting=setting
+            setting=setting,
+            storage_version=storage_version,
         )
 
         # Sync to main storage
@@ -487,8 +740,8 @@ class DnDStorage:
         # Rebuild indexes for new campaign
         self._rebuild_character_index()
 
-        # Update campaign hash
-        self._campaign_hash = self._compute_campaign_hash()
+        # Start change tracking from the freshly written state
+        self._tracker.attach(campaign)
 
         # Initialize library bindings for the new campaign
         self._library_bindings = LibraryBindings(campaign_id=campaign.id)
@@ -498,36 +751,31 @@ class DnDStorage:
         self._discovery_tracker = DiscoveryTracker(campaign_dir)
         logger.debug(f"Initialized empty DiscoveryTracker for campaign '{name}'")
 
+        self._registry_name = campaign_dir.name
+        self._record_current_campaign()
+
         logger.info(f"✅ Campaign '{name}' created and set as active using {self._current_format} format (rules: {rules_version}, mode: {interaction_mode}).")
         return campaign
 
     def get_current_campaign(self) -> Campaign | None:
-        """Get the current campaign."""
+        """Get the current campaign.
+
+        Entity sections stay tracked through the returned object; session
+        notes are marked for comparison on the next save.
+        """
+        if self._current_campaign:
+            self._tracker.touch_sessions()
         return self._current_campaign
 
     def list_campaigns(self) -> list[str]:
         """List all available campaigns (both monolithic and split formats)."""
-        campaigns_dir = self.data_dir / "campaigns"
-        if not campaigns_dir.exists():
-            return []
-
-        campaigns = []
-
-        # Find monolithic campaigns (JSON files)
-        for f in campaigns_dir.glob("*.json"):
-            campaigns.append(f.stem)
-
-        # Find split campaigns (directories with campaign.json)
-        for d in campaigns_dir.iterdir():
-            if d.is_dir():
-                campaign_file = d / "campaign.json"
-                if campaign_file.exists():
-                    campaigns.append(d.name)
-
-        return sorted(campaigns)
+        self._ensure_registry()
+        return self._registry.names()
 
     def load_campaign(self, name: str) -> Campaign:
         """Load a specific campaign, automatically detecting format."""
+        # Pending write-behind saves belong to the campaign being replaced
+        self.flush()
         logger.info(f"📂 Attempting to load campaign: '{name}'")
 
         # Detect storage format
@@ -537,6 +785,18 @@ class DnDStorage:
             logger.error(f"❌ Campaign '{name}' not found")
             raise FileNotFoundError(f"Campaign '{name}' not found")
 
+        return self._open_campaign(name, storage_format)
+
+    def _open_campaign(self, name: str, storage_format: str) -> Campaign:
+        """Load a campaign whose storage format is already known.
+
+        Args:
+            name: Campaign name
+            storage_format: StorageFormat.MONOLITHIC or StorageFormat.SPLIT
+
+        Returns:
+            The loaded campaign, now active
+        """
         # Route to appropriate loader based on format
         if storage_format == StorageFormat.MONOLITHIC:
             campaign = self._load_monolithic_campaign(name)
@@ -550,7 +810,7 @@ class DnDStorage:
         self._current_campaign = campaign
         self._current_format = storage_format
         self._rebuild_character_index()
-        self._campaign_hash = self._compute_campaign_hash()
+        self._tracker.attach(campaign)
 
         # Load rules version and interaction mode from campaign metadata
         self._load_rules_version()
@@ -568,6 +828,10 @@ class DnDStorage:
         # Load discovery tracker (split campaigns only)
         self._load_discovery_tracker()
 
+        self._ensure_registry()
+        self._registry_name = self._safe_campaign_name(name)
+        self._record_current_campaign()
+
         logger.info(f"✅ Successfully loaded campaign '{name}' using {storage_format} format (rules: {self._rules_version}).")
         return self._current_campaign
 
@@ -586,6 +850,8 @@ class DnDStorage:
         Raises:
             FileNotFoundError: If the campaign does not exist
         """
+        self.flush()
+        self._ensure_registry()
         storage_format = self._detect_campaign_format(name)
 
         if storage_format == StorageFormat.NOT_FOUND:
@@ -618,7 +884,7 @@ class DnDStorage:
             self._current_format = StorageFormat.NOT_FOUND
             self._character_id_index.clear()
             self._player_name_index.clear()
-            self._campaign_hash = ""
+            self._tracker.reset()
             self._rulebook_manager = None
             self._rules_version = "2024"
             self._interaction_mode = "classic"
@@ -626,8 +892,12 @@ class DnDStorage:
             self._discovery_tracker = None
             if hasattr(self, '_split_backend'):
                 self._split_backend._current_campaign = None
+            self._registry_name = None
             logger.info(f"🧹 Cleared active campaign state (was: '{name}')")
 
+        self._registry.remove(safe_name)
+        self._registry.save()
+
         return name
 
     def _save_rules_version(self, campaign_dir: Path, rules_version: str) -> None:
@@ -960,8 +1230,8 @@ class DnDStorage:
         """Load a campaign from split directory structure (new format)."""
         logger.debug(f"📂 Loading split campaign: '{name}'")
 
-        # Use split backend to load campaign
-        campaign = self._split_backend.load_campaign(name)
+        # Use split backend to load campaign; entity sections are read on first use
+        campaign = self._split_backend.load_campaign(name, lazy=True)
 
         logger.debug(f"✅ Successfully loaded split campaign: '{name}'")
         return campaign
@@ -1036,6 +1306,27 @@ class DnDStorage:
         logger.debug(f"✅ Found character '{char.name}'")
         return char
 
+    def get_character_view(self, name_or_id: str) -> tuple[int | None, dict] | None:
+        """Get a character's saved revision and data.
+
+        The data is the character as of its last save, so it always matches
+        the revision, even while write-behind holds back newer edits. A
+        character that was never saved has no revision: it is dumped as it
+        is now, with revision None.
+
+        Returns:
+            (revision, JSON-ready character data), or None if not found
+        """
+        character = self._find_character(name_or_id)
+        if not character:
+            return None
+        with self._revision_lock:
+            data = self._tracker.snapshot("characters", character.name)
+            revision = self._character_revisions.get(character.id, 0)
+        if data is None:
+            return None, character.model_dump(mode='json')
+        return revision, data
+
     def update_character(self, name_or_id: str, **kwargs) -> None:
         """Update a character's data."""
         if not self._current_campaign:
@@ -1242,6 +1533,7 @@ class DnDStorage:
             raise ValueError("No current campaign")
 
         self._current_campaign.sessions.append(session_note)
+        self._tracker.touch_sessions()
         self._current_campaign.updated_at = datetime.now()
         self._save_campaign()
 
@@ -1249,38 +1541,24 @@ class DnDStorage:
         """Get all session notes."""
         if not self._current_campaign:
             return []
+        self._tracker.touch_sessions()
         return self._current_campaign.sessions
 
     # Adventure Log / Events
     def add_event(self, event: AdventureEvent) -> None:
         """Add an event to the adventure log."""
         logger.info(f"➕ Adding event: '{event.title}' ({event.event_type})")
-        self._events.append(event)
-        self._save_events()
+        self._event_log.append(event)
         logger.debug("✅ Event added and log saved.")
 
     def get_events(self, limit: int | None = None, event_type: str | None = None) -> list[AdventureEvent]:
         """Get adventure events, optionally filtered."""
-        events = self._events
-
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-
-        # Sort by timestamp (newest first)
-        events = sorted(events, key=lambda e: e.timestamp, reverse=True)
-
-        if limit:
-            events = events[:limit]
-
-        return events
+        # Newest first, served from the timestamp index
+        return self._event_log.recent(limit=limit, event_type=event_type)
 
     def search_events(self, query: str) -> list[AdventureEvent]:
         """Search events by title or description."""
-        query_lower = query.lower()
-        return [
-            event for event in self._events
-            if query_lower in event.title.lower() or query_lower in event.description.lower()
-        ]
+        return self._event_log.search(query)
 
     # Library Bindings Management
     def enable_library_source(
@@ -1478,18 +1756,42 @@ class SplitStorageBackend:
         └── sessions/
             └── session-{NNN}.json
 
+    With ``storage_version`` 2 (SplitLayout.ENTITY_FILES) each entity section
+    is a directory instead, so editing one NPC rewrites one small file:
+        ├── npcs/
+        │   ├── _index.json              # Ordered key -> file name map
+        │   └── {slug}-{digest}.json     # One NPC
+        └── ...
+
     Features:
-    - Per-file dirty tracking using SHA-256 hashes
+    - Per-entity dirty tracking via ChangeTracker for entity sections
+    - SHA-256 hashes for the small metadata and game state files
     - Only writes files that have been modified
     - Atomic writes (write to temp file, then rename)
     """
 
-    def __init__(self, data_dir: str | Path = "dnd_data", auto_load: bool = True):
+    # Layout used for newly created campaigns
+    DEFAULT_STORAGE_VERSION = SplitLayout.SECTION_FILES
+
+    # Pydantic model for each entity section
+    SECTION_MODELS: dict[str, type[BaseModel]] = {
+        "characters": Character,
+        "npcs": NPC,
+        "locations": Location,
+        "quests": Quest,
+        "encounters": CombatEncounter,
+    }
+
+    ENTITY_INDEX_FILE = "_index.json"
+
+    def __init__(self, data_dir: str | Path = "dnd_data", auto_load: bool = True, tracker: ChangeTracker | None = None):
         """Initialize split storage backend.
 
         Args:
             data_dir: Base directory for all campaign data
             auto_load: If True, automatically load the most recent campaign
+            tracker: Change tracker to share with the owning storage.
+                A private tracker is created if None.
         """
         self.data_dir = Path(data_dir)
         logger.debug(f"📂 Initializing SplitStorageBackend with data_dir: {self.data_dir.resolve()}")
@@ -1501,17 +1803,22 @@ class SplitStorageBackend:
 
         self._current_campaign: Campaign | None = None
 
-        # Per-section hash tracking for dirty detection
+        # Per-entity dirty tracking for characters, NPCs, locations, quests, encounters
+        self._tracker = tracker if tracker is not None else ChangeTracker()
+
+        # Hash tracking for the single-object sections
         self._section_hashes: dict[str, str] = {
             "campaign": "",
-            "characters": "",
-            "npcs": "",
-            "locations": "",
-            "quests": "",
-            "encounters": "",
             "game_state": "",
         }
 
+        # Layout of the current campaign and, for entity files, the last written key order
+        self._storage_version: int = self.DEFAULT_STORAGE_VERSION
+        self._entity_index: dict[str, list[str]] = {}
+
+        # Total bytes handed to _atomic_write (write amplification metric)
+        self.bytes_written: int = 0
+
         # Load existing data if auto_load is enabled
         if auto_load:
             logger.debug("📂 Loading initial data...")
@@ -1571,6 +1878,7 @@ class SplitStorageBackend:
         try:
             with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, default=str)
+                self.bytes_written += f.tell()
             temp_file.replace(file_path)
             logger.debug(f"✅ Atomic write to {file_path.name} successful")
         except Exception as e:
@@ -1579,141 +1887,158 @@ class SplitStorageBackend:
             logger.error(f"❌ Error during atomic write to {file_path.name}: {e}")
             raise
 
-    def _save_characters(self, force: bool = False) -> None:
+    def _save_characters(self, force: bool = False, changes: ChangeSet | None = None) -> None:
         """Save characters to characters.json if modified.
 
         Args:
             force: If True, save even if unchanged
+            changes: Pending changes from save_all(). If None, the characters
+                section is collected and committed on its own.
         """
-        if not self._current_campaign:
-            return
+        self._save_entity_section("characters", force, changes)
 
-        characters_data = {
-            name: char.model_dump(mode='json')
-            for name, char in self._current_campaign.characters.items()
-        }
-
-        current_hash = self._compute_section_hash(characters_data)
-        if not force and current_hash == self._section_hashes["characters"]:
-            logger.debug("✅ Characters unchanged, skipping save.")
-            return
-
-        campaign_dir = self._get_campaign_dir()
-        file_path = campaign_dir / "characters.json"
-        self._atomic_write(file_path, characters_data)
-        self._section_hashes["characters"] = current_hash
-        logger.debug(f"💾 Saved characters to {file_path}")
-
-    def _save_npcs(self, force: bool = False) -> None:
+    def _save_npcs(self, force: bool = False, changes: ChangeSet | None = None) -> None:
         """Save NPCs to npcs.json if modified.
 
         Args:
             force: If True, save even if unchanged
+            changes: Pending changes from save_all(). If None, the NPCs
+                section is collected and committed on its own.
         """
-        if not self._current_campaign:
-            return
-
-        npcs_data = {
-            name: npc.model_dump(mode='json')
-            for name, npc in self._current_campaign.npcs.items()
-        }
+        self._save_entity_section("npcs", force, changes)
 
-        current_hash = self._compute_section_hash(npcs_data)
-        if not force and current_hash == self._section_hashes["npcs"]:
-            logger.debug("✅ NPCs unchanged, skipping save.")
-            return
+    def _save_locations(self, force: bool = False, changes: ChangeSet | None = None) -> None:
+        """Save locations to locations.json if modified.
 
-        campaign_dir = self._get_campaign_dir()
-        file_path = campaign_dir / "npcs.json"
-        self._atomic_write(file_path, npcs_data)
-        self._section_hashes["npcs"] = current_hash
-        logger.debug(f"💾 Saved NPCs to {file_path}")
+        Args:
+            force: If True, save even if unchanged
+            changes: Pending changes from save_all(). If None, the locations
+                section is collected and committed on its own.
+        """
+        self._save_entity_section("locations", force, changes)
 
-    def _save_locations(self, force: bool = False) -> None:
-        """Save locations to locations.json if modified.
+    def _save_quests(self, force: bool = False, changes: ChangeSet | None = None) -> None:
+        """Save quests to quests.json if modified.
 
         Args:
             force: If True, save even if unchanged
+            changes: Pending changes from save_all(). If None, the quests
+                section is collected and committed on its own.
         """
-        if not self._current_campaign:
-            return
+        self._save_entity_section("quests", force, changes)
 
-        locations_data = {
-            name: loc.model_dump(mode='json')
-            for name, loc in self._current_campaign.locations.items()
-        }
+    def _save_encounters(self, force: bool = False, changes: ChangeSet | None = None) -> None:
+        """Save encounters to encounters.json if modified.
 
-        current_hash = self._compute_section_hash(locations_data)
-        if not force and current_hash == self._section_hashes["locations"]:
-            logger.debug("✅ Locations unchanged, skipping save.")
-            return
+        Args:
+            force: If True, save even if unchanged
+            changes: Pending changes from save_all(). If None, the encounters
+                section is collected and committed on its own.
+        """
+        self._save_entity_section("encounters", force, changes)
 
-        campaign_dir = self._get_campaign_dir()
-        file_path = campaign_dir / "locations.json"
-        self._atomic_write(file_path, locations_data)
-        self._section_hashes["locations"] = current_hash
-        logger.debug(f"💾 Saved locations to {file_path}")
+    def _save_entity_section(self, section: str, force: bool, changes: ChangeSet | None) -> None:
+        """Write one entity section file using tracked per-entity dumps.
 
-    def _save_quests(self, force: bool = False) -> None:
-        """Save quests to quests.json if modified.
+        Only entities touched since the last save are serialized again; the
+        rest of the file is assembled from the tracker's snapshot.
 
         Args:
-            force: If True, save even if unchanged
+            section: Entity section name (also the file stem)
+            force: If True, write even if no entity changed
+            changes: Pending changes, or None to collect this section alone
         """
         if not self._current_campaign:
             return
 
-        quests_data = {
-            title: quest.model_dump(mode='json')
-            for title, quest in self._current_campaign.quests.items()
-        }
+        standalone = changes is None
+        if changes is None:
+            changes = self._tracker.collect(self._current_campaign, sections=(section,))
 
-        current_hash = self._compute_section_hash(quests_data)
-        if not force and current_hash == self._section_hashes["quests"]:
-            logger.debug("✅ Quests unchanged, skipping save.")
+        if not force and not changes.section_changed(section):
+            logger.debug(f"✅ {section.capitalize()} unchanged, skipping save.")
+            if standalone:
+                self._tracker.commit(changes)
             return
 
-        campaign_dir = self._get_campaign_dir()
-        file_path = campaign_dir / "quests.json"
-        self._atomic_write(file_path, quests_data)
-        self._section_hashes["quests"] = current_hash
-        logger.debug(f"💾 Saved quests to {file_path}")
+        if self._storage_version >= SplitLayout.ENTITY_FILES:
+            self._write_entity_files(section, force, changes)
+        else:
+            section_data = self._tracker.section_data(section, self._current_campaign, changes)
+            file_path = self._get_campaign_dir() / f"{section}.json"
+            self._atomic_write(file_path, section_data)
+            logger.debug(f"💾 Saved {section} to {file_path}")
+        if standalone:
+            self._tracker.commit(changes)
 
-    def _save_encounters(self, force: bool = False) -> None:
-        """Save encounters to encounters.json if modified.
+    @staticmethod
+    def _entity_filename(key: str) -> str:
+        """Build a stable, filesystem-safe file name for an entity key.
+
+        A readable slug is combined with a digest of the full key so that keys
+        differing only in punctuation or case never share a file.
 
         Args:
-            force: If True, save even if unchanged
+            key: Entity key (name, title or ID) within its section
+
+        Returns:
+            File name such as ``old-durnan-1a2b3c4d.json``
+        """
+        slug = "".join(c if c.isalnum() else "-" for c in key.lower()).strip("-")
+        slug = "-".join(part for part in slug.split("-") if part)[:40] or "entity"
+        return f"{slug}-{sha256(key.encode()).hexdigest()[:8]}.json"
+
+    def _write_entity_files(self, section: str, force: bool, changes: ChangeSet) -> None:
+        """Write changed entities of a section as individual files.
+
+        Entity files are written before the index and removed after it, so an
+        interrupted save leaves at worst an orphaned file, never a dangling
+        index entry.
+
+        Args:
+            section: Entity section name (also the directory name)
+            force: If True, rewrite every entity file and the index
+            changes: Pending changes for this save
         """
         if not self._current_campaign:
             return
 
-        encounters_data = {
-            name: enc.model_dump(mode='json')
-            for name, enc in self._current_campaign.encounters.items()
-        }
+        section_dir = self._get_campaign_dir() / section
+        section_dir.mkdir(exist_ok=True)
 
-        current_hash = self._compute_section_hash(encounters_data)
-        if not force and current_hash == self._section_hashes["encounters"]:
-            logger.debug("✅ Encounters unchanged, skipping save.")
-            return
+        if force:
+            written = self._tracker.section_data(section, self._current_campaign, changes)
+            removed: list[str] = []
+        else:
+            pending = changes.entities.get(section, {})
+            written = {key: data for key, data in pending.items() if data is not None}
+            removed = [key for key, data in pending.items() if data is None]
 
-        campaign_dir = self._get_campaign_dir()
-        file_path = campaign_dir / "encounters.json"
-        self._atomic_write(file_path, encounters_data)
-        self._section_hashes["encounters"] = current_hash
-        logger.debug(f"💾 Saved encounters to {file_path}")
+        for key, data in written.items():
+            self._atomic_write(section_dir / self._entity_filename(key), data)
+
+        keys = list(dict.keys(getattr(self._current_campaign, section)))
+        if force or keys != self._entity_index.get(section):
+            index = {key: self._entity_filename(key) for key in keys}
+            self._atomic_write(section_dir / self.ENTITY_INDEX_FILE, index)
+            self._entity_index[section] = keys
+
+        for key in removed:
+            (section_dir / self._entity_filename(key)).unlink(missing_ok=True)
 
-    def _save_game_state(self, force: bool = False) -> None:
+        logger.debug(f"💾 Saved {len(written)} {section} file(s), removed {len(removed)} in {section_dir}")
+
+    def _save_game_state(self, force: bool = False, data: dict | None = None) -> None:
         """Save game state to game_state.json if modified.
 
         Args:
             force: If True, save even if unchanged
+            data: Game state already dumped by the caller, or None to dump it
         """
         if not self._current_campaign:
             return
 
-        game_state_data = self._current_campaign.game_state.model_dump(mode='json')
+        game_state_data = data if data is not None else self._current_campaign.game_state.model_dump(mode='json')
 
         current_hash = self._compute_section_hash(game_state_data)
         if not force and current_hash == self._section_hashes["game_state"]:
@@ -1739,7 +2064,7 @@ class SplitStorageBackend:
             return
 
         # Extract only metadata fields
-        metadata = {
+        metadata: dict[str, Any] = {
             "id": self._current_campaign.id,
             "name": self._current_campaign.name,
             "description": self._current_campaign.description,
@@ -1749,6 +2074,8 @@ class SplitStorageBackend:
             "created_at": self._current_campaign.created_at.isoformat(),
             "updated_at": self._current_campaign.updated_at.isoformat() if self._current_campaign.updated_at else None,
         }
+        if self._storage_version != SplitLayout.SECTION_FILES:
+            metadata["storage_version"] = self._storage_version
 
         current_hash = self._compute_section_hash(metadata)
         if not force and current_hash == self._section_hashes["campaign"]:
@@ -1761,12 +2088,13 @@ class SplitStorageBackend:
         self._section_hashes["campaign"] = current_hash
         logger.debug(f"💾 Saved campaign metadata to {file_path}")
 
-    def _save_session(self, session: SessionNote, force: bool = False) -> None:
+    def _save_session(self, session: SessionNote, force: bool = False, data: dict | None = None) -> None:
         """Save a session note to sessions/session-{NNN}.json.
 
         Args:
             session: Session note to save
             force: If True, save even if unchanged
+            data: Session already dumped by the caller, or None to dump it
         """
         if not self._current_campaign:
             return
@@ -1776,7 +2104,7 @@ class SplitStorageBackend:
         sessions_dir.mkdir(exist_ok=True)
 
         file_path = sessions_dir / f"session-{session.session_number:03d}.json"
-        session_data = session.model_dump(mode='json')
+        session_data = data if data is not None else session.model_dump(mode='json')
 
         # Check if file exists and compare hash
         if not force and file_path.exists():
@@ -1794,11 +2122,14 @@ class SplitStorageBackend:
         self._atomic_write(file_path, session_data)
         logger.debug(f"💾 Saved session {session.session_number} to {file_path}")
 
-    def save_all(self, force: bool = False) -> None:
+    def save_all(self, force: bool = False, changes: ChangeSet | None = None) -> None:
         """Save all campaign data to their respective files.
 
         Args:
             force: If True, save all files regardless of dirty state
+            changes: Pending changes collected by the caller, who is then
+                responsible for committing them. If None, changes are
+                collected and committed here.
         """
         if not self._current_campaign:
             logger.debug("❌ No current campaign to save.")
@@ -1806,20 +2137,30 @@ class SplitStorageBackend:
 
         logger.info(f"💾 Saving campaign '{self._current_campaign.name}'")
 
+        standalone = changes is None
+        if changes is None:
+            changes = self._tracker.collect(self._current_campaign)
+
         # Save metadata first
         self._save_campaign_metadata(force=force)
 
         # Save all data sections
-        self._save_characters(force=force)
-        self._save_npcs(force=force)
-        self._save_locations(force=force)
-        self._save_quests(force=force)
-        self._save_encounters(force=force)
-        self._save_game_state(force=force)
-
-        # Save all sessions
-        for session in self._current_campaign.sessions:
-            self._save_session(session, force=force)
+        self._save_characters(force=force, changes=changes)
+        self._save_npcs(force=force, changes=changes)
+        self._save_locations(force=force, changes=changes)
+        self._save_quests(force=force, changes=changes)
+        self._save_encounters(force=force, changes=changes)
+        # The tracker already compared the game state; only an unwritten file needs the hash check
+        if force or changes.game_state is not None or not self._section_hashes["game_state"]:
+            self._save_game_state(force=force, data=changes.game_state)
+
+        # Save sessions: all when forced, otherwise only those that changed
+        for session in list(self._current_campaign.sessions):
+            if force or session.session_number in changes.sessions:
+                self._save_session(session, force=True, data=changes.sessions.get(session.session_number))
+
+        if standalone:
+            self._tracker.commit(changes)
 
         logger.info(f"✅ Campaign '{self._current_campaign.name}' saved successfully.")
 
@@ -1844,7 +2185,6 @@ class SplitStorageBackend:
                 name: Character.model_validate(char_data)
                 for name, char_data in data.items()
             }
-            self._section_hashes["characters"] = self._compute_section_hash(data)
             logger.debug(f"✅ Loaded {len(characters)} characters")
             return characters
         except Exception as e:
@@ -1872,7 +2212,6 @@ class SplitStorageBackend:
                 name: NPC.model_validate(npc_data)
                 for name, npc_data in data.items()
             }
-            self._section_hashes["npcs"] = self._compute_section_hash(data)
             logger.debug(f"✅ Loaded {len(npcs)} NPCs")
             return npcs
         except Exception as e:
@@ -1900,7 +2239,6 @@ class SplitStorageBackend:
                 name: Location.model_validate(loc_data)
                 for name, loc_data in data.items()
             }
-            self._section_hashes["locations"] = self._compute_section_hash(data)
             logger.debug(f"✅ Loaded {len(locations)} locations")
             return locations
         except Exception as e:
@@ -1928,7 +2266,6 @@ class SplitStorageBackend:
                 title: Quest.model_validate(quest_data)
                 for title, quest_data in data.items()
             }
-            self._section_hashes["quests"] = self._compute_section_hash(data)
             logger.debug(f"✅ Loaded {len(quests)} quests")
             return quests
         except Exception as e:
@@ -1956,13 +2293,63 @@ class SplitStorageBackend:
                 name: CombatEncounter.model_validate(enc_data)
                 for name, enc_data in data.items()
             }
-            self._section_hashes["encounters"] = self._compute_section_hash(data)
             logger.debug(f"✅ Loaded {len(encounters)} encounters")
             return encounters
         except Exception as e:
             logger.error(f"❌ Error loading encounters: {e}")
             return {}
 
+    def _load_entity_files(self, campaign_dir: Path, section: str) -> dict:
+        """Load an entity section stored as one file per entity.
+
+        Args:
+            campaign_dir: Path to campaign directory
+            section: Entity section name
+
+        Returns:
+            Dictionary of key to entity object, in index order
+        """
+        model = self.SECTION_MODELS[section]
+        section_dir = campaign_dir / section
+        index_path = section_dir / self.ENTITY_INDEX_FILE
+        if not index_path.exists():
+            logger.debug(f"No {section}/{self.ENTITY_INDEX_FILE} found, returning empty dict.")
+            self._entity_index[section] = []
+            return {}
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except Exception as e:
+            logger.error(f"❌ Error loading {section} index: {e}")
+            return {}
+
+        entities = {}
+        for key, filename in index.items():
+            try:
+                with open(section_dir / filename, 'r', encoding='utf-8') as f:
+                    entities[key] = model.model_validate(json.load(f))
+            except Exception as e:
+                logger.error(f"❌ Error loading {section} entry '{key}' from {filename}: {e}")
+        self._entity_index[section] = list(index)
+        logger.debug(f"✅ Loaded {len(entities)} {section} from entity files")
+        return entities
+
+    def _load_section(self, campaign_dir: Path, section: str, storage_version: int) -> dict:
+        """Load one entity section using the campaign's layout.
+
+        Args:
+            campaign_dir: Path to campaign directory
+            section: Entity section name
+            storage_version: Layout of the campaign (see SplitLayout)
+
+        Returns:
+            Dictionary of key to entity object
+        """
+        if storage_version >= SplitLayout.ENTITY_FILES:
+            return self._load_entity_files(campaign_dir, section)
+        return cast(dict, getattr(self, f"_load_{section}")(campaign_dir))
+
     def _load_game_state(self, campaign_dir: Path, campaign_name: str) -> GameState:
         """Load game state from game_state.json.
 
@@ -2035,9 +2422,10 @@ class SplitStorageBackend:
             raise FileNotFoundError(f"Campaign metadata file not found: {file_path}")
 
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data: dict = json.load(f)
 
         self._section_hashes["campaign"] = self._compute_section_hash(data)
+        self._storage_version = data.get("storage_version", SplitLayout.SECTION_FILES)
         logger.debug("✅ Loaded campaign metadata")
         return data
 
@@ -2065,11 +2453,13 @@ class SplitStorageBackend:
         except Exception as e:
             logger.error(f"❌ Error loading campaign from {latest_dir.name}: {e}")
 
-    def _load_campaign_from_dir(self, campaign_dir: Path) -> Campaign:
+    def _load_campaign_from_dir(self, campaign_dir: Path, lazy: bool = False) -> Campaign:
         """Load a campaign from a directory.
 
         Args:
             campaign_dir: Path to campaign directory
+            lazy: If True, entity sections are read from disk on first access
+                instead of up front
 
         Returns:
             Campaign object
@@ -2078,13 +2468,14 @@ class SplitStorageBackend:
             FileNotFoundError: If campaign.json does not exist
         """
         metadata = self._load_campaign_metadata(campaign_dir)
-
-        # Load all data sections
-        characters = self._load_characters(campaign_dir)
-        npcs = self._load_npcs(campaign_dir)
-        locations = self._load_locations(campaign_dir)
-        quests = self._load_quests(campaign_dir)
-        encounters = self._load_encounters(campaign_dir)
+        storage_version = self._storage_version
+        self._entity_index = {}
+
+        # Load all data sections (deferred when lazy)
+        sections = {}
+        if not lazy:
+            for section in ENTITY_SECTIONS:
+                sections[section] = self._load_section(campaign_dir, section, storage_version)
         game_state = self._load_game_state(campaign_dir, metadata["name"])
         sessions = self._load_sessions(campaign_dir)
 
@@ -2095,22 +2486,24 @@ class SplitStorageBackend:
             description=metadata["description"],
             dm_name=metadata.get("dm_name"),
             setting=metadata.get("setting"),
-            characters=characters,
-            npcs=npcs,
-            locations=locations,
-            quests=quests,
-            encounters=encounters,
             sessions=sessions,
             game_state=game_state,
             world_notes=metadata.get("world_notes", ""),
             created_at=datetime.fromisoformat(metadata["created_at"]),
             updated_at=datetime.fromisoformat(metadata["updated_at"]) if metadata.get("updated_at") else None,
+            **sections,
         )
 
+        if lazy:
+            for section in ENTITY_SECTIONS:
+                loader = partial(self._load_section, campaign_dir, section, storage_version)
+                setattr(campaign, section, LazyEntities(loader, self._tracker, section))
+
         self._current_campaign = campaign
+        self._tracker.attach(campaign)
         return campaign
 
-    def create_campaign(self, name: str, description: str, dm_name: str | None = None, setting: str | Path | None = None) -> Campaign:
+    def create_campaign(self, name: str, description: str, dm_name: str | None = None, setting: str | Path | None = None, storage_version: int | None = None) -> Campaign:
         """Create a new campaign.
 
         Args:
@@ -2118,11 +2511,15 @@ class SplitStorageBackend:
             description: Campaign description
             dm_name: Dungeon Master name
             setting: Campaign setting (string or path to file)
+            storage_version: Entity section layout (see SplitLayout).
+                Defaults to DEFAULT_STORAGE_VERSION.
 
         Returns:
             New Campaign object
         """
         logger.info(f"✨ Creating new campaign: '{name}'")
+        self._storage_version = storage_version or self.DEFAULT_STORAGE_VERSION
+        self._entity_index = {}
 
         # Ensure directory structure exists
         self._ensure_campaign_structure(name)
@@ -2138,6 +2535,7 @@ class SplitStorageBackend:
         )
 
         self._current_campaign = campaign
+        self._tracker.attach(campaign)
         self.save_all(force=True)  # Force save for new campaign
         logger.info(f"✅ Campaign '{name}' created and set as active.")
         return campaign
@@ -2162,11 +2560,12 @@ class SplitStorageBackend:
 
         return [d.name for d in campaigns_dir.iterdir() if d.is_dir()]
 
-    def load_campaign(self, name: str) -> Campaign:
+    def load_campaign(self, name: str, lazy: bool = False) -> Campaign:
         """Load a specific campaign.
 
         Args:
             name: Campaign name to load
+            lazy: If True, entity sections are read on first access
 
         Returns:
             Loaded Campaign object
@@ -2182,6 +2581,59 @@ class SplitStorageBackend:
             logger.error(f"❌ Campaign directory not found for '{name}'")
             raise FileNotFoundError(f"Campaign '{name}' not found")
 
-        campaign = self._load_campaign_from_dir(campaign_dir)
+        campaign = self._load_campaign_from_dir(campaign_dir, lazy=lazy)
         logger.info(f"✅ Successfully loaded campaign '{name}'.")
         return campaign
+
+    @property
+    def storage_version(self) -> int:
+        """Entity section layout of the current campaign (see SplitLayout)."""
+        return self._storage_version
+
+    def convert_layout(self, storage_version: int) -> None:
+        """Rewrite the current campaign's entity sections in another layout.
+
+        All sections are written in the new layout and campaign.json is
+        updated before the files of the old layout are removed, so an
+        interrupted conversion still leaves a loadable campaign.
+
+        Args:
+            storage_version: Target layout (see SplitLayout)
+
+        Raises:
+            ValueError: If no campaign is loaded or the layout is unknown
+        """
+        if not self._current_campaign:
+            raise ValueError("No current campaign to convert")
+        if storage_version not in (SplitLayout.SECTION_FILES, SplitLayout.ENTITY_FILES):
+            raise ValueError(f"Unknown storage version: {storage_version}")
+        if storage_version == self._storage_version:
+            return
+
+        campaign_dir = self._get_campaign_dir()
+        # Read lazily loaded sections while the old layout is still on disk
+        for section in ENTITY_SECTIONS:
+            entities = getattr(self._current_campaign, section)
+            if isinstance(entities, LazyEntities):
+                entities.ensure_loaded()
+
+        old_version = self._storage_version
+        self._storage_version = storage_version
+        self._entity_index = {}
+
+        # Entity data first, campaign.json (which records the layout) last
+        changes = self._tracker.collect(self._current_campaign)
+        for section in ENTITY_SECTIONS:
+            self._save_entity_section(section, True, changes)
+        self._save_campaign_metadata(force=True)
+        self._tracker.commit(changes)
+
+        for section in ENTITY_SECTIONS:
+            if old_version >= SplitLayout.ENTITY_FILES:
+                shutil.rmtree(campaign_dir / section, ignore_errors=True)
+            else:
+                (campaign_dir / f"{section}.json").unlink(missing_ok=True)
+        logger.info(
+            f"✅ Converted campaign '{self._current_campaign.name}' from storage version "
+            f"{old_version} to {storage_version}"
+        )
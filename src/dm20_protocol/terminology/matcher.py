@@ -0,0 +1,137 @@
+"""
+Multi-pattern term matcher (Aho-Corasick over word tokens).
+
+Finds every known term variant in a text in one pass, however large the
+vocabulary. Text and variants are split into the same tokens (runs of word
+characters, or single punctuation marks), so a match always starts and ends
+on a token edge, which gives the word-boundary behaviour of ``\\b...\\b``.
+"""
+
+import re
+from bisect import bisect_left
+from collections import deque
+from typing import Iterable
+
+# Runs of word characters, or single non-space punctuation marks
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over the word tokens of normalized variants.
+
+    Built once per vocabulary; scanning a text costs one automaton step per
+    token plus the matches found, independent of the vocabulary size.
+
+    Overlapping matches are resolved like a longest-first greedy scan: longer
+    variants win, then the earlier one among variants of the same length.
+
+    Args:
+        variants: Normalized term variants (lowercase, accents stripped)
+
+    Example:
+        >>> matcher = TermMatcher(["palla di fuoco", "palla", "fuoco"])
+        >>> matcher.find("lancio palla di fuoco")
+        [(7, 21, 'palla di fuoco')]
+    """
+
+    def __init__(self, variants: Iterable[str]) -> None:
+        # Node 0 is the root; goto[node] maps the next token to a child node
+        self._goto: list[dict[str, int]] = [{}]
+        self._depth: list[int] = [0]
+        self._variants: list[tuple[str, ...]] = [()]
+        for variant in variants:
+            self._add(variant)
+        self._fail, self._output_link = self._link()
+
+    def _add(self, variant: str) -> None:
+        tokens = _TOKEN_RE.findall(variant)
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            child = self._goto[node].get(token)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][token] = child
+                self._goto.append({})
+                self._depth.append(self._depth[node] + 1)
+                self._variants.append(())
+            node = child
+        if variant not in self._variants[node]:
+            # Variants with the same tokens differ only in whitespace
+            self._variants[node] += (variant,)
+
+    def _link(self) -> tuple[list[int], list[int]]:
+        """Failure links, and links to the nearest suffix node ending a variant."""
+        fail = [0] * len(self._goto)
+        output_link = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                state = fail[node]
+                while state and token not in self._goto[state]:
+                    state = fail[state]
+                target = self._goto[state].get(token, 0)
+                fail[child] = target if target != child else 0
+                output_link[child] = target if self._variants[target] else output_link[target]
+                queue.append(child)
+        return fail, output_link
+
+    def __len__(self) -> int:
+        """Number of distinct variants."""
+        return sum(len(variants) for variants in self._variants)
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """Find non-overlapping variants in a normalized text.
+
+        Args:
+            text: Text normalized like the variants
+
+        Returns:
+            List of (start, end, variant) tuples ordered by start
+        """
+        goto, fail, output_link, depth, variants = (
+            self._goto, self._fail, self._output_link, self._depth, self._variants,
+        )
+        starts: list[int] = []
+        candidates: list[tuple[int, int, str]] = []
+        state = 0
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group()
+            starts.append(match.start())
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+
+            node = state if variants[state] else output_link[state]
+            end = match.end()
+            while node:
+                start = starts[len(starts) - depth[node]]
+                for variant in variants[node]:
+                    # Same tokens, but the whitespace between them must match too
+                    if len(variant) == end - start and text.startswith(variant, start):
+                        candidates.append((start, end, variant))
+                node = output_link[node]
+
+        return _longest_first(candidates)
+
+
+def _longest_first(candidates: list[tuple[int, int, str]]) -> list[tuple[int, int, str]]:
+    """Pick non-overlapping matches, longest first, then leftmost."""
+    candidates.sort(key=lambda c: (c[0] - c[1], c[0]))
+    chosen_starts: list[int] = []
+    chosen: list[tuple[int, int, str]] = []
+    for candidate in candidates:
+        start, end, _ = candidate
+        position = bisect_left(chosen_starts, start)
+        if position < len(chosen) and chosen[position][0] < end:
+            continue
+        if position > 0 and chosen[position - 1][1] > start:
+            continue
+        chosen_starts.insert(position, start)
+        chosen.insert(position, candidate)
+    return chosen
+
+
+__all__ = ["TermMatcher"]
@@ -3,13 +3,13 @@ Term resolver with O(1) lookup and accent normalization.
 """
 
 import logging
-import re
 import unicodedata
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import yaml
 
+from .matcher import TermMatcher
 from .models import TermEntry
 
 if TYPE_CHECKING:
@@ -43,6 +43,11 @@ class TermResolver:
         """Initialize an empty resolver."""
         self._lookup: dict[str, TermEntry] = {}
         self._sorted_variants: list[tuple[str, str]] = []  # (normalized, original) sorted by length
+        # Bumped whenever _sorted_variants changes; the matcher is compiled
+        # on first use and recompiled once its version is stale
+        self._variants_version = 0
+        self._matcher: TermMatcher | None = None
+        self._matcher_version = -1
 
     def _normalize(self, text: str) -> str:
         """Normalize text for accent-insensitive, case-insensitive matching.
@@ -67,6 +72,36 @@ class TermResolver:
         # Strip combining marks (accents)
         return "".join(c for c in nfkd if not unicodedata.combining(c))
 
+    def _normalize_with_offsets(self, text: str) -> tuple[str, list[int]]:
+        """Normalize text like _normalize, keeping track of positions.
+
+        Unlike _normalize, surrounding whitespace is kept.
+
+        Args:
+            text: Input text to normalize
+
+        Returns:
+            Tuple of (normalized text, index in ``text`` of each normalized character)
+        """
+        if text.isascii():
+            return text.lower(), list(range(len(text)))
+
+        chars: list[str] = []
+        offsets: list[int] = []
+        for i, c in enumerate(text):
+            for n in unicodedata.normalize("NFD", c.lower()):
+                if not unicodedata.combining(n):
+                    chars.append(n)
+                    offsets.append(i)
+        return "".join(chars), offsets
+
+    def _get_matcher(self) -> TermMatcher:
+        """Compiled matcher for the current variants, rebuilt when they change."""
+        if self._matcher is None or self._matcher_version != self._variants_version:
+            self._matcher = TermMatcher(normalized for normalized, _ in self._sorted_variants)
+            self._matcher_version = self._variants_version
+        return self._matcher
+
     def load_yaml(self, path: Path) -> None:
         """Load term dictionary from YAML file.
 
@@ -99,6 +134,7 @@ class TermResolver:
         # Clear existing data
         self._lookup.clear()
         self._sorted_variants.clear()
+        self._variants_version += 1
 
         for term_data in data["terms"]:
             entry = TermEntry(**term_data)
@@ -153,6 +189,8 @@ class TermResolver:
         Handles multi-word terms (e.g., "Palla di Fuoco").
 
         Uses greedy matching with longest-first strategy to handle overlapping terms.
+        All variants are matched in a single pass by a TermMatcher compiled
+        once per vocabulary, so the cost does not grow with the vocabulary.
 
         Args:
             text: Input text to scan
@@ -169,43 +207,19 @@ class TermResolver:
             return []
 
         results: list[tuple[str, TermEntry]] = []
-        normalized_text = self._normalize(text)
-
-        # Track matched positions to avoid overlaps
-        matched_positions: set[int] = set()
-
-        # Try to match each variant (sorted longest-first)
-        for normalized_variant, original_variant in self._sorted_variants:
-            # Build regex pattern for word boundaries
-            # Escape special regex chars
-            pattern = re.escape(normalized_variant)
-            # Use word boundaries for single words, space boundaries for multi-word
-            if " " in pattern:
-                pattern = r"\b" + pattern + r"\b"
-            else:
-                pattern = r"\b" + pattern + r"\b"
-
-            # Find all matches in normalized text
-            for match in re.finditer(pattern, normalized_text):
-                start, end = match.span()
-
-                # Check if this position overlaps with existing match
-                if any(pos in matched_positions for pos in range(start, end)):
-                    continue
+        normalized_text, offsets = self._normalize_with_offsets(text)
 
-                # Mark positions as matched
-                matched_positions.update(range(start, end))
-
-                # Extract original text (preserve case/accents)
-                matched_text = text[start:end]
-
-                # Resolve the term
-                entry = self._lookup.get(normalized_variant)
-                if entry:
-                    results.append((matched_text, entry))
+        for start, end, normalized_variant in self._get_matcher().find(normalized_text):
+            entry = self._lookup.get(normalized_variant)
+            if not entry:
+                continue
 
-        # Sort by position in text
-        results.sort(key=lambda x: text.find(x[0]))
+            # Extract original text (preserve case/accents)
+            original_start = offsets[start]
+            original_end = offsets[end - 1] + 1
+            while original_end < len(text) and unicodedata.combining(text[original_end]):
+                original_end += 1
+            results.append((text[original_start:original_end], entry))
 
         return results
 
@@ -285,6 +299,7 @@ class TermResolver:
         if count > 0:
             # Re-sort variants by length (longest first) for greedy matching
             self._sorted_variants.sort(key=lambda x: len(x[0]), reverse=True)
+            self._variants_version += 1
             logger.info("Indexed %d terms from rulebook sources", count)
 
         return count
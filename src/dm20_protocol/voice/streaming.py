@@ -214,11 +214,14 @@ class AudioStreamManager:
                 "duration_ms": result.duration_ms,
             }
 
+            # Chunks go straight into the connections' outbound queues;
+            # only the last one waits for delivery.
+            wait = seq == total_chunks - 1
             try:
                 if player_id:
-                    await self._conn.send_to_player(player_id, message)
+                    await self._conn.send_to_player(player_id, message, wait=wait)
                 else:
-                    await self._conn.broadcast(message)
+                    await self._conn.broadcast(message, wait=wait)
             except Exception as exc:
                 logger.warning(
                     "Failed to send audio chunk %d/%d: %s", seq, total_chunks, exc
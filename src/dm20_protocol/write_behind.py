@@ -0,0 +1,252 @@
+"""
+Write-behind saving for the storage layer.
+
+With write-behind enabled, a mutating tool call only records that a save is
+needed and returns. A background thread waits until no further save request
+arrived for a short debounce window (or until a maximum delay has passed
+since the first pending request) and then runs a single flush, so a burst
+of edits such as a round of HP changes costs one write.
+
+Key components:
+- SaverMetrics: request/flush counters, coalescing ratio and flush latency
+- WriteBehindSaver: the debouncing background thread. ``flush()`` writes
+  pending changes synchronously on the calling thread and ``close()``
+  flushes and stops the thread; both are safe to call at shutdown.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Callable
+
+logger = logging.getLogger("dm20-protocol")
+
+
+@dataclass
+class SaverMetrics:
+    """Counters describing how well saves are being coalesced.
+
+    Attributes:
+        requests: Save requests received
+        flushes: Successful flushes
+        errors: Flushes that raised
+        last_latency: Seconds from the oldest pending request to the end of
+            the latest flush
+        max_latency: Largest flush latency seen
+        total_latency: Sum of all flush latencies
+        total_flush_time: Seconds spent inside the flush callback
+    """
+    requests: int = 0
+    flushes: int = 0
+    errors: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    total_flush_time: float = 0.0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Average number of save requests folded into one flush."""
+        return self.requests / self.flushes if self.flushes else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Mean seconds between a request and its data reaching disk."""
+        return self.total_latency / self.flushes if self.flushes else 0.0
+
+    def to_dict(self) -> dict:
+        """Return the counters and derived ratios as a plain dict."""
+        return {
+            "requests": self.requests,
+            "flushes": self.flushes,
+            "errors": self.errors,
+            "coalescing_ratio": round(self.coalescing_ratio, 2),
+            "last_latency_ms": round(self.last_latency * 1000, 1),
+            "average_latency_ms": round(self.average_latency * 1000, 1),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "total_flush_time_ms": round(self.total_flush_time * 1000, 1),
+        }
+
+
+class WriteBehindSaver:
+    """Debounces save requests and flushes them from a background thread.
+
+    Args:
+        flush: Callable that writes all pending changes. Called with no
+            arguments, never concurrently with itself.
+        debounce: Seconds without new requests before flushing
+        max_delay: Upper bound in seconds on how long a pending request can
+            wait while requests keep arriving. Defaults to 10x debounce.
+
+    Usage:
+        saver = WriteBehindSaver(storage_flush, debounce=0.5)
+        saver.request()   # returns immediately
+        saver.flush()     # write now, e.g. before switching campaigns
+        saver.close()     # flush and stop the thread
+    """
+
+    def __init__(self, flush: Callable[[], None], debounce: float = 0.5, max_delay: float | None = None):
+        if debounce < 0:
+            raise ValueError(f"debounce must be >= 0, got {debounce}")
+        self._flush_callback = flush
+        self.debounce = debounce
+        self.max_delay = max_delay if max_delay is not None else max(debounce * 10, debounce)
+        self.metrics = SaverMetrics()
+
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._pending_requests = 0
+        self._first_request: float | None = None
+        self._last_request = 0.0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+        # Flush on interpreter exit even if close() is never called
+        self._atexit = _make_atexit_close(self)
+        atexit.register(self._atexit)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a save was requested but not yet flushed."""
+        with self._condition:
+            return self._first_request is not None
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    def request(self) -> None:
+        """Record that a save is needed and return immediately.
+
+        After close() the flush runs synchronously instead.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self.metrics.requests += 1
+            self._pending_requests += 1
+            if self._first_request is None:
+                self._first_request = now
+            self._last_request = now
+            if not self._closed:
+                self._ensure_thread()
+                self._condition.notify()
+                return
+        self.flush()
+
+    def flush(self) -> bool:
+        """Write pending changes now on the calling thread.
+
+        Returns:
+            True if a flush ran, False if nothing was pending
+        """
+        with self._flush_lock:
+            taken = self._take_requests()
+            if taken is None:
+                return False
+            first_request, requests = taken
+
+            started = time.monotonic()
+            try:
+                self._flush_callback()
+            except Exception:
+                self._restore_requests(first_request, requests)
+                raise
+
+            finished = time.monotonic()
+            latency = finished - first_request
+            with self._condition:
+                self.metrics.flushes += 1
+                self.metrics.last_latency = latency
+                self.metrics.total_latency += latency
+                self.metrics.max_latency = max(self.metrics.max_latency, latency)
+                self.metrics.total_flush_time += finished - started
+            logger.debug(f"💾 Write-behind flush of {requests} request(s) after {latency * 1000:.0f} ms")
+            return True
+
+    def close(self) -> None:
+        """Flush pending changes and stop the background thread.
+
+        Safe to call more than once.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+        atexit.unregister(self._atexit)
+
+    def _take_requests(self) -> tuple[float, int] | None:
+        """Clear the pending requests, returning (first request time, count)."""
+        with self._condition:
+            first_request = self._first_request
+            if first_request is None:
+                return None
+            requests = self._pending_requests
+            self._first_request = None
+            self._pending_requests = 0
+            return first_request, requests
+
+    def _restore_requests(self, first_request: float, requests: int) -> None:
+        """Keep the requests of a failed flush pending so the next attempt retries them.
+
+        Requests made while the flush ran are merged in.
+        """
+        with self._condition:
+            self.metrics.errors += 1
+            self._pending_requests += requests
+            if self._first_request is None or first_request < self._first_request:
+                self._first_request = first_request
+            self._last_request = time.monotonic()
+            self._condition.notify()
+
+    # --- Background thread ---
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="dm20-write-behind", daemon=True)
+            self._thread.start()
+
+    def _wait_for_burst(self) -> bool:
+        """Block until requested saves have settled; False once closed."""
+        with self._condition:
+            while self._first_request is None and not self._closed:
+                self._condition.wait()
+            # Wait for the burst to settle, bounded by max_delay
+            while not self._closed and self._first_request is not None:
+                now = time.monotonic()
+                deadline = min(self._last_request + self.debounce, self._first_request + self.max_delay)
+                if now >= deadline:
+                    break
+                self._condition.wait(deadline - now)
+            return not self._closed
+
+    def _run(self) -> None:
+        while self._wait_for_burst():
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("❌ Write-behind flush failed, will retry")
+                with self._condition:
+                    # Back off for one debounce window before retrying
+                    self._condition.wait(max(self.debounce, 0.05))
+
+
+def _make_atexit_close(saver: WriteBehindSaver) -> Callable[[], None]:
+    """Build an atexit hook that does not keep the saver alive."""
+    ref = weakref.ref(saver)
+
+    def close() -> None:
+        target = ref()
+        if target is not None and not target.closed:
+            try:
+                target.close()
+            except Exception:
+                logger.exception("❌ Failed to flush pending saves at exit")
+
+    return close
@@ -13,7 +13,7 @@ This test suite covers:
 
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -745,3 +745,77 @@ class TestSaveLoad:
         assert data["metadata"]["total_detected"] == 2
         assert data["metadata"]["total_resolved"] == 1
         assert "last_updated" in data["metadata"]
+
+
+class TestLargeDatabase:
+    """Contradiction checks over the whole database via the keyword index."""
+
+    @staticmethod
+    def _fill(fact_db, count):
+        """Add ``count`` unrelated, highly relevant facts."""
+        words = [f"word{chr(97 + i % 26)}{chr(97 + i // 26 % 26)}" for i in range(2000)]
+        for i in range(count):
+            fact_db.add_fact(Fact(
+                id=f"filler_{i:05d}",
+                category=FactCategory.EVENT,
+                content=" ".join(words[(i * 7 + k * 13) % len(words)] for k in range(8)),
+                session_number=1,
+                relevance_score=5.0,
+            ))
+
+    def test_low_relevance_fact_beyond_top_hundred(self, detector, fact_db):
+        """Test an old, low-relevance fact is still checked."""
+        self._fill(fact_db, 300)
+        fact_db.add_fact(Fact(
+            id="old_fact",
+            category=FactCategory.NPC,
+            content="The ancient red dragon is alive and guards the mountain",
+            session_number=1,
+            relevance_score=0.1,
+        ))
+
+        contradictions = detector.check_statement("The ancient red dragon is dead", session_number=5)
+
+        assert [c.conflicting_fact_ids for c in contradictions] == [["old_fact"]]
+
+    def test_npc_statement_checks_whole_database(self, detector_with_npc, fact_db):
+        """Test NPC statements are checked against facts past the first thousand."""
+        self._fill(fact_db, 1200)
+        fact_db.add_fact(Fact(
+            id="secret",
+            category=FactCategory.EVENT,
+            content="The duke poisoned the king at the harvest banquet",
+            session_number=1,
+            relevance_score=0.1,
+        ))
+
+        contradictions = detector_with_npc.check_npc_statement(
+            "npc_maid", "I heard the duke poisoned the king", session_number=2
+        )
+
+        assert [c.conflicting_fact_ids for c in contradictions] == [["secret"]]
+
+    @pytest.mark.slow
+    def test_check_statement_benchmark(self, detector, fact_db):
+        """Test checks compare only keyword-sharing facts out of 10k."""
+        self._fill(fact_db, 10_000)
+        fact_db.add_fact(Fact(
+            id="dragon",
+            category=FactCategory.NPC,
+            content="The ancient red dragon is alive and guards the mountain",
+            session_number=1,
+        ))
+        statements = [
+            "The ancient red dragon is dead",
+            "The innkeeper was never in the village",
+            "wordaa wordhb are closed now",
+        ]
+
+        with patch.object(
+            detector, "_check_negation_conflict", wraps=detector._check_negation_conflict
+        ) as compare:
+            for statement in statements:
+                detector.check_statement(statement, session_number=2)
+
+        # A full scan would compare every statement with all 10k facts
+        assert 1 <= compare.call_count < 50
@@ -781,3 +781,171 @@ class TestEdgeCases:
         assert loaded.timestamp.hour == 10
         assert loaded.timestamp.minute == 30
         assert loaded.timestamp.second == 45
+
+
+class TestKeywordIndex:
+    """Tests for the inverted keyword index."""
+
+    def test_find_by_keywords(self, tmp_path):
+        """Test facts are found by shared keywords, best first."""
+        db = FactDatabase(tmp_path / "campaign")
+        db.add_fact(Fact(id="f1", category=FactCategory.NPC, content="The red dragon sleeps",
+                         session_number=1, relevance_score=1.0))
+        db.add_fact(Fact(id="f2", category=FactCategory.NPC, content="A red dragon attacked the village",
+                         session_number=1, relevance_score=2.0))
+        db.add_fact(Fact(id="f3", category=FactCategory.EVENT, content="The village feast",
+                         session_number=1))
+
+        assert [f.id for f in db.find_by_keywords({"red", "dragon"}, min_shared=2)] == ["f2", "f1"]
+        assert {f.id for f in db.find_by_keywords({"village"})} == {"f2", "f3"}
+        assert db.find_by_keywords({"dragon", "feast"}, min_shared=2) == []
+
+    def test_replaced_fact_is_reindexed(self, tmp_path):
+        """Test adding a fact with an existing ID replaces its keywords."""
+        db = FactDatabase(tmp_path / "campaign")
+        db.add_fact(Fact(id="f1", category=FactCategory.NPC, content="Bob the innkeeper",
+                         session_number=1))
+        db.add_fact(Fact(id="f1", category=FactCategory.NPC, content="Alice the blacksmith",
+                         session_number=1))
+
+        assert db.find_by_keywords({"innkeeper"}) == []
+        assert db.get_keywords("f1") == {"alice", "blacksmith"}
+
+    def test_edited_content_is_reindexed(self, tmp_path):
+        """Test a fact edited in place gets fresh keywords."""
+        db = FactDatabase(tmp_path / "campaign")
+        db.add_fact(Fact(id="f1", category=FactCategory.NPC, content="Bob the innkeeper",
+                         session_number=1))
+
+        db.facts["f1"].content = "Bob the smuggler"
+
+        assert db.get_keywords("f1") == {"bob", "smuggler"}
+        assert [f.id for f in db.find_by_keywords({"smuggler"})] == ["f1"]
+
+    def test_load_rebuilds_index(self, tmp_path):
+        """Test the index is rebuilt from a saved database."""
+        db = FactDatabase(tmp_path / "campaign")
+        db.add_fact(Fact(id="f1", category=FactCategory.LOCATION, content="Ancient ruins discovered",
+                         session_number=2))
+        db.save()
+
+        reloaded = FactDatabase(tmp_path / "campaign")
+
+        assert [f.id for f in reloaded.find_by_keywords({"ancient", "ruins"}, min_shared=2)] == ["f1"]
+
+
+class TestQueryPlanner:
+    """Tests for the secondary indexes behind query_facts."""
+
+    @staticmethod
+    def reference_query(db, category=None, session=None, min_relevance=0.0, tags=None, limit=50):
+        """The previous implementation: filter every fact, then sort."""
+        results = [
+            f for f in db.facts.values()
+            if (category is None or f.category == category)
+            and (session is None or f.session_number == session)
+            and f.relevance_score >= min_relevance
+            and (not tags or all(tag in f.tags for tag in tags))
+        ]
+        results.sort(key=lambda f: (-f.relevance_score, -f.timestamp.timestamp()))
+        return results[:limit]
+
+    @staticmethod
+    def random_db(tmp_path, count, seed=7):
+        """A database of ``count`` facts with random attributes and tied timestamps."""
+        import random
+
+        rng = random.Random(seed)
+        base = datetime(2026, 1, 1)
+        db = FactDatabase(tmp_path / "campaign")
+        categories = list(FactCategory)
+        for i in range(count):
+            db.add_fact(Fact(
+                id=f"fact_{i:05d}",
+                category=categories[i % len(categories)],
+                content=f"Fact number {i}",
+                session_number=rng.randint(1, 40),
+                relevance_score=rng.choice([0.5, 1.0, 1.5, 2.0, 3.0]),
+                timestamp=base + timedelta(minutes=rng.randint(0, 50)),
+                tags=rng.sample(["combat", "npc", "quest", "loot", "rare"], rng.randint(0, 3)),
+            ))
+        return db
+
+    def assert_same_as_reference(self, db):
+        queries = [
+            {},
+            {"limit": 5},
+            {"category": FactCategory.NPC, "limit": 5},
+            {"session": 3},
+            {"session": 3, "category": FactCategory.EVENT, "limit": 2},
+            {"tags": ["rare", "loot"], "limit": 10},
+            {"tags": ["missing"]},
+            {"min_relevance": 2.0, "limit": 500},
+            {"category": FactCategory.QUEST, "min_relevance": 1.5, "tags": ["combat"]},
+            {"limit": 0},
+            {"session": 99},
+        ]
+        for query in queries:
+            assert [f.id for f in db.query_facts(**query)] == [
+                f.id for f in self.reference_query(db, **query)
+            ], query
+
+    def test_same_results_as_full_scan(self, tmp_path):
+        """Test every plan returns the full-scan results in the same order."""
+        self.assert_same_as_reference(self.random_db(tmp_path, 2000))
+
+    def test_indexes_follow_updates(self, tmp_path):
+        """Test indexes are kept current by add_fact, update_relevance and add_tag."""
+        db = self.random_db(tmp_path, 500)
+
+        db.update_relevance("fact_00010", 10.0)
+        db.update_relevance("fact_00011", 0.0)
+        db.add_tag("fact_00012", "rare")
+        assert db.add_tag("fact_00013", "cursed")
+        assert not db.add_tag("fact_00013", "cursed")
+        db.add_fact(Fact(id="fact_00014", category=FactCategory.ITEM, content="Replaced",
+                         session_number=77, relevance_score=4.0, tags=["loot"]))
+
+        self.assert_same_as_reference(db)
+        assert db.query_facts(limit=1)[0].id == "fact_00010"
+        assert [f.id for f in db.query_facts(tags=["cursed"])] == ["fact_00013"]
+        assert [f.id for f in db.query_facts(session=77)] == ["fact_00014"]
+
+    def test_indexes_rebuilt_on_load(self, tmp_path):
+        """Test a reloaded database plans queries from rebuilt indexes."""
+        self.random_db(tmp_path, 300).save()
+
+        self.assert_same_as_reference(FactDatabase(tmp_path / "campaign"))
+
+    def test_add_tag_unknown_fact(self, tmp_path):
+        """Test add_tag raises KeyError for an unknown fact."""
+        db = FactDatabase(tmp_path / "campaign")
+
+        with pytest.raises(KeyError, match="not found"):
+            db.add_tag("nonexistent", "tag")
+
+    @pytest.mark.slow
+    def test_limited_query_benchmark(self, tmp_path):
+        """Test limited queries look at a fraction of 20k facts."""
+        class CountingDict(dict):
+            reads = 0
+
+            def __getitem__(self, key):
+                CountingDict.reads += 1
+                return super().__getitem__(key)
+
+        db = self.random_db(tmp_path, 20_000)
+        queries = [
+            {"limit": 5},
+            {"category": FactCategory.EVENT, "limit": 5},
+            {"session": 12, "limit": 10},
+            {"tags": ["rare"], "min_relevance": 1.0, "limit": 5},
+        ]
+        expected = [[f.id for f in self.reference_query(db, **query)] for query in queries]
+        db.facts = CountingDict(db.facts)
+
+        for query, ids in zip(queries, expected):
+            CountingDict.reads = 0
+            assert [f.id for f in db.query_facts(**query)] == ids
+            # The full scan reads all 20k facts
+            assert CountingDict.reads < 200, query
@@ -0,0 +1,321 @@
+"""
+Tests for journaled persistence of the consistency stores.
+
+Tests cover:
+- Appending one record per change instead of rewriting the snapshot
+- Replaying the journal on load for every store
+- Compaction into a fresh snapshot
+- Crash consistency: torn and corrupt records, a crash between writing
+  a snapshot and resetting its journal, snapshots written before journaling
+"""
+
+import json
+
+import pytest
+
+from dm20_protocol.claudmaster.consistency import (
+    ContradictionDetector,
+    Fact,
+    FactCategory,
+    FactDatabase,
+    GameTime,
+    KnowledgeSource,
+    LocationStateManager,
+    NPCKnowledgeTracker,
+    PlayerInteraction,
+    ResolutionStrategy,
+    StateChange,
+    StateChangeType,
+    TimelineEvent,
+    TimelineTracker,
+    TimeUnit,
+)
+from dm20_protocol.claudmaster.consistency.journal import StoreJournal
+from dm20_protocol.consistency import AcquisitionMethod, PartyKnowledge
+
+
+def make_fact(i: int, **kwargs) -> Fact:
+    return Fact(
+        id=f"fact_{i:03d}",
+        category=kwargs.pop("category", FactCategory.EVENT),
+        content=kwargs.pop("content", f"Event number {i}"),
+        session_number=1,
+        **kwargs,
+    )
+
+
+def journal_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def campaign_path(tmp_path):
+    return tmp_path / "campaign"
+
+
+class TestStoreJournal:
+    """Tests for StoreJournal itself."""
+
+    def test_save_appends_records_after_first_snapshot(self, campaign_path):
+        """Test only the first save writes a snapshot."""
+        db = FactDatabase(campaign_path)
+        for i in range(10):
+            db.add_fact(make_fact(i))
+        db.save()
+        snapshot = (campaign_path / "fact_database.json").read_text()
+
+        db.add_fact(make_fact(10))
+        db.save()
+
+        assert (campaign_path / "fact_database.json").read_text() == snapshot
+        lines = journal_lines(campaign_path / "fact_database.journal.jsonl")
+        assert lines[0] == {"journal": json.loads(snapshot)["journal"]}
+        assert [line["op"] for line in lines[1:]] == ["put"]
+        assert lines[1]["fact"]["id"] == "fact_010"
+
+    def test_save_without_changes_writes_nothing(self, campaign_path):
+        """Test saving twice does not grow the journal."""
+        db = FactDatabase(campaign_path)
+        db.add_fact(make_fact(0))
+        db.save()
+        db.update_relevance("fact_000", 2.0)
+        db.save()
+        journal = (campaign_path / "fact_database.journal.jsonl").read_text()
+
+        db.save()
+
+        assert (campaign_path / "fact_database.journal.jsonl").read_text() == journal
+
+    def test_compaction(self, campaign_path):
+        """Test the journal is compacted once it holds as many records as the store."""
+        db = FactDatabase(campaign_path)
+        db._journal.compact_after = 5
+        for i in range(5):
+            db.add_fact(make_fact(i))
+        db.save()
+
+        for i in range(4):
+            db.update_relevance("fact_000", float(i))
+            db.save()
+        assert db._journal.record_count == 4
+
+        db.update_relevance("fact_000", 9.0)
+        db.save()
+
+        assert db._journal.record_count == 0
+        assert len(journal_lines(campaign_path / "fact_database.journal.jsonl")) == 1
+        data = json.loads((campaign_path / "fact_database.json").read_text())
+        assert next(f for f in data["facts"] if f["id"] == "fact_000")["relevance_score"] == 9.0
+        assert FactDatabase(campaign_path).facts["fact_000"].relevance_score == 9.0
+
+    def test_unsaved_changes_are_not_persisted(self, campaign_path):
+        """Test queued records are discarded by a reload without save."""
+        db = FactDatabase(campaign_path)
+        db.save()
+        db.add_fact(make_fact(0))
+
+        assert FactDatabase(campaign_path).facts == {}
+
+
+class TestCrashConsistency:
+    """Tests for recovering from interrupted writes."""
+
+    @pytest.fixture
+    def saved_db(self, campaign_path):
+        """A database with a snapshot and two journaled facts."""
+        db = FactDatabase(campaign_path)
+        db.add_fact(make_fact(0))
+        db.save()
+        db.add_fact(make_fact(1))
+        db.save()
+        db.add_fact(make_fact(2))
+        db.save()
+        return db
+
+    def test_torn_last_record_is_ignored(self, campaign_path, saved_db):
+        """Test a half-written last record is skipped on load."""
+        journal_path = campaign_path / "fact_database.journal.jsonl"
+        content = journal_path.read_bytes()
+        journal_path.write_bytes(content[:-20])
+
+        db = FactDatabase(campaign_path)
+
+        assert sorted(db.facts) == ["fact_000", "fact_001"]
+
+    def test_torn_record_is_truncated_before_append(self, campaign_path, saved_db):
+        """Test records appended after a torn record are replayed."""
+        journal_path = campaign_path / "fact_database.journal.jsonl"
+        journal_path.write_bytes(journal_path.read_bytes()[:-20])
+
+        db = FactDatabase(campaign_path)
+        db.add_fact(make_fact(3))
+        db.save()
+
+        assert sorted(FactDatabase(campaign_path).facts) == ["fact_000", "fact_001", "fact_003"]
+        assert all(journal_lines(journal_path))
+
+    def test_corrupt_record_ends_replay(self, campaign_path, saved_db):
+        """Test records after a corrupt one are not replayed."""
+        journal_path = campaign_path / "fact_database.journal.jsonl"
+        lines = journal_path.read_text().splitlines()
+        lines[1] = lines[1][:10] + "#garbage"
+        journal_path.write_text("\n".join(lines) + "\n")
+
+        assert sorted(FactDatabase(campaign_path).facts) == ["fact_000"]
+
+    def test_invalid_record_is_skipped(self, campaign_path, saved_db):
+        """Test a well-formed but invalid record does not stop replay."""
+        journal_path = campaign_path / "fact_database.journal.jsonl"
+        lines = journal_path.read_text().splitlines()
+        lines.insert(1, json.dumps({"op": "relevance", "fact_id": "missing", "score": 1.0}))
+        journal_path.write_text("\n".join(lines) + "\n")
+
+        assert sorted(FactDatabase(campaign_path).facts) == ["fact_000", "fact_001", "fact_002"]
+
+    def test_crash_between_snapshot_and_journal_reset(self, campaign_path):
+        """Test records already compacted into a snapshot are not replayed twice."""
+        tracker = NPCKnowledgeTracker(FactDatabase(campaign_path), campaign_path)
+        tracker.save()
+        tracker.record_interaction("bob", PlayerInteraction(
+            session_number=1, interaction_type="conversation", summary="Chat"
+        ))
+        tracker.save()
+        journal_path = campaign_path / "npc_knowledge.journal.jsonl"
+        stale_journal = journal_path.read_bytes()
+
+        # Compact, then restore the old journal as if the reset never happened
+        tracker._journal.write_snapshot(json.loads((campaign_path / "npc_knowledge.json").read_text()) | {
+            "npc_knowledge": {"bob": {"interactions": [
+                i.model_dump(mode="json") for i in tracker.get_interactions("bob")
+            ]}},
+        })
+        journal_path.write_bytes(stale_journal)
+
+        loaded = NPCKnowledgeTracker(FactDatabase(campaign_path), campaign_path)
+        assert len(loaded.get_interactions("bob")) == 1
+
+        loaded.add_knowledge("bob", "fact_000", KnowledgeSource.RUMOR, 1)
+        loaded.save()
+        reloaded = NPCKnowledgeTracker(FactDatabase(campaign_path), campaign_path)
+        assert len(reloaded.get_interactions("bob")) == 1
+        assert reloaded.npc_knows_fact("bob", "fact_000")
+
+    def test_snapshot_without_journal_token(self, campaign_path):
+        """Test a snapshot written before journaling loads and starts a journal."""
+        campaign_path.mkdir()
+        (campaign_path / "fact_database.json").write_text(json.dumps({
+            "version": "1.0",
+            "facts": [make_fact(0).model_dump(mode="json")],
+        }))
+
+        db = FactDatabase(campaign_path)
+        db.add_fact(make_fact(1))
+        db.save()
+
+        assert "journal" in json.loads((campaign_path / "fact_database.json").read_text())
+        assert sorted(FactDatabase(campaign_path).facts) == ["fact_000", "fact_001"]
+
+
+class TestStoreReplay:
+    """Tests for replaying journaled changes of every store."""
+
+    def test_fact_database(self, campaign_path):
+        db = FactDatabase(campaign_path)
+        db.add_fact(make_fact(0))
+        db.add_fact(make_fact(1))
+        db.save()
+
+        db.update_relevance("fact_000", 4.0)
+        db.add_tag("fact_001", "secret")
+        db.link_facts("fact_000", "fact_001")
+        db.add_fact(make_fact(1, content="Replaced"))
+        db.save()
+
+        loaded = FactDatabase(campaign_path)
+        assert loaded.facts["fact_000"].relevance_score == 4.0
+        assert loaded.facts["fact_000"].related_facts == ["fact_001"]
+        assert loaded.facts["fact_001"].content == "Replaced"
+        assert loaded.query_facts(limit=1)[0].id == "fact_000"
+
+    def test_npc_knowledge(self, campaign_path):
+        fact_db = FactDatabase(campaign_path)
+        tracker = NPCKnowledgeTracker(fact_db, campaign_path)
+        tracker.add_knowledge("bob", "fact_000", KnowledgeSource.WITNESSED, 1)
+        tracker.save()
+
+        tracker.add_knowledge("bob", "fact_001", KnowledgeSource.RUMOR, 2)
+        tracker.record_interaction("alice", PlayerInteraction(
+            session_number=2, interaction_type="trade", summary="Bought a sword"
+        ))
+        tracker.save()
+
+        loaded = NPCKnowledgeTracker(fact_db, campaign_path)
+        assert [e.fact_id for e in loaded.get_npc_knowledge("bob")] == ["fact_000", "fact_001"]
+        assert [i.summary for i in loaded.get_interactions("alice")] == ["Bought a sword"]
+
+    def test_timeline(self, campaign_path):
+        timeline = TimelineTracker(campaign_path)
+        timeline.add_event(TimelineEvent(game_time=GameTime(day=5), real_session=1, description="Late"))
+        timeline.save()
+
+        timeline.add_event(TimelineEvent(game_time=GameTime(day=2), real_session=1, description="Early"))
+        timeline.advance_time(3, TimeUnit.HOUR)
+        timeline.save()
+
+        loaded = TimelineTracker(campaign_path)
+        assert [e.description for e in loaded._events] == ["Early", "Late"]
+        assert loaded.get_current_time().hour == 11
+
+    def test_location_state(self, campaign_path):
+        manager = LocationStateManager(campaign_path)
+        manager.get_location_state("crypt")
+        manager.save()
+
+        change_id = manager.record_state_change("crypt", StateChange(
+            change_type=StateChangeType.DOOR_OPENED, description="Door opened",
+            game_time=GameTime(), session_number=1, target_object="door_1", reversible=True,
+        ))
+        manager.mark_visited("crypt", GameTime(day=2))
+        manager.get_location_state("tower")
+        manager.save()
+        manager.revert_change("crypt", change_id)
+        manager.save()
+
+        loaded = LocationStateManager(campaign_path)
+        assert loaded.location_count == 2
+        assert loaded.get_location_state("crypt").visited
+        assert not loaded.is_door_open("crypt", "door_1")
+
+    def test_contradictions(self, campaign_path):
+        fact_db = FactDatabase(campaign_path)
+        fact_db.add_fact(make_fact(0, category=FactCategory.NPC,
+                                   content="The ancient red dragon is alive and guards the mountain"))
+        detector = ContradictionDetector(fact_db, campaign_path=campaign_path)
+        detector.save()
+
+        [contradiction] = detector.check_statement("The ancient red dragon is dead", session_number=2)
+        detector.save()
+        detector.resolve(contradiction.id, ResolutionStrategy.RETCON)
+        detector.save()
+
+        [loaded] = ContradictionDetector(fact_db, campaign_path=campaign_path).get_all_contradictions()
+        assert loaded.id == contradiction.id
+        assert loaded.resolved
+
+    def test_party_knowledge(self, campaign_path):
+        fact_db = FactDatabase(campaign_path)
+        fact_db.add_fact(make_fact(0))
+        party = PartyKnowledge(fact_db, campaign_path)
+        party.save()
+
+        party.learn_fact("fact_000", "Old Sage", AcquisitionMethod.TOLD_BY_NPC, session=1)
+        party.save()
+        fact_db.save()
+
+        assert PartyKnowledge(fact_db, campaign_path).party_knows("fact_000")
+        assert "party_known" in FactDatabase(campaign_path).facts["fact_000"].tags
+
+    def test_journal_path(self, tmp_path):
+        journal = StoreJournal(tmp_path / "timeline.json")
+
+        assert journal.journal_path == tmp_path / "timeline.journal.jsonl"
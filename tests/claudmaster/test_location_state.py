@@ -391,3 +391,136 @@ class TestLocationStateManager:
 
         manager.get_location_state("dungeon_2")
         assert manager.location_count == 2
+
+
+class TestMaterializedState:
+    """Tests for the materialized state behind the state queries."""
+
+    @staticmethod
+    def scan_door_open(loc, door_id):
+        """The previous implementations: walk the change history."""
+        for change in reversed(loc.state_changes):
+            if change.target_object == door_id and not change.reverted:
+                if change.change_type in (StateChangeType.DOOR_OPENED, StateChangeType.DOOR_BROKEN):
+                    return True
+                if change.change_type == StateChangeType.DOOR_LOCKED:
+                    return False
+        return False
+
+    @staticmethod
+    def scan_trap_active(loc, trap_id):
+        return not any(
+            c.target_object == trap_id and not c.reverted
+            and c.change_type in (StateChangeType.TRAP_TRIGGERED, StateChangeType.TRAP_DISARMED)
+            for c in loc.state_changes
+        )
+
+    @staticmethod
+    def scan_loot_collected(loc, loot_id):
+        return any(
+            c.target_object == loot_id and not c.reverted
+            and c.change_type == StateChangeType.LOOT_COLLECTED
+            for c in loc.state_changes
+        )
+
+    @staticmethod
+    def random_history(manager, count, seed=11):
+        """Record ``count`` random changes in a dungeon, reverting some."""
+        import random
+
+        rng = random.Random(seed)
+        change_ids = []
+        for i in range(count):
+            change_ids.append(manager.record_state_change("dungeon", StateChange(
+                change_type=rng.choice(list(StateChangeType)),
+                description=f"Change {i}",
+                game_time=GameTime(day=rng.randint(1, 30), hour=rng.randint(0, 23)),
+                session_number=1,
+                target_object=rng.choice(["door_1", "door_2", "trap_1", "loot_1", None]),
+                reversible=rng.random() < 0.7,
+            )))
+            if change_ids and rng.random() < 0.3:
+                manager.revert_change("dungeon", rng.choice(change_ids))
+        return change_ids
+
+    def assert_same_as_scan(self, manager):
+        loc = manager.get_location_state("dungeon")
+        for target in ["door_1", "door_2", "trap_1", "loot_1", None, "unknown"]:
+            assert manager.is_door_open("dungeon", target) == self.scan_door_open(loc, target)
+            assert manager.is_trap_active("dungeon", target) == self.scan_trap_active(loc, target)
+            assert manager.is_loot_collected("dungeon", target) == self.scan_loot_collected(loc, target)
+        for day in [1, 10, 15, 30]:
+            threshold = GameTime(day=day, hour=12)._to_total_minutes()
+            assert manager.get_changes_since("dungeon", GameTime(day=day, hour=12)) == [
+                c for c in loc.state_changes if c.game_time._to_total_minutes() >= threshold
+            ]
+
+    def test_same_results_as_scan(self, tmp_path):
+        """Test queries match a history walk after every kind of change."""
+        manager = LocationStateManager(tmp_path)
+        for count in (1, 5, 50, 400):
+            self.random_history(manager, count, seed=count)
+            self.assert_same_as_scan(manager)
+
+    def test_rebuilt_on_load(self, tmp_path):
+        """Test a reloaded manager rebuilds the materialized state."""
+        manager = LocationStateManager(tmp_path)
+        self.random_history(manager, 200)
+        manager.save()
+        self.random_history(manager, 50, seed=12)
+        manager.save()
+
+        self.assert_same_as_scan(LocationStateManager(tmp_path))
+
+    def test_revert_twice(self, tmp_path):
+        """Test reverting a change twice does not undo another change."""
+        manager = LocationStateManager(tmp_path)
+        for _ in range(2):
+            manager.record_state_change("dungeon", StateChange(
+                change_type=StateChangeType.LOOT_COLLECTED, description="Gold taken",
+                game_time=GameTime(), session_number=1, target_object="gold", reversible=True,
+            ))
+        first = manager.get_location_state("dungeon").state_changes[0].id
+
+        assert manager.revert_change("dungeon", first)
+        assert manager.revert_change("dungeon", first)
+
+        assert manager.is_loot_collected("dungeon", "gold")
+
+    @pytest.mark.slow
+    def test_benchmark(self, tmp_path):
+        """Test state queries do not walk a long history."""
+        class WatchedHistory(list):
+            reads = 0
+
+            def __iter__(self):
+                WatchedHistory.reads += 1
+                return super().__iter__()
+
+            def __getitem__(self, index):
+                WatchedHistory.reads += 1
+                return super().__getitem__(index)
+
+            def __reversed__(self):
+                WatchedHistory.reads += 1
+                return super().__reversed__()
+
+        manager = LocationStateManager(tmp_path)
+        self.random_history(manager, 20_000)
+        loc = manager.get_location_state("dungeon")
+        expected = (
+            self.scan_door_open(loc, "door_1"),
+            self.scan_trap_active(loc, "trap_1"),
+            self.scan_loot_collected(loc, "loot_9"),
+        )
+        loc.state_changes = WatchedHistory(loc.state_changes)
+
+        found = (
+            manager.is_door_open("dungeon", "door_1"),
+            manager.is_trap_active("dungeon", "trap_1"),
+            manager.is_loot_collected("dungeon", "loot_9"),
+        )
+
+        # Answered from the materialized state; a history walk reads all 20k changes
+        assert found == expected
+        assert WatchedHistory.reads == 0
@@ -6,7 +6,7 @@ for adventure module content.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 
 # Configure pytest to use anyio with asyncio backend only
 pytestmark = pytest.mark.anyio
@@ -595,3 +595,47 @@ def test_plot_context_uses_context_filter(module_keeper_agent, mock_vector_store
     # Verify query was called with current chapter context
     call_args = mock_vector_store.query.call_args
     assert call_args is not None
+
+
+# ------------------------------------------------------------------
+# Async lookup tests
+# ------------------------------------------------------------------
+
+NPC_RESULTS = [
+    {
+        "id": "doc1",
+        "document": "Theron keeps a hidden stash of adamantine and seeks a worthy apprentice.",
+        "metadata": {"content_type": "npc"},
+        "distance": 0.1,
+    },
+]
+
+
+async def test_async_lookups_match_sync(module_keeper_agent, mock_vector_store):
+    """Test the async lookups query with the same arguments and build the same results."""
+    mock_vector_store.query.return_value = NPC_RESULTS
+    mock_vector_store.query_async = AsyncMock(return_value=NPC_RESULTS)
+
+    lookups = [
+        ("get_npc_knowledge", ("Theron Ironhand", "adamantine")),
+        ("get_location_description", ("Rusty Dragon Tavern", "brief")),
+        ("check_encounter_trigger", ("Forest Path", "walking")),
+        ("get_plot_context", ("main quest",)),
+    ]
+    for name, args in lookups:
+        expected = getattr(module_keeper_agent, name)(*args)
+        result = await getattr(module_keeper_agent, f"{name}_async")(*args)
+
+        assert result == expected
+        assert mock_vector_store.query_async.call_args == mock_vector_store.query.call_args
+    assert mock_vector_store.query_async.await_count == len(lookups)
+
+
+async def test_async_lookup_does_not_call_sync_query(module_keeper_agent, mock_vector_store):
+    """Test the async NPC lookup goes through query_async only."""
+    mock_vector_store.query_async = AsyncMock(return_value=NPC_RESULTS)
+
+    knowledge = await module_keeper_agent.get_npc_knowledge_async("Theron Ironhand")
+
+    assert knowledge.secrets
+    mock_vector_store.query.assert_not_called()
@@ -945,3 +945,159 @@ class TestEdgeCases:
         context = tracker.get_knowledge_context("bandit")
         assert context["fact_count"] == 0
         assert context["interaction_count"] == 1
+
+
+class TestSpreadKnowledge:
+    """Tests for spreading rumors through an NPC relationship graph."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        campaign_path = tmp_path / "campaign"
+        return NPCKnowledgeTracker(FactDatabase(campaign_path), campaign_path)
+
+    RELATIONSHIPS = {
+        "barkeep": ["guard", "merchant"],
+        "guard": ["captain", "barkeep"],
+        "merchant": ["captain", "smuggler"],
+        "captain": ["duke"],
+        "smuggler": [],
+    }
+
+    def test_spread_breadth_first(self, tracker):
+        """Test every reachable NPC learns the rumor from its nearest teller."""
+        tracker.add_knowledge("barkeep", "fact_rumor", KnowledgeSource.WITNESSED, 1)
+
+        learned = tracker.spread_knowledge(["barkeep"], ["fact_rumor"], self.RELATIONSHIPS, session=2)
+
+        assert list(learned) == ["guard", "merchant", "captain", "smuggler", "duke"]
+        assert tracker.query_npcs_who_know("fact_rumor") == [
+            "barkeep", "guard", "merchant", "captain", "smuggler", "duke"
+        ]
+        [entry] = tracker.get_npc_knowledge("captain")
+        assert entry.source == KnowledgeSource.TOLD_BY_NPC
+        assert entry.source_entity == "guard"
+        assert entry.acquired_session == 2
+
+    def test_max_hops(self, tracker):
+        """Test the rumor stops after max_hops retellings."""
+        tracker.add_knowledge("barkeep", "fact_rumor", KnowledgeSource.WITNESSED, 1)
+
+        learned = tracker.spread_knowledge(["barkeep"], ["fact_rumor"], self.RELATIONSHIPS, 2, max_hops=1)
+
+        assert list(learned) == ["guard", "merchant"]
+        assert not tracker.npc_knows_fact("captain", "fact_rumor")
+
+    def test_only_known_facts_spread(self, tracker):
+        """Test NPCs only pass on facts they know and skip facts already known."""
+        tracker.add_knowledge("barkeep", "fact_a", KnowledgeSource.WITNESSED, 1)
+        tracker.add_knowledge("guard", "fact_a", KnowledgeSource.RUMOR, 1)
+        tracker.add_knowledge("guard", "fact_b", KnowledgeSource.RUMOR, 1)
+
+        learned = tracker.spread_knowledge(["barkeep"], ["fact_a", "fact_b"], self.RELATIONSHIPS, 2)
+
+        assert learned["captain"] == ["fact_a", "fact_b"]
+        assert "guard" not in learned
+        # The guard tells the barkeep back what the barkeep did not know,
+        # and the barkeep passes it on to the merchant a round later
+        assert learned["barkeep"] == ["fact_b"]
+        assert learned["merchant"] == ["fact_a", "fact_b"]
+        assert tracker.get_npc_knowledge("merchant")[1].source_entity == "barkeep"
+
+    def test_fact_heard_this_round_waits_for_next(self, tracker):
+        """Test a fact moves one hop per round, even between sources."""
+        relationships = {"alice": ["bob"], "bob": ["carol"]}
+        tracker.add_knowledge("alice", "fact_a", KnowledgeSource.WITNESSED, 1)
+        tracker.add_knowledge("bob", "fact_b", KnowledgeSource.WITNESSED, 1)
+
+        learned = tracker.spread_knowledge(
+            ["alice", "bob"], ["fact_a", "fact_b"], relationships, 2, max_hops=1
+        )
+
+        assert learned == {"bob": ["fact_a"], "carol": ["fact_b"]}
+        assert not tracker.npc_knows_fact("carol", "fact_a")
+
+    def test_fact_heard_by_source_is_retold(self, tracker):
+        """Test a source passes on a fact it heard in the next round."""
+        relationships = {"alice": ["bob"], "bob": ["carol"]}
+        tracker.add_knowledge("alice", "fact_a", KnowledgeSource.WITNESSED, 1)
+        tracker.add_knowledge("bob", "fact_b", KnowledgeSource.WITNESSED, 1)
+
+        learned = tracker.spread_knowledge(["alice", "bob"], ["fact_a", "fact_b"], relationships, 2)
+
+        assert learned == {"bob": ["fact_a"], "carol": ["fact_b", "fact_a"]}
+        assert tracker.get_npc_knowledge("carol")[1].source_entity == "bob"
+
+    def test_unknown_source(self, tracker):
+        """Test a source that knows none of the facts spreads nothing."""
+        assert tracker.spread_knowledge(["nobody"], ["fact_a"], self.RELATIONSHIPS, 1) == {}
+
+
+class TestKnowledgeIndex:
+    """Tests for the NPC/fact indexes."""
+
+    def test_index_rebuilt_on_load(self, tmp_path):
+        """Test a reloaded tracker answers from rebuilt indexes."""
+        campaign_path = tmp_path / "campaign"
+        fact_db = FactDatabase(campaign_path)
+        tracker = NPCKnowledgeTracker(fact_db, campaign_path)
+        tracker.add_knowledge("zed", "fact_1", KnowledgeSource.WITNESSED, 1)
+        tracker.add_knowledge("amy", "fact_1", KnowledgeSource.WITNESSED, 1)
+        tracker.save()
+        tracker.reveal_to_npc("bob", "fact_1", "Frodo", 2)
+        tracker.save()
+
+        loaded = NPCKnowledgeTracker(fact_db, campaign_path)
+
+        assert loaded.query_npcs_who_know("fact_1") == ["zed", "amy", "bob"]
+        assert loaded.npc_knows_fact("bob", "fact_1")
+        assert not loaded.npc_knows_fact("bob", "fact_2")
+
+    @pytest.mark.slow
+    def test_benchmark(self, tmp_path):
+        """Test lookups answer from the index without scanning NPC knowledge."""
+        import random
+
+        class WatchedKnowledge(dict):
+            reads = 0
+
+            def _read(self):
+                WatchedKnowledge.reads += 1
+
+            def __getitem__(self, key):
+                self._read()
+                return super().__getitem__(key)
+
+            def __iter__(self):
+                self._read()
+                return super().__iter__()
+
+            def get(self, *args):
+                self._read()
+                return super().get(*args)
+
+            def items(self):
+                self._read()
+                return super().items()
+
+            def values(self):
+                self._read()
+                return super().values()
+
+        campaign_path = tmp_path / "campaign"
+        tracker = NPCKnowledgeTracker(FactDatabase(campaign_path), campaign_path)
+        rng = random.Random(5)
+        for npc in range(500):
+            for fact in rng.sample(range(5000), 40):
+                tracker.add_knowledge(f"npc_{npc}", f"fact_{fact}", KnowledgeSource.RUMOR, 1)
+
+        expected = {
+            f"fact_{fact}": [npc for npc, entries in tracker._npc_knowledge.items()
+                             if any(e.fact_id == f"fact_{fact}" for e in entries)]
+            for fact in range(200)
+        }
+        tracker._npc_knowledge = WatchedKnowledge(tracker._npc_knowledge)
+
+        indexed = {fact_id: tracker.query_npcs_who_know(fact_id) for fact_id in expected}
+
+        assert indexed == expected
+        assert WatchedKnowledge.reads == 0
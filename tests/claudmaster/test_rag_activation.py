@@ -291,8 +291,8 @@ class TestVectorLibrarySearch:
         count = search.index_source("test-book", entries, "test-book.pdf")
 
         assert count == 2
-        mock_collection.add.assert_called_once()
-        add_call = mock_collection.add.call_args
+        mock_collection.upsert.assert_called_once()
+        add_call = mock_collection.upsert.call_args
         assert len(add_call.kwargs["documents"]) == 2
         assert "class: Fighter" in add_call.kwargs["documents"][0]
 
@@ -347,6 +347,151 @@ class TestVectorLibrarySearch:
         )
 
 
+class TestVectorLibrarySearchFanOut:
+    """Test one embedding per search, fanned out to all source collections."""
+
+    @staticmethod
+    def make_collection(source_id: str, distances: list[float]) -> MagicMock:
+        collection = MagicMock()
+        collection.count.return_value = len(distances)
+        collection.query.return_value = {
+            "ids": [[f"{source_id}_{i}" for i in range(len(distances))]],
+            "documents": [[f"doc {i}" for i in range(len(distances))]],
+            "metadatas": [[{"title": f"{source_id} {i}", "page": i} for i in range(len(distances))]],
+            "distances": [distances],
+        }
+        return collection
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        """A manager with three sources, each with a mocked collection."""
+        manager = MagicMock()
+        manager._index_cache = {
+            source_id: MagicMock(filename=f"{source_id}.pdf") for source_id in ("a", "b", "c")
+        }
+        manager.has_extracted_content.side_effect = lambda source_id: source_id == "b"
+        collections = {
+            "library_a": self.make_collection("a", [0.5, 0.9]),
+            "library_b": self.make_collection("b", [0.1, 0.7]),
+            "library_c": self.make_collection("c", [0.3]),
+        }
+        embed = MagicMock(return_value=[[0.25, 0.75]])
+        store = MagicMock()
+        store._get_embedding_function.return_value = embed
+        store._client.get_collection.side_effect = lambda name, embedding_function: collections[name]
+        return manager, store, collections, embed
+
+    def test_query_embedded_once(self, library):
+        """search() embeds the query once and queries every collection by vector."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, collections, embed = library
+        VectorLibrarySearch(manager, store).search("frontline fighter", limit=3)
+
+        embed.assert_called_once_with(["frontline fighter"])
+        for collection in collections.values():
+            kwargs = collection.query.call_args.kwargs
+            assert kwargs["query_embeddings"] == [[0.25, 0.75]]
+            assert "query_texts" not in kwargs
+
+    def test_results_merged_top_k(self, library):
+        """search() keeps the best matches across sources."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, _, _ = library
+        results = VectorLibrarySearch(manager, store).search("fighter", limit=3)
+
+        assert [r.title for r in results] == ["b 0", "c 0", "a 0"]
+        assert [r.is_extracted for r in results] == [True, False, False]
+
+    def test_collections_and_counts_cached(self, library):
+        """Repeated searches reuse collection handles and counts."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, collections, _ = library
+        search = VectorLibrarySearch(manager, store)
+        search.search("fighter")
+        search.search("wizard")
+
+        assert store._client.get_collection.call_count == 3
+        assert all(c.count.call_count == 1 for c in collections.values())
+        assert all(c.query.call_count == 2 for c in collections.values())
+
+    def test_index_source_invalidates_cache(self, library):
+        """A source indexed after a search is found by the next search."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+        from dm20_protocol.library.models import TOCEntry
+
+        manager, store, collections, _ = library
+        manager._index_cache["d"] = MagicMock(filename="d.pdf")
+        search = VectorLibrarySearch(manager, store)
+        assert not search.is_source_indexed("d")
+
+        collections["library_d"] = self.make_collection("d", [0.0])
+        store._client.get_or_create_collection.return_value = collections["library_d"]
+        search.index_source("d", [TOCEntry(title="Paladin", page=1)], "d.pdf")
+
+        assert search.is_source_indexed("d")
+        assert search.search("paladin", limit=1)[0].source_id == "d"
+
+    def test_thread_pool_reused(self, library):
+        """Searches share one query pool, released by close()."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, _, _ = library
+        search = VectorLibrarySearch(manager, store)
+        search.search("fighter")
+        executor = search._executor
+        search.search("wizard")
+
+        assert executor is not None
+        assert search._executor is executor
+        search.close()
+        assert search._executor is None
+
+    def test_missing_collection_cached(self, library):
+        """A source without a collection is looked up once."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, _, _ = library
+        store._client.get_collection.side_effect = ValueError("Collection library_d does not exist.")
+        search = VectorLibrarySearch(manager, store)
+
+        assert not search.is_source_indexed("d")
+        assert not search.is_source_indexed("d")
+        assert store._client.get_collection.call_count == 1
+
+    def test_read_failure_retried(self, library):
+        """A failed collection lookup is not cached as a missing collection."""
+        from dm20_protocol.library import vector_search
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, collections, _ = library
+        store._client.get_collection.side_effect = [RuntimeError("database is locked"), collections["library_a"]]
+        search = VectorLibrarySearch(manager, store)
+
+        # Without chromadb installed its not-found error is aliased to Exception
+        with patch.object(vector_search, "ChromaNotFoundError", ValueError):
+            assert not search.is_source_indexed("a")
+            assert search.is_source_indexed("a")
+
+    def test_lookup_racing_invalidate_not_cached(self, library):
+        """A lookup that overlaps invalidate() is not cached."""
+        from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+        manager, store, collections, _ = library
+        search = VectorLibrarySearch(manager, store)
+
+        def get_collection(name, embedding_function):
+            search.invalidate("a")
+            return collections[name]
+
+        store._client.get_collection.side_effect = get_collection
+        assert search.is_source_indexed("a")
+        assert search.is_source_indexed("a")
+        assert store._client.get_collection.call_count == 2
+
+
 # ============================================================================
 # Part B: LibraryManager Backend Selection Tests
 # ============================================================================
@@ -366,7 +511,7 @@ class TestLibraryManagerBackendSelection:
         assert isinstance(manager.semantic_search, LibrarySearch)
 
     def test_save_index_triggers_vector_indexing(self, tmp_path):
-        """save_index() triggers vector indexing when backend active."""
+        """save_index() queues vector indexing when backend active."""
         from dm20_protocol.library.manager import LibraryManager
         from dm20_protocol.library.models import IndexEntry, ContentType, TOCEntry, SourceType
 
@@ -389,6 +534,7 @@ class TestLibraryManagerBackendSelection:
         )
         manager.save_index(index_entry)
 
+        assert manager.wait_for_vector_index(timeout=5)
         mock_vector_search.index_source.assert_called_once()
 
     def test_save_index_no_crash_without_vector(self, tmp_path):
@@ -447,6 +593,7 @@ class TestLibraryManagerBackendSelection:
 
         count = manager.load_all_indexes()
         assert count == 1
+        assert manager.wait_for_vector_index(timeout=5)
 
         # Should have backfilled the vector index
         mock_vector_search.is_source_indexed.assert_called_once_with("test-book")
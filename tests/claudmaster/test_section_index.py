@@ -0,0 +1,179 @@
+"""
+Tests for the MinHash/LSH section index behind ContentTagger.
+
+Tests cover:
+- Tokenization and exact Jaccard matching the previous implementation
+- Exhaustive comparison for small modules, LSH candidates for large ones
+- Same canonical/hybrid/improvised decisions as comparing every section
+- Lazy construction on the first lookup
+- Benchmark (slow): a 2000-section module over a 20k-word vocabulary,
+  counting exact comparisons instead of timing them
+"""
+
+import random
+
+import pytest
+
+from dm20_protocol.claudmaster.content_tagging import ContentOrigin, ContentTagger
+from dm20_protocol.claudmaster.section_index import SectionIndex, jaccard, tokenize
+
+
+def brute_force_classify(tagger: ContentTagger, content: str):
+    """The previous implementation: Jaccard with every section, re-tokenized."""
+    best_section = None
+    best_similarity = 0.0
+    for section_id, module_text in tagger.module_content.items():
+        similarity = tagger._jaccard_similarity(content, module_text)
+        if similarity > best_similarity:
+            best_similarity = similarity
+            best_section = section_id
+    if best_similarity >= tagger.similarity_threshold:
+        return (ContentOrigin.CANONICAL, best_similarity, best_section)
+    if best_similarity >= tagger.similarity_threshold * 0.5:
+        return (ContentOrigin.HYBRID, best_similarity, best_section)
+    return (ContentOrigin.IMPROVISED, 1.0 - best_similarity, None)
+
+
+def generated_module(sections: int, seed: int = 7, vocabulary_size: int = 3000) -> dict[str, str]:
+    """Room descriptions of 40-80 words drawn from a generated vocabulary."""
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(vocabulary_size)]
+    return {
+        f"area_{i}": " ".join(rng.choices(vocabulary, k=rng.randint(40, 80))) + "."
+        for i in range(sections)
+    }
+
+
+def generated_narratives(module: dict[str, str], count: int, seed: int = 11) -> list[str]:
+    """Copies, edited copies and mixes of module sections, and unrelated text."""
+    rng = random.Random(seed)
+    texts = list(module.values())
+    narratives = []
+    for i in range(count):
+        words = rng.choice(texts).rstrip(".").split()
+        kind = i % 4
+        if kind == 0:
+            words = words[:]
+        elif kind == 1:
+            # Replace a fraction of the words with improvised ones
+            ratio = rng.uniform(0.05, 0.6)
+            words = [f"new{rng.randint(0, 500)}" if rng.random() < ratio else w for w in words]
+        elif kind == 2:
+            words = words[: len(words) // 2] + rng.choice(texts).rstrip(".").split()[:20]
+        else:
+            words = [f"new{rng.randint(0, 500)}" for _ in range(50)] + words[:3]
+        narratives.append(" ".join(words) + ".")
+    return narratives
+
+
+class TestSectionIndex:
+    """Tests for the index itself."""
+
+    def test_tokenize_keeps_alphanumeric_words(self):
+        assert tokenize("You enter a DARK chamber. Its door, oak") == {"you", "enter", "a", "dark", "its", "oak"}
+
+    def test_jaccard(self):
+        assert jaccard(tokenize("hello world"), tokenize("hello there")) == pytest.approx(1 / 3)
+        assert jaccard(frozenset(), tokenize("hello")) == 0.0
+
+    def test_small_module_compares_every_section(self):
+        index = SectionIndex({"a": "one two three", "b": "", "c": "three four five"})
+
+        assert index.candidates(tokenize("unrelated words")) == [0, 2]
+        assert index.best_match(tokenize("three four")) == ("c", pytest.approx(2 / 3))
+
+    def test_ties_go_to_first_section(self):
+        index = SectionIndex({"a": "red door", "b": "red door"}, exact_scan_below=1)
+
+        assert index.best_match(tokenize("red door")) == ("a", 1.0)
+
+    def test_lsh_candidates(self):
+        module = generated_module(200)
+        index = SectionIndex(module)
+        query = tokenize(module["area_42"])
+
+        candidates = index.candidates(query)
+
+        assert 42 in candidates
+        assert len(candidates) < 20
+        assert index.best_match(query) == ("area_42", 1.0)
+
+    def test_unknown_words_only(self):
+        index = SectionIndex(generated_module(100))
+
+        assert index.candidates(tokenize("nothing from the module")) == []
+        assert index.best_match(tokenize("nothing from the module")) == (None, 0.0)
+
+    def test_built_on_first_lookup(self):
+        index = SectionIndex(generated_module(100))
+        assert not index.built
+
+        index.best_match(tokenize("w1 w2 w3"))
+
+        assert index.built
+
+    def test_tagger_rebuilds_index(self):
+        tagger = ContentTagger({})
+        tagger.module_content = {"room1": "You enter a dark chamber."}
+        assert not tagger._section_index.built
+
+        assert tagger.tag_narrative("You enter a dark chamber.", agent_id="narrator").tag.origin == (
+            ContentOrigin.CANONICAL
+        )
+
+
+@pytest.fixture(scope="module")
+def tagger() -> ContentTagger:
+    """A tagger over a module large enough to use LSH candidates."""
+    return ContentTagger(generated_module(2000))
+
+
+class TestClassificationEquivalence:
+    """LSH classification against comparing every section."""
+
+    def test_same_decisions(self, tagger):
+        narratives = generated_narratives(tagger.module_content, 100)
+
+        results = [(tagger._classify_origin(n), brute_force_classify(tagger, n)) for n in narratives]
+
+        origins = [expected[0] for _, expected in results]
+        assert {ContentOrigin.CANONICAL, ContentOrigin.HYBRID, ContentOrigin.IMPROVISED} <= set(origins)
+        for (origin, confidence, section), (expected_origin, expected_confidence, expected_section) in results:
+            assert origin == expected_origin
+            assert section == expected_section
+            if origin != ContentOrigin.IMPROVISED:
+                assert confidence == expected_confidence
+            else:
+                # Distant sections may not be compared at all
+                assert expected_confidence <= confidence <= 1.0
+
+    def test_same_segments(self, tagger):
+        texts = list(tagger.module_content.values())
+        content = f"{texts[3]} The walls drip with strange ichor. {texts[8]}"
+
+        segments = tagger._segment_hybrid(content)
+
+        assert [(s.origin, s.source_reference) for s in segments] == [
+            (ContentOrigin.CANONICAL, "area_3"),
+            (ContentOrigin.IMPROVISED, None),
+            (ContentOrigin.CANONICAL, "area_8"),
+        ]
+
+
+@pytest.mark.slow
+class TestClassificationBenchmark:
+    """Classification compares a handful of sections, not the whole module."""
+
+    def test_large_module_vs_brute_force(self):
+        module = generated_module(2000, vocabulary_size=20000)
+        tagger = ContentTagger(module)
+        index = tagger._section_index
+        narratives = generated_narratives(module, 200, seed=5)
+
+        indexed = [tagger._classify_origin(n)[0] for n in narratives]
+        compared = [len(index.candidates(tokenize(n))) for n in narratives]
+
+        assert indexed[:20] == [brute_force_classify(tagger, n)[0] for n in narratives[:20]]
+        # Exact comparisons per narrative instead of one per section
+        assert sum(compared) / len(compared) < len(module) / 100
+        assert len(index._token_hashes) <= 20000
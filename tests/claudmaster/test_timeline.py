@@ -7,6 +7,7 @@ in-game time progression and event tracking.
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from dm20_protocol.claudmaster.consistency.timeline import (
     GameTime,
@@ -357,3 +358,95 @@ class TestTimelineTracker:
         assert len(events) == 1
         assert events[0].description == "Saved event"
         assert events[0].location == "Castle"
+
+
+class TestSortedTimeline:
+    """Tests for the sorted event index behind range queries."""
+
+    @staticmethod
+    def random_events(count, seed=3):
+        import random
+
+        rng = random.Random(seed)
+        return [
+            TimelineEvent(
+                id=f"evt_{i:05d}",
+                game_time=GameTime(month=rng.randint(1, 12), day=rng.randint(1, 30),
+                                   hour=rng.randint(0, 23), minute=rng.choice([0, 30])),
+                real_session=1,
+                description=f"Event {i}",
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def scan_between(events, start, end):
+        """The previous implementation: sort after every insert, then scan."""
+        s, e = start._to_total_minutes(), end._to_total_minutes()
+        ordered = sorted(events, key=lambda ev: ev.game_time._to_total_minutes())
+        return [ev for ev in ordered if s <= ev.game_time._to_total_minutes() <= e]
+
+    def test_same_results_as_scan(self, tmp_path):
+        """Test bisected queries match a full scan, ties in insertion order."""
+        tracker = TimelineTracker(tmp_path)
+        events = self.random_events(3000)
+        for event in events:
+            tracker.add_event(event)
+
+        ranges = [
+            (GameTime(month=3, day=1), GameTime(month=3, day=30, hour=23, minute=59)),
+            (GameTime(month=6, day=10, hour=12), GameTime(month=6, day=10, hour=12)),
+            (GameTime(month=12, day=30, hour=23, minute=59), GameTime(month=1, day=1)),
+            (GameTime(month=1, day=1, hour=0), GameTime(month=12, day=30, hour=23, minute=59)),
+        ]
+        for start, end in ranges:
+            assert [e.id for e in tracker.get_events_between(start, end)] == [
+                e.id for e in self.scan_between(events, start, end)
+            ]
+        for event in events[:50]:
+            assert [e.id for e in tracker.get_events_at(event.game_time)] == [
+                e.id for e in self.scan_between(events, event.game_time, event.game_time)
+            ]
+
+    def test_order_kept_after_reload(self, tmp_path):
+        """Test a reloaded timeline answers queries like the original."""
+        tracker = TimelineTracker(tmp_path)
+        for event in self.random_events(200):
+            tracker.add_event(event)
+        tracker.save()
+        for event in self.random_events(50, seed=4):
+            event.id = f"late_{event.id}"
+            tracker.add_event(event)
+        tracker.save()
+
+        loaded = TimelineTracker(tmp_path)
+
+        start, end = GameTime(month=2), GameTime(month=9)
+        assert [e.id for e in loaded.get_events_between(start, end)] == [
+            e.id for e in tracker.get_events_between(start, end)
+        ]
+
+    @pytest.mark.slow
+    def test_benchmark(self, tmp_path):
+        """Test inserts and queries convert times once, not per stored event."""
+        tracker = TimelineTracker(tmp_path)
+        events = self.random_events(30_000)
+        start, end = GameTime(month=4, day=1), GameTime(month=4, day=2)
+        probe = TimelineEvent(game_time=GameTime(month=5, day=5, hour=5), real_session=1,
+                              description="Probe", location="Here", characters_involved=["Alice"])
+
+        with patch.object(GameTime, "_to_total_minutes", autospec=True,
+                          side_effect=GameTime._to_total_minutes) as to_minutes:
+            for event in events:
+                tracker.add_event(event)
+            insert_conversions = to_minutes.call_count
+
+            to_minutes.reset_mock()
+            found = tracker.get_events_between(start, end)
+            tracker.validate_temporal_order(probe)
+            query_conversions = to_minutes.call_count
+
+        # A sorted list rescan would convert every stored event again
+        assert insert_conversions == len(events)
+        assert query_conversions <= 3
+        assert [e.id for e in found] == [e.id for e in self.scan_between(events, start, end)]
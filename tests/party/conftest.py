@@ -91,7 +91,7 @@ def e2e_permission_resolver() -> PermissionResolver:
 @pytest.fixture
 def e2e_mock_storage() -> MagicMock:
     """Mock DnDStorage returning test characters."""
-    storage = MagicMock(spec=["get_character"])
+    storage = MagicMock(spec=["get_character", "get_character_view"])
 
     def _get(char_id: str) -> Character:
         if char_id in CHARACTERS:
@@ -99,6 +99,7 @@ def e2e_mock_storage() -> MagicMock:
         raise ValueError(f"Character {char_id} not found")
 
     storage.get_character.side_effect = _get
+    storage.get_character_view.side_effect = lambda char_id: (0, _get(char_id).model_dump(mode="json"))
     return storage
 
 
@@ -0,0 +1,242 @@
+"""
+Tests for versioned character views in Party Mode.
+
+Tests cover:
+- JSON Patch generation and application
+- Per-character revisions and saved views in DnDStorage
+- ETag / If-None-Match handling on GET /character/{player_id}
+- character_patch pushes to the owning player when the host saves
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from starlette.testclient import TestClient
+
+from dm20_protocol.claudmaster.pc_tracking import MultiPlayerConfig, PCRegistry
+from dm20_protocol.models import Character, CharacterClass, Item, Race
+from dm20_protocol.party.patch import apply_patch, make_patch
+from dm20_protocol.party.server import PartyServer
+from dm20_protocol.permissions import PermissionResolver, PlayerRole
+from dm20_protocol.storage import DnDStorage
+
+
+@pytest.fixture
+def anyio_backend():
+    """Configure anyio to use asyncio backend."""
+    return "asyncio"
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    storage = DnDStorage(data_dir=tmp_path / "data")
+    storage.create_campaign(name="Sync", description="Character sync test")
+    for name, player in [("Thorin", "thorin"), ("Elara", "elara")]:
+        storage.add_character(Character(
+            name=name,
+            player_name=player,
+            race=Race(name="Human"),
+            character_class=CharacterClass(name="Fighter", level=3),
+            hit_points_max=30,
+            hit_points_current=30,
+        ))
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def server(storage: DnDStorage, tmp_path: Path) -> PartyServer:
+    return _make_server(storage, tmp_path)
+
+
+def _make_server(storage: DnDStorage, tmp_path: Path) -> PartyServer:
+    registry = PCRegistry(MultiPlayerConfig(max_players=4))
+    resolver = PermissionResolver()
+    for pid in ("thorin", "elara"):
+        registry.join_session(pid, f"Player-{pid}", PlayerRole.PLAYER)
+        resolver.set_player_role(pid, PlayerRole.PLAYER)
+        resolver.register_character_ownership(pid, pid)
+    server = PartyServer(
+        pc_registry=registry,
+        permission_resolver=resolver,
+        storage=storage,
+        campaign_dir=tmp_path / "campaign",
+        host="127.0.0.1",
+        port=9998,
+    )
+    for pid in ("thorin", "elara"):
+        server.token_manager.generate_token(pid)
+    return server
+
+
+def _damage(storage: DnDStorage, name: str, hp: int) -> None:
+    storage.get_character(name).hit_points_current = hp
+    storage.save()
+
+
+class TestPatch:
+    """Tests for make_patch / apply_patch."""
+
+    def test_equal_documents(self) -> None:
+        assert make_patch({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+    def test_round_trip(self) -> None:
+        old = {"hp": 30, "notes": "x", "slots": {"1": 2}, "tags": ["a", "b"], "a/b": 1}
+        new = {"hp": 12, "slots": {"1": 1, "2": 1}, "tags": ["a", "b", "c"], "a/b": 2}
+
+        patch = make_patch(old, new)
+
+        assert apply_patch(json.loads(json.dumps(old)), patch) == new
+        assert {"op": "replace", "path": "/a~1b", "value": 2} in patch
+
+    def test_list_insert_is_one_operation(self) -> None:
+        old = {"inventory": [{"name": "Rope"}, {"name": "Torch"}]}
+        new = {"inventory": [{"name": "Dagger"}, {"name": "Rope"}, {"name": "Torch"}]}
+
+        assert make_patch(old, new) == [
+            {"op": "add", "path": "/inventory/0", "value": {"name": "Dagger"}},
+        ]
+
+    def test_invalid_path(self) -> None:
+        with pytest.raises(ValueError):
+            apply_patch({"a": 1}, [{"op": "replace", "path": "/b/c", "value": 1}])
+
+
+class TestStorageRevisions:
+    """Tests for per-character revisions in DnDStorage."""
+
+    def test_save_bumps_only_changed_characters(self, storage: DnDStorage) -> None:
+        thorin, elara = storage.get_character_view("thorin")[0], storage.get_character_view("elara")[0]
+
+        _damage(storage, "Thorin", 20)
+
+        assert storage.get_character_view("thorin")[0] == thorin + 1
+        assert storage.get_character_view("elara")[0] == elara
+        assert storage.get_character_view("nobody") is None
+
+    def test_updated_callback(self, storage: DnDStorage) -> None:
+        events = []
+        storage.register_character_callback(lambda action, *args: events.append((action, args)))
+
+        _damage(storage, "Thorin", 20)
+
+        [(action, (name, revision, previous, data))] = [e for e in events if e[0] == "updated"]
+        assert name == "Thorin"
+        assert revision == storage.get_character_view("Thorin")[0]
+        assert (previous["hit_points_current"], data["hit_points_current"]) == (30, 20)
+        assert events[-1][0] == "saved"
+
+    def test_view_is_saved_state_under_write_behind(self, tmp_path: Path) -> None:
+        storage = DnDStorage(data_dir=tmp_path, write_behind=True, write_behind_delay=60)
+        storage.create_campaign(name="Deferred", description="Write-behind test")
+        storage.add_character(Character(name="Vex", race=Race(name="Elf"), character_class=CharacterClass(name="Rogue", level=1)))
+        storage.flush()
+        revision, data = storage.get_character_view("Vex")
+
+        storage.get_character("Vex").notes = "Pending"
+        storage.save()
+        assert storage.get_character_view("Vex") == (revision, data)
+
+        storage.flush()
+        new_revision, new_data = storage.get_character_view("Vex")
+        assert (new_revision, new_data["notes"]) == (revision + 1, "Pending")
+        storage.close()
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match on GET /character/{player_id}."""
+
+    def test_not_modified_until_saved(self, server: PartyServer, storage: DnDStorage) -> None:
+        client = TestClient(server.app)
+        url = f"/character/thorin?token={server.token_manager.get_all_tokens()['thorin']}"
+
+        first = client.get(url)
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert first.json()["name"] == "Thorin"
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        _damage(storage, "Thorin", 11)
+
+        fresh = client.get(url, headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert fresh.json()["hit_points_current"] == 11
+
+    def test_etag_list_and_weak_match(self, server: PartyServer) -> None:
+        client = TestClient(server.app)
+        url = f"/character/thorin?token={server.token_manager.get_all_tokens()['thorin']}"
+        etag = client.get(url).headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": f'"other", W/{etag}'})
+
+        assert response.status_code == 304
+
+    def test_unsaved_character_has_no_etag(self, tmp_path: Path) -> None:
+        storage = DnDStorage(data_dir=tmp_path / "data", write_behind=True, write_behind_delay=60)
+        storage.create_campaign(name="Deferred", description="Write-behind test")
+        storage.add_character(Character(
+            name="Thorin",
+            player_name="thorin",
+            race=Race(name="Dwarf"),
+            character_class=CharacterClass(name="Fighter", level=3),
+            hit_points_max=30,
+            hit_points_current=30,
+        ))
+        server = _make_server(storage, tmp_path)
+        client = TestClient(server.app)
+        url = f"/character/thorin?token={server.token_manager.get_all_tokens()['thorin']}"
+
+        first = client.get(url)
+        assert first.status_code == 200
+        assert "etag" not in first.headers
+        assert storage.get_character_view("thorin")[0] is None
+
+        _damage(storage, "Thorin", 12)
+
+        fresh = client.get(url, headers={"If-None-Match": f'"{server._etag_prefix}-{first.json()["id"]}-0"'})
+        assert fresh.status_code == 200
+        assert fresh.json()["hit_points_current"] == 12
+        storage.close()
+
+
+class TestCharacterPatchPush:
+    """Tests for character_patch messages."""
+
+    @pytest.mark.anyio
+    async def test_patch_goes_to_owner_and_applies(self, server: PartyServer, storage: DnDStorage) -> None:
+        thorin_ws, elara_ws = AsyncMock(), AsyncMock()
+        server.connection_manager._connections = {"thorin": {thorin_ws}, "elara": {elara_ws}}
+        server._loop = asyncio.get_running_loop()
+        storage.register_character_callback(server._on_character_event)
+        client_revision, client_data = storage.get_character_view("thorin")
+        client_data = json.loads(json.dumps(client_data))
+
+        character = storage.get_character("Thorin")
+        character.hit_points_current = 7
+        character.inventory.append(Item(name="Healing Potion"))
+        storage.save()
+        for _ in range(50):
+            if thorin_ws.send_json.called:
+                break
+            await asyncio.sleep(0.01)
+
+        [message] = [call.args[0] for call in thorin_ws.send_json.call_args_list]
+        elara_ws.send_json.assert_not_called()
+        assert message["type"] == "character_patch"
+        assert message["base_etag"] == server._character_etag(character.id, client_revision)
+        assert message["etag"] == server._character_etag(character.id, client_revision + 1)
+        assert len(json.dumps(message["patch"])) < len(json.dumps(client_data))
+
+        patched = apply_patch(client_data, json.loads(json.dumps(message["patch"])))
+        assert patched == json.loads(json.dumps(storage.get_character_view("thorin")[1]))
+        storage.unregister_character_callback(server._on_character_event)
@@ -0,0 +1,242 @@
+"""
+Tests for per-connection outbound queues.
+
+Tests concurrent fan-out, slow connections not delaying others,
+combat-state coalescing, backpressure that never drops narrative,
+and the queue metrics exposed on /status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dm20_protocol.party.outbox import Outbox
+from dm20_protocol.party.server import ConnectionManager
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    """Configure anyio to use asyncio backend."""
+    return "asyncio"
+
+
+def slow_ws(delay: float) -> AsyncMock:
+    """A WebSocket whose sends take ``delay`` seconds."""
+    ws = AsyncMock()
+
+    async def send_json(message: dict) -> None:
+        await asyncio.sleep(delay)
+
+    ws.send_json = AsyncMock(side_effect=send_json)
+    return ws
+
+
+def blocked_ws() -> tuple[AsyncMock, asyncio.Event]:
+    """A WebSocket whose sends wait until the returned event is set."""
+    ws = AsyncMock()
+    release = asyncio.Event()
+
+    async def send_json(message: dict) -> None:
+        await release.wait()
+
+    ws.send_json = AsyncMock(side_effect=send_json)
+    return ws, release
+
+
+def sent_types(ws: AsyncMock) -> list[str]:
+    return [call[0][0]["type"] for call in ws.send_json.call_args_list]
+
+
+class TestFanOut:
+    """Broadcasts go out concurrently."""
+
+    async def test_broadcast_is_concurrent(self) -> None:
+        cm = ConnectionManager()
+        in_flight = peak = 0
+
+        async def send_json(message: dict) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        sockets = [AsyncMock() for _ in range(6)]
+        for ws in sockets:
+            ws.send_json = AsyncMock(side_effect=send_json)
+        cm._connections = {f"player_{i}": {ws} for i, ws in enumerate(sockets)}
+
+        sent = await cm.broadcast({"type": "narrative", "content": "The door creaks."})
+
+        assert sent == 6
+        assert all(ws.send_json.called for ws in sockets)
+        # Serial sends would never overlap
+        assert peak == 6
+
+    async def test_slow_connection_does_not_delay_others(self) -> None:
+        cm = ConnectionManager(send_timeout=0.05)
+        slow, release = blocked_ws()
+        fast = AsyncMock()
+        cm._connections = {"slow": {slow}, "fast": {fast}}
+
+        for i in range(3):
+            await cm.broadcast({"type": "narrative", "content": f"Line {i}"})
+
+        # Every line reached the fast socket while the slow one is stuck on the first
+        assert fast.send_json.call_count == 3
+        assert slow.send_json.call_count == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert sent_types(slow) == ["narrative"] * 3
+
+    async def test_failed_send_not_counted(self) -> None:
+        cm = ConnectionManager()
+        broken = AsyncMock()
+        broken.send_json.side_effect = RuntimeError("gone")
+        cm._connections = {"thorin": {broken, AsyncMock()}}
+
+        assert await cm.send_to_player("thorin", {"type": "narrative"}) == 1
+
+    async def test_order_kept_per_connection(self) -> None:
+        cm = ConnectionManager()
+        ws = slow_ws(0.001)
+        cm._connections = {"thorin": {ws}}
+
+        for i in range(20):
+            await cm.send_to_player("thorin", {"type": "narrative", "n": i}, wait=False)
+        await cm.send_to_player("thorin", {"type": "narrative", "n": 20})
+
+        assert [call[0][0]["n"] for call in ws.send_json.call_args_list] == list(range(21))
+
+
+class TestBackpressure:
+    """Stale combat state is coalesced or dropped, narrative never."""
+
+    async def test_combat_state_coalesced(self) -> None:
+        ws, release = blocked_ws()
+        outbox = Outbox("thorin", ws)
+
+        outbox.put({"type": "combat_state", "round": 1})
+        await asyncio.sleep(0)  # round 1 is now being sent
+        outbox.put({"type": "combat_state", "round": 2})
+        outbox.put({"type": "narrative", "content": "The orc falls."})
+        outbox.put({"type": "combat_state", "round": 3})
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        messages = [call[0][0] for call in ws.send_json.call_args_list]
+        assert [m.get("round") for m in messages] == [1, 3, None]
+        assert outbox.coalesced == 1
+
+    async def test_full_queue_drops_combat_state_not_narrative(self) -> None:
+        ws, release = blocked_ws()
+        outbox = Outbox("thorin", ws, max_queue=3)
+        outbox.put({"type": "narrative", "n": 0})
+        await asyncio.sleep(0)
+
+        outbox.put({"type": "combat_state"})
+        outbox.put({"type": "narrative", "n": 1})
+        outbox.put({"type": "system"})
+        assert outbox.put({"type": "narrative", "n": 2})
+        assert outbox.put({"type": "private", "n": 3})
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert sent_types(ws) == ["narrative", "narrative", "narrative", "private"]
+        assert outbox.dropped == 2
+
+    async def test_dropped_message_resolves_waiter(self) -> None:
+        ws, release = blocked_ws()
+        outbox = Outbox("thorin", ws, max_queue=1)
+        outbox.put({"type": "narrative"})
+        await asyncio.sleep(0)
+        waiter = asyncio.get_running_loop().create_future()
+
+        outbox.put({"type": "system"}, waiter)
+        outbox.put({"type": "narrative"})
+
+        assert waiter.done() and waiter.result() is False
+        release.set()
+
+    async def test_audio_chunks_not_dropped(self) -> None:
+        ws, release = blocked_ws()
+        outbox = Outbox("thorin", ws, max_queue=2)
+        outbox.put({"type": "narrative"})
+        await asyncio.sleep(0)
+        outbox.put({"type": "audio", "sequence": 0, "total_chunks": 3})
+        outbox.put({"type": "audio", "sequence": 1, "total_chunks": 3})
+
+        assert not outbox.put({"type": "audio", "sequence": 2, "total_chunks": 3})
+        await asyncio.sleep(0)
+
+        # Closed so the client reconnects, rather than playing a broken clip
+        assert outbox.closed
+        assert outbox.dropped == 0
+        ws.close.assert_awaited_once()
+        release.set()
+
+    async def test_queue_full_of_narrative_closes_connection(self) -> None:
+        ws, release = blocked_ws()
+        outbox = Outbox("thorin", ws, max_queue=2)
+        for i in range(3):
+            outbox.put({"type": "narrative", "n": i})
+        await asyncio.sleep(0)
+
+        assert not outbox.put({"type": "narrative", "n": 3})
+        await asyncio.sleep(0)
+
+        assert outbox.closed
+        ws.close.assert_awaited_once()
+        assert ws.close.call_args.kwargs["code"] == 1013
+        release.set()
+
+
+class TestMetrics:
+    """Per-connection queue metrics."""
+
+    async def test_latency_and_counts(self) -> None:
+        cm = ConnectionManager()
+        ws = slow_ws(0.01)
+        cm._connections = {"thorin": {ws}}
+
+        await cm.send_to_player("thorin", {"type": "narrative"})
+        await cm.send_to_player("thorin", {"type": "narrative"})
+
+        [metrics] = cm.get_connection_metrics()["thorin"]
+        assert metrics["sent"] == 2
+        assert metrics["queue_depth"] == 0
+        assert metrics["last_latency_ms"] >= 10
+        assert metrics["max_latency_ms"] >= metrics["last_latency_ms"]
+
+    async def test_disconnect_stops_writer(self) -> None:
+        cm = ConnectionManager()
+        ws = AsyncMock()
+        await cm.connect("thorin", ws)
+        outbox = cm._outboxes[ws]
+
+        cm.disconnect("thorin", ws)
+        await asyncio.sleep(0)
+
+        assert outbox.closed
+        assert cm.get_connection_metrics() == {}
+
+    async def test_replaced_outbox_is_closed(self) -> None:
+        cm = ConnectionManager()
+        ws = AsyncMock()
+        await cm.connect("thorin", ws)
+        stale = cm._outboxes[ws]
+        stale._task.cancel()
+        await asyncio.sleep(0)
+
+        assert await cm.send_to_player("thorin", {"type": "narrative"}) == 1
+
+        assert stale.closed
+        assert cm._outboxes[ws] is not stale
@@ -87,6 +87,9 @@ def mock_storage() -> MagicMock:
         raise ValueError(f"Character {char_id} not found")
 
     storage.get_character.side_effect = get_character_side_effect
+    storage.get_character_view.side_effect = lambda char_id: (
+        0, get_character_side_effect(char_id).model_dump(mode="json")
+    )
 
     return storage
 
@@ -349,6 +352,23 @@ class TestPartyServerRoutes:
         assert "connected_players" in data
         assert data["active_pcs"] == 3  # aragorn, legolas, OBSERVER
 
+    def test_get_status_connection_metrics(self, party_server: PartyServer) -> None:
+        """Test GET /status reports outbound queue metrics per connection."""
+        client = TestClient(party_server.app)
+        token = party_server.token_manager.get_all_tokens()["aragorn"]
+
+        with client.websocket_connect(f"/ws?token={token}") as websocket:
+            websocket.receive_json()
+            websocket.receive_json()
+
+            data = client.get("/status").json()
+
+        [metrics] = data["connections"]["aragorn"]
+        assert metrics["sent"] == 2
+        assert metrics["dropped"] == 0
+        assert "queue_depth" in metrics
+        assert "avg_latency_ms" in metrics
+
 
 class TestPartyServerWebSocket:
     """Tests for PartyServer WebSocket endpoint."""
@@ -0,0 +1,139 @@
+"""
+Unit tests for the campaign registry.
+
+Tests cover:
+- Registry maintenance on create/load/delete and entity count updates
+- Startup and list_campaigns served from the registry without scanning
+- Fallback to a directory scan when the registry is missing, stale or corrupt
+"""
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dm20_protocol.campaign_registry import CampaignRegistry
+from dm20_protocol.models import NPC
+from dm20_protocol.storage import DnDStorage, StorageFormat
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    storage = DnDStorage(data_dir=tmp_path)
+    storage.create_campaign(name="First", description="First campaign")
+    storage.add_npc(NPC(name="Barkeep"))
+    storage.create_campaign(name="Second", description="Second campaign")
+    storage.load_campaign("First")
+    return tmp_path
+
+
+def _registry_data(data_dir: Path) -> dict:
+    return json.loads((data_dir / "campaign_registry.json").read_text())
+
+
+class TestRegistryMaintenance:
+    """Tests for keeping the registry file up to date."""
+
+    def test_create_and_load_are_recorded(self, data_dir: Path) -> None:
+        data = _registry_data(data_dir)
+
+        assert set(data["campaigns"]) == {"First", "Second"}
+        assert data["current"] == "First"
+        assert data["campaigns"]["First"]["format"] == StorageFormat.SPLIT
+
+    def test_counts_follow_saves(self, data_dir: Path) -> None:
+        storage = DnDStorage(data_dir=data_dir)
+        storage.add_npc(NPC(name="Guard"))
+
+        assert _registry_data(data_dir)["campaigns"]["First"]["counts"]["npcs"] == 2
+
+    def test_delete_removes_entry(self, data_dir: Path) -> None:
+        storage = DnDStorage(data_dir=data_dir)
+        storage.delete_campaign("Second")
+
+        assert set(_registry_data(data_dir)["campaigns"]) == {"First"}
+        assert storage.list_campaigns() == ["First"]
+
+    def test_summaries_include_counts(self, data_dir: Path) -> None:
+        storage = DnDStorage(data_dir=data_dir)
+        summaries = {entry.name: entry for entry in storage.campaign_summaries()}
+
+        assert summaries["First"].counts["npcs"] == 1
+        assert summaries["Second"].counts["sessions"] == 0
+
+
+class TestRegistryStartup:
+    """Tests for startup and listing from the registry."""
+
+    def test_startup_loads_registered_campaign_without_scan(self, data_dir: Path) -> None:
+        with patch.object(DnDStorage, "_scan_campaigns") as scan, \
+                patch.object(DnDStorage, "_detect_campaign_format") as detect:
+            storage = DnDStorage(data_dir=data_dir)
+            names = storage.list_campaigns()
+
+        scan.assert_not_called()
+        detect.assert_not_called()
+        assert storage.get_current_campaign().name == "First"
+        assert names == ["First", "Second"]
+
+    def test_missing_registry_falls_back_to_scan(self, data_dir: Path) -> None:
+        (data_dir / "campaign_registry.json").unlink()
+
+        storage = DnDStorage(data_dir=data_dir)
+
+        assert storage.list_campaigns() == ["First", "Second"]
+        assert (data_dir / "campaign_registry.json").exists()
+
+    def test_corrupt_registry_falls_back_to_scan(self, data_dir: Path) -> None:
+        (data_dir / "campaign_registry.json").write_text("{not json")
+
+        storage = DnDStorage(data_dir=data_dir)
+
+        assert storage.get_current_campaign() is not None
+        assert storage.list_campaigns() == ["First", "Second"]
+
+    def test_campaign_added_externally_marks_registry_stale(self, data_dir: Path) -> None:
+        storage = DnDStorage(data_dir=data_dir)
+        external = data_dir / "campaigns" / "Imported.json"
+        monolithic = json.loads((data_dir / "campaigns" / "First" / "campaign.json").read_text())
+        external.write_text(json.dumps({**monolithic, "name": "Imported"}))
+
+        assert "Imported" in storage.list_campaigns()
+
+    def test_registered_campaign_removed_externally(self, data_dir: Path) -> None:
+        shutil.rmtree(data_dir / "campaigns" / "First")
+
+        storage = DnDStorage(data_dir=data_dir)
+
+        assert storage.get_current_campaign().name == "Second"
+        assert storage.list_campaigns() == ["Second"]
+
+
+class TestCampaignRegistry:
+    """Tests for the registry class itself."""
+
+    def test_round_trip_and_freshness(self, tmp_path: Path) -> None:
+        campaigns_dir = tmp_path / "campaigns"
+        campaigns_dir.mkdir()
+        registry = CampaignRegistry(tmp_path / "registry.json", campaigns_dir)
+        registry.record("Alpha", StorageFormat.SPLIT, {"npcs": 3})
+        registry.save()
+
+        reloaded = CampaignRegistry(tmp_path / "registry.json", campaigns_dir)
+        assert reloaded.load()
+        assert reloaded.most_recent().name == "Alpha"
+        assert reloaded.get("Alpha").counts == {"npcs": 3}
+
+        (campaigns_dir / "Beta").mkdir()
+        assert not CampaignRegistry(tmp_path / "registry.json", campaigns_dir).load()
+
+    def test_replace_keeps_known_counts(self, tmp_path: Path) -> None:
+        registry = CampaignRegistry(tmp_path / "registry.json", tmp_path)
+        registry.record("Alpha", StorageFormat.SPLIT, {"npcs": 3})
+        scanned = registry.get("Alpha").model_copy(update={"counts": {}})
+
+        registry.replace([scanned])
+
+        assert registry.get("Alpha").counts == {"npcs": 3}
@@ -0,0 +1,295 @@
+"""
+Unit tests for per-entity change tracking in the storage layer.
+
+Tests cover:
+- TrackedEntities marking on lookup, write and bulk access
+- ChangeTracker collect/commit semantics
+- DnDStorage saves writing only changed entities (split and monolithic)
+- Direct edits followed by storage.save(), including through kept references
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dm20_protocol.change_tracker import ChangeTracker, TrackedEntities
+from dm20_protocol.models import (
+    NPC,
+    Campaign,
+    Character,
+    CharacterClass,
+    GameState,
+    Quest,
+    Race,
+    SessionNote,
+)
+from dm20_protocol.storage import DnDStorage
+
+
+def _make_character(name: str, player: str | None = None) -> Character:
+    return Character(
+        name=name,
+        player_name=player,
+        character_class=CharacterClass(name="Fighter", level=3),
+        race=Race(name="Human"),
+    )
+
+
+@pytest.fixture
+def campaign() -> Campaign:
+    """A campaign with a few entities, not yet tracked."""
+    campaign = Campaign(
+        name="Tracked",
+        description="Change tracking test",
+        game_state=GameState(campaign_name="Tracked"),
+    )
+    for i in range(5):
+        campaign.npcs[f"NPC {i}"] = NPC(name=f"NPC {i}")
+    campaign.characters["Hero"] = _make_character("Hero", "Ann")
+    return campaign
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> DnDStorage:
+    """Storage with a fresh split campaign."""
+    storage = DnDStorage(data_dir=tmp_path / "data")
+    storage.create_campaign(name="Tracked", description="Change tracking test")
+    return storage
+
+
+class TestTrackedEntities:
+    """Tests for the tracked entity dict."""
+
+    def test_attach_wraps_sections(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        assert isinstance(campaign.npcs, TrackedEntities)
+        assert isinstance(campaign.characters, TrackedEntities)
+        assert not tracker.is_dirty
+
+    def test_lookup_marks_only_that_entity(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        campaign.npcs["NPC 2"].attitude = "hostile"
+        changes = tracker.collect(campaign)
+
+        assert set(changes.entities) == {"npcs"}
+        assert set(changes.entities["npcs"]) == {"NPC 2"}
+        assert changes.checked["npcs"] == {"NPC 2"}
+
+    def test_untouched_entities_are_not_dumped(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+        campaign.npcs["NPC 1"].notes = "changed"
+
+        with patch.object(NPC, "model_dump", autospec=True, side_effect=NPC.model_dump) as dump:
+            tracker.collect(campaign)
+
+        assert dump.call_count == 1
+
+    def test_lookup_without_change_is_not_reported(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        _ = campaign.npcs["NPC 0"]
+        changes = tracker.collect(campaign)
+
+        assert not changes
+        tracker.commit(changes)
+        assert not tracker.is_dirty
+
+    def test_handed_out_entity_compared_after_commit(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+        npc = campaign.npcs["NPC 1"]
+        tracker.commit(tracker.collect(campaign))
+
+        npc.notes = "changed later"
+        changes = tracker.collect(campaign)
+
+        assert set(changes.entities["npcs"]) == {"NPC 1"}
+        assert changes.checked["npcs"] == {"NPC 1"}
+
+    def test_removal_is_reported(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        del campaign.npcs["NPC 3"]
+        changes = tracker.collect(campaign)
+
+        assert changes.entities["npcs"] == {"NPC 3": None}
+
+    def test_bulk_access_rescans_section(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        for npc in campaign.npcs.values():
+            npc.notes = "seen"
+        changes = tracker.collect(campaign)
+
+        assert changes.rescanned == {"npcs"}
+        assert len(changes.entities["npcs"]) == 5
+
+    def test_replaced_section_dict_is_rescanned(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        campaign.quests = {"Q": Quest(title="Q", description="New")}
+        changes = tracker.collect(campaign)
+
+        assert set(changes.entities["quests"]) == {"Q"}
+        assert isinstance(campaign.quests, TrackedEntities)
+
+    def test_uncommitted_changes_are_reported_again(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+        campaign.npcs["NPC 4"].occupation = "smith"
+
+        first = tracker.collect(campaign)
+        second = tracker.collect(campaign)
+        tracker.commit(second)
+        third = tracker.collect(campaign)
+
+        assert first.entities == second.entities
+        assert not third
+
+    def test_campaign_data_matches_model_dump(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+        campaign.npcs["NPC 0"].notes = "updated"
+        campaign.sessions.append(SessionNote(session_number=1, summary="Start"))
+        tracker.touch_sessions()
+
+        changes = tracker.collect(campaign)
+
+        assert tracker.campaign_data(campaign, changes) == campaign.model_dump(mode="json")
+
+    def test_copies_are_plain_dicts(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        copied = campaign.model_copy(deep=True)
+
+        assert type(copied.npcs) is dict
+        assert copied.npcs == dict(campaign.npcs)
+
+    def test_merge_operators(self, campaign: Campaign) -> None:
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        merged = campaign.npcs | {"Guard": NPC(name="Guard")}
+        assert type(merged) is dict
+        assert not tracker.collect(campaign)
+
+        campaign.npcs |= {"Guard": NPC(name="Guard")}
+        assert isinstance(campaign.npcs, TrackedEntities)
+        assert set(tracker.collect(campaign).entities["npcs"]) == {"Guard"}
+
+
+class TestStorageChangeTracking:
+    """Tests for DnDStorage saves driven by the change tracker."""
+
+    def test_update_character_writes_characters_only(self, storage: DnDStorage) -> None:
+        storage.add_character(_make_character("Hero", "Ann"))
+        storage.add_npc(NPC(name="Barkeep"))
+        campaign_dir = storage._split_backend._get_campaign_dir()
+        npcs_mtime = (campaign_dir / "npcs.json").stat().st_mtime_ns
+
+        storage.update_character("Hero", background="Soldier")
+
+        data = json.loads((campaign_dir / "characters.json").read_text())
+        assert data["Hero"]["background"] == "Soldier"
+        assert (campaign_dir / "npcs.json").stat().st_mtime_ns == npcs_mtime
+
+    def test_direct_edit_then_save(self, storage: DnDStorage) -> None:
+        storage.add_character(_make_character("Hero", "Ann"))
+
+        character = storage.get_character("Ann")
+        character.hit_points_current = 1
+        storage.save()
+
+        campaign_dir = storage._split_backend._get_campaign_dir()
+        data = json.loads((campaign_dir / "characters.json").read_text())
+        assert data["Hero"]["hit_points_current"] == 1
+
+    def test_direct_quest_edit_then_save(self, storage: DnDStorage) -> None:
+        storage.add_quest(Quest(title="Rats", description="Clear the cellar", objectives=["Kill rats"]))
+
+        quest = storage.get_quest("Rats")
+        quest.completed_objectives.append("Kill rats")
+        storage.save()
+
+        reloaded = DnDStorage(data_dir=storage.data_dir)
+        assert reloaded.get_quest("Rats").completed_objectives == ["Kill rats"]
+
+    def test_mark_dirty_for_kept_reference(self, storage: DnDStorage) -> None:
+        storage.add_npc(NPC(name="Barkeep"))
+        npc = storage.get_npc("Barkeep")
+        storage.save()
+
+        npc.attitude = "friendly"
+        storage.mark_dirty("npcs", "Barkeep")
+        storage.save()
+
+        reloaded = DnDStorage(data_dir=storage.data_dir)
+        assert reloaded.get_npc("Barkeep").attitude == "friendly"
+
+    def test_kept_reference_edited_after_save(self, storage: DnDStorage) -> None:
+        storage.add_character(_make_character("Hero", "Ann"))
+        character = storage.get_character("Hero")
+        storage.save()
+
+        character.hit_points_current = 3
+        storage.save()
+
+        reloaded = DnDStorage(data_dir=storage.data_dir)
+        assert reloaded.get_character("Hero").hit_points_current == 3
+
+    def test_kept_bulk_reference_edited_after_save(self, storage: DnDStorage) -> None:
+        storage.add_npc(NPC(name="Barkeep"))
+        [npc] = storage.get_current_campaign().npcs.values()
+        storage.save()
+
+        npc.attitude = "hostile"
+        storage.save()
+
+        reloaded = DnDStorage(data_dir=storage.data_dir)
+        assert reloaded.get_npc("Barkeep").attitude == "hostile"
+
+    def test_mark_dirty_rejects_unknown_section(self, storage: DnDStorage) -> None:
+        with pytest.raises(ValueError, match="Unknown campaign section"):
+            storage.mark_dirty("dragons", "Smaug")
+
+    def test_unchanged_save_is_skipped(self, storage: DnDStorage) -> None:
+        storage.add_npc(NPC(name="Barkeep"))
+        _ = storage.get_npc("Barkeep")
+
+        with patch.object(storage, "_save_split_campaign") as save_split:
+            storage.save()
+
+        save_split.assert_not_called()
+
+    def test_monolithic_save_round_trip(self, tmp_path: Path, campaign: Campaign) -> None:
+        data_dir = tmp_path / "data"
+        (data_dir / "campaigns").mkdir(parents=True)
+        (data_dir / "campaigns" / "Tracked.json").write_text(campaign.model_dump_json())
+
+        storage = DnDStorage(data_dir=data_dir)
+        storage.load_campaign("Tracked")
+        storage.get_npc("NPC 1").notes = "edited"
+        storage.save()
+
+        saved = json.loads((data_dir / "campaigns" / "Tracked.json").read_text())
+        assert saved["npcs"]["NPC 1"]["notes"] == "edited"
+        assert saved["npcs"]["NPC 0"] == campaign.npcs["NPC 0"].model_dump(mode="json")
+        assert saved["characters"]["Hero"]["player_name"] == "Ann"
+
+    def test_session_notes_are_saved(self, storage: DnDStorage) -> None:
+        storage.add_session_note(SessionNote(session_number=1, summary="Arrival"))
+
+        session_file = storage._split_backend._get_campaign_dir() / "sessions" / "session-001.json"
+        assert json.loads(session_file.read_text())["summary"] == "Arrival"
@@ -0,0 +1,254 @@
+"""
+Tests for the encounter builder's monster table.
+
+Covers the XP-sorted table and its CR/type/environment filters, caching per
+rulebook manager generation, the budget-fitting strategies over the whole
+bestiary, and a benchmark against the old 50-monster sampler.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from dm20_protocol.combat.encounter_builder import CR_TO_XP, build_encounter
+from dm20_protocol.combat.monster_table import MonsterEntry, MonsterTable, get_monster_table
+from dm20_protocol.rulebooks.manager import RulebookManager
+from dm20_protocol.rulebooks.models import ArmorClassInfo, MonsterDefinition, RulebookSource, Size
+from dm20_protocol.rulebooks.sources.base import ContentCounts, RulebookSourceBase
+
+
+def run_async(coro):
+    """Helper to run async code in sync tests."""
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def make_monster(name: str, cr: float, creature_type: str = "beast", environment=()) -> MonsterDefinition:
+    return MonsterDefinition(
+        index=name.lower().replace(" ", "-"),
+        name=name,
+        size=Size.MEDIUM,
+        type=creature_type,
+        alignment="unaligned",
+        armor_class=[ArmorClassInfo(type="natural", value=12)],
+        hit_points=11,
+        hit_dice="2d8+2",
+        speed={"walk": "30 ft."},
+        strength=12, dexterity=12, constitution=12, intelligence=3, wisdom=10, charisma=6,
+        challenge_rating=cr,
+        xp=CR_TO_XP[cr],
+        environment=list(environment),
+    )
+
+
+class BestiarySource(RulebookSourceBase):
+    """Rulebook source holding only monsters."""
+
+    def __init__(self, monsters, source_id: str = "bestiary"):
+        super().__init__(source_id, RulebookSource.CUSTOM)
+        self._monsters = {m.index: m for m in monsters}
+
+    async def load(self) -> None:
+        self._loaded = True
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def get_class(self, index): return None
+    def get_subclass(self, index): return None
+    def get_race(self, index): return None
+    def get_subrace(self, index): return None
+    def get_spell(self, index): return None
+    def get_monster(self, index): return self._monsters.get(index)
+    def get_feat(self, index): return None
+    def get_background(self, index): return None
+    def get_item(self, index): return None
+
+    def content_counts(self) -> ContentCounts:
+        return ContentCounts(monsters=len(self._monsters))
+
+
+def make_manager(monsters) -> RulebookManager:
+    manager = RulebookManager()
+    run_async(manager.load_source(BestiarySource(monsters)))
+    return manager
+
+
+class SampledManager:
+    """The old encounter builder's view: the first 50 search results only."""
+
+    def __init__(self, manager: RulebookManager):
+        self._manager = manager
+
+    def search(self, query="", categories=None, limit=50, class_filter=None):
+        return self._manager.search(query=query, categories=categories, limit=min(limit, 50))
+
+    def get_monster(self, index):
+        return self._manager.get_monster(index)
+
+
+def synthetic_bestiary(count: int) -> list[MonsterDefinition]:
+    """A bestiary weighted towards low CRs, like the published ones."""
+    crs = sorted(CR_TO_XP)
+    types = ["beast", "undead", "fiend", "humanoid", "dragon", "giant", "monstrosity", "construct"]
+    environments = ["forest", "mountain", "swamp", "underdark", "urban", "coastal"]
+    monsters = []
+    for i in range(count):
+        cr = crs[(i * 7) % 12] if i % 3 else crs[(i * 13) % len(crs)]
+        monsters.append(make_monster(
+            f"Creature {i:04d}", cr, types[i % len(types)], [environments[i % len(environments)]],
+        ))
+    return monsters
+
+
+# =============================================================================
+# MonsterTable
+# =============================================================================
+
+class TestMonsterTable:
+    """Tests for the sorted table and its filters."""
+
+    @pytest.fixture
+    def table(self) -> MonsterTable:
+        return MonsterTable([
+            MonsterEntry("Ogre", "ogre", 2, 450, "giant", ("hill",)),
+            MonsterEntry("Goblin", "goblin", 0.25, 50, "humanoid", ("forest", "hill")),
+            MonsterEntry("Zombie", "zombie", 0.25, 50, "undead"),
+            MonsterEntry("Ghoul", "ghoul", 1, 200, "Undead"),
+        ])
+
+    def test_sorted_by_xp_then_name(self, table: MonsterTable) -> None:
+        assert [e.name for e in table] == ["Goblin", "Zombie", "Ghoul", "Ogre"]
+
+    def test_position_at_most(self, table: MonsterTable) -> None:
+        assert table[table.position_at_most(449)].name == "Ghoul"
+        assert table.position_at_most(10) == -1
+        assert table[table.position_at_most(1000, below=200)].name == "Zombie"
+
+    def test_distinct_xp_positions(self, table: MonsterTable) -> None:
+        assert [table[p].name for p in table.distinct_xp_positions()] == ["Ogre", "Ghoul", "Goblin"]
+
+    def test_select(self, table: MonsterTable) -> None:
+        assert [e.name for e in table.select(creature_type="undead")] == ["Zombie", "Ghoul"]
+        assert [e.name for e in table.select(min_cr=1)] == ["Ghoul", "Ogre"]
+        assert [e.name for e in table.select(environment="hill", max_cr=1)] == ["Goblin"]
+        assert table.select() is table
+
+    def test_has_environments(self, table: MonsterTable) -> None:
+        assert table.has_environments
+        assert not table.select(creature_type="undead").has_environments
+
+
+class TestMonsterTableCache:
+    """The table is built once per loaded rulebook set."""
+
+    def test_cached_until_sources_change(self) -> None:
+        manager = make_manager([make_monster("Wolf", 0.25)])
+        table = get_monster_table(manager)
+
+        assert get_monster_table(manager) is table
+
+        run_async(manager.load_source(BestiarySource([make_monster("Owlbear", 3)], "homebrew")))
+        rebuilt = get_monster_table(manager)
+
+        assert rebuilt is not table
+        assert {e.name for e in rebuilt} == {"Wolf", "Owlbear"}
+
+    def test_higher_priority_source_wins(self) -> None:
+        manager = make_manager([make_monster("Wolf", 0.25)])
+        run_async(manager.load_source(BestiarySource([make_monster("Wolf", 1)], "homebrew")))
+
+        assert [e.challenge_rating for e in get_monster_table(manager)] == [1]
+
+
+# =============================================================================
+# Encounter building over the whole bestiary
+# =============================================================================
+
+class TestBuildOverWholeBestiary:
+    """The strategies see every monster, not a 50-monster sample."""
+
+    def test_best_fit_beyond_first_fifty(self) -> None:
+        # 60 weak monsters sort before the only one that fits a medium budget
+        monsters = [make_monster(f"Rat {i:02d}", 0) for i in range(60)]
+        monsters.append(make_monster("Zealot", 5, "humanoid"))
+        result = build_encounter([5, 5, 5, 5], "medium", rulebook_manager=make_manager(monsters))
+
+        single = next(c for c in result.compositions if c.strategy == "single_powerful")
+        assert single.monster_groups[0].monster_name == "Zealot"
+
+    def test_compositions_fit_budget(self) -> None:
+        manager = make_manager(synthetic_bestiary(300))
+        for levels in ([1, 1, 1, 1], [5, 5, 5, 5], [11, 11, 10], [17, 17, 17, 17, 17, 17]):
+            for difficulty in ("easy", "medium", "hard", "deadly"):
+                result = build_encounter(levels, difficulty, rulebook_manager=manager)
+                assert result.rulebooks_loaded
+                for comp in result.compositions:
+                    assert comp.adjusted_xp <= result.xp_budget
+                    assert comp.base_xp == sum(g.xp_per_monster * g.count for g in comp.monster_groups)
+
+    def test_mixed_group_minions_weaker_than_leader(self) -> None:
+        result = build_encounter([8, 8, 8, 8], "hard", rulebook_manager=make_manager(synthetic_bestiary(300)))
+
+        mixed = next(c for c in result.compositions if c.strategy == "mixed_group")
+        leader, minions = mixed.monster_groups
+        assert leader.count == 1 and 2 <= minions.count <= 4
+        assert minions.xp_per_monster < leader.xp_per_monster
+
+    def test_unmatched_creature_type_uses_placeholders(self) -> None:
+        # No fallback to monsters of other types in any strategy
+        manager = make_manager([make_monster("Wolf", 0.25), make_monster("Bear", 1)])
+        result = build_encounter([1, 1, 1, 1], "medium", rulebook_manager=manager, creature_type="undead")
+
+        assert not result.rulebooks_loaded
+        assert any("no matching monsters" in note for note in result.notes)
+        names = {g.monster_name for c in result.compositions for g in c.monster_groups}
+        assert names and not names & {"Wolf", "Bear"}
+
+    def test_environment_filter(self) -> None:
+        monsters = [
+            make_monster("Wolf", 0.25, environment=["forest"]),
+            make_monster("Crab", 0.25, environment=["coastal"]),
+        ]
+        result = build_encounter([1, 1, 1, 1], "medium", rulebook_manager=make_manager(monsters), environment="coastal")
+
+        names = {g.monster_name for c in result.compositions for g in c.monster_groups}
+        assert names == {"Crab"}
+
+    def test_environment_ignored_without_data(self) -> None:
+        manager = make_manager([make_monster("Wolf", 0.25)])
+        result = build_encounter([1, 1, 1, 1], "medium", rulebook_manager=manager, environment="forest")
+
+        assert result.rulebooks_loaded
+        assert any("no environment data" in note for note in result.notes)
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+@pytest.mark.slow
+class TestEncounterBenchmark:
+    """Table reuse and budget use against the old 50-monster sampler."""
+
+    PARTIES = [[1] * 4, [3] * 4, [5] * 4, [8] * 5, [11] * 4, [15] * 3, [20] * 6]
+
+    @staticmethod
+    def _quality(manager) -> float:
+        """Mean adjusted XP / budget over all compositions."""
+        ratios = []
+        for levels in TestEncounterBenchmark.PARTIES:
+            for difficulty in ("easy", "medium", "hard", "deadly"):
+                result = build_encounter(levels, difficulty, rulebook_manager=manager)
+                ratios += [c.adjusted_xp / result.xp_budget for c in result.compositions]
+        return sum(ratios) / len(ratios)
+
+    def test_whole_bestiary_vs_sampler(self) -> None:
+        manager = make_manager(synthetic_bestiary(2400))
+
+        with patch.object(MonsterTable, "from_rulebooks", side_effect=MonsterTable.from_rulebooks) as build:
+            table_quality = self._quality(manager)
+
+        # One pass over the bestiary serves all 28 encounters
+        assert build.call_count == 1
+        assert len(get_monster_table(manager)) == 2400
+        assert table_quality >= self._quality(SampledManager(manager))
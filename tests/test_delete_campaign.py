@@ -141,7 +141,7 @@ class TestDeleteCampaign:
         assert storage._current_format == StorageFormat.NOT_FOUND
         assert len(storage._character_id_index) == 0
         assert len(storage._player_name_index) == 0
-        assert storage._campaign_hash == ""
+        assert storage.change_tracker.campaign is None
         assert storage._rulebook_manager is None
         assert storage._library_bindings is None
 
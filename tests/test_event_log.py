@@ -0,0 +1,190 @@
+"""
+Unit tests for the append-only adventure log.
+
+Tests cover:
+- Appending writes one JSONL line without rewriting the file
+- Newest-first queries with and without an event_type filter
+- Token-indexed substring search matching the old linear scan
+- Recovery from torn records and migration of the legacy JSON log
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from dm20_protocol.event_log import AdventureLog
+from dm20_protocol.models import AdventureEvent
+from dm20_protocol.storage import DnDStorage
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0)
+
+
+def _event(title: str, event_type: str = "combat", minutes: int = 0, description: str = "") -> AdventureEvent:
+    return AdventureEvent(
+        event_type=event_type,
+        title=title,
+        description=description or f"{title} happened",
+        timestamp=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def log(tmp_path: Path) -> AdventureLog:
+    return AdventureLog(tmp_path / "adventure_log.jsonl")
+
+
+class TestAppend:
+    """Tests for writing events."""
+
+    def test_append_writes_one_line_per_event(self, log: AdventureLog) -> None:
+        log.append(_event("Goblin ambush"))
+        log.append(_event("Met the mayor", "roleplay", 5))
+
+        lines = log.path.read_text().splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Goblin ambush", "Met the mayor"]
+
+    def test_append_does_not_rewrite_existing_lines(self, log: AdventureLog) -> None:
+        log.append(_event("First"))
+        first_line = log.path.read_text()
+
+        log.append(_event("Second", minutes=1))
+
+        assert log.path.read_text().startswith(first_line)
+
+    def test_round_trip(self, log: AdventureLog) -> None:
+        event = _event("Dragon sighted", "world")
+        log.append(event)
+
+        reloaded = AdventureLog(log.path)
+        reloaded.load()
+
+        assert reloaded.events == [event]
+
+
+class TestRecent:
+    """Tests for newest-first queries."""
+
+    def test_newest_first_with_out_of_order_timestamps(self, log: AdventureLog) -> None:
+        for title, minutes in [("B", 10), ("A", 0), ("C", 20), ("Mid", 5)]:
+            log.append(_event(title, minutes=minutes))
+
+        assert [e.title for e in log.recent()] == ["C", "B", "Mid", "A"]
+        assert [e.title for e in log.recent(limit=2)] == ["C", "B"]
+
+    def test_filter_by_type(self, log: AdventureLog) -> None:
+        log.append(_event("Fight", "combat", 0))
+        log.append(_event("Chat", "roleplay", 1))
+        log.append(_event("Rematch", "combat", 2))
+
+        assert [e.title for e in log.recent(event_type="combat")] == ["Rematch", "Fight"]
+        assert log.recent(event_type="quest") == []
+
+    def test_equal_timestamps_keep_insertion_order(self, log: AdventureLog) -> None:
+        events = [_event(f"E{i}") for i in range(4)]
+        for event in events:
+            log.append(event)
+
+        expected = sorted(events, key=lambda e: e.timestamp, reverse=True)
+        assert log.recent() == expected
+
+
+class TestSearch:
+    """Tests for the token-indexed search."""
+
+    @pytest.fixture
+    def filled_log(self, log: AdventureLog) -> AdventureLog:
+        log.append(_event("Dragon's lair", description="The party found the dragon's hoard"))
+        log.append(_event("Tavern brawl", "roleplay", description="Chairs flew"))
+        log.append(_event("Dragonborn envoy", "roleplay", description="An envoy arrived"))
+        log.append(_event("Quiet night", "exploration", description="Nothing happened!"))
+        return log
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "dragon", "DRAGON", "agon", "dragon's h", "brawl", "envoy arr", "happened!", "!", "", "missing",
+            "s l", "ty found the dr", "the party", " party ", "n ", "e", "dragonb", "n's", "lair the",
+        ],
+    )
+    def test_matches_linear_scan(self, filled_log: AdventureLog, query: str) -> None:
+        expected = [
+            e for e in filled_log.events
+            if query.lower() in e.title.lower() or query.lower() in e.description.lower()
+        ]
+
+        assert filled_log.search(query) == expected
+
+    def test_random_queries_match_linear_scan(self, log: AdventureLog) -> None:
+        rng = random.Random(7)
+        words = ["goblin", "gob", "lin", "cave", "caverns", "rave", "ravenous", "ogre", "grey", "key"]
+        for i in range(60):
+            title = " ".join(rng.choices(words, k=3))
+            log.append(_event(title, minutes=i, description=" ".join(rng.choices(words, k=5))))
+        texts = [e.title for e in log.events] + [e.description for e in log.events]
+
+        for _ in range(200):
+            text = rng.choice(texts)
+            start = rng.randrange(len(text))
+            query = text[start:start + rng.randint(1, 15)]
+            expected = [e for e in log.events if query in e.title or query in e.description]
+            assert log.search(query) == expected, query
+
+
+class TestRecovery:
+    """Tests for damaged logs and migration."""
+
+    def test_torn_record_is_dropped_and_compacted(self, log: AdventureLog) -> None:
+        log.append(_event("Kept"))
+        with open(log.path, "a", encoding="utf-8") as f:
+            f.write('{"event_type": "combat", "title": "Tor')
+
+        reloaded = AdventureLog(log.path)
+        reloaded.load()
+        reloaded.append(_event("After crash", minutes=1))
+
+        again = AdventureLog(log.path)
+        again.load()
+        assert [e.title for e in again.events] == ["Kept", "After crash"]
+
+    def test_record_missing_newline_is_terminated(self, log: AdventureLog) -> None:
+        event = _event("No newline")
+        log.path.write_text(event.model_dump_json())
+
+        log.load()
+        log.append(_event("Next", minutes=1))
+
+        again = AdventureLog(log.path)
+        again.load()
+        assert [e.title for e in again.events] == ["No newline", "Next"]
+
+    def test_legacy_json_log_is_migrated(self, tmp_path: Path) -> None:
+        legacy = tmp_path / "adventure_log.json"
+        events = [_event("Old one"), _event("Old two", minutes=1)]
+        legacy.write_text(json.dumps([e.model_dump(mode="json") for e in events]))
+
+        log = AdventureLog(tmp_path / "adventure_log.jsonl", legacy_path=legacy)
+        log.load()
+
+        assert log.events == events
+        assert log.path.exists()
+        assert not legacy.exists()
+        assert (tmp_path / "adventure_log.json.bak").exists()
+
+
+class TestStorageEvents:
+    """Tests for DnDStorage's event API on top of the log."""
+
+    def test_events_persist_across_storage_instances(self, tmp_path: Path) -> None:
+        storage = DnDStorage(data_dir=tmp_path)
+        storage.add_event(_event("Goblin ambush"))
+        storage.add_event(_event("Found the map", "quest", 1))
+
+        reloaded = DnDStorage(data_dir=tmp_path)
+
+        assert [e.title for e in reloaded.get_events()] == ["Found the map", "Goblin ambush"]
+        assert [e.title for e in reloaded.get_events(event_type="quest")] == ["Found the map"]
+        assert [e.title for e in reloaded.search_events("goblin")] == ["Goblin ambush"]
+        assert (tmp_path / "events" / "adventure_log.jsonl").exists()
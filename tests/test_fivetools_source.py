@@ -1776,6 +1776,12 @@ class TestMonsterMapping:
         assert monster.type == "humanoid"
         assert "goblinoid" in monster.subtype
 
+    def test_environment(self):
+        source = FiveToolsSource()
+        monster = source._map_monster({**FIVETOOLS_MONSTER_GOBLIN, "environment": ["forest", "Underdark"]})
+        assert monster.environment == ["forest", "underdark"]
+        assert source._map_monster(FIVETOOLS_MONSTER_GOBLIN).environment == []
+
     def test_goblin_alignment(self):
         source = FiveToolsSource()
         monster = source._map_monster(FIVETOOLS_MONSTER_GOBLIN)
@@ -0,0 +1,197 @@
+"""
+Tests for the compiled intent pattern matcher.
+
+Tests cover:
+- Identical scores, metadata, ambiguity and fallback to the per-pattern
+  substring scan it replaced, over a corpus of player inputs
+- Recompilation when the config or its weight overrides change
+- Benchmark replaying the corpus: one compile, one regex pass per input
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dm20_protocol.claudmaster import IntentType, Orchestrator, PlayerIntent
+from dm20_protocol.claudmaster.config import ClaudmasterConfig
+from dm20_protocol.claudmaster.intent_matcher import IntentMatcher
+from dm20_protocol.claudmaster.orchestrator import DEFAULT_INTENT_PATTERNS, WeightedPattern
+from dm20_protocol.models import Campaign, GameState
+
+PLAYER_INPUTS = [
+    line.strip()
+    for line in (Path(__file__).parent / "fixtures" / "player_inputs.txt").read_text().splitlines()
+    if line.strip()
+]
+
+
+def scan_classify(orchestrator: Orchestrator, player_input: str) -> PlayerIntent:
+    """The previous classify_intent: every pattern tested with ``in``, per call."""
+    input_lower = player_input.lower().strip()
+    scores: dict[IntentType, float] = {}
+    best_weights: dict[IntentType, float] = {}
+    all_matched: dict[IntentType, list[str]] = {}
+    for intent_type, patterns in orchestrator._get_intent_patterns().items():
+        total = 0.0
+        best = 0.0
+        matched: list[str] = []
+        for p in sorted(patterns, key=lambda p: len(p.phrase), reverse=True):
+            if p.phrase in input_lower:
+                total += p.weight
+                best = max(best, p.weight)
+                matched.append(p.phrase)
+        if total > 0:
+            scores[intent_type] = total
+            best_weights[intent_type] = best
+            all_matched[intent_type] = matched
+
+    if not scores:
+        return PlayerIntent(
+            intent_type=IntentType.ACTION,
+            confidence=orchestrator.config.fallback_confidence,
+            raw_input=player_input,
+            metadata={"fallback": True},
+        )
+
+    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    winner_type, winner_score = ranked[0]
+    runner_up_type, runner_up_score = ranked[1] if len(ranked) > 1 else (None, 0.0)
+    score_gap = winner_score - runner_up_score
+    metadata: dict[str, Any] = {
+        "matched_patterns": all_matched.get(winner_type, []),
+        "scores": {k.value: v for k, v in scores.items()},
+    }
+    if runner_up_type is not None and score_gap < orchestrator.config.ambiguity_threshold:
+        metadata["ambiguous"] = True
+        metadata["alternative_intent"] = runner_up_type.value
+        metadata["score_gap"] = score_gap
+    return PlayerIntent(
+        intent_type=winner_type,
+        confidence=min(best_weights[winner_type], 1.0),
+        raw_input=player_input,
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def orchestrator() -> Orchestrator:
+    campaign = Campaign(
+        name="Test Campaign",
+        description="Intent matcher tests",
+        game_state=GameState(campaign_name="Test Campaign"),
+    )
+    return Orchestrator(campaign=campaign, config=ClaudmasterConfig())
+
+
+def assert_same_as_scan(orchestrator: Orchestrator, inputs: list[str]) -> None:
+    for player_input in inputs:
+        intent = orchestrator.classify_intent(player_input)
+        expected = scan_classify(orchestrator, player_input)
+        assert intent.intent_type == expected.intent_type, player_input
+        assert intent.confidence == expected.confidence, player_input
+        # Compare as lists: dict order decides ties between equal scores
+        assert list(intent.metadata.items()) == list(expected.metadata.items()), player_input
+        assert list(intent.metadata.get("scores", {})) == list(expected.metadata.get("scores", {}))
+
+
+class TestIntentMatcher:
+    """Tests for the matcher itself."""
+
+    def test_contained_phrases_are_found(self) -> None:
+        matcher = IntentMatcher(DEFAULT_INTENT_PATTERNS)
+
+        present = matcher.present_phrases("i search for traps")
+
+        assert {"search for traps", "search for", "search"} <= present
+
+    def test_counts_each_pattern_once(self) -> None:
+        matcher = IntentMatcher({IntentType.COMBAT: [WeightedPattern(phrase="stab", weight=0.5)]})
+
+        assert matcher.score("stab stab stab").scores == {IntentType.COMBAT: 0.5}
+
+    def test_overlapping_phrases(self) -> None:
+        matcher = IntentMatcher({
+            IntentType.COMBAT: [WeightedPattern(phrase="abc", weight=0.2)],
+            IntentType.QUESTION: [WeightedPattern(phrase="bcd", weight=0.3)],
+        })
+
+        assert matcher.score("abcd").matched == {IntentType.COMBAT: ["abc"], IntentType.QUESTION: ["bcd"]}
+
+    def test_zero_total_is_left_out(self) -> None:
+        matcher = IntentMatcher({IntentType.SYSTEM: [WeightedPattern(phrase="help", weight=0.0)]})
+
+        assert matcher.score("help me").scores == {}
+
+
+class TestClassifyIntentEquivalence:
+    """classify_intent gives exactly what the substring scan gave."""
+
+    def test_corpus(self, orchestrator: Orchestrator) -> None:
+        assert_same_as_scan(orchestrator, PLAYER_INPUTS)
+
+    def test_corpus_with_overrides_and_ambiguity(self, orchestrator: Orchestrator) -> None:
+        orchestrator.config.ambiguity_threshold = 1.5
+        orchestrator.config.intent_weight_overrides = {
+            "combat": {"attack": 0.3, "Charge": 0.9},
+            "question": {"is there": 1.0, "?": 0.4},
+            "bogus": {"anything": 1.0},
+        }
+
+        assert_same_as_scan(orchestrator, PLAYER_INPUTS)
+
+    def test_fallback(self, orchestrator: Orchestrator) -> None:
+        intent = orchestrator.classify_intent("Mmm")
+
+        assert intent.intent_type == IntentType.ACTION
+        assert intent.metadata == {"fallback": True}
+
+
+class TestRecompilation:
+    """The compiled matcher follows config changes."""
+
+    def test_reused_while_config_unchanged(self, orchestrator: Orchestrator) -> None:
+        orchestrator.classify_intent("I attack")
+        matcher = orchestrator._intent_matcher
+
+        orchestrator.classify_intent("I look around")
+
+        assert orchestrator._intent_matcher is matcher
+
+    def test_override_mutated_in_place(self, orchestrator: Orchestrator) -> None:
+        orchestrator.config.intent_weight_overrides = {"combat": {"attack": 0.9}}
+        assert orchestrator.classify_intent("I attack").confidence == 0.9
+
+        orchestrator.config.intent_weight_overrides["combat"]["attack"] = 0.2
+
+        assert orchestrator.classify_intent("I attack").confidence == 0.2
+
+    def test_config_replaced(self, orchestrator: Orchestrator) -> None:
+        orchestrator.classify_intent("I whistle")
+        orchestrator.config = ClaudmasterConfig(intent_weight_overrides={"roleplay": {"whistle": 0.7}})
+
+        assert orchestrator.classify_intent("I whistle").intent_type == IntentType.ROLEPLAY
+
+
+@pytest.mark.slow
+class TestClassifyIntentBenchmark:
+    """Replaying the corpus compiles the patterns once, not per call."""
+
+    def test_replay_corpus(self, orchestrator: Orchestrator) -> None:
+        inputs = PLAYER_INPUTS * 20
+
+        build_patch = patch("dm20_protocol.claudmaster.orchestrator.IntentMatcher", side_effect=IntentMatcher)
+        scan_patch = patch.object(
+            IntentMatcher, "present_phrases", autospec=True, side_effect=IntentMatcher.present_phrases
+        )
+        with build_patch as build, scan_patch as scan:
+            results = [orchestrator.classify_intent(player_input) for player_input in inputs]
+
+        assert build.call_count == 1
+        # One regex pass per input, where the old scan tested every pattern
+        assert scan.call_count == len(inputs)
+        assert sum(len(p) for p in orchestrator._get_intent_patterns().values()) > 50
+        assert [r.intent_type for r in results] == [
+            scan_classify(orchestrator, player_input).intent_type for player_input in inputs
+        ]
@@ -689,6 +689,20 @@ class TestLibraryManager:
 
             assert len(results) == 5
 
+    def test_has_extracted_content_is_cached(self):
+        """Test the extracted-content flag is cached until invalidated."""
+        with TemporaryDirectory() as tmpdir:
+            manager = LibraryManager(Path(tmpdir) / "library")
+            assert manager.has_extracted_content("test") is False
+
+            extracted = manager.extracted_dir / "test"
+            extracted.mkdir(parents=True)
+            (extracted / "class-fighter.json").write_text("{}")
+            assert manager.has_extracted_content("test") is False
+
+            manager.invalidate_extracted("test")
+            assert manager.has_extracted_content("test") is True
+
     def test_search_across_multiple_sources(self):
         """Test search finds entries across multiple indexed sources."""
         with TemporaryDirectory() as tmpdir:
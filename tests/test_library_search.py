@@ -2,14 +2,18 @@
 Unit tests for the Library Search System.
 
 Tests the LibrarySearch class including query expansion,
-TF-IDF scoring, and result ranking.
+BM25 scoring, the persisted index, and result ranking.
 """
 
+import json
+
 import pytest
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
+from dm20_protocol.library.bm25 import BM25Index
 from dm20_protocol.library.manager import LibraryManager
 from dm20_protocol.library.search import LibrarySearch, SearchResult
 from dm20_protocol.library.models import (
@@ -79,11 +83,15 @@ class TestLibrarySearchInit:
         assert "tanky" in LibrarySearch.CONCEPT_SYNONYMS
         assert "spellcaster" in LibrarySearch.CONCEPT_SYNONYMS
 
-    def test_term_rarity_dict_exists(self):
-        """Test that TERM_RARITY dictionary is populated."""
-        assert len(LibrarySearch.TERM_RARITY) > 0
-        assert "class" in LibrarySearch.TERM_RARITY
-        assert "dragon" in LibrarySearch.TERM_RARITY
+    def test_synonyms_weigh_less_than_query_terms(self):
+        """Test that synonyms are weighted below the terms typed in the query."""
+        with TemporaryDirectory() as tmpdir:
+            search = LibrarySearch(LibraryManager(Path(tmpdir) / "library"))
+
+            weights = search._weighted_query("dragon")
+
+            assert weights["dragon"] == 1.0
+            assert weights["draconic"] == LibrarySearch.SYNONYM_WEIGHT
 
 
 class TestQueryExpansion:
@@ -167,93 +175,231 @@ class TestQueryExpansion:
             assert keywords == []
 
 
+def make_manager(tmpdir: str, *entries: TOCEntry, source_id: str = "phb") -> LibraryManager:
+    """A library with one indexed source holding the given TOC entries."""
+    manager = LibraryManager(Path(tmpdir) / "library")
+    manager.save_index(IndexEntry(
+        source_id=source_id,
+        filename=f"{source_id}.pdf",
+        source_type=SourceType.PDF,
+        indexed_at=datetime(2024, 1, 1),
+        file_hash="hash123",
+        total_pages=300,
+        toc=list(entries),
+    ))
+    return manager
+
+
+def scores(manager: LibraryManager, query: str) -> dict[str, float]:
+    """Score of every matching entry, by title."""
+    return {r.title: r.score for r in manager.semantic_search.search(query, limit=100)}
+
+
 class TestScoring:
-    """Tests for the _score_entry method."""
+    """Tests for BM25 scoring."""
 
     def test_exact_match_scores_higher(self):
-        """Test that exact token matches score higher than partial."""
+        """Test that short exact titles score higher than longer ones."""
         with TemporaryDirectory() as tmpdir:
-            library_dir = Path(tmpdir) / "library"
-            manager = LibraryManager(library_dir)
-            search = LibrarySearch(manager)
+            manager = make_manager(
+                tmpdir,
+                TOCEntry(title="Fighter", page=10, content_type=ContentType.CLASS),
+                TOCEntry(title="The Fighter's Handbook", page=20, content_type=ContentType.CLASS),
+            )
 
-            entry_exact = TOCEntry(title="Fighter", page=10, content_type=ContentType.CLASS)
-            entry_partial = TOCEntry(title="The Fighter's Handbook", page=20, content_type=ContentType.CLASS)
+            result = scores(manager, "fighter")
 
-            keywords = ["fighter"]
+            assert result["Fighter"] > result["The Fighter's Handbook"]
 
-            score_exact = search._score_entry(entry_exact, keywords)
-            score_partial = search._score_entry(entry_partial, keywords)
+    def test_no_match_scores_zero(self):
+        """Test that non-matching entries are not returned."""
+        with TemporaryDirectory() as tmpdir:
+            manager = make_manager(tmpdir, TOCEntry(title="Wizard", page=10, content_type=ContentType.CLASS))
 
-            assert score_exact > score_partial
+            assert scores(manager, "fighter martial warrior") == {}
 
-    def test_no_match_scores_zero(self):
-        """Test that non-matching entries score zero."""
+    def test_multiple_keywords_increase_score(self):
+        """Test that matching multiple keywords increases score."""
         with TemporaryDirectory() as tmpdir:
-            library_dir = Path(tmpdir) / "library"
-            manager = LibraryManager(library_dir)
-            search = LibrarySearch(manager)
+            manager = make_manager(
+                tmpdir,
+                TOCEntry(title="Fire Dragon", page=10, content_type=ContentType.MONSTER),
+                TOCEntry(title="Goblin", page=20, content_type=ContentType.MONSTER),
+            )
 
-            entry = TOCEntry(title="Wizard", page=10, content_type=ContentType.CLASS)
-            keywords = ["fighter", "martial", "warrior"]
+            assert scores(manager, "fire dragon")["Fire Dragon"] > scores(manager, "fire")["Fire Dragon"]
 
-            score = search._score_entry(entry, keywords)
+    def test_content_type_bonus(self):
+        """Test that entries with known content types get a bonus."""
+        with TemporaryDirectory() as tmpdir:
+            manager = make_manager(
+                tmpdir,
+                TOCEntry(title="Fire Giant", page=10, content_type=ContentType.MONSTER),
+                TOCEntry(title="Frost Giant", page=20, content_type=ContentType.UNKNOWN),
+            )
 
-            assert score == 0.0
+            result = scores(manager, "giant")
 
-    def test_multiple_keywords_increase_score(self):
-        """Test that matching multiple keywords increases score."""
+            assert result["Fire Giant"] == pytest.approx(result["Frost Giant"] * LibrarySearch.CONTENT_TYPE_BOOST)
+
+    def test_rare_terms_weigh_more(self):
+        """Test that IDF comes from the library's document frequencies."""
         with TemporaryDirectory() as tmpdir:
-            library_dir = Path(tmpdir) / "library"
-            manager = LibraryManager(library_dir)
-            search = LibrarySearch(manager)
+            manager = make_manager(
+                tmpdir,
+                TOCEntry(title="Ancient Dragon", page=10),
+                TOCEntry(title="Ancient Lich", page=20),
+                TOCEntry(title="Ancient Ruins", page=30),
+                TOCEntry(title="Ancient Empire", page=40),
+            )
 
-            entry = TOCEntry(title="Fire Dragon", page=10, content_type=ContentType.MONSTER)
+            result = scores(manager, "ancient dragon")
 
-            keywords_single = ["fire"]
-            keywords_multiple = ["fire", "dragon"]
+            assert max(result, key=result.get) == "Ancient Dragon"
+            assert result["Ancient Dragon"] > 2 * result["Ancient Lich"]
 
-            score_single = search._score_entry(entry, keywords_single)
-            score_multiple = search._score_entry(entry, keywords_multiple)
+    def test_prefix_matches(self):
+        """Test that query terms also match longer words they start."""
+        with TemporaryDirectory() as tmpdir:
+            manager = make_manager(
+                tmpdir,
+                TOCEntry(title="Fireball", page=10, content_type=ContentType.SPELL),
+                TOCEntry(title="Fire Bolt", page=20, content_type=ContentType.SPELL),
+            )
 
-            assert score_multiple > score_single
+            result = scores(manager, "fire")
 
-    def test_content_type_bonus(self):
-        """Test that entries with known content types get a bonus."""
+            assert result["Fire Bolt"] > result["Fireball"] > 0
+
+    def test_extracted_text_is_indexed(self):
+        """Test that extracted content is searchable and weighs less than titles."""
         with TemporaryDirectory() as tmpdir:
-            library_dir = Path(tmpdir) / "library"
-            manager = LibraryManager(library_dir)
-            search = LibrarySearch(manager)
+            manager = make_manager(
+                tmpdir,
+                TOCEntry(title="Fighter", page=10, content_type=ContentType.CLASS),
+                TOCEntry(title="Second Wind", page=12, content_type=ContentType.FEAT),
+                TOCEntry(title="Wizard", page=50, content_type=ContentType.CLASS),
+            )
+            assert scores(manager, "stamina") == {}
 
-            entry_typed = TOCEntry(title="Fire Giant", page=10, content_type=ContentType.MONSTER)
-            entry_unknown = TOCEntry(title="Fire Giant", page=10, content_type=ContentType.UNKNOWN)
+            extracted_dir = manager.extracted_dir / "phb"
+            extracted_dir.mkdir(parents=True)
+            (extracted_dir / "class-fighter.json").write_text(json.dumps({
+                "source_info": {"source_id": "phb", "page_start": 10},
+                "content": {"classes": [{"name": "Fighter", "description": "Second wind restores stamina"}]},
+            }))
+            manager.invalidate_extracted("phb")
 
-            keywords = ["fire", "giant"]
+            result = scores(manager, "stamina")
+            assert list(result) == ["Fighter"]
+            assert scores(manager, "second wind")["Second Wind"] > scores(manager, "second wind")["Fighter"]
 
-            score_typed = search._score_entry(entry_typed, keywords)
-            score_unknown = search._score_entry(entry_unknown, keywords)
 
-            assert score_typed > score_unknown
+class TestIndexPersistence:
+    """Tests for the persisted, memory-mapped search index."""
 
-    def test_position_weight(self):
-        """Test that earlier keywords in list have more weight."""
+    TOC = [
+        TOCEntry(title="Fighter", page=20, content_type=ContentType.CLASS, children=[
+            TOCEntry(title="Champion", page=72, content_type=ContentType.SUBCLASS),
+        ]),
+        TOCEntry(title="Fireball", page=241, content_type=ContentType.SPELL),
+    ]
+
+    def test_save_index_writes_segment(self):
+        """Test that saving a source's index also writes its search segment."""
         with TemporaryDirectory() as tmpdir:
-            library_dir = Path(tmpdir) / "library"
-            manager = LibraryManager(library_dir)
-            search = LibrarySearch(manager)
+            manager = make_manager(tmpdir, *self.TOC)
+
+            assert (manager.index_dir / "phb.bm25.json").exists()
+            assert (manager.index_dir / "phb.bm25").stat().st_size > 0
 
-            entry = TOCEntry(title="Dragon", page=10)
+    def test_reload_uses_persisted_segment(self):
+        """Test that a new manager maps the saved segment instead of rebuilding it."""
+        with TemporaryDirectory() as tmpdir:
+            expected = scores(make_manager(tmpdir, *self.TOC), "fire champion")
+
+            manager = LibraryManager(Path(tmpdir) / "library")
+            manager.load_all_indexes()
+            index = manager.semantic_search._index
+            index.index_source = None  # a rebuild would fail
+
+            assert scores(manager, "fire champion") == expected
+            assert index._segments["phb"]._mapped is not None
+
+    def test_changed_index_rebuilds_segment(self):
+        """Test that a re-indexed source replaces its stale segment."""
+        with TemporaryDirectory() as tmpdir:
+            make_manager(tmpdir, *self.TOC)
+
+            manager = make_manager(tmpdir, TOCEntry(title="Rogue", page=90, content_type=ContentType.CLASS))
 
-            # "dragon" first in list
-            keywords_first = ["dragon", "other", "keywords"]
-            # "dragon" last in list
-            keywords_last = ["other", "keywords", "dragon"]
+            assert list(scores(manager, "rogue")) == ["Rogue"]
+            assert scores(manager, "fighter") == {}
+
+    def test_removed_source_leaves_index(self):
+        """Test that sources dropped from the manager are no longer searched."""
+        with TemporaryDirectory() as tmpdir:
+            manager = make_manager(tmpdir, *self.TOC)
+            assert scores(manager, "fighter")
 
-            score_first = search._score_entry(entry, keywords_first)
-            score_last = search._score_entry(entry, keywords_last)
+            del manager._index_cache["phb"]
 
-            # Earlier position should score higher
-            assert score_first > score_last
+            assert scores(manager, "fighter") == {}
+            assert manager.semantic_search._index.document_count == 0
+
+    def test_reindex_while_postings_held(self, tmp_path):
+        """Test that a mapped segment is replaced while a reader holds its postings."""
+        entries = [("Fighter", 20, "class", ""), ("Fireball", 241, None, "")]
+        BM25Index(tmp_path).index_source("phb", "v1", entries)
+        index = BM25Index(tmp_path)
+        assert index.load_source("phb", "v1")
+        postings = iter(index._segments["phb"].postings_of("fighter"))
+        assert next(postings) == (0, 3)
+
+        index.index_source("phb", "v2", [("Rogue", 90, "class", "")])
+
+        assert index.document_count == 1
+        assert index.segment_key("phb") == "v2"
+        assert [doc.title for _, _, doc in index.search({"rogue": 1.0}, 5)] == ["Rogue"]
+        assert index.search({"fighter": 1.0}, 5) == []
+
+
+class TestSearchBenchmark:
+    """Search cost follows the matching entries, not the library size."""
+
+    @pytest.mark.slow
+    def test_large_library(self):
+        with TemporaryDirectory() as tmpdir:
+            manager = LibraryManager(Path(tmpdir) / "library")
+            types = [ContentType.SPELL, ContentType.MONSTER, ContentType.FEAT, ContentType.UNKNOWN]
+            for s in range(10):
+                manager.save_index(IndexEntry(
+                    source_id=f"source-{s}",
+                    filename=f"source-{s}.pdf",
+                    source_type=SourceType.PDF,
+                    indexed_at=datetime(2024, 1, 1),
+                    file_hash=f"hash{s}",
+                    total_pages=500,
+                    toc=[
+                        TOCEntry(title=f"Entry {s} {i} Topic{i % 997}", page=i, content_type=types[i % 4])
+                        for i in range(2000)
+                    ] + [TOCEntry(title="Bladesinger", page=9999, content_type=ContentType.SUBCLASS)],
+                ))
+            search = manager.semantic_search
+
+            scored = []
+            score = BM25Index.score
+
+            def record_score(index, weights):
+                scored.append(score(index, weights))
+                return scored[-1]
+
+            with patch.object(BM25Index, "score", autospec=True, side_effect=record_score):
+                results = search.search("bladesinger", limit=5)
+
+            assert [r.title for r in results] == ["Bladesinger"] * 5
+            # Only the ten matching entries of the 20010 indexed are scored
+            assert [len(s) for s in scored] == [10]
 
 
 class TestFlattenToc:
@@ -0,0 +1,240 @@
+"""
+Tests for background, resumable vector indexing of library sources.
+
+Tests cover:
+- Batched upserts with stable chunk IDs and a resume position
+- VectorIndexQueue progress, checkpoints, resuming and re-indexing
+- LibraryManager serving keyword search until the vector index is ready
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from dm20_protocol.library.manager import LibraryManager
+from dm20_protocol.library.models import ContentType, IndexEntry, SourceType, TOCEntry
+from dm20_protocol.library.search import LibrarySearch
+from dm20_protocol.library.vector_indexing import VectorIndexQueue
+from dm20_protocol.library.vector_search import VectorLibrarySearch
+
+
+def make_index(count: int, file_hash: str = "hash1") -> IndexEntry:
+    return IndexEntry(
+        source_id="phb",
+        filename="phb.pdf",
+        source_type=SourceType.PDF,
+        indexed_at=datetime(2026, 1, 1),
+        file_hash=file_hash,
+        total_pages=400,
+        toc=[TOCEntry(title=f"Entry {i}", page=i + 1, content_type=ContentType.SPELL) for i in range(count)],
+    )
+
+
+@pytest.fixture
+def collection():
+    return MagicMock()
+
+
+@pytest.fixture
+def vector_search(collection):
+    store = MagicMock()
+    store._client.get_or_create_collection.return_value = collection
+    store._client.get_collection.return_value = collection
+    collection.count.return_value = 0
+    return VectorLibrarySearch(MagicMock(), store)
+
+
+def upserted_ids(collection) -> list[list[str]]:
+    return [call.kwargs["ids"] for call in collection.upsert.call_args_list]
+
+
+class TestBatchedIndexing:
+    """Tests for VectorLibrarySearch.index_source batching."""
+
+    def test_batches(self, vector_search, collection):
+        """Entries are embedded and stored in bounded batches."""
+        entries = make_index(150).toc
+        progress = []
+
+        count = vector_search.index_source("phb", entries, "phb.pdf", batch_size=64, on_batch=progress.append)
+
+        assert count == 150
+        assert [len(ids) for ids in upserted_ids(collection)] == [64, 64, 22]
+        assert progress == [64, 128, 150]
+
+    def test_resume_from_start(self, vector_search, collection):
+        """Indexing resumes after the entries already stored, with the same IDs."""
+        entries = make_index(150).toc
+
+        vector_search.index_source("phb", entries, "phb.pdf", start=128, batch_size=64)
+
+        assert upserted_ids(collection) == [[f"phb_{i}" for i in range(128, 150)]]
+
+    def test_on_batch_can_stop(self, vector_search, collection):
+        """Returning False from on_batch stops after that batch."""
+        count = vector_search.index_source(
+            "phb", make_index(150).toc, "phb.pdf", batch_size=64, on_batch=lambda done: False,
+        )
+
+        assert count == 64
+        assert collection.upsert.call_count == 1
+
+
+class TestVectorIndexQueue:
+    """Tests for the background queue and its checkpoints."""
+
+    def test_indexes_in_background(self, tmp_path, vector_search, collection):
+        queue = VectorIndexQueue(vector_search, tmp_path)
+        index = make_index(100)
+
+        queue.enqueue(index, index.toc)
+
+        assert queue.wait(timeout=5)
+        assert queue.progress()["phb"].to_dict() == {
+            "source_id": "phb", "total": 100, "done": 100, "state": "done", "error": None,
+        }
+        checkpoint = json.loads((tmp_path / "phb.vector.json").read_text())
+        assert checkpoint["done"] == 100
+        assert sum(len(ids) for ids in upserted_ids(collection)) == 100
+
+    def test_resumes_from_checkpoint(self, tmp_path, vector_search, collection):
+        """A source interrupted mid-way is resumed, not restarted."""
+        index = make_index(100)
+        (tmp_path / "phb.vector.json").write_text(json.dumps({
+            "key": f"{index.file_hash}:{index.indexed_at.isoformat()}", "done": 64, "total": 100,
+        }))
+        queue = VectorIndexQueue(vector_search, tmp_path)
+
+        queue.enqueue(index, index.toc, check_existing=True)
+
+        assert queue.wait(timeout=5)
+        assert upserted_ids(collection) == [[f"phb_{i}" for i in range(64, 100)]]
+        vector_search._store._client.delete_collection.assert_not_called()
+
+    def test_complete_checkpoint_skips_source(self, tmp_path, vector_search, collection):
+        index = make_index(10)
+        queue = VectorIndexQueue(vector_search, tmp_path)
+        queue.enqueue(index, index.toc)
+        assert queue.wait(timeout=5)
+        collection.upsert.reset_mock()
+
+        restarted = VectorIndexQueue(vector_search, tmp_path)
+        restarted.enqueue(index, index.toc, check_existing=True)
+
+        assert restarted.wait(timeout=5)
+        collection.upsert.assert_not_called()
+        assert restarted.progress()["phb"].state == "done"
+
+    def test_changed_index_restarts(self, tmp_path, vector_search, collection):
+        """A checkpoint of an older index is discarded with its collection."""
+        old = make_index(10)
+        queue = VectorIndexQueue(vector_search, tmp_path)
+        queue.enqueue(old, old.toc)
+        assert queue.wait(timeout=5)
+        collection.upsert.reset_mock()
+        vector_search._store._client.delete_collection.reset_mock()
+
+        new = make_index(5, file_hash="hash2")
+        queue.enqueue(new, new.toc)
+
+        assert queue.wait(timeout=5)
+        vector_search._store._client.delete_collection.assert_called_once_with(name="library_phb")
+        assert upserted_ids(collection) == [[f"phb_{i}" for i in range(5)]]
+
+    def test_existing_collection_without_checkpoint(self, tmp_path, vector_search, collection):
+        """Sources indexed before checkpoints existed are not re-embedded at startup."""
+        collection.count.return_value = 10
+        index = make_index(10)
+        queue = VectorIndexQueue(vector_search, tmp_path)
+
+        queue.enqueue(index, index.toc, check_existing=True)
+
+        assert queue.wait(timeout=5)
+        collection.upsert.assert_not_called()
+        assert json.loads((tmp_path / "phb.vector.json").read_text())["done"] == 10
+
+    def test_failure_is_reported(self, tmp_path, vector_search, collection):
+        collection.upsert.side_effect = RuntimeError("embedding model missing")
+        index = make_index(10)
+        queue = VectorIndexQueue(vector_search, tmp_path)
+
+        queue.enqueue(index, index.toc)
+
+        assert queue.wait(timeout=5)
+        progress = queue.progress()["phb"]
+        assert (progress.state, progress.error) == ("failed", "embedding model missing")
+
+    def test_close_stops_at_checkpoint(self, tmp_path, vector_search, collection):
+        """Closing mid-source keeps a checkpoint the next queue resumes from."""
+        first_batch = threading.Event()
+        release = threading.Event()
+
+        def slow_upsert(**kwargs):
+            first_batch.set()
+            release.wait(5)
+
+        collection.upsert.side_effect = slow_upsert
+        index = make_index(200)
+        queue = VectorIndexQueue(vector_search, tmp_path)
+        queue.enqueue(index, index.toc)
+        assert first_batch.wait(5)
+
+        closer = threading.Thread(target=queue.close)
+        closer.start()
+        while not queue._closed:
+            time.sleep(0.001)
+        release.set()
+        closer.join(5)
+
+        assert queue.progress()["phb"].state == "stopped"
+        assert json.loads((tmp_path / "phb.vector.json").read_text())["done"] == 64
+
+        collection.upsert.side_effect = None
+        collection.upsert.reset_mock()
+        resumed = VectorIndexQueue(vector_search, tmp_path)
+        resumed.enqueue(index, index.toc, check_existing=True)
+        assert resumed.wait(timeout=5)
+        assert upserted_ids(collection)[0][0] == "phb_64"
+
+
+class TestManagerBackendSwitch:
+    """Keyword search serves queries until the vector index is ready."""
+
+    def test_keyword_search_while_indexing(self, tmp_path, vector_search, collection):
+        release = threading.Event()
+        collection.upsert.side_effect = lambda **kwargs: release.wait(5)
+        manager = LibraryManager(tmp_path / "library")
+        manager._vector_search = vector_search
+
+        manager.save_index(make_index(100))
+
+        assert isinstance(manager.semantic_search, LibrarySearch)
+        assert not manager.vector_index_ready
+        assert manager.semantic_search.search("entry 7")[0].title == "Entry 7"
+        assert manager.vector_index_progress()["phb"].state in ("queued", "indexing")
+
+        release.set()
+        assert manager.wait_for_vector_index(timeout=5)
+        assert manager.semantic_search is vector_search
+        manager.close()
+
+    def test_startup_does_not_block(self, tmp_path, vector_search, collection):
+        """load_all_indexes returns before the vector index is built."""
+        release = threading.Event()
+        collection.upsert.side_effect = lambda **kwargs: release.wait(5)
+        first = LibraryManager(tmp_path / "library")
+        first.save_index(make_index(100))
+
+        manager = LibraryManager(tmp_path / "library")
+        manager._vector_search = vector_search
+
+        assert manager.load_all_indexes() == 1
+        assert not manager.vector_index_ready
+
+        release.set()
+        assert manager.wait_for_vector_index(timeout=5)
+        manager.close()
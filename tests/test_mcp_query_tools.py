@@ -230,6 +230,13 @@ def test_search_rules_with_category_filter(storage_with_rules: DnDStorage):
     assert all(r.category == "spell" for r in results)
 
 
+def test_search_rules_with_facets(storage_with_rules: DnDStorage):
+    """Test listing entries by facet without a query."""
+    results = storage_with_rules.rulebook_manager.search(query="", facets={"level": 3}, limit=20)
+
+    assert [r.index for r in results] == ["fireball"]
+
+
 def test_search_rules_no_results(storage_with_rules: DnDStorage):
     """Test search with no results."""
     results = storage_with_rules.rulebook_manager.search(query="nonexistent", categories=None, limit=20)
@@ -341,6 +341,75 @@ class TestCampaignMigrator:
         # Backup should not exist
         assert not (campaigns_dir / "Test.json.bak").exists()
 
+    def test_migration_to_entity_layout(self, tmp_path):
+        """Test that --layout entities writes one file per entity."""
+        from dm20_protocol.models import Campaign, GameState, NPC
+
+        campaigns_dir = tmp_path / "campaigns"
+        campaigns_dir.mkdir()
+        campaign = Campaign(
+            name="Test",
+            description="Test description",
+            game_state=GameState(campaign_name="Test"),
+            npcs={"Barkeep": NPC(name="Barkeep")},
+        )
+        (campaigns_dir / "Test.json").write_text(campaign.model_dump_json())
+
+        migrator = CampaignMigrator("Test", tmp_path, layout="entities")
+        migrator.migrate()
+
+        split_dir = campaigns_dir / "Test"
+        metadata = json.loads((split_dir / "campaign.json").read_text())
+        index = json.loads((split_dir / "npcs" / "_index.json").read_text())
+        assert metadata["storage_version"] == 2
+        assert list(index) == ["Barkeep"]
+        assert (split_dir / "npcs" / index["Barkeep"]).exists()
+        assert not (split_dir / "npcs.json").exists()
+
+    def test_layout_upgrade_of_split_campaign(self, tmp_path):
+        """Test converting an already split campaign in place."""
+        from dm20_protocol.models import NPC
+        from dm20_protocol.storage import SplitStorageBackend
+
+        backend = SplitStorageBackend(data_dir=tmp_path)
+        backend.create_campaign(name="Test", description="Test description")
+        backend.get_current_campaign().npcs["Barkeep"] = NPC(name="Barkeep")
+        backend.save_all()
+
+        migrator = CampaignMigrator("Test", tmp_path, layout="entities")
+        migrator.migrate()
+
+        split_dir = tmp_path / "campaigns" / "Test"
+        assert (split_dir / "npcs" / "_index.json").exists()
+        assert not (split_dir / "npcs.json").exists()
+        reloaded = SplitStorageBackend(data_dir=tmp_path, auto_load=False)
+        assert "Barkeep" in reloaded.load_campaign("Test").npcs
+
+    def test_layout_downgrade_of_split_campaign(self, tmp_path):
+        """Test converting an entity-layout campaign back to section files."""
+        from dm20_protocol.models import NPC
+        from dm20_protocol.storage import SplitLayout, SplitStorageBackend
+
+        backend = SplitStorageBackend(data_dir=tmp_path)
+        backend.create_campaign(name="Test", description="Test description", storage_version=SplitLayout.ENTITY_FILES)
+        backend.get_current_campaign().npcs["Barkeep"] = NPC(name="Barkeep")
+        backend.save_all()
+
+        migrator = CampaignMigrator("Test", tmp_path, layout="sections")
+        migrator.migrate()
+
+        split_dir = tmp_path / "campaigns" / "Test"
+        assert (split_dir / "npcs.json").exists()
+        assert not (split_dir / "npcs").exists()
+        assert "storage_version" not in json.loads((split_dir / "campaign.json").read_text())
+        reloaded = SplitStorageBackend(data_dir=tmp_path, auto_load=False)
+        assert "Barkeep" in reloaded.load_campaign("Test").npcs
+
+    def test_unknown_layout_rejected(self):
+        """Test that unknown layouts are rejected."""
+        with pytest.raises(MigrationError, match="Unknown layout"):
+            CampaignMigrator("Test", Path("data"), layout="shards")
+
 
 class TestCommandLineInterface:
     """Test command-line interface parsing."""
@@ -375,3 +444,13 @@ class TestCommandLineInterface:
             assert args.dry_run
             assert args.force
             assert args.data_dir == Path('/custom/path')
+
+    def test_parse_args_layout(self):
+        """Test the --layout option and its default."""
+        from migrate_campaign import parse_args
+
+        with patch('sys.argv', ['migrate_campaign.py', 'Test Campaign']):
+            assert parse_args().layout is None
+
+        with patch('sys.argv', ['migrate_campaign.py', 'Test Campaign', '--layout', 'entities']):
+            assert parse_args().layout == 'entities'
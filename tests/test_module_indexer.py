@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import fitz
 import pytest
 
 from dm20_protocol.claudmaster.module_indexer import (
@@ -35,6 +36,7 @@ from dm20_protocol.claudmaster.vector_store import (
     CollectionNotFoundError,
     VectorStoreManager,
 )
+from dm20_protocol.library.extractors import PageTextExtractor, RangeText
 
 
 # ---------------------------------------------------------------------------
@@ -69,6 +71,16 @@ def _make_mock_store() -> MagicMock:
     return store
 
 
+def _patch_page_text(text: str = "", error: str | None = None):
+    """Patch page extraction so every requested range reads *text* (or fails)."""
+
+    def extract_ranges(self, pdf_path, ranges, file_hash=None):
+        for page_start, page_end in ranges:
+            yield RangeText(page_start, page_end, "" if error else text, error)
+
+    return patch.object(PageTextExtractor, "extract_ranges", extract_ranges)
+
+
 def _sample_text(length: int = 600) -> str:
     """Generate sample adventure text of approximately *length* characters."""
     paragraph = (
@@ -525,10 +537,7 @@ class TestIndexModule:
         """Basic indexing creates collection and adds documents."""
         indexer = ModuleIndexer(mock_store)
 
-        with patch(
-            "dm20_protocol.claudmaster.module_indexer.extract_text_from_pdf",
-            return_value="The mists close in around the party. Strahd watches from Castle Ravenloft.",
-        ):
+        with _patch_page_text("The mists close in around the party. Strahd watches from Castle Ravenloft."):
             result = indexer.index_module(sample_structure, str(tmp_pdf))
 
         assert result.module_id == "curse-of-strahd"
@@ -576,10 +585,7 @@ class TestIndexModule:
 
         indexer = ModuleIndexer(mock_store)
 
-        with patch(
-            "dm20_protocol.claudmaster.module_indexer.extract_text_from_pdf",
-            return_value="Some adventure text about Strahd.",
-        ):
+        with _patch_page_text("Some adventure text about Strahd."):
             result = indexer.index_module(
                 sample_structure, str(tmp_pdf), force_reindex=True,
             )
@@ -599,10 +605,7 @@ class TestIndexModule:
         """Errors during text extraction should be recorded but not fatal."""
         indexer = ModuleIndexer(mock_store)
 
-        with patch(
-            "dm20_protocol.claudmaster.module_indexer.extract_text_from_pdf",
-            side_effect=RuntimeError("PDF read failure"),
-        ):
+        with _patch_page_text(error="PDF read failure"):
             result = indexer.index_module(sample_structure, str(tmp_pdf))
 
         # Should still return a result with errors
@@ -618,10 +621,7 @@ class TestIndexModule:
         """Elements with no extractable text should be skipped gracefully."""
         indexer = ModuleIndexer(mock_store)
 
-        with patch(
-            "dm20_protocol.claudmaster.module_indexer.extract_text_from_pdf",
-            return_value="",
-        ):
+        with _patch_page_text(""):
             result = indexer.index_module(sample_structure, str(tmp_pdf))
 
         assert result.chunks_created == 0
@@ -636,15 +636,60 @@ class TestIndexModule:
         """NPC and location cross-reference counts should be populated."""
         indexer = ModuleIndexer(mock_store)
 
-        with patch(
-            "dm20_protocol.claudmaster.module_indexer.extract_text_from_pdf",
-            return_value="Strahd lurks in Castle Ravenloft, watching.",
-        ):
+        with _patch_page_text("Strahd lurks in Castle Ravenloft, watching."):
             result = indexer.index_module(sample_structure, str(tmp_pdf))
 
         assert result.npcs_indexed >= 1
         assert result.locations_indexed >= 1
 
+    def test_index_module_stores_in_batches(
+        self,
+        mock_store: MagicMock,
+        sample_structure: ModuleStructure,
+        tmp_pdf: Path,
+    ) -> None:
+        """Chunks are stored in bounded batches as they are produced."""
+        indexer = ModuleIndexer(
+            mock_store,
+            chunk_config=ChunkConfig(chunk_size=200, chunk_overlap=50, min_chunk_size=50),
+            batch_size=3,
+        )
+
+        with _patch_page_text(_sample_text(2000)):
+            result = indexer.index_module(sample_structure, str(tmp_pdf))
+
+        batches = [call.kwargs["ids"] for call in mock_store.add_documents.call_args_list]
+        assert len(batches) > 1
+        assert all(len(ids) <= 3 for ids in batches)
+        assert sum(len(ids) for ids in batches) == result.chunks_created
+        assert batches[0][0] == "curse-of-strahd_1_0"
+
+    def test_close_releases_own_page_text(self, mock_store: MagicMock) -> None:
+        """close() shuts down the extractor the indexer created."""
+        indexer = ModuleIndexer(mock_store)
+
+        with patch.object(PageTextExtractor, "close") as close:
+            indexer.close()
+
+        close.assert_called_once_with()
+
+    def test_page_cache_under_persist_directory(self, mock_store: MagicMock, tmp_path: Path) -> None:
+        """The page cache defaults to a directory next to the vector store."""
+        mock_store.persist_directory = str(tmp_path / "chromadb")
+        indexer = ModuleIndexer(mock_store)
+
+        assert indexer._page_text.cache_dir == tmp_path / "chromadb" / "page_cache"
+        indexer.close()
+
+    def test_close_keeps_injected_page_text(self, mock_store: MagicMock) -> None:
+        """An extractor passed in stays open for its other users."""
+        page_text = MagicMock(spec=PageTextExtractor)
+        indexer = ModuleIndexer(mock_store, page_text=page_text)
+
+        indexer.close()
+
+        page_text.close.assert_not_called()
+
     def test_index_module_with_no_chapters(
         self,
         mock_store: MagicMock,
@@ -727,43 +772,38 @@ class TestForceSplit:
 
 
 class TestExtractTextFromPdf:
-    """Tests for extract_text_from_pdf with mocked PyMuPDF."""
+    """Tests for extract_text_from_pdf."""
 
-    @patch("fitz.open")
-    def test_basic_extraction(self, mock_fitz_open: MagicMock) -> None:
+    @pytest.fixture
+    def pdf(self, tmp_path: Path) -> Path:
+        document = fitz.open()
+        for number in range(1, 6):
+            document.new_page().insert_text((72, 72), f"Page {number} text")
+        path = tmp_path / "module.pdf"
+        document.save(path)
+        document.close()
+        return path
+
+    def test_basic_extraction(self, pdf: Path) -> None:
         """Should extract text from the correct page range."""
-        mock_page1 = MagicMock()
-        mock_page1.get_text.return_value = "Page 1 text"
-        mock_page2 = MagicMock()
-        mock_page2.get_text.return_value = "Page 2 text"
-
-        pages = [mock_page1, mock_page2, MagicMock(), MagicMock(), MagicMock()]
-        mock_doc = MagicMock()
-        mock_doc.page_count = 5
-        mock_doc.__getitem__ = MagicMock(side_effect=lambda idx: pages[idx])
-        mock_fitz_open.return_value = mock_doc
-
-        result = extract_text_from_pdf("/fake/path.pdf", 1, 2)
+        result = extract_text_from_pdf(pdf, 1, 2)
         assert "Page 1 text" in result
         assert "Page 2 text" in result
+        assert "Page 3 text" not in result
 
-    @patch("fitz.open")
-    def test_single_page(self, mock_fitz_open: MagicMock) -> None:
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Solo page"
-
-        mock_doc = MagicMock()
-        mock_doc.page_count = 10
-        mock_doc.__getitem__ = MagicMock(return_value=mock_page)
-        mock_fitz_open.return_value = mock_doc
+    def test_single_page(self, pdf: Path) -> None:
+        result = extract_text_from_pdf(str(pdf), 5, None)
+        assert result.strip() == "Page 5 text"
 
-        result = extract_text_from_pdf("/fake/path.pdf", 5, None)
-        assert "Solo page" in result
+    def test_range_clamped_to_document(self, pdf: Path) -> None:
+        result = extract_text_from_pdf(pdf, 4, 99)
+        assert "Page 4 text" in result
+        assert "Page 5 text" in result
 
-    @patch("fitz.open")
-    def test_open_failure(self, mock_fitz_open: MagicMock) -> None:
-        mock_fitz_open.side_effect = RuntimeError("Cannot open")
-        result = extract_text_from_pdf("/bad/path.pdf", 1, 5)
+    def test_open_failure(self, tmp_path: Path) -> None:
+        not_a_pdf = tmp_path / "notes.pdf"
+        not_a_pdf.write_text("plain text, not a PDF")
+        result = extract_text_from_pdf(not_a_pdf, 1, 5)
         assert result == ""
 
 
@@ -814,10 +854,7 @@ class TestFullPipeline:
             "The sounds of dripping water echo through the tunnels."
         )
 
-        with patch(
-            "dm20_protocol.claudmaster.module_indexer.extract_text_from_pdf",
-            return_value=long_text,
-        ):
+        with _patch_page_text(long_text):
             result = indexer.index_module(structure, str(pdf_file))
 
         assert result.module_id == "lost-mine"
@@ -0,0 +1,125 @@
+"""
+Tests for the PDF page text extraction service.
+
+Tests cover:
+- Range text, clamping and overlapping ranges
+- The on-disk page cache keyed by file hash, and pages it cannot store
+- Error reporting for unreadable files
+- Reading uncached pages in a process pool
+"""
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from dm20_protocol.library.extractors import pages as pages_module
+from dm20_protocol.library.extractors.pages import PageTextExtractor, RangeText
+
+
+def make_pdf(path: Path, page_count: int) -> Path:
+    document = fitz.open()
+    for number in range(1, page_count + 1):
+        page = document.new_page()
+        page.insert_text((72, 72), f"Page {number} text")
+    document.save(path)
+    document.close()
+    return path
+
+
+@pytest.fixture
+def pdf(tmp_path: Path) -> Path:
+    return make_pdf(tmp_path / "book.pdf", 10)
+
+
+@pytest.fixture
+def extractor(tmp_path: Path):
+    extractor = PageTextExtractor(tmp_path / "page_cache", workers=1)
+    yield extractor
+    extractor.close()
+
+
+def page_numbers(text: str) -> list[int]:
+    return [int(line.split()[1]) for line in text.splitlines() if line.startswith("Page ")]
+
+
+class TestRanges:
+    """Tests for reading page ranges."""
+
+    def test_single_page_and_range(self, extractor, pdf):
+        assert page_numbers(extractor.text(pdf, 3)) == [3]
+        assert page_numbers(extractor.text(pdf, 2, 4)) == [2, 3, 4]
+
+    def test_overlapping_ranges_in_request_order(self, extractor, pdf):
+        sections = list(extractor.extract_ranges(pdf, [(5, 8), (1, 3), (6, 6)]))
+
+        assert [page_numbers(s.text) for s in sections] == [[5, 6, 7, 8], [1, 2, 3], [6]]
+        assert [(s.page_start, s.page_end) for s in sections] == [(5, 8), (1, 3), (6, 6)]
+
+    def test_ranges_are_clamped(self, extractor, pdf):
+        assert page_numbers(extractor.text(pdf, 8, 50)) == [8, 9, 10]
+        assert page_numbers(extractor.text(pdf, 0, 1)) == [1]
+
+    def test_missing_file(self, extractor, tmp_path):
+        [section] = extractor.extract_ranges(tmp_path / "missing.pdf", [(1, 2)])
+
+        assert section.text == ""
+        assert "cannot open PDF" in section.error
+        assert extractor.text(tmp_path / "missing.pdf", 1) == ""
+
+
+class TestCache:
+    """Tests for the on-disk page cache."""
+
+    def test_pages_are_cached_by_hash(self, extractor, pdf, tmp_path):
+        extractor.text(pdf, 1, 3)
+
+        cache = tmp_path / "page_cache" / extractor.file_hash(pdf)
+        assert sorted(p.name for p in cache.iterdir()) == ["00000.txt", "00001.txt", "00002.txt", "meta.json"]
+
+    def test_cached_pages_are_not_reread(self, tmp_path, pdf, monkeypatch):
+        first = PageTextExtractor(tmp_path / "page_cache", workers=1)
+        expected = first.text(pdf, 1, 10)
+        first.close()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached page read from the PDF")
+
+        monkeypatch.setattr(pages_module, "_read_pages", fail)
+        second = PageTextExtractor(tmp_path / "page_cache", workers=1)
+        assert second.text(pdf, 1, 10) == expected
+
+    def test_unencodable_text_is_not_cached(self, extractor, pdf, monkeypatch):
+        monkeypatch.setattr(pages_module, "_read_pages", lambda *args: ["Page 1 \ud800" for _ in args[3]])
+
+        assert extractor.text(pdf, 1) == "Page 1 \ud800"
+        assert not extractor._cached(extractor.file_hash(pdf), 0)
+
+    def test_without_cache_dir(self, pdf):
+        extractor = PageTextExtractor(workers=1)
+
+        assert page_numbers(extractor.text(pdf, 1, 2)) == [1, 2]
+        extractor.close()
+
+
+class TestParallel:
+    """Tests for reading uncached pages in worker processes."""
+
+    def test_pool_matches_in_process(self, tmp_path, monkeypatch):
+        pdf = make_pdf(tmp_path / "large.pdf", 40)
+        monkeypatch.setattr(pages_module, "PARALLEL_MIN_PAGES", 8)
+        monkeypatch.setattr(pages_module, "PAGES_PER_TASK", 4)
+        ranges = [(1, 20), (15, 40), (3, 3)]
+
+        parallel = PageTextExtractor(tmp_path / "parallel", workers=2)
+        try:
+            parallel_sections = list(parallel.extract_ranges(pdf, ranges))
+        finally:
+            parallel.close()
+        serial = PageTextExtractor(tmp_path / "serial", workers=1)
+        serial_sections = list(serial.extract_ranges(pdf, ranges))
+        serial.close()
+
+        assert parallel_sections == serial_sections
+        assert page_numbers(parallel_sections[1].text) == list(range(15, 41))
+        assert all(isinstance(s, RangeText) and s.error is None for s in parallel_sections)
@@ -0,0 +1,315 @@
+"""
+Tests for the rulebook search index.
+
+Tests cover:
+- Ranking: exact, prefix, word prefix, substring, description
+- Same matches as the old linear substring scan
+- Facet filters and class_filter, with and without a query
+- Index rebuild when a source's content changes
+- RulebookManager merging, de-duplication and sources with their own search()
+- Benchmark: indexed queries examine only the entries that match
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Iterator
+
+import pytest
+
+from dm20_protocol.rulebooks.manager import RulebookManager
+from dm20_protocol.rulebooks.models import (
+    ArmorClassInfo,
+    MonsterDefinition,
+    RulebookSource,
+    Size,
+    SpellDefinition,
+    SpellSchool,
+)
+from dm20_protocol.rulebooks.sources.base import ContentCounts, RulebookSourceBase, SearchResult
+
+
+def run_async(coro):
+    """Helper to run async code in sync tests."""
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def make_spell(name: str, level: int = 1, school: SpellSchool = SpellSchool.EVOCATION,
+               classes: list[str] | None = None, desc: str = "") -> SpellDefinition:
+    return SpellDefinition(
+        index=name.lower().replace(" ", "-"),
+        name=name,
+        level=level,
+        school=school,
+        casting_time="1 action",
+        range="60 feet",
+        duration="Instantaneous",
+        components=["V", "S"],
+        desc=[desc] if desc else [],
+        classes=classes or ["wizard"],
+    )
+
+
+def make_monster(name: str, cr: float = 1, creature_type: str = "beast", desc: str | None = None) -> MonsterDefinition:
+    return MonsterDefinition(
+        index=name.lower().replace(" ", "-"),
+        name=name,
+        size=Size.MEDIUM,
+        type=creature_type,
+        alignment="unaligned",
+        armor_class=[ArmorClassInfo(type="natural", value=12)],
+        hit_points=11,
+        hit_dice="2d8+2",
+        speed={"walk": "30 ft."},
+        strength=12, dexterity=12, constitution=12, intelligence=3, wisdom=10, charisma=6,
+        challenge_rating=cr,
+        xp=200,
+        desc=desc,
+    )
+
+
+class DictSource(RulebookSourceBase):
+    """Source holding spells and monsters in the standard category dicts."""
+
+    def __init__(self, source_id: str = "test", spells=(), monsters=()):
+        super().__init__(source_id, RulebookSource.CUSTOM)
+        self._spells = {s.index: s for s in spells}
+        self._monsters = {m.index: m for m in monsters}
+
+    async def load(self) -> None:
+        self._loaded = True
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def get_class(self, index): return None
+    def get_subclass(self, index): return None
+    def get_race(self, index): return None
+    def get_subrace(self, index): return None
+    def get_spell(self, index): return self._spells.get(index)
+    def get_monster(self, index): return self._monsters.get(index)
+    def get_feat(self, index): return None
+    def get_background(self, index): return None
+    def get_item(self, index): return None
+
+    def content_counts(self) -> ContentCounts:
+        return ContentCounts(spells=len(self._spells), monsters=len(self._monsters))
+
+
+class LinearSource(DictSource):
+    """Source with its own search(), as third-party sources may have."""
+
+    def search(self, query, categories=None, limit=20, class_filter=None) -> Iterator[SearchResult]:
+        q = query.lower()
+        count = 0
+        for monster in self._monsters.values():
+            if q in monster.name.lower():
+                yield SearchResult(monster.index, monster.name, "monster", self.source_id)
+                count += 1
+                if count >= limit:
+                    return
+
+
+def linear_search(source: DictSource, query: str) -> set[str]:
+    """The name/index matches of the old linear scan."""
+    q = query.lower()
+    entries = list(source._spells.values()) + list(source._monsters.values())
+    return {e.index for e in entries if q in e.index or q in e.name.lower()}
+
+
+@pytest.fixture
+def source() -> DictSource:
+    return DictSource(
+        spells=[
+            make_spell("Fireball", 3, classes=["wizard", "sorcerer"], desc="A bright streak of flame."),
+            make_spell("Fire Bolt", 0, classes=["wizard", "sorcerer"]),
+            make_spell("Wall of Fire", 4, classes=["wizard", "druid"]),
+            make_spell("Delayed Blast Fireball", 7, classes=["wizard"]),
+            make_spell("Shield", 1, SpellSchool.ABJURATION, classes=["wizard"]),
+            make_spell("Cure Wounds", 1, SpellSchool.EVOCATION, classes=["cleric", "ranger"],
+                       desc="A creature you touch regains hit points."),
+            make_spell("Hunter's Mark", 1, SpellSchool.DIVINATION, classes=["ranger"]),
+        ],
+        monsters=[
+            make_monster("Fire Elemental", 5, "elemental"),
+            make_monster("Wolf", 0.25, "beast", desc="Wolves hunt in packs and fear fire."),
+            make_monster("Zombie", 0.25, "undead"),
+            make_monster("Ghoul", 1, "undead"),
+            make_monster("Dire Wolf", 1, "beast"),
+        ],
+    )
+
+
+def names(results) -> list[str]:
+    return [r.name for r in results]
+
+
+class TestRanking:
+    """Results come best match first."""
+
+    def test_tier_order(self, source: DictSource) -> None:
+        results = names(source.search("fire", limit=50))
+
+        # Prefix (shorter names first), word prefix, then description-only
+        assert results[:3] == ["Fireball", "Fire Bolt", "Fire Elemental"]
+        assert results.index("Fire Elemental") < results.index("Wall of Fire")
+        assert results.index("Wall of Fire") < results.index("Wolf")
+        assert results[-1] == "Wolf"
+
+    def test_exact_match_first(self, source: DictSource) -> None:
+        assert names(source.search("fireball"))[0] == "Fireball"
+
+    def test_substring_below_word_prefix(self, source: DictSource) -> None:
+        results = names(source.search("ball"))
+
+        assert set(results) == {"Fireball", "Delayed Blast Fireball"}
+        assert results[0] == "Fireball"
+
+    def test_limit(self, source: DictSource) -> None:
+        assert len(list(source.search("fire", limit=2))) == 2
+
+    def test_summary_is_first_paragraph(self, source: DictSource) -> None:
+        result = next(source.search("fireball"))
+
+        assert result.summary == "A bright streak of flame."
+
+
+class TestLinearEquivalence:
+    """The index finds at least what the old substring scan found."""
+
+    @pytest.mark.parametrize("query", ["f", "fi", "fire", "wolf", "e", "ld", "hunter's", "zzz", "-", "of fire"])
+    def test_name_matches_are_found(self, source: DictSource, query: str) -> None:
+        found = {r.index for r in source.search(query, limit=1000)}
+
+        assert linear_search(source, query) <= found
+
+    def test_extra_matches_come_from_descriptions(self, source: DictSource) -> None:
+        found = {r.index for r in source.search("creature", limit=1000)}
+
+        assert linear_search(source, "creature") == set()
+        assert found == {"cure-wounds"}
+
+    def test_short_query_skips_descriptions(self, source: DictSource) -> None:
+        found = {r.index for r in source.search("a", limit=1000)}
+
+        assert found == linear_search(source, "a")
+
+
+class TestFacets:
+    """Facet and class filters."""
+
+    def test_spell_level(self, source: DictSource) -> None:
+        assert names(source.search_index.search("fire", facets={"level": 3})) == ["Fireball"]
+
+    def test_spell_school_and_class(self, source: DictSource) -> None:
+        results = source.search_index.search("", facets={"school": "evocation", "class": "druid"})
+
+        assert names(results) == ["Wall of Fire"]
+
+    def test_monster_cr_and_type(self, source: DictSource) -> None:
+        results = source.search_index.search("", facets={"cr": 0.25, "type": "undead"})
+
+        assert names(results) == ["Zombie"]
+
+    def test_list_values_match_any(self, source: DictSource) -> None:
+        results = source.search_index.search("", categories=["monster"], facets={"cr": [1, 5]}, limit=50)
+
+        assert set(names(results)) == {"Fire Elemental", "Ghoul", "Dire Wolf"}
+
+    def test_unknown_facet(self, source: DictSource) -> None:
+        with pytest.raises(ValueError, match="Unknown facet"):
+            source.search_index.search("", facets={"colour": "red"})
+
+    def test_facet_counts(self, source: DictSource) -> None:
+        assert source.search_index.facet_counts("type") == {"elemental": 1, "beast": 2, "undead": 2}
+
+    def test_class_filter_with_query_keeps_other_categories(self, source: DictSource) -> None:
+        results = names(source.search("fire", class_filter="druid", limit=50))
+
+        assert "Wall of Fire" in results
+        assert "Fire Elemental" in results
+        assert "Fireball" not in results
+
+    def test_class_filter_without_query_lists_class_spells(self, source: DictSource) -> None:
+        assert set(names(source.search("", class_filter="ranger"))) == {"Cure Wounds", "Hunter's Mark"}
+
+    def test_empty_query_without_filters_finds_nothing(self, source: DictSource) -> None:
+        assert list(source.search("")) == []
+
+
+class TestRebuild:
+    """The index follows changes to the source content."""
+
+    def test_new_entries_are_indexed(self, source: DictSource) -> None:
+        assert list(source.search("owlbear")) == []
+
+        owlbear = make_monster("Owlbear", 3, "monstrosity")
+        source._monsters[owlbear.index] = owlbear
+
+        assert names(source.search("owlbear")) == ["Owlbear"]
+
+    def test_unchanged_content_reuses_index(self, source: DictSource) -> None:
+        # DictSource has no class/race/... dicts at all
+        assert source.search_index is source.search_index
+
+    def test_replaced_content_is_indexed(self, source: DictSource) -> None:
+        source.build_search_index()
+        source._spells = {"light": make_spell("Light", 0)}
+
+        assert names(source.search("", categories=["spell"])) == ["Light"]
+
+
+class TestManagerSearch:
+    """RulebookManager merges ranked results across sources."""
+
+    def _manager(self, tmp_path, *sources) -> RulebookManager:
+        manager = RulebookManager(tmp_path)
+        for s in sources:
+            run_async(manager.load_source(s))
+        return manager
+
+    def test_merged_ranking_and_priority(self, tmp_path) -> None:
+        base = DictSource("base", spells=[make_spell("Fire Bolt"), make_spell("Wall of Fire")])
+        homebrew = DictSource("homebrew", spells=[make_spell("Fire", 2), make_spell("Wall of Fire", 5)])
+        manager = self._manager(tmp_path, base, homebrew)
+
+        results = manager.search("fire")
+
+        assert names(results) == ["Fire", "Fire Bolt", "Wall of Fire"]
+        assert results[2].source == "homebrew"
+
+    def test_facets_through_manager(self, tmp_path, source: DictSource) -> None:
+        manager = self._manager(tmp_path, source)
+
+        assert names(manager.search("", facets={"type": "beast", "cr": 1})) == ["Dire Wolf"]
+        with pytest.raises(ValueError):
+            manager.search("wolf", facets={"size": "large"})
+
+    def test_source_with_own_search(self, tmp_path) -> None:
+        linear = LinearSource("linear", monsters=[make_monster("Wolf", 0.25), make_monster("Dire Wolf", 1),
+                                                  make_monster("Werewolf", 3, "humanoid")])
+        manager = self._manager(tmp_path, linear)
+
+        assert names(manager.search("wolf")) == ["Wolf", "Dire Wolf", "Werewolf"]
+        assert names(manager.search("wolf", facets={"cr": 1})) == ["Dire Wolf"]
+
+
+@pytest.mark.slow
+class TestSearchBenchmark:
+    """An indexed query must only look at entries that can match."""
+
+    def test_indexed_query_examines_only_matches(self) -> None:
+        adjectives = ["Ancient", "Young", "Frost", "Shadow", "Iron", "Bone", "Storm", "Swamp"]
+        kinds = ["Dragon", "Giant", "Wolf", "Golem", "Hag", "Troll", "Wraith", "Drake"]
+        monsters = [
+            make_monster(f"{adjectives[i % 8]} {kinds[i // 8 % 8]} {i}", i % 20, kinds[i // 8 % 8].lower())
+            for i in range(4000)
+        ]
+        source = DictSource(monsters=monsters)
+        index = source.build_search_index()
+        queries = ["frost troll", "wraith", "golem 12", "drag", "iron", "hag 3999"]
+
+        for query in queries:
+            expected = linear_search(source, query)
+            candidates = set(index._name_candidates(query))
+            # The linear scan reads all 4000 entries; the n-gram index hands
+            # out exactly the entries whose name or index contains the query
+            assert len(candidates) == len(expected)
+            assert expected <= {r.index for r in index.search(query, limit=5000)}
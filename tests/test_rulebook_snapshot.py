@@ -0,0 +1,232 @@
+"""
+Tests for binary rulebook snapshots.
+
+Tests cover:
+- Snapshot file round trip and rejection of stale or damaged files
+- FiveToolsSource hydrating from its snapshot and re-mapping on cache change
+- SRDSource hydrating without reading per-entry cache files
+- RulebookManager.from_manifest using snapshots
+- Benchmark: snapshot hydration maps nothing, re-mapping maps every entry
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dm20_protocol.rulebooks.manager import RulebookManager
+from dm20_protocol.rulebooks.snapshot import (
+    SnapshotError,
+    read_snapshot,
+    write_snapshot,
+)
+from dm20_protocol.rulebooks.sources.fivetools import FiveToolsSource
+from dm20_protocol.rulebooks.sources.srd import SRDSource
+
+
+def run_async(coro):
+    """Helper to run async code in sync tests."""
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def _spell(i: int) -> dict:
+    return {
+        "name": f"Arcane Bolt {i}",
+        "source": "PHB",
+        "level": i % 9 + 1,
+        "school": "V",
+        "time": [{"number": 1, "unit": "action"}],
+        "range": {"type": "point", "distance": {"type": "feet", "amount": 120}},
+        "components": {"v": True, "s": True},
+        "duration": [{"type": "instant"}],
+        "entries": [f"A bolt of {{@damage {i % 6 + 1}d6}} force strikes a {{@creature goblin}}."],
+        "classes": {"fromClassList": [{"name": "Wizard", "source": "PHB"}]},
+    }
+
+
+def _monster(i: int) -> dict:
+    return {
+        "name": f"Cave Beast {i}",
+        "source": "MM",
+        "size": ["L"],
+        "type": "monstrosity",
+        "cr": str(i % 20 + 1),
+        "ac": [{"ac": 14, "from": ["natural armor"]}],
+        "hp": {"average": 50 + i, "formula": "8d10+20"},
+        "speed": {"walk": 40, "climb": 20},
+        "str": 18, "dex": 12, "con": 16, "int": 3, "wis": 12, "cha": 6,
+        "action": [
+            {"name": "Bite", "entries": [f"{{@atk mw}} {{@hit 6}} to hit, {{@h}}{i % 10 + 5} damage."]},
+            {"name": "Claw", "entries": ["{@atk mw} {@hit 6} to hit, {@h}8 ({@damage 1d10 + 3}) damage."]},
+        ],
+    }
+
+
+def _write_fivetools_cache(cache_dir: Path, spells: int = 3, monsters: int = 2) -> None:
+    merged = cache_dir / "merged"
+    merged.mkdir(parents=True, exist_ok=True)
+    (cache_dir / "metadata.json").write_text(json.dumps({"downloaded_at": "2026-01-01T00:00:00"}))
+    (merged / "spells.json").write_text(json.dumps({"spell": [_spell(i) for i in range(spells)]}))
+    (merged / "bestiary.json").write_text(json.dumps({"monster": [_monster(i) for i in range(monsters)]}))
+
+
+def _load_fivetools(cache_dir: Path) -> FiveToolsSource:
+    source = FiveToolsSource(cache_dir=cache_dir)
+    run_async(source.load())
+    return source
+
+
+class TestSnapshotFile:
+    """Tests for the snapshot file format."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "s.snapshot"
+        write_snapshot(path, {"source_id": "x", "content_hash": "abc"}, {"_spells": {"a": 1}})
+
+        assert read_snapshot(path, {"source_id": "x", "content_hash": "abc"}) == {"_spells": {"a": 1}}
+
+    def test_changed_content_hash_is_stale(self, tmp_path: Path) -> None:
+        path = tmp_path / "s.snapshot"
+        write_snapshot(path, {"source_id": "x", "content_hash": "abc"}, {"_spells": {}})
+
+        with pytest.raises(SnapshotError, match="content_hash"):
+            read_snapshot(path, {"source_id": "x", "content_hash": "def"})
+
+    def test_damaged_file_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "s.snapshot"
+        write_snapshot(path, {"source_id": "x"}, {"_spells": {}})
+        path.write_bytes(path.read_bytes()[:-5])
+
+        with pytest.raises(SnapshotError):
+            read_snapshot(path, {"source_id": "x"})
+
+    def test_foreign_file_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "s.snapshot"
+        path.write_text("{}")
+
+        with pytest.raises(SnapshotError, match="not a rulebook snapshot"):
+            read_snapshot(path, {})
+
+
+class TestFiveToolsSnapshot:
+    """Tests for FiveToolsSource snapshots."""
+
+    def test_second_load_hydrates_without_mapping(self, tmp_path: Path) -> None:
+        _write_fivetools_cache(tmp_path)
+        first = _load_fivetools(tmp_path)
+
+        with patch.object(FiveToolsSource, "_parse_all_data") as parse:
+            second = _load_fivetools(tmp_path)
+
+        parse.assert_not_called()
+        assert second.is_loaded
+        assert second.get_spell("arcane-bolt-1") == first.get_spell("arcane-bolt-1")
+        assert second.content_counts() == first.content_counts()
+        assert [r.index for r in second.search("cave")] == [r.index for r in first.search("cave")]
+
+    def test_changed_cache_is_remapped(self, tmp_path: Path) -> None:
+        _write_fivetools_cache(tmp_path, spells=3)
+        _load_fivetools(tmp_path)
+
+        _write_fivetools_cache(tmp_path, spells=5)
+        reloaded = _load_fivetools(tmp_path)
+
+        assert reloaded.content_counts().spells == 5
+
+    def test_mapper_version_change_invalidates(self, tmp_path: Path) -> None:
+        _write_fivetools_cache(tmp_path)
+        _load_fivetools(tmp_path)
+
+        with patch.object(FiveToolsSource, "SNAPSHOT_MAPPER_VERSION", 99):
+            reloaded = _load_fivetools(tmp_path)
+
+        assert reloaded.raw_data_counts["spells"] == 3
+
+
+class TestSRDSnapshot:
+    """Tests for SRDSource snapshots."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path: Path) -> Path:
+        cache_dir = tmp_path / "srd"
+        cache_dir.mkdir()
+        empty = {"count": 0, "results": []}
+        for endpoint in ["classes", "races", "monsters", "equipment", "feats", "backgrounds"]:
+            (cache_dir / f"{endpoint}.json").write_text(json.dumps(empty))
+        (cache_dir / "spells.json").write_text(json.dumps({"count": 1, "results": [{"index": "fireball"}]}))
+        (cache_dir / "spells_fireball.json").write_text(json.dumps({
+            "index": "fireball", "name": "Fireball", "level": 3, "school": {"name": "Evocation"},
+            "casting_time": "1 action", "range": "150 feet", "duration": "Instantaneous",
+            "components": ["V", "S"], "desc": ["Boom."], "classes": [{"index": "wizard"}],
+        }))
+        return cache_dir
+
+    def test_second_load_skips_cache_files(self, cache_dir: Path) -> None:
+        run_async(SRDSource(cache_dir=cache_dir).load())
+
+        source = SRDSource(cache_dir=cache_dir)
+        with patch.object(SRDSource, "_fetch") as fetch:
+            run_async(source.load())
+
+        fetch.assert_not_called()
+        assert source.get_spell("fireball").name == "Fireball"
+
+    def test_partial_load_writes_no_snapshot(self, cache_dir: Path) -> None:
+        (cache_dir / "spells_fireball.json").write_text(json.dumps({"index": "fireball"}))
+        source = SRDSource(cache_dir=cache_dir)
+
+        run_async(source.load())
+
+        assert source.get_spell("fireball") is None
+        assert not source.snapshot_path().exists()
+
+    def test_versions_do_not_share_snapshots(self, cache_dir: Path) -> None:
+        paths = {SRDSource(version=v, cache_dir=cache_dir).snapshot_path() for v in ["2014", "2024"]}
+
+        assert len(paths) == 2
+
+
+class TestManifestHydration:
+    """RulebookManager.from_manifest goes through the snapshot."""
+
+    def test_from_manifest_uses_snapshot(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "rulebooks" / "cache"
+        _write_fivetools_cache(cache_dir)
+
+        async def build() -> None:
+            manager = RulebookManager(tmp_path)
+            await manager.load_source(FiveToolsSource(cache_dir=cache_dir))
+
+        run_async(build())
+
+        with patch.object(FiveToolsSource, "_parse_all_data") as parse:
+            manager = run_async(RulebookManager.from_manifest(tmp_path))
+
+        parse.assert_not_called()
+        assert manager.get_monster("cave-beast-1").name == "Cave Beast 1"
+
+
+@pytest.mark.slow
+class TestSnapshotBenchmark:
+    """Hydrating from a snapshot must skip re-parsing and re-mapping."""
+
+    def test_snapshot_skips_mapping(self, tmp_path: Path) -> None:
+        _write_fivetools_cache(tmp_path, spells=400, monsters=400)
+
+        def counting(name: str):
+            return patch.object(
+                FiveToolsSource, name, autospec=True, side_effect=getattr(FiveToolsSource, name)
+            )
+
+        with counting("_map_spell") as spell, counting("_map_monster") as monster:
+            mapped = _load_fivetools(tmp_path)
+            mapping_calls = spell.call_count + monster.call_count
+            hydrated = _load_fivetools(tmp_path)
+            snapshot_calls = spell.call_count + monster.call_count - mapping_calls
+
+        assert hydrated.content_counts() == mapped.content_counts()
+        assert hydrated.raw_data_counts == {}
+        assert mapping_calls == 800
+        assert snapshot_calls == 0
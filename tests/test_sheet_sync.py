@@ -221,14 +221,21 @@ class TestLifecycle:
         sm.stop()
         assert not sm.is_active
 
-    def test_on_event_saved(
-        self, sync: SheetSyncManager, sample_character: Character, mock_storage: MagicMock
+    def test_on_event_updated(
+        self, sync: SheetSyncManager, sample_character: Character
     ) -> None:
-        # Should render all characters
-        sync.on_event("saved")
+        # Renders the saved data, not the live character
+        data = sample_character.model_dump(mode="json")
+        sync.on_event("updated", sample_character.name, 1, None, data)
         path = sync._sheets_dir / "Aldric Stormwind.md"
         assert path.exists()
 
+    def test_on_event_saved_does_not_read_live_characters(
+        self, sync: SheetSyncManager, mock_storage: MagicMock
+    ) -> None:
+        sync.on_event("saved")
+        mock_storage.get_current_campaign.assert_not_called()
+
     def test_on_event_deleted(
         self, sync: SheetSyncManager, sample_character: Character
     ) -> None:
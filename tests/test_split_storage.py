@@ -125,7 +125,7 @@ class TestSplitStorageBackendInit:
         assert storage.data_dir.exists()
         assert (storage.data_dir / "campaigns").exists()
         assert storage._current_campaign is None
-        assert len(storage._section_hashes) == 7
+        assert set(storage._section_hashes) == {"campaign", "game_state"}
 
     def test_init_with_nonexistent_dir(self, temp_storage_dir):
         """Test initialization with a non-existent directory."""
@@ -795,5 +795,222 @@ class TestGetCurrentCampaign:
         assert current.name == "Test Campaign"
 
 
+class TestEntityFileLayout:
+    """Tests for the per-entity file layout (storage_version 2)."""
+
+    def test_create_writes_entity_directories(self, split_storage, sample_npc):
+        split_storage.create_campaign(
+            name="Entity Layout", description="One file per entity", storage_version=2
+        )
+        campaign = split_storage.get_current_campaign()
+        campaign.npcs[sample_npc.name] = sample_npc
+        split_storage.save_all()
+
+        campaign_dir = split_storage._get_campaign_dir()
+        metadata = json.loads((campaign_dir / "campaign.json").read_text())
+        index = json.loads((campaign_dir / "npcs" / "_index.json").read_text())
+        npc_filename = SplitStorageBackend._entity_filename(sample_npc.name)
+        npc_file = campaign_dir / "npcs" / npc_filename
+
+        assert metadata["storage_version"] == 2
+        assert not (campaign_dir / "npcs.json").exists()
+        assert index == {sample_npc.name: npc_filename}
+        assert json.loads(npc_file.read_text())["name"] == sample_npc.name
+
+    def test_single_edit_rewrites_only_that_file(self, split_storage):
+        split_storage.create_campaign(name="Entity Layout", description="Test", storage_version=2)
+        campaign = split_storage.get_current_campaign()
+        for i in range(5):
+            campaign.npcs[f"NPC {i}"] = NPC(name=f"NPC {i}")
+        split_storage.save_all()
+
+        npc_dir = split_storage._get_campaign_dir() / "npcs"
+        mtimes = {path.name: path.stat().st_mtime_ns for path in npc_dir.iterdir()}
+        campaign.npcs["NPC 3"].notes = "Knows the secret door"
+        split_storage.save_all()
+
+        changed = {
+            path.name for path in npc_dir.iterdir()
+            if path.stat().st_mtime_ns != mtimes[path.name]
+        }
+        assert changed == {SplitStorageBackend._entity_filename("NPC 3")}
+
+    def test_removed_entity_file_is_deleted(self, split_storage, sample_quest):
+        split_storage.create_campaign(name="Entity Layout", description="Test", storage_version=2)
+        campaign = split_storage.get_current_campaign()
+        campaign.quests[sample_quest.title] = sample_quest
+        split_storage.save_all()
+
+        del campaign.quests[sample_quest.title]
+        split_storage.save_all()
+
+        quest_dir = split_storage._get_campaign_dir() / "quests"
+        assert json.loads((quest_dir / "_index.json").read_text()) == {}
+        assert not (quest_dir / SplitStorageBackend._entity_filename(sample_quest.title)).exists()
+
+    def test_entity_filenames_are_unique_and_safe(self):
+        first = SplitStorageBackend._entity_filename("Goblin/Boss")
+        second = SplitStorageBackend._entity_filename("Goblin Boss")
+
+        assert first != second
+        assert "/" not in first
+        assert first.endswith(".json")
+
+    def test_round_trip(self, temp_storage_dir, sample_character, sample_location):
+        storage = SplitStorageBackend(data_dir=temp_storage_dir)
+        storage.create_campaign(name="Entity Layout", description="Test", storage_version=2)
+        campaign = storage.get_current_campaign()
+        campaign.characters[sample_character.id] = sample_character
+        campaign.locations[sample_location.name] = sample_location
+        storage.save_all()
+
+        reloaded = SplitStorageBackend(data_dir=temp_storage_dir, auto_load=False)
+        loaded = reloaded.load_campaign("Entity Layout")
+
+        assert reloaded.storage_version == 2
+        assert loaded.characters[sample_character.id].name == sample_character.name
+        assert loaded.locations[sample_location.name].description == sample_location.description
+
+
+class TestLazyLoading:
+    """Tests for loading entity sections on first access."""
+
+    @pytest.fixture
+    def saved_campaign(self, temp_storage_dir, sample_npc, sample_location):
+        storage = SplitStorageBackend(data_dir=temp_storage_dir)
+        storage.create_campaign(name="Lazy Campaign", description="Test")
+        campaign = storage.get_current_campaign()
+        campaign.npcs[sample_npc.name] = sample_npc
+        campaign.locations[sample_location.name] = sample_location
+        storage.save_all()
+        return temp_storage_dir
+
+    def test_sections_load_on_first_access(self, saved_campaign, sample_npc):
+        from dm20_protocol.change_tracker import LazyEntities
+
+        storage = SplitStorageBackend(data_dir=saved_campaign, auto_load=False)
+        campaign = storage.load_campaign("Lazy Campaign", lazy=True)
+
+        assert isinstance(campaign.npcs, LazyEntities)
+        assert not campaign.npcs.is_loaded
+        assert sample_npc.name in campaign.npcs
+        assert campaign.npcs.is_loaded
+        assert not campaign.locations.is_loaded
+
+    def test_save_leaves_unloaded_sections_alone(self, saved_campaign, sample_location):
+        storage = SplitStorageBackend(data_dir=saved_campaign, auto_load=False)
+        campaign = storage.load_campaign("Lazy Campaign", lazy=True)
+        campaign.npcs["Shopkeeper Bob"].notes = "Owes the party gold"
+        storage.save_all()
+
+        assert not campaign.locations.is_loaded
+        reloaded = SplitStorageBackend(data_dir=saved_campaign, auto_load=False).load_campaign("Lazy Campaign")
+        assert reloaded.npcs["Shopkeeper Bob"].notes == "Owes the party gold"
+        assert sample_location.name in reloaded.locations
+
+    def test_model_dump_loads_sections(self, saved_campaign, sample_location):
+        storage = SplitStorageBackend(data_dir=saved_campaign, auto_load=False)
+        campaign = storage.load_campaign("Lazy Campaign", lazy=True)
+
+        data = campaign.model_dump(mode="json")
+
+        assert sample_location.name in data["locations"]
+
+    def test_failed_load_is_retried(self, sample_npc):
+        from dm20_protocol.change_tracker import ChangeTracker, LazyEntities
+
+        calls = []
+
+        def loader():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("disk not ready")
+            return {sample_npc.name: sample_npc}
+
+        npcs = LazyEntities(loader, ChangeTracker(), "npcs")
+
+        with pytest.raises(OSError):
+            npcs.ensure_loaded()
+        assert not npcs.is_loaded
+
+        assert sample_npc.name in npcs
+        assert npcs.is_loaded
+        assert len(calls) == 2
+
+
+class TestConvertLayout:
+    """Tests for converting between split layouts."""
+
+    def test_convert_to_entity_files_and_back(self, split_storage, sample_npc, sample_encounter):
+        split_storage.create_campaign(name="Convert Me", description="Test")
+        campaign = split_storage.get_current_campaign()
+        campaign.npcs[sample_npc.name] = sample_npc
+        campaign.encounters[sample_encounter.name] = sample_encounter
+        split_storage.save_all()
+        campaign_dir = split_storage._get_campaign_dir()
+
+        split_storage.convert_layout(2)
+
+        assert (campaign_dir / "npcs" / "_index.json").exists()
+        assert not (campaign_dir / "npcs.json").exists()
+        reloaded = SplitStorageBackend(data_dir=split_storage.data_dir, auto_load=False)
+        assert reloaded.load_campaign("Convert Me").npcs[sample_npc.name].race == "Dwarf"
+        assert reloaded.storage_version == 2
+
+        reloaded.convert_layout(1)
+
+        assert (campaign_dir / "npcs.json").exists()
+        assert not (campaign_dir / "npcs").exists()
+        final = SplitStorageBackend(data_dir=split_storage.data_dir, auto_load=False)
+        assert sample_encounter.name in final.load_campaign("Convert Me").encounters
+        assert final.storage_version == 1
+
+    def test_convert_requires_campaign(self, split_storage):
+        with pytest.raises(ValueError):
+            split_storage.convert_layout(2)
+
+    def test_convert_rejects_unknown_version(self, split_storage):
+        split_storage.create_campaign(name="Convert Me", description="Test")
+        with pytest.raises(ValueError):
+            split_storage.convert_layout(7)
+
+
+class TestWriteAmplificationBenchmark:
+    """Compare bytes written for a single-NPC edit across layouts."""
+
+    @staticmethod
+    def _bytes_for_single_edit(data_dir: Path, storage_version: int) -> int:
+        storage = SplitStorageBackend(data_dir=data_dir)
+        storage.create_campaign(name="Big Campaign", description="Benchmark", storage_version=storage_version)
+        campaign = storage.get_current_campaign()
+        for i in range(6):
+            campaign.characters[f"char-{i}"] = Character(
+                name=f"Hero {i}",
+                character_class=CharacterClass(name="Fighter", level=5),
+                race=Race(name="Human"),
+                backstory="A long and winding backstory. " * 20,
+            )
+        for i in range(40):
+            campaign.npcs[f"NPC {i}"] = NPC(name=f"NPC {i}", description="A villager " * 20)
+        for i in range(100):
+            campaign.locations[f"Location {i}"] = Location(
+                name=f"Location {i}", location_type="village", description="Rolling hills " * 20
+            )
+        storage.save_all()
+
+        storage.bytes_written = 0
+        campaign.npcs["NPC 17"].attitude = "hostile"
+        storage.save_all()
+        return storage.bytes_written
+
+    def test_entity_layout_reduces_write_amplification(self, temp_storage_dir):
+        section_bytes = self._bytes_for_single_edit(temp_storage_dir / "v1", 1)
+        entity_bytes = self._bytes_for_single_edit(temp_storage_dir / "v2", 2)
+
+        assert entity_bytes > 0
+        assert entity_bytes * 10 < section_bytes
+        assert entity_bytes < 4096
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
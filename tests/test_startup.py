@@ -0,0 +1,111 @@
+"""
+Tests for server cold start.
+
+Tests cover:
+- Importing dm20_protocol.main does not import PDF, library or adventure
+  subsystems and does not load the global rulebook
+- An import-time budget guarding cold-start latency
+- LazyResource background loading, sharing and error propagation
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from dm20_protocol.lazy import LazyResource
+
+# Generous bound: a cold import takes about 1.3 s on a developer laptop,
+# while the eager startup it replaced also fetched 5etools over the network.
+IMPORT_BUDGET_SECONDS = 5.0
+
+DEFERRED_MODULES = [
+    "fitz",
+    "dm20_protocol.library.manager",
+    "dm20_protocol.library.extractors",
+    "dm20_protocol.library.search",
+    "dm20_protocol.adventures.index",
+]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import dm20_protocol.main as m
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": [name for name in %r if name in sys.modules],
+    "rulebook_loaded": m.global_rulebook_manager.loaded,
+    "library_loaded": m.library_manager.loaded,
+}))
+""" % (DEFERRED_MODULES,)
+
+
+@pytest.fixture(scope="module")
+def cold_import(tmp_path_factory) -> dict:
+    data_dir = tmp_path_factory.mktemp("startup")
+    env = {**os.environ, "DM20_STORAGE_DIR": str(data_dir)}
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True, text=True, env=env, cwd=data_dir, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.slow
+class TestColdImport:
+    """Tests for what importing the server module does."""
+
+    def test_heavy_subsystems_are_not_imported(self, cold_import: dict) -> None:
+        assert cold_import["modules"] == []
+
+    def test_rulebook_and_library_are_not_loaded(self, cold_import: dict) -> None:
+        assert not cold_import["rulebook_loaded"]
+        assert not cold_import["library_loaded"]
+
+    def test_import_time_budget(self, cold_import: dict) -> None:
+        assert cold_import["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+class TestLazyResource:
+    """Tests for the background loader."""
+
+    def test_factory_runs_once_off_the_calling_thread(self) -> None:
+        threads = []
+        resource = LazyResource("test", lambda: threads.append(threading.current_thread()) or len(threads))
+
+        resource.start()
+        values = [resource.get(timeout=2) for _ in range(3)]
+
+        assert values == [1, 1, 1]
+        assert threads[0] is not threading.current_thread()
+        assert resource.loaded
+
+    def test_attribute_access_is_forwarded(self, tmp_path: Path) -> None:
+        resource = LazyResource("path", lambda: tmp_path)
+
+        assert resource.name == tmp_path.name
+
+    def test_factory_error_is_raised_to_callers(self) -> None:
+        def fail():
+            raise OSError("disk gone")
+
+        resource = LazyResource("broken", fail)
+
+        with pytest.raises(OSError, match="disk gone"):
+            resource.get(timeout=2)
+        assert resource.loaded
+
+    def test_timeout_while_loading(self) -> None:
+        release = threading.Event()
+        resource = LazyResource("slow", lambda: release.wait(2))
+
+        with pytest.raises(TimeoutError):
+            resource.get(timeout=0.01)
+        release.set()
+        assert resource.get(timeout=2) is True
@@ -0,0 +1,214 @@
+"""
+Tests for the multi-pattern term matcher behind TermResolver.resolve_in_text.
+
+Tests cover:
+- Longest match, word boundaries, whitespace and punctuation in variants
+- Original text spans for accented, decomposed and padded input
+- Rebuilding the matcher when the vocabulary changes
+- Benchmark: 2 KB IT/EN narration against a 5etools-sized vocabulary,
+  compared with the per-variant regex scan it replaced
+"""
+
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dm20_protocol.terminology import TermResolver
+from dm20_protocol.terminology.matcher import TermMatcher
+
+CORE_TERMS = Path(__file__).parent.parent / "src" / "dm20_protocol" / "terminology" / "data" / "core_terms.yaml"
+
+
+def regex_resolve_in_text(resolver: TermResolver, text: str) -> list[tuple[str, str]]:
+    """The previous implementation: one regex scan per variant, longest first."""
+    normalized_text = resolver._normalize(text)
+    matched_positions: set[int] = set()
+    results = []
+    for normalized_variant, _ in resolver._sorted_variants:
+        pattern = r"\b" + re.escape(normalized_variant) + r"\b"
+        for match in re.finditer(pattern, normalized_text):
+            start, end = match.span()
+            if any(pos in matched_positions for pos in range(start, end)):
+                continue
+            matched_positions.update(range(start, end))
+            entry = resolver._lookup.get(normalized_variant)
+            if entry:
+                results.append((start, text[start:end], entry.canonical))
+    results.sort()
+    return [(matched, canonical) for _, matched, canonical in results]
+
+
+@pytest.fixture(scope="module")
+def core_resolver() -> TermResolver:
+    resolver = TermResolver()
+    resolver.load_yaml(CORE_TERMS)
+    return resolver
+
+
+class TestTermMatcher:
+    """Tests for the automaton itself."""
+
+    def test_longest_match_wins(self) -> None:
+        matcher = TermMatcher(["palla", "palla di fuoco", "fuoco"])
+
+        assert matcher.find("lancio palla di fuoco e fuoco") == [
+            (7, 21, "palla di fuoco"),
+            (24, 29, "fuoco"),
+        ]
+
+    def test_word_boundaries(self) -> None:
+        matcher = TermMatcher(["ball", "fire"])
+
+        assert matcher.find("fireball, fire_ball, fire-ball") == [(21, 25, "fire"), (26, 30, "ball")]
+
+    def test_whitespace_must_match(self) -> None:
+        matcher = TermMatcher(["magic missile", "missile"])
+
+        assert matcher.find("magic  missile") == [(7, 14, "missile")]
+
+    def test_punctuation_in_variants(self) -> None:
+        matcher = TermMatcher(["hunter's mark", "+1 longsword", "mark"])
+
+        assert [v for _, _, v in matcher.find("hunter's mark on a +1 longsword")] == [
+            "hunter's mark",
+            "+1 longsword",
+        ]
+
+    def test_overlap_prefers_longer_then_earlier(self) -> None:
+        matcher = TermMatcher(["a b", "b c d", "d e"])
+
+        assert [v for _, _, v in matcher.find("a b c d e")] == ["b c d"]
+
+    def test_suffix_matches_through_failure_links(self) -> None:
+        matcher = TermMatcher(["dire wolf pack", "wolf", "pack"])
+
+        assert [v for _, _, v in matcher.find("a dire wolf attacks the pack")] == ["wolf", "pack"]
+
+
+class TestResolveInText:
+    """resolve_in_text on top of the matcher."""
+
+    def test_accented_spans(self, core_resolver: TermResolver) -> None:
+        matches = core_resolver.resolve_in_text("Furtività, poi FURTIVITA")
+
+        assert [(text, entry.canonical) for text, entry in matches] == [
+            ("Furtività", "stealth"),
+            ("FURTIVITA", "stealth"),
+        ]
+
+    def test_decomposed_accents_and_padding(self, core_resolver: TermResolver) -> None:
+        text = "   Furtivita\u0300 e la Spada Lunga"
+        matches = core_resolver.resolve_in_text(text)
+
+        assert [text for text, _ in matches] == ["Furtivita\u0300", "Spada Lunga"]
+
+    def test_same_results_as_regex_scan(self, core_resolver: TermResolver) -> None:
+        text = NARRATION[:600]
+
+        found = [(t, e.canonical) for t, e in core_resolver.resolve_in_text(text)]
+
+        assert found == regex_resolve_in_text(core_resolver, text)
+        assert found
+
+    def test_rebuilt_after_rulebook_indexing(self) -> None:
+        resolver = TermResolver()
+        resolver.load_yaml(CORE_TERMS)
+        assert resolver.resolve_in_text("a Tarrasque appears") == []
+
+        resolver.index_from_rulebook(fake_manager(monsters=["Tarrasque"]))
+
+        assert [e.canonical for _, e in resolver.resolve_in_text("a Tarrasque appears")] == ["tarrasque"]
+
+    def test_rebuilt_after_reload_with_same_size(self, tmp_path: Path) -> None:
+        def write_terms(name: str) -> Path:
+            path = tmp_path / f"{name}.yaml"
+            path.write_text(
+                f"terms:\n  - canonical: {name}\n    category: spell\n"
+                f"    en: {name}\n    it_primary: {name}\n"
+            )
+            return path
+
+        resolver = TermResolver()
+        resolver.load_yaml(write_terms("bless"))
+        assert [e.canonical for _, e in resolver.resolve_in_text("bless them")] == ["bless"]
+
+        resolver.load_yaml(write_terms("bane"))
+
+        assert [e.canonical for _, e in resolver.resolve_in_text("bless or bane")] == ["bane"]
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+NARRATION = (
+    "Il vento ulula tra le rovine mentre Thorin sguaina la sua Spada Lunga e avanza con "
+    "Furtività lungo il corridoio. The cleric casts Bless on the party, then Guiding Bolt "
+    "strikes the Ancient Red Dragon for 4d6 radiant damage. Elara lancia Palla di Fuoco: "
+    "tutti i goblin devono superare un tiro salvezza su Destrezza o subire 8d6 danni da "
+    "fuoco. Il mago usa Scudo come reazione, aumentando la sua Classe Armatura di 5. "
+    "Roll for Initiative! The Owlbear is Frightened, and the Troll regenerates 10 hit points "
+    "at the start of its turn unless it took acid or fire damage. Kael beve una Pozione di "
+    "Guarigione e recupera 2d4+2 punti ferita; poi tenta una prova di Atletica per scalare "
+    "il muro. The rogue gains Advantage on the attack and deals Sneak Attack damage with "
+    "her Shortsword. Il chierico incanta Cura Ferite sul ranger Avvelenato mentre il "
+    "Beholder fluttua sopra la Bag of Holding dimenticata. "
+) * 4
+
+
+def fake_manager(spells=(), monsters=(), items=()) -> SimpleNamespace:
+    """A RulebookManager-like object with one loaded source."""
+    def storage(names):
+        return {name.lower().replace(" ", "-").replace("'", ""): SimpleNamespace(name=name) for name in names}
+
+    source = SimpleNamespace(
+        is_loaded=True,
+        _spells=storage(spells),
+        _monsters=storage(monsters),
+        _items=storage(items),
+    )
+    return SimpleNamespace(_sources={"5etools": source})
+
+
+def fivetools_sized_vocabulary() -> SimpleNamespace:
+    """About 900 spells, 3000 monsters and 2400 items, like a full 5etools cache."""
+    adjectives = ["Ancient", "Young", "Frost", "Shadow", "Iron", "Bone", "Storm", "Swamp", "Greater",
+                  "Lesser", "Elder", "Spectral", "Flame", "Deep", "Giant", "Dire"]
+    kinds = ["Dragon", "Giant", "Wolf", "Golem", "Hag", "Troll", "Wraith", "Drake", "Spider",
+             "Knight", "Mage", "Priest", "Cultist", "Elemental", "Serpent", "Beetle"]
+    spells = [f"{adjectives[i % 16]} {w}" for i, w in enumerate(
+        "Bolt Ward Blast Binding Sight Step Wall Shield Storm Aura Curse Touch Word Grasp Ray"
+        " Sphere Strike Veil Chains Mark Shroud Lance Pulse Eruption Cage Song Tide Mist Rune"
+        " Fang Spear Tongue Path".split() * 27
+    )] + ["Bless", "Guiding Bolt", "Shield", "Fireball", "Cure Wounds"]
+    monsters = [f"{adjectives[i % 16]} {kinds[i // 16 % 16]} {['Warrior', 'Lord', 'Spawn', 'Hatchling'][i // 256 % 4]}"
+                f"{'' if i < 1024 else f' {i // 1024}'}" for i in range(3000)]
+    monsters += ["Owlbear", "Troll", "Beholder", "Ancient Red Dragon", "Goblin"]
+    items = [f"{['Ring', 'Cloak', 'Wand', 'Staff', 'Amulet', 'Boots'][i % 6]} of {adjectives[i // 6 % 16]} "
+             f"{kinds[i // 96 % 16]}{'' if i < 1536 else ' +1'}" for i in range(2400)]
+    items += ["Bag of Holding", "Shortsword", "Potion of Healing"]
+    return fake_manager(spells, monsters, items)
+
+
+@pytest.mark.slow
+class TestResolveInTextBenchmark:
+    """One pass over the text, whatever the vocabulary size."""
+
+    def test_full_vocabulary_vs_regex_scan(self) -> None:
+        resolver = TermResolver()
+        resolver.load_yaml(CORE_TERMS)
+        resolver.index_from_rulebook(fivetools_sized_vocabulary())
+        assert len(NARRATION.encode()) >= 2048
+
+        matcher = resolver._get_matcher()
+        matches = resolver.resolve_in_text(NARRATION)
+
+        assert [(t, e.canonical) for t, e in matches] == regex_resolve_in_text(resolver, NARRATION)
+        expected = {"fireball", "stealth", "ancient-red-dragon", "bag-of-holding"}
+        assert {e.canonical for _, e in matches} >= expected
+        # Built once for thousands of variants, then reused for every text
+        assert len(resolver._sorted_variants) > 5000
+        resolver.resolve_in_text(NARRATION)
+        assert resolver._get_matcher() is matcher
@@ -8,6 +8,7 @@ free of heavy ML library imports.
 
 import pytest
 from typing import Any
+from unittest.mock import Mock
 
 from dm20_protocol.claudmaster.vector_store import (
     HAS_CHROMADB,
@@ -254,6 +255,121 @@ class TestUtilities:
             tmp_store.collection_count("ghost")
 
 
+# ---------------------------------------------------------------------------
+# Query cache
+# ---------------------------------------------------------------------------
+
+class TestQueryCache:
+    """Tests for cached collection handles, counts and query results."""
+
+    @pytest.fixture
+    def indexed_store(
+        self,
+        tmp_store: VectorStoreManager,
+        sample_documents: tuple[list[str], list[dict[str, Any]], list[str]],
+    ) -> VectorStoreManager:
+        docs, metas, ids = sample_documents
+        tmp_store.create_collection("cached")
+        tmp_store.add_documents("cached", docs[:2], metas[:2], ids[:2])
+        return tmp_store
+
+    def test_repeated_query_is_cached(self, indexed_store: VectorStoreManager) -> None:
+        first = indexed_store.query("cached", "goblin chief", n_results=2)
+        spy = Mock(wraps=indexed_store._collections["cached"])
+        indexed_store._collections["cached"] = spy
+
+        second = indexed_store.query("cached", "goblin chief", n_results=2)
+        indexed_store.query("cached", "goblin camp", n_results=2)
+
+        assert second == first
+        assert spy.query.call_count == 1
+        spy.count.assert_not_called()
+
+    def test_cached_results_are_copies(self, indexed_store: VectorStoreManager) -> None:
+        indexed_store.query("cached", "goblin chief")[0]["document"] = "changed"
+
+        assert indexed_store.query("cached", "goblin chief")[0]["document"] != "changed"
+
+    def test_cached_metadata_is_copied(self, indexed_store: VectorStoreManager) -> None:
+        indexed_store.query("cached", "goblin chief")[0]["metadata"]["content_type"] = "changed"
+
+        assert indexed_store.query("cached", "goblin chief")[0]["metadata"]["content_type"] != "changed"
+
+    def test_where_filter_is_part_of_key(self, indexed_store: VectorStoreManager) -> None:
+        unfiltered = indexed_store.query("cached", "goblin")
+        filtered = indexed_store.query("cached", "goblin", where={"content_type": "npc"})
+
+        assert len(unfiltered) == 2
+        assert [r["metadata"]["content_type"] for r in filtered] == ["npc"]
+
+    def test_add_documents_invalidates(
+        self,
+        indexed_store: VectorStoreManager,
+        sample_documents: tuple[list[str], list[dict[str, Any]], list[str]],
+    ) -> None:
+        docs, metas, ids = sample_documents
+        assert len(indexed_store.query("cached", "tunnel river", n_results=5)) == 2
+
+        indexed_store.add_documents("cached", docs[2:], metas[2:], ids[2:])
+
+        results = indexed_store.query("cached", "tunnel river", n_results=5)
+        assert len(results) == 3
+        assert indexed_store.collection_count("cached") == 3
+
+    def test_delete_collection_invalidates(self, indexed_store: VectorStoreManager) -> None:
+        indexed_store.query("cached", "goblin")
+        indexed_store.delete_collection("cached")
+
+        with pytest.raises(CollectionNotFoundError):
+            indexed_store.query("cached", "goblin")
+
+    def test_handle_fetched_during_invalidate_not_cached(
+        self, indexed_store: VectorStoreManager,
+    ) -> None:
+        indexed_store.invalidate("cached")
+        get_collection = indexed_store._client.get_collection
+
+        def racing_get_collection(**kwargs: Any) -> Any:
+            collection = get_collection(**kwargs)
+            indexed_store.invalidate("cached")
+            return collection
+
+        indexed_store._client.get_collection = racing_get_collection
+        assert indexed_store.collection_count("cached") == 2
+        assert "cached" not in indexed_store._collections
+
+    def test_count_taken_during_invalidate_not_cached(
+        self, indexed_store: VectorStoreManager,
+    ) -> None:
+        collection = Mock()
+        collection.count.side_effect = lambda: indexed_store.invalidate() or 2
+
+        assert indexed_store._count("cached", collection) == 2
+        assert "cached" not in indexed_store._counts
+
+    def test_lru_eviction(self, indexed_store: VectorStoreManager, monkeypatch) -> None:
+        monkeypatch.setattr("dm20_protocol.claudmaster.vector_store.QUERY_CACHE_SIZE", 2)
+        for text in ("goblin", "camp", "forest"):
+            indexed_store.query("cached", text)
+
+        assert [key[1] for key in indexed_store._results] == ["camp", "forest"]
+
+    def test_query_async(self, indexed_store: VectorStoreManager) -> None:
+        import asyncio
+
+        async def run() -> list[list[dict[str, Any]]]:
+            return await asyncio.gather(
+                indexed_store.query_async("cached", "goblin chief", n_results=1),
+                indexed_store.query_async("cached", "darkwood forest", n_results=1),
+            )
+
+        chief, forest = asyncio.run(run())
+        indexed_store.close()
+
+        assert chief == indexed_store.query("cached", "goblin chief", n_results=1)
+        assert forest == indexed_store.query("cached", "darkwood forest", n_results=1)
+
+
 # ---------------------------------------------------------------------------
 # Collection naming
 # ---------------------------------------------------------------------------
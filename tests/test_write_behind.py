@@ -0,0 +1,230 @@
+"""
+Unit tests for write-behind saving.
+
+Tests cover:
+- WriteBehindSaver debouncing, coalescing and metrics
+- Deterministic flush() and close()
+- Retrying after a failed flush
+- DnDStorage in write-behind mode (deferred writes, flush on campaign switch)
+- Edits made while a save is in flight are not lost
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dm20_protocol.change_tracker import ChangeTracker
+from dm20_protocol.models import NPC, Campaign, GameState
+from dm20_protocol.storage import DnDStorage
+from dm20_protocol.write_behind import WriteBehindSaver
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestWriteBehindSaver:
+    """Tests for the debouncing saver."""
+
+    def test_burst_is_coalesced_into_one_flush(self) -> None:
+        flushed = threading.Event()
+        calls = []
+
+        def flush() -> None:
+            calls.append(time.monotonic())
+            flushed.set()
+
+        saver = WriteBehindSaver(flush, debounce=0.05)
+        for _ in range(20):
+            saver.request()
+
+        assert flushed.wait(2.0)
+        time.sleep(0.1)
+        saver.close()
+
+        assert len(calls) == 1
+        assert saver.metrics.requests == 20
+        assert saver.metrics.coalescing_ratio == 20
+        assert saver.metrics.last_latency >= 0.05
+
+    def test_flush_runs_synchronously(self) -> None:
+        calls = []
+        saver = WriteBehindSaver(lambda: calls.append(1), debounce=60)
+
+        saver.request()
+        assert saver.pending
+        assert saver.flush() is True
+
+        assert calls == [1]
+        assert not saver.pending
+        assert saver.flush() is False
+        saver.close()
+
+    def test_close_flushes_pending_request(self) -> None:
+        calls = []
+        saver = WriteBehindSaver(lambda: calls.append(1), debounce=60)
+
+        saver.request()
+        saver.close()
+        saver.close()
+
+        assert calls == [1]
+        assert saver.metrics.to_dict()["flushes"] == 1
+
+    def test_request_after_close_saves_immediately(self) -> None:
+        calls = []
+        saver = WriteBehindSaver(lambda: calls.append(1), debounce=60)
+        saver.close()
+
+        saver.request()
+
+        assert calls == [1]
+
+    def test_max_delay_bounds_continuous_requests(self) -> None:
+        calls = []
+        saver = WriteBehindSaver(lambda: calls.append(1), debounce=0.05, max_delay=0.1)
+
+        stop = time.monotonic() + 0.4
+        while time.monotonic() < stop:
+            saver.request()
+            time.sleep(0.01)
+        saver.close()
+
+        assert len(calls) >= 2
+
+    def test_failed_flush_is_retried(self) -> None:
+        attempts = []
+
+        def flush() -> None:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("disk full")
+
+        saver = WriteBehindSaver(flush, debounce=0.02)
+        saver.request()
+
+        assert _wait_for(lambda: saver.metrics.flushes == 1)
+        saver.close()
+        assert saver.metrics.errors == 1
+        assert len(attempts) == 2
+
+    def test_negative_debounce_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            WriteBehindSaver(lambda: None, debounce=-1)
+
+
+class TestStorageWriteBehind:
+    """Tests for DnDStorage with write-behind enabled."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path):
+        storage = DnDStorage(data_dir=tmp_path, write_behind=True, write_behind_delay=60)
+        storage.create_campaign(name="Deferred", description="Write-behind test")
+        storage.add_npc(NPC(name="Barkeep"))
+        storage.flush()
+        yield storage
+        storage.close()
+
+    def _npcs_file(self, storage: DnDStorage) -> Path:
+        return storage._split_backend._get_campaign_dir() / "npcs.json"
+
+    def _edit_npc(self, storage: DnDStorage, **fields) -> None:
+        npc = storage.get_npc("Barkeep")
+        for name, value in fields.items():
+            setattr(npc, name, value)
+        storage.save()
+
+    def test_default_is_synchronous(self, tmp_path: Path) -> None:
+        storage = DnDStorage(data_dir=tmp_path)
+
+        assert not storage.write_behind
+        assert storage.save_metrics is None
+
+    def test_mutations_are_deferred_until_flush(self, storage: DnDStorage) -> None:
+        before = storage.save_metrics
+        for attitude in ["friendly", "neutral", "hostile"]:
+            self._edit_npc(storage, attitude=attitude)
+
+        assert json.loads(self._npcs_file(storage).read_text())["Barkeep"]["attitude"] != "hostile"
+
+        storage.flush()
+
+        assert json.loads(self._npcs_file(storage).read_text())["Barkeep"]["attitude"] == "hostile"
+        after = storage.save_metrics
+        assert after["requests"] - before["requests"] == 3
+        assert after["flushes"] - before["flushes"] == 1
+
+    def test_close_writes_pending_changes(self, storage: DnDStorage) -> None:
+        self._edit_npc(storage, notes="Saw the thief")
+
+        storage.close()
+
+        reloaded = DnDStorage(data_dir=storage.data_dir)
+        assert reloaded.get_npc("Barkeep").notes == "Saw the thief"
+        assert not storage.write_behind
+
+    def test_switching_campaign_flushes_first(self, storage: DnDStorage) -> None:
+        self._edit_npc(storage, notes="Before switching")
+
+        storage.create_campaign(name="Other", description="Second campaign")
+        storage.load_campaign("Deferred")
+
+        assert storage.get_npc("Barkeep").notes == "Before switching"
+
+    def test_flush_writes_state_as_of_save(self, storage: DnDStorage) -> None:
+        self._edit_npc(storage, notes="Saved")
+        storage.get_npc("Barkeep").notes = "Edited after the save"
+
+        storage.flush()
+
+        assert json.loads(self._npcs_file(storage).read_text())["Barkeep"]["notes"] == "Saved"
+
+    def test_background_flush_does_not_serialize_models(self, tmp_path: Path, monkeypatch) -> None:
+        storage = DnDStorage(data_dir=tmp_path, write_behind=True, write_behind_delay=0.01)
+        storage.create_campaign(name="Threads", description="Write-behind test")
+        storage.add_npc(NPC(name="Barkeep"))
+        storage.flush()
+        dump_threads = []
+        original_dump = NPC.model_dump
+
+        def recording_dump(self, *args, **kwargs):
+            dump_threads.append(threading.current_thread())
+            return original_dump(self, *args, **kwargs)
+
+        monkeypatch.setattr(NPC, "model_dump", recording_dump)
+        flushes = storage.save_metrics["flushes"]
+        try:
+            self._edit_npc(storage, notes="From the main thread")
+            assert _wait_for(lambda: storage.save_metrics["flushes"] > flushes)
+        finally:
+            storage.close()
+
+        assert dump_threads
+        assert set(dump_threads) == {threading.current_thread()}
+
+
+class TestEditsDuringSave:
+    """Touches made between collect() and commit() must survive the commit."""
+
+    def test_retouched_entity_is_checked_again(self) -> None:
+        campaign = Campaign(name="Race", description="d", game_state=GameState(campaign_name="Race"))
+        campaign.npcs["Guard"] = NPC(name="Guard")
+        tracker = ChangeTracker()
+        tracker.attach(campaign)
+
+        campaign.npcs["Guard"].attitude = "friendly"
+        changes = tracker.collect(campaign)
+        # Edited again while the first change is being written
+        campaign.npcs["Guard"].notes = "Late edit"
+        tracker.commit(changes)
+
+        again = tracker.collect(campaign)
+        assert again.entities["npcs"]["Guard"]["notes"] == "Late edit"